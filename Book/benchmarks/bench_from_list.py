@@ -0,0 +1,66 @@
+"""
+Benchmarks building a chart of accounts hierarchy with from_list.
+
+Usage:
+    python benchmarks/bench_from_list.py [rows]
+
+Generates a synthetic chart of accounts (default 1,000,000 accounts, ten
+children per parent), writes it to a temporary CSV file and times
+from_list (with pause_gc=True) on an in-memory list of records and
+streamed from the CSV file.
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from book.hierarchy import from_list, sort_nodes  # noqa: E402
+from book.connectors import iter_csv  # noqa: E402
+
+
+def chart_of_accounts(rows: int, fanout: int = 10):
+    """Yields account records; account i (1-based) reports to account i // fanout."""
+    for i in range(1, rows + 1):
+        parent = i // fanout
+        yield {
+            "account_id": f"A{i:07d}",
+            "parent_account": f"A{parent:07d}" if parent else "",
+            "account_name": f"Account {i}",
+            "sort_order": str(rows - i),
+        }
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:8.2f}s")
+    return result
+
+
+def main(rows: int):
+    print(f"Chart of accounts: {rows:,} rows")
+    records = timed("generate records", lambda: list(chart_of_accounts(rows)))
+    roots = timed("from_list (records)", lambda: from_list(
+        records, parent_col="parent_account", child_col="account_id", name_col="account_name", pause_gc=True
+    ))
+    timed("sort_nodes", lambda: sort_nodes(roots, sort_by="sort_order"))
+    del roots
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "chart_of_accounts.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(records[0]))
+            writer.writeheader()
+            writer.writerows(records)
+        del records
+        timed("from_list (streamed CSV)", lambda: from_list(
+            iter_csv(path), parent_col="parent_account", child_col="account_id", name_col="account_name",
+            pause_gc=True,
+        ))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -6,8 +6,12 @@ from .properties import (
     remove_property,
     propagate_to_children,
     propagate_to_parents,
+    propagate_to_descendants_bulk,
+    propagate_to_ancestors_bulk,
+    inherit_properties,
     get_property,
 )
+from .index import NodeIndex
 from .actions import (
     add_python_function,
     run_python_function,
@@ -31,7 +35,13 @@ from .management import copy_book, load_book, SyncManager
 from .linked_book import LinkedBook, Delta
 from .logger import get_logger
 from .formulas import Formula
-from .formula_engine import execute_formulas
+from .formula_engine import (
+    execute_formulas,
+    execute_formulas_bulk,
+    compile_formula,
+    FormulaEvaluator,
+    FormulaError,
+)
 from .ai_agent import AIAgent
 from .ai_agent_config import AIAgentConfig
 
@@ -52,7 +62,11 @@ __all__ = [
     "remove_property",
     "propagate_to_children",
     "propagate_to_parents",
+    "propagate_to_descendants_bulk",
+    "propagate_to_ancestors_bulk",
+    "inherit_properties",
     "get_property",
+    "NodeIndex",
     "add_python_function",
     "run_python_function",
     "add_llm_prompt",
@@ -74,6 +88,10 @@ __all__ = [
     "get_logger",
     "Formula",
     "execute_formulas",
+    "execute_formulas_bulk",
+    "compile_formula",
+    "FormulaEvaluator",
+    "FormulaError",
     "AIAgent",
     "AIAgentConfig",
     "dbt_integration",
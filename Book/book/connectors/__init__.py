@@ -1,4 +1,4 @@
-from .csv_connector import from_csv
+from .csv_connector import from_csv, iter_csv
 from .json_connector import from_json
 
-__all__ = ["from_csv", "from_json"]
+__all__ = ["from_csv", "iter_csv", "from_json"]
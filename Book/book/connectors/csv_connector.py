@@ -1,5 +1,5 @@
 import csv
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any
 
 def from_csv(file_path: str, **kwargs) -> List[Dict[str, Any]]:
     """
@@ -15,3 +15,21 @@ def from_csv(file_path: str, **kwargs) -> List[Dict[str, Any]]:
     with open(file_path, mode='r', encoding='utf-8') as infile:
         reader = csv.DictReader(infile, **kwargs)
         return [row for row in reader]
+
+
+def iter_csv(file_path: str, **kwargs) -> Iterator[Dict[str, Any]]:
+    """
+    Streams rows from a CSV file as dictionaries, one at a time.
+
+    Useful for large files, e.g. ``from_list(iter_csv(path), ...)`` builds a
+    hierarchy without holding the raw rows in memory.
+
+    Args:
+        file_path: The path to the CSV file.
+        **kwargs: Additional arguments to be passed to csv.DictReader.
+
+    Yields:
+        A dictionary per row.
+    """
+    with open(file_path, mode='r', encoding='utf-8', newline='') as infile:
+        yield from csv.DictReader(infile, **kwargs)
@@ -1,24 +1,375 @@
+import ast
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
 from .models import Node, Book
+from .formulas import Formula
 from .properties import get_property
 
+
+class FormulaError(ValueError):
+    """Raised when a formula expression uses syntax the engine does not allow."""
+
+
+# Functions available to formula expressions
+SAFE_FUNCTIONS = {"abs": abs, "min": min, "max": max, "round": round}
+# NumPy equivalents used when a formula is evaluated over operand arrays
+_VECTOR_FUNCTIONS = {"abs": np.abs, "min": np.minimum, "max": np.maximum}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+# Integers beyond this are evaluated one node at a time to keep Python's exact arithmetic
+_EXACT_INT_LIMIT = 2 ** 52
+
+
+class CompiledFormula:
+    """
+    A formula expression validated against a small arithmetic grammar and
+    compiled to bytecode once.
+    """
+
+    def __init__(self, expression: str):
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError as e:
+            raise FormulaError(f"Invalid formula '{expression}': {e.msg}") from e
+
+        vectorizable = True
+        self.uses_pow = False
+        # min/max return one of their arguments unchanged, int or float
+        self.uses_min_max = False
+        self.constant_kinds: Set[type] = set()
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise FormulaError(f"Unsupported syntax in formula '{expression}': {type(node).__name__}")
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in SAFE_FUNCTIONS or node.keywords:
+                    raise FormulaError(f"Unsupported function call in formula '{expression}'")
+                if node.func.id not in _VECTOR_FUNCTIONS or (node.func.id != "abs" and len(node.args) != 2):
+                    vectorizable = False
+                elif node.func.id != "abs":
+                    self.uses_min_max = True
+            elif isinstance(node, (ast.BoolOp, ast.IfExp)) or isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+                vectorizable = False  # need Python truthiness per value
+            elif isinstance(node, ast.Compare) and len(node.ops) > 1:
+                vectorizable = False  # chained comparisons expand to "and"
+            elif isinstance(node, ast.Constant):
+                if not isinstance(node.value, (int, float)):
+                    vectorizable = False
+                elif isinstance(node.value, float):
+                    self.constant_kinds.add(float)
+                elif abs(node.value) >= _EXACT_INT_LIMIT:
+                    vectorizable = False  # not exact as a float and may not fit in int64
+                else:
+                    self.constant_kinds.add(int)
+            elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+                self.uses_pow = True
+
+        self.expression = expression
+        self.names: Set[str] = {
+            n.id for n in ast.walk(tree) if isinstance(n, ast.Name) and n.id not in SAFE_FUNCTIONS
+        }
+        self.vectorizable = vectorizable
+        self._code = compile(tree, "<formula>", "eval")
+        self._globals = {"__builtins__": {}, **SAFE_FUNCTIONS}
+        self._vector_globals = {"__builtins__": {}, **_VECTOR_FUNCTIONS}
+
+    def evaluate(self, scope: Dict[str, Any]) -> Any:
+        """Evaluates the formula for one set of operand values."""
+        return eval(self._code, self._globals, scope)
+
+    def evaluate_arrays(self, arrays: Dict[str, np.ndarray], size: int) -> np.ndarray:
+        """Evaluates the formula element-wise over operand arrays of length ``size``."""
+        result = eval(self._code, self._vector_globals, arrays)
+        return np.broadcast_to(np.asarray(result), (size,))
+
+
+@lru_cache(maxsize=1024)
+def compile_formula(expression: str) -> CompiledFormula:
+    """
+    Compiles a formula expression (cached per expression string).
+
+    Args:
+        expression: The formula expression, e.g. "(revenue - cogs) / revenue".
+
+    Returns:
+        The compiled formula.
+
+    Raises:
+        FormulaError: If the expression is not valid formula syntax.
+    """
+    return CompiledFormula(expression)
+
+
+def _dependency_order(formulas: List[Formula]) -> List[Formula]:
+    """
+    Orders formulas so that a formula runs after the formulas whose results it
+    uses as operands. Declaration order is kept otherwise, and for cycles.
+    """
+    names = {f.name for f in formulas}
+    pending = list(formulas)
+    done: Set[str] = set()
+    ordered = []
+    while pending:
+        for i, formula in enumerate(pending):
+            waiting = {
+                op for op in formula.operands
+                if op in names and op != formula.name and op not in done
+                and any(p.name == op for p in pending if p is not formula)
+            }
+            if not waiting:
+                break
+        else:
+            i = 0  # cycle: fall back to declaration order
+        formula = pending.pop(i)
+        ordered.append(formula)
+        if not any(p.name == formula.name for p in pending):
+            done.add(formula.name)
+    return ordered
+
+
+def _run_formula(node: Node, book: Book, formula: Formula) -> bool:
+    """Evaluates one formula on one node. Returns True if a result was stored."""
+    try:
+        compiled = compile_formula(formula.expression)
+        scope = {operand: get_property(node, book, operand) for operand in formula.operands}
+        node.properties[formula.name] = compiled.evaluate(scope)
+        return True
+
+    except KeyError as e:
+        # Handle cases where an operand is missing
+        print(f"Skipping formula '{formula.name}' on node '{node.name}': Missing operand {e}")
+    except Exception as e:
+        # Handle other evaluation errors
+        print(f"Error executing formula '{formula.name}' on node '{node.name}': {e}")
+    return False
+
+
 def execute_formulas(node: Node, book: Book):
     """
     Executes the formulas attached to a node and stores the results as properties.
+
+    Expressions are compiled once and evaluated without access to Python
+    builtins; formulas run after the formulas they depend on.
     """
-    for formula in node.formulas:
-        local_scope = {}
+    for formula in _dependency_order(list(node.formulas)):
+        _run_formula(node, book, formula)
+
+
+_MISSING = object()
+
+
+class _Column:
+    """The values of one operand across the nodes of a formula group."""
+
+    __slots__ = ("values", "kind", "array")
+
+    def __init__(self, values: List[Any]):
+        self.values = values
+        # int or float when every value has that type; the values then also live in a float64 array
+        self.kind: Optional[type] = None
+        self.array: Optional[np.ndarray] = None
+        kinds = set(map(type, values))
+        if len(kinds) == 1:
+            kind = kinds.pop()
+            if kind is int or kind is float:
+                try:
+                    self.array = np.array(values, dtype=np.float64)
+                    self.kind = kind
+                except OverflowError:
+                    pass
+
+    def changed(self, previous: "_Column") -> np.ndarray:
+        """Mask of positions whose value or value type differs from ``previous``."""
+        if self.kind is not None and self.kind is previous.kind:
+            mask = self.array != previous.array
+            if self.kind is int:
+                # Large ints are not exactly comparable as floats
+                for i in np.flatnonzero(np.abs(self.array) >= _EXACT_INT_LIMIT).tolist():
+                    mask[i] = self.values[i] != previous.values[i]
+            return mask
+        return np.fromiter(
+            (type(a) is not type(b) or bool(a != b) for a, b in zip(self.values, previous.values)),
+            dtype=bool,
+            count=len(self.values),
+        )
+
+
+class FormulaEvaluator:
+    """
+    Evaluates the formulas of a whole book in bulk.
+
+    Node formulas are grouped by (name, expression) and the groups run in
+    dependency order. Each group gathers its operands into one column per
+    operand; when the columns hold plain ints or floats the formula is
+    evaluated for all nodes at once over NumPy arrays. Anything else
+    (strings, conditionals, division by zero, ...) falls back to per-node
+    evaluation with the same results and messages as execute_formulas.
+
+    The evaluator remembers the operand columns each group was computed
+    from, so calling evaluate() again only recomputes nodes whose inputs
+    changed (and every node of a group whose set of nodes changed). Use
+    invalidate() to force a full recomputation.
+    """
+
+    def __init__(self, book: Book):
+        """
+        Args:
+            book: The book whose formulas are evaluated.
+        """
+        self.book = book
+        # (formula name, expression) -> (node ids, operand columns) of the last evaluation
+        self._inputs: Dict[Tuple[str, str], Tuple[List[str], List[_Column]]] = {}
+
+    def invalidate(self):
+        """Forgets all previous inputs so the next evaluate() recomputes everything."""
+        self._inputs.clear()
+
+    def _groups(self, nodes: Iterable[Node]) -> List[Tuple[Formula, List[Node]]]:
+        groups: Dict[Tuple[str, str], Tuple[Formula, List[Node]]] = {}
+        for node in nodes:
+            for formula in node.formulas:
+                key = (formula.name, formula.expression)
+                if key not in groups:
+                    groups[key] = (formula, [])
+                groups[key][1].append(node)
+        ordered = _dependency_order([formula for formula, _ in groups.values()])
+        return [groups[(f.name, f.expression)] for f in ordered]
+
+    def evaluate(self, nodes: Optional[Iterable[Node]] = None) -> int:
+        """
+        Evaluates formulas, recomputing only nodes whose operands changed.
+
+        Args:
+            nodes: The nodes to evaluate. Defaults to every node in the book.
+
+        Returns:
+            The number of (node, formula) results that were recomputed.
+        """
+        if nodes is None:
+            nodes = self.book.node_index().order
+        globals_ = self.book.global_properties
+        recomputed = 0
+
+        for formula, group_nodes in self._groups(nodes):
+            try:
+                compiled = compile_formula(formula.expression)
+            except FormulaError as e:
+                print(f"Error executing formula '{formula.name}': {e}")
+                continue
+
+            key = (formula.name, formula.expression)
+            ids = [node.id for node in group_nodes]
+            properties = [node.properties for node in group_nodes]
+            columns = [
+                _Column([p[op] if op in p else globals_.get(op, _MISSING) for p in properties])
+                for op in formula.operands
+            ]
+
+            previous = self._inputs.get(key)
+            if previous is not None and previous[0] == ids:
+                dirty = np.zeros(len(ids), dtype=bool)
+                for column, old in zip(columns, previous[1]):
+                    dirty |= column.changed(old)
+            else:
+                dirty = np.ones(len(ids), dtype=bool)
+            self._inputs[key] = (ids, columns)
+
+            positions = np.flatnonzero(dirty)
+            recomputed += len(positions)
+            if not len(positions):
+                continue
+            if not compiled.vectorizable or not compiled.names <= set(formula.operands):
+                # Names outside the operands fail per node (and are reported there)
+                for i in positions.tolist():
+                    _run_formula(group_nodes[i], self.book, formula)
+            elif all(column.kind is not None for column in columns):
+                self._evaluate_vectorized(formula, compiled, columns, positions, group_nodes)
+            else:
+                # Mixed operand types: vectorize each run of nodes sharing the same types
+                by_types: Dict[Tuple[type, ...], List[int]] = {}
+                for i in positions.tolist():
+                    types = tuple(type(column.values[i]) for column in columns)
+                    by_types.setdefault(types, []).append(i)
+                for types, rows in by_types.items():
+                    if all(kind is int or kind is float for kind in types):
+                        subset = [_Column([column.values[i] for i in rows]) for column in columns]
+                        self._evaluate_vectorized(
+                            formula, compiled, subset, np.arange(len(rows)), [group_nodes[i] for i in rows]
+                        )
+                    else:
+                        for i in rows:
+                            _run_formula(group_nodes[i], self.book, formula)
+
+        return recomputed
+
+    def _evaluate_vectorized(
+        self,
+        formula: Formula,
+        compiled: CompiledFormula,
+        columns: List[_Column],
+        positions: np.ndarray,
+        nodes: List[Node],
+    ):
+        """Evaluates one formula over NumPy arrays for the nodes at ``positions``."""
+        kinds = {column.kind for column in columns} | compiled.constant_kinds
+        int_pow = compiled.uses_pow and (not columns or any(column.kind is int for column in columns))
+        if compiled.uses_min_max and len(kinds) > 1 or int_pow:
+            # Arrays would promote the selected int (or an int power) to float
+            for i in positions.tolist():
+                _run_formula(nodes[i], self.book, formula)
+            return
+
+        size = len(positions)
+        as_float = {op: column.array[positions] for op, column in zip(formula.operands, columns)}
+
         try:
-            for operand in formula.operands:
-                local_scope[operand] = get_property(node, book, operand)
-            
-            # Security Warning: eval is used here for simplicity.
-            # In a real-world application, consider using a safer evaluation engine.
-            result = eval(formula.expression, globals(), local_scope)
-            node.properties[formula.name] = result
-
-        except KeyError as e:
-            # Handle cases where an operand is missing
-            print(f"Skipping formula '{formula.name}' on node '{node.name}': Missing operand {e}")
-        except Exception as e:
-            # Handle other evaluation errors
-            print(f"Error executing formula '{formula.name}' on node '{node.name}': {e}")
+            with np.errstate(all="ignore"):
+                result = compiled.evaluate_arrays(as_float, size)
+                # Division by zero, overflow and NaN inputs are left to exact per-node evaluation
+                exact = np.isfinite(result) if result.dtype.kind == "f" else np.ones(size, dtype=bool)
+                # So are ints too large to convert to float without rounding
+                int_operands = [op for op, column in zip(formula.operands, columns) if column.kind is int]
+                for op in int_operands:
+                    exact &= np.abs(as_float[op]) < _EXACT_INT_LIMIT
+
+                if len(int_operands) == len(columns) and not compiled.uses_pow:
+                    as_int = {op: np.where(exact, array, 0).astype(np.int64) for op, array in as_float.items()}
+                    int_result = compiled.evaluate_arrays(as_int, size)
+                    if int_result.dtype.kind in "iub":
+                        # int64 results are exact while the float estimate stays small
+                        exact &= np.abs(result) < _EXACT_INT_LIMIT
+                        result = int_result
+        except Exception:
+            # e.g. a value NumPy cannot represent; per-node evaluation handles or reports it
+            result = np.zeros(size)
+            exact = np.zeros(size, dtype=bool)
+
+        name = formula.name
+        for i, value, ok in zip(positions.tolist(), result.tolist(), exact.tolist()):
+            node = nodes[i]
+            if ok:
+                node.properties[name] = value
+            else:
+                _run_formula(node, self.book, formula)
+
+
+def execute_formulas_bulk(book: Book) -> int:
+    """
+    Executes the formulas of every node in a book in bulk.
+
+    Args:
+        book: The book to evaluate.
+
+    Returns:
+        The number of (node, formula) results that were computed.
+    """
+    return FormulaEvaluator(book).evaluate()
@@ -1,8 +1,36 @@
-from typing import List, Dict, Any, Optional
+import gc
+import os
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
+
+import numpy as np
+
 from .models import Node
 
+# Parent codes for rows without a parent (roots) and rows whose parent is unknown
+_ROOT = -1
+_ORPHAN = -2
+
+
+def _iter_records(data: Any) -> Iterable[Dict[str, Any]]:
+    """Returns records from a list/iterable of dicts, a pandas DataFrame or an Arrow table."""
+    if hasattr(data, "to_pylist"):  # pyarrow.Table / RecordBatch
+        return data.to_pylist()
+    if hasattr(data, "to_dict") and hasattr(data, "columns"):  # pandas.DataFrame
+        return data.to_dict(orient="records")
+    return data
+
+
+def _is_blank(value: Any) -> bool:
+    """True for missing identifiers: None, "", 0 and NaN (pandas' missing value)."""
+    return not value or value != value
+
+
 def from_list(
-    data: List[Dict[str, Any]], parent_col: str, child_col: str, name_col: Optional[str] = None
+    data: Iterable[Dict[str, Any]],
+    parent_col: str,
+    child_col: str,
+    name_col: Optional[str] = None,
+    pause_gc: bool = False,
 ) -> List[Node]:
     """
     Builds a hierarchy of Node objects from a list of dictionaries.
@@ -10,49 +38,162 @@ def from_list(
     This function assumes a parent-child relationship is defined by two
     columns in the input data.
 
+    The records are read in a single pass, so ``data`` may also be a
+    generator (e.g. ``connectors.iter_csv``), a pandas DataFrame or an
+    Arrow table. Children are grouped under their parents in one vectorized
+    step, and nodes are created without re-validating each record.
+    Records repeating an identifier are merged into one node (later values
+    win, including the parent).
+
     Args:
         data: A list of dictionaries, where each dictionary represents a record.
         parent_col: The name of the column containing the parent's identifier.
         child_col: The name of the column containing the child's identifier.
-        name_col: The name of the column to use for the node's name. 
+        name_col: The name of the column to use for the node's name.
                   If not provided, child_col is used.
+        pause_gc: Disable Python's cyclic garbage collector while building.
+                  Everything created here stays reachable, so this only saves
+                  repeated scans of the growing heap on very large inputs, but
+                  it affects every thread of the process until from_list returns.
 
     Returns:
         A list of root Node objects.
     """
-    nodes: Dict[str, Node] = {}
-    root_nodes: List[Node] = []
+    if not pause_gc or not gc.isenabled():
+        return _build_hierarchy(data, parent_col, child_col, name_col)
+    gc.disable()
+    try:
+        return _build_hierarchy(data, parent_col, child_col, name_col)
+    finally:
+        gc.enable()
+
+
+def _build_hierarchy(
+    data: Iterable[Dict[str, Any]], parent_col: str, child_col: str, name_col: Optional[str]
+) -> List[Node]:
+    positions: Dict[Any, int] = {}
+    properties: List[Dict[str, Any]] = []
+    parents: List[Any] = []
 
-    # Create all nodes
-    for item in data:
+    # Collect one merged record per identifier, in first-seen order
+    for item in _iter_records(data):
         child_id = item.get(child_col)
-        if not child_id:
+        if _is_blank(child_id):
             continue
+        position = positions.get(child_id)
+        if position is None:
+            positions[child_id] = len(properties)
+            properties.append(dict(item))
+            parents.append(item.get(parent_col) if parent_col else None)
+        else:
+            properties[position].update(item)
+            parents[position] = item.get(parent_col) if parent_col else None
+
+    if not properties:
+        return []
 
-        node_name = item.get(name_col) if name_col else child_id
+    # Parent row of each row, then a stable sort groups siblings in input order
+    parent_codes = np.fromiter(
+        (_ROOT if _is_blank(p) else positions.get(p, _ORPHAN) for p in parents),
+        dtype=np.int64,
+        count=len(parents),
+    )
+    order = np.argsort(parent_codes, kind="stable")
+    sorted_codes = parent_codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    ends = np.r_[starts[1:], len(order)]
 
-        if child_id not in nodes:
-            nodes[child_id] = Node(name=node_name, properties=item)
+    names = [_node_name(props, child_col, name_col) for props in properties]
+    nodes = _new_nodes(names, properties)
+
+    root_nodes: List[Node] = []
+    order_list = order.tolist()
+    for code, start, end in zip(sorted_codes[starts].tolist(), starts.tolist(), ends.tolist()):
+        if code == _ORPHAN:
+            continue  # parent not in the data
+        members = [nodes[i] for i in order_list[start:end]]
+        if code == _ROOT:
+            root_nodes = members
         else:
-            nodes[child_id].properties.update(item)
+            nodes[code].children.extend(members)
 
-    # Build the hierarchy
-    for item in data:
-        child_id = item.get(child_col)
-        parent_id = item.get(parent_col)
+    return root_nodes
+
+
+def _uuid4_strings(count: int) -> List[str]:
+    """Generates ``count`` random (version 4) UUID strings from one block of random bytes."""
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.tobytes().hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
 
-        if not child_id:
+
+def _field_defaults() -> Tuple[Dict[str, Any], List[Tuple[str, Callable[[], Any]]]]:
+    """
+    Reads the defaults of the Node fields.
+
+    Returns:
+        The field values shared by every new node (in field order), and a
+        factory per field that needs a fresh value for each node.
+    """
+    shared: Dict[str, Any] = {}
+    fresh: List[Tuple[str, Callable[[], Any]]] = []
+    for field_name, field in Node.model_fields.items():
+        if field.is_required() and field_name != "name":
+            continue  # left unset, as model_construct does
+        shared[field_name] = None  # placeholder keeping the field order
+        if field_name in ("id", "name", "properties"):
             continue
+        default = field.default
+        if field.default_factory is not None:
+            fresh.append((field_name, field.default_factory))
+        elif type(default) in (list, dict, set) and not default:
+            fresh.append((field_name, type(default)))
+        elif isinstance(default, (list, dict, set)):
+            fresh.append((field_name, lambda f=field: f.get_default(call_default_factory=True)))
+        else:
+            shared[field_name] = default
+    return shared, fresh
 
-        node = nodes[child_id]
 
-        if parent_id and parent_id in nodes:
-            parent_node = nodes[parent_id]
-            parent_node.children.append(node)
-        elif not parent_id:
-            root_nodes.append(node)
+def _new_nodes(names: List[str], properties: List[Dict[str, Any]]) -> List[Node]:
+    """
+    Creates nodes without validation, in bulk.
+
+    Equivalent to ``Node(name=name, properties=props)`` for already-clean
+    values: the remaining fields get their declared defaults (fresh copies
+    of mutable ones), but pydantic validation and the per-call overhead of
+    ``model_construct`` are skipped, as they dominate for large hierarchies.
+    """
+    shared, fresh = _field_defaults()
+    new = Node.__new__
+    set_attr = object.__setattr__
+    nodes = []
+    for node_id, name, props in zip(_uuid4_strings(len(names)), names, properties):
+        state = dict(shared)
+        state["id"] = node_id
+        state["name"] = name
+        state["properties"] = props
+        for field_name, factory in fresh:
+            state[field_name] = factory()
+        node = new(Node)
+        set_attr(node, "__dict__", state)
+        set_attr(node, "__pydantic_fields_set__", {"name", "properties"})
+        set_attr(node, "__pydantic_extra__", None)
+        set_attr(node, "__pydantic_private__", None)
+        nodes.append(node)
+    return nodes
 
-    return root_nodes
+
+def _node_name(properties: Dict[str, Any], child_col: str, name_col: Optional[str]) -> str:
+    name = properties.get(name_col) if name_col else None
+    if name is None:
+        name = properties[child_col]
+    return name if isinstance(name, str) else str(name)
 
 
 def sort_nodes(nodes: List[Node], sort_by: str, reverse: bool = False):
@@ -64,10 +205,13 @@ def sort_nodes(nodes: List[Node], sort_by: str, reverse: bool = False):
         sort_by: The key in the node's properties to sort by.
         reverse: Whether to sort in descending order.
     """
-    for node in nodes:
-        if node.children:
-            node.children.sort(
-                key=lambda n: n.properties.get(sort_by), reverse=reverse
-            )
-            sort_nodes(node.children, sort_by, reverse)
-    nodes.sort(key=lambda n: n.properties.get(sort_by), reverse=reverse)
+    def key(n: Node) -> Any:
+        return n.properties.get(sort_by)
+
+    nodes.sort(key=key, reverse=reverse)
+    stack = [nodes]
+    while stack:
+        for node in stack.pop():
+            if node.children:
+                node.children.sort(key=key, reverse=reverse)
+                stack.append(node.children)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set
+
+if TYPE_CHECKING:
+    from .models import Node
+
+
+class NodeIndex:
+    """
+    An id -> node and child -> parent index over a forest of nodes.
+
+    Built in one iterative pass, so lookups of a node, its parent or its
+    ancestors no longer need to search the tree from every root.
+    """
+
+    def __init__(self, root_nodes: List[Node]):
+        """
+        Builds the index.
+
+        Args:
+            root_nodes: The root nodes of the hierarchy.
+        """
+        self.root_nodes = root_nodes
+        self.nodes: Dict[str, Node] = {}
+        self.parents: Dict[str, Optional[Node]] = {}
+        # Position of each node in its parent's child list (or in root_nodes)
+        self.positions: Dict[str, int] = {}
+        # Preorder (parents before children); used by top-down bulk passes
+        self.order: List[Node] = []
+
+        stack = [(node, None, i) for i, node in reversed(list(enumerate(root_nodes)))]
+        while stack:
+            node, parent, position = stack.pop()
+            self.nodes[node.id] = node
+            self.parents[node.id] = parent
+            self.positions[node.id] = position
+            self.order.append(node)
+            stack.extend((child, node, i) for i, child in reversed(list(enumerate(node.children))))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.nodes
+
+    def get(self, node_id: str) -> Optional[Node]:
+        """Returns the node with the given id, or None."""
+        return self.nodes.get(node_id)
+
+    def parent_of(self, node: Node) -> Optional[Node]:
+        """Returns the parent of a node (None for roots and unknown nodes)."""
+        return self.parents.get(node.id)
+
+    def ancestors(self, node: Node) -> Iterator[Node]:
+        """Yields the parent, grandparent, ... of a node, nearest first."""
+        parent = self.parents.get(node.id)
+        while parent is not None:
+            yield parent
+            parent = self.parents.get(parent.id)
+
+    def is_current(self, node: Node) -> bool:
+        """
+        Checks that the indexed position of a node still matches the tree.
+
+        This is a constant-time spot check used before trusting the index for
+        a node: the node must still sit at its indexed position in its
+        parent's child list. It catches nodes that were moved or removed
+        (and reports siblings shifted by an insertion as stale too).
+        """
+        if self.nodes.get(node.id) is not node:
+            return False
+        parent = self.parents.get(node.id)
+        siblings = parent.children if parent is not None else self.root_nodes
+        position = self.positions[node.id]
+        return position < len(siblings) and siblings[position] is node
+
+    def is_attached(self, node: Node, verified: Optional[Set[str]] = None) -> bool:
+        """
+        Checks that a node and each of its ancestors are current, i.e. the
+        node is still reachable from the roots where the index put it.
+
+        Args:
+            node: The node to check.
+            verified: Ids already known to be attached. Checked ids are added,
+                      so a caller checking many nodes walks each chain once.
+        """
+        chain = []
+        current: Optional[Node] = node
+        while current is not None and (verified is None or current.id not in verified):
+            if not self.is_current(current):
+                return False
+            chain.append(current.id)
+            current = self.parents.get(current.id)
+        if verified is not None:
+            verified.update(chain)
+        return True
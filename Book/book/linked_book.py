@@ -1,5 +1,5 @@
 from .models import Book, Node
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Optional, Set, Tuple
 from pydantic import BaseModel
 
 class Delta(BaseModel):
@@ -13,45 +13,37 @@ class Delta(BaseModel):
 class LinkedBook:
     """
     Represents a linked book that stores changes as deltas from a base book.
+
+    Every change is appended to ``deltas``, the ordered change log used for
+    auditing, and indexed by (node_id, key) so reads never scan the log.
+    compact() drops superseded deltas once their history is no longer needed.
     """
     def __init__(self, base_book: Book):
         self.base_book = base_book
         self.deltas: List[Delta] = []
+        # (node_id, key) -> latest delta for that property
+        self._latest: Dict[Tuple[str, str], Delta] = {}
         self._node_cache: Dict[str, Node] = self._build_node_cache(base_book)
 
     def _build_node_cache(self, book: Book) -> Dict[str, Node]:
         """Builds a cache of nodes for quick access."""
-        cache = {}
-        all_nodes = self._get_all_nodes(book.root_nodes)
-        for node in all_nodes:
-            cache[node.id] = node
-        return cache
-
-    def _get_all_nodes(self, nodes: List[Node]) -> List[Node]:
-        """Recursively gets all nodes in a list of nodes."""
-        all_nodes = []
-        for node in nodes:
-            all_nodes.append(node)
-            all_nodes.extend(self._get_all_nodes(node.children))
-        return all_nodes
+        return dict(book.node_index().nodes)
 
     def add_change(self, node_id: str, key: str, new_value: Any):
         """
         Adds a change to the linked book.
         """
-        # For simplicity, we just append the delta. A more robust implementation
-        # would check for existing deltas for the same node and key.
         delta = Delta(node_id=node_id, key=key, new_value=new_value)
         self.deltas.append(delta)
+        self._latest[(node_id, key)] = delta
 
     def get_property(self, node_id: str, key: str) -> Any:
         """
         Gets a property value, checking the deltas first, then the base book.
         """
-        # Check deltas in reverse order to get the latest change
-        for delta in reversed(self.deltas):
-            if delta.node_id == node_id and delta.key == key:
-                return delta.new_value
+        delta = self._latest.get((node_id, key))
+        if delta is not None:
+            return delta.new_value
 
         # If not in deltas, get from the base book
         node = self._node_cache.get(node_id)
@@ -60,20 +52,110 @@ class LinkedBook:
 
         return node.properties.get(key)
 
-    def to_book(self, new_book_name: str) -> Book:
+    def get_changes(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the effective changes as node_id -> {key: latest value}.
+        """
+        changes: Dict[str, Dict[str, Any]] = {}
+        for (node_id, key), delta in self._latest.items():
+            changes.setdefault(node_id, {})[key] = delta.new_value
+        return changes
+
+    def get_history(self, node_id: str, key: Optional[str] = None) -> List[Delta]:
+        """
+        Returns the logged deltas for a node (optionally a single key), oldest first.
+        """
+        return [
+            delta for delta in self.deltas
+            if delta.node_id == node_id and (key is None or delta.key == key)
+        ]
+
+    def compact(self, drop_unchanged: bool = False) -> int:
+        """
+        Removes superseded deltas from the change log, keeping the latest
+        delta per (node_id, key) in log order.
+
+        Args:
+            drop_unchanged: Also drop deltas whose value equals the base book value.
+
+        Returns:
+            The number of deltas removed.
+        """
+        latest = self._latest
+        kept = [delta for delta in self.deltas if latest.get((delta.node_id, delta.key)) is delta]
+        if drop_unchanged:
+            unset = object()
+            unchanged = []
+            for delta in kept:
+                node = self._node_cache.get(delta.node_id)
+                if node is not None and node.properties.get(delta.key, unset) == delta.new_value:
+                    unchanged.append(delta)
+                    del latest[(delta.node_id, delta.key)]
+            if unchanged:
+                kept = [delta for delta in kept if latest.get((delta.node_id, delta.key)) is delta]
+        removed = len(self.deltas) - len(kept)
+        self.deltas = kept
+        return removed
+
+    def to_book(self, new_book_name: str, deep_copy: bool = True) -> Book:
         """
         Applies the deltas to the base book and returns a new, independent Book object.
+
+        Pass deep_copy=False to clone only the nodes touched by deltas (and
+        their ancestors, whose child lists change) and share untouched
+        subtrees with the base book. The result must then be treated as
+        read-only: changing a shared node changes the base book too.
         """
-        # Deep copy the base book to avoid modifying it
-        new_book = self.base_book.model_copy(deep=True)
-        new_book.name = new_book_name
-        
-        # Re-build the node cache for the new book
-        new_node_cache = self._build_node_cache(new_book)
-
-        for delta in self.deltas:
-            if delta.node_id in new_node_cache:
-                node = new_node_cache[delta.node_id]
-                node.properties[delta.key] = delta.new_value
-        
-        return new_book
+        if deep_copy:
+            new_book = self.base_book.model_copy(deep=True)
+            new_book.name = new_book_name
+            new_node_cache = self._build_node_cache(new_book)
+            for (node_id, key), delta in self._latest.items():
+                if node_id in new_node_cache:
+                    new_node_cache[node_id].properties[key] = delta.new_value
+            return new_book
+
+        changes = self.get_changes()
+        for attempt in range(2):
+            index = self.base_book.node_index()
+            to_clone: Set[str] = set()
+            indexed = 0  # changes for nodes known to the index; others are not in the book
+            for node_id in changes:
+                node = index.get(node_id)
+                if node is None:
+                    continue
+                indexed += 1
+                to_clone.add(node_id)
+                for ancestor in index.ancestors(node):
+                    if ancestor.id in to_clone:
+                        break
+                    to_clone.add(ancestor.id)
+
+            applied: Set[str] = set()
+
+            def clone(node: Node) -> Node:
+                if node.id not in to_clone:
+                    return node
+                properties = dict(node.properties)
+                if node.id in changes:
+                    properties.update(changes[node.id])
+                    applied.add(node.id)
+                return node.model_copy(update={
+                    "properties": properties,
+                    "children": [clone(child) for child in node.children],
+                    "flags": dict(node.flags),
+                    "formulas": list(node.formulas),
+                })
+
+            root_nodes = [clone(node) for node in self.base_book.root_nodes]
+            if len(applied) == indexed or attempt:
+                break
+            # Some indexed nodes were not reached: the base book changed since it was indexed
+            self.base_book.invalidate_index()
+
+        return self.base_book.model_copy(update={
+            "name": new_book_name,
+            "root_nodes": root_nodes,
+            "metadata": dict(self.base_book.metadata),
+            "global_properties": dict(self.base_book.global_properties),
+        })
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import uuid
 from datetime import datetime, timezone
 from .formulas import Formula
+from .index import NodeIndex
 
 class Node(BaseModel):
     """
@@ -31,5 +32,75 @@ class Book(BaseModel):
     metadata: Dict[str, Any] = {}
     global_properties: Dict[str, Any] = {}
 
+    _index: Optional[NodeIndex] = PrivateAttr(default=None)
+
+    def node_index(self) -> NodeIndex:
+        """
+        Returns the id -> node and child -> parent index of this book.
+
+        The index is built on first use and rebuilt when the root node list
+        is replaced or invalidate_index() is called. Lookups through the
+        Book methods below also detect nodes that were added, moved or
+        removed and rebuild the index when needed.
+        """
+        index = self._index
+        if index is None or index.root_nodes is not self.root_nodes:
+            index = self._index = NodeIndex(self.root_nodes)
+        return index
+
+    def invalidate_index(self):
+        """Marks the node index stale after structural changes."""
+        self._index = None
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        """
+        Finds a node by id.
+
+        Args:
+            node_id: The id of the node.
+
+        Returns:
+            The node, or None if it is not in the book.
+        """
+        index = self.node_index()
+        node = index.get(node_id)
+        if node is None or not index.is_attached(node):
+            self.invalidate_index()
+            node = self.node_index().get(node_id)
+        return node
+
+    def get_parent(self, node: Node) -> Optional[Node]:
+        """
+        Finds the parent of a node.
+
+        Args:
+            node: The node.
+
+        Returns:
+            The parent node, or None for root nodes and nodes not in the book.
+        """
+        index = self.node_index()
+        if not index.is_current(node):
+            self.invalidate_index()
+            index = self.node_index()
+        return index.parent_of(node)
+
+    def get_ancestors(self, node: Node) -> List[Node]:
+        """
+        Returns the ancestors of a node, nearest first.
+
+        Args:
+            node: The node.
+
+        Returns:
+            The parent, grandparent, ... up to the root.
+        """
+        index = self.node_index()
+        chain = [node] + list(index.ancestors(node))
+        if not all(index.is_current(n) for n in chain):
+            self.invalidate_index()
+            chain = [node] + list(self.node_index().ancestors(node))
+        return chain[1:]
+
 # Update forward reference
 Node.model_rebuild()
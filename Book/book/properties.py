@@ -1,5 +1,6 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from .models import Node, Book
+from .index import NodeIndex
 
 def get_property(node: Node, book: Book, key: str) -> Any:
     """
@@ -64,46 +65,141 @@ def remove_property(node: Node, key: str):
 
 def propagate_to_children(node: Node, key: str, value: Any):
     """
-    Recursively propagates a property to all children of a node.
+    Propagates a property to a node and all of its descendants.
+
+    Every node is visited exactly once, without recursion, so deep
+    hierarchies do not hit the interpreter's recursion limit.
 
     Args:
         node: The starting node.
         key: The key of the property.
         value: The value of the property.
     """
-    add_property(node, key, value)
-    for child in node.children:
-        add_property(child, key, value)
-        propagate_to_children(child, key, value)
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        add_property(current, key, value)
+        stack.extend(current.children)
 
-def _find_parent(target_node: Node, current_node: Node) -> Optional[Node]:
-    """Helper function to find the parent of a node."""
-    for child in current_node.children:
-        if child.id == target_node.id:
-            return current_node
-        parent = _find_parent(target_node, child)
-        if parent:
-            return parent
-    return None
-
-def propagate_to_parents(node: Node, key: str, value: Any, root_nodes: List[Node]):
+def propagate_to_parents(node: Node, key: str, value: Any, root_nodes: Union[List[Node], Book]):
     """
-    Propagates a property to all parents of a node.
+    Propagates a property to a node and all of its parents.
 
     Args:
         node: The starting node.
         key: The key of the property.
         value: The value of the property.
-        root_nodes: The list of all root nodes in the book.
+        root_nodes: The list of all root nodes in the book, or the book itself.
+                    Passing the book reuses its node index across calls.
     """
-    add_property(node, key, value)
-    parent = None
-    for root_node in root_nodes:
-        parent = _find_parent(node, root_node)
-        if parent:
-            break
+    if isinstance(root_nodes, Book):
+        ancestors = root_nodes.get_ancestors(node)
+    else:
+        ancestors = list(NodeIndex(root_nodes).ancestors(node))
 
-    if parent:
+    add_property(node, key, value)
+    for parent in ancestors:
         add_property(parent, key, value)
-        propagate_to_parents(parent, key, value, root_nodes)
 
+def _resolve_nodes(book: Book, node_ids: Iterable[str]) -> List[Node]:
+    """Looks up nodes by id, rebuilding the book's index once if it is stale."""
+    index = book.node_index()
+    attached: Set[str] = set()
+    nodes = []
+    for node_id in node_ids:
+        node = index.get(node_id)
+        if node is None or not index.is_attached(node, attached):
+            node = book.get_node(node_id)
+            if book.node_index() is not index:
+                index = book.node_index()
+                attached.clear()
+        if node is not None:
+            nodes.append(node)
+    return nodes
+
+def propagate_to_descendants_bulk(book: Book, node_ids: Iterable[str], key: str, value: Any) -> int:
+    """
+    Propagates a property from several nodes to all of their descendants.
+
+    Subtrees shared by several starting nodes are only visited once, so the
+    cost is linear in the size of the book.
+
+    Args:
+        book: The book containing the nodes.
+        node_ids: The ids of the starting nodes.
+        key: The key of the property.
+        value: The value of the property.
+
+    Returns:
+        The number of nodes that were updated.
+    """
+    visited: Set[str] = set()
+    stack = _resolve_nodes(book, node_ids)
+    while stack:
+        current = stack.pop()
+        if current.id in visited:
+            continue
+        visited.add(current.id)
+        add_property(current, key, value)
+        stack.extend(current.children)
+    return len(visited)
+
+def propagate_to_ancestors_bulk(book: Book, node_ids: Iterable[str], key: str, value: Any) -> int:
+    """
+    Propagates a property from several nodes to all of their ancestors.
+
+    Each upward walk stops at the first ancestor already updated by this
+    call, so the cost is linear in the size of the book.
+
+    Args:
+        book: The book containing the nodes.
+        node_ids: The ids of the starting nodes.
+        key: The key of the property.
+        value: The value of the property.
+
+    Returns:
+        The number of nodes that were updated.
+    """
+    nodes = _resolve_nodes(book, node_ids)
+    index = book.node_index()
+    visited: Set[str] = set()
+    for node in nodes:
+        current: Optional[Node] = node
+        while current is not None and current.id not in visited:
+            visited.add(current.id)
+            add_property(current, key, value)
+            current = index.parent_of(current)
+    return len(visited)
+
+def inherit_properties(book: Book, keys: Optional[Iterable[str]] = None, overwrite: bool = False) -> int:
+    """
+    Pushes properties down the hierarchy so every node inherits the values
+    of its ancestors, in a single top-down pass over the book's node index.
+
+    Args:
+        book: The book to update.
+        keys: The property keys to inherit. Defaults to all keys.
+        overwrite: Whether inherited values replace values already set on
+                   a descendant. By default the nearest value wins.
+
+    Returns:
+        The number of property values that were set.
+    """
+    key_filter = set(keys) if keys is not None else None
+    index = book.node_index()
+    inherited: Dict[str, Dict[str, Any]] = {}
+    updates = 0
+
+    # Preorder guarantees a parent's effective properties are known first
+    for node in index.order:
+        parent = index.parent_of(node)
+        from_parent = inherited.get(parent.id, {}) if parent is not None else {}
+        for key, value in from_parent.items():
+            if overwrite or key not in node.properties:
+                node.properties[key] = value
+                updates += 1
+        if node.children:
+            inherited[node.id] = node.properties if key_filter is None else {
+                k: v for k, v in node.properties.items() if k in key_filter
+            }
+    return updates
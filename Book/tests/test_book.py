@@ -4,12 +4,16 @@ import networkx as nx
 import chromadb
 from book.models import Book, Node
 from book.hierarchy import from_list, sort_nodes
+from book.connectors import iter_csv
 from book.properties import (
     add_property,
     update_property,
     remove_property,
     propagate_to_children,
     propagate_to_parents,
+    propagate_to_descendants_bulk,
+    propagate_to_ancestors_bulk,
+    inherit_properties,
     get_property,
 )
 from book.actions import (
@@ -26,7 +30,14 @@ from book.vector_db import (
     get_node_text_representation,
 )
 from book.formulas import Formula
-from book.formula_engine import execute_formulas
+from book.linked_book import LinkedBook
+from book.formula_engine import (
+    execute_formulas,
+    execute_formulas_bulk,
+    compile_formula,
+    FormulaEvaluator,
+    FormulaError,
+)
 
 # Sample Data for hierarchy tests
 sample_csv_data = [
@@ -92,6 +103,44 @@ class TestHierarchy:
         assert node_a.children[0].name == "C"
         assert node_a.children[1].name == "B"
 
+    def test_from_list_orphans_and_duplicates(self):
+        data = sample_csv_data + [
+            {"id": "6", "name": "F", "parent_id": "missing", "value": "60"},
+            {"id": "3", "name": "C2", "parent_id": "2", "value": "31"},
+        ]
+        root_nodes = from_list(data, "parent_id", "id", name_col="name")
+        node_a, node_e = root_nodes
+        node_b = node_a.children[0]
+        assert [n.name for n in node_a.children] == ["B"]
+        assert [n.name for n in node_b.children] == ["C2", "D"]
+        assert node_b.children[0].properties["value"] == "31"
+        assert node_e.name == "E"
+        # Properties are copies of the input records
+        assert node_a.properties is not sample_csv_data[0]
+
+    def test_from_list_nodes_match_validated_nodes(self):
+        import gc
+
+        node_a, node_e = from_list(sample_csv_data, "parent_id", "id", name_col="name", pause_gc=True)
+        assert gc.isenabled()
+
+        expected = Node(name="E", properties=dict(sample_csv_data[4]))
+        assert node_e.model_dump(exclude={"id"}) == expected.model_dump(exclude={"id"})
+        assert node_e.model_fields_set == {"name", "properties"}
+        # Mutable defaults are not shared between nodes
+        assert node_e.flags is not node_a.flags and node_e.formulas is not node_a.formulas
+
+    def test_from_list_streams_csv(self, tmp_path):
+        path = tmp_path / "hierarchy.csv"
+        rows = ["id,name,parent_id,value"] + [
+            f"{r['id']},{r['name']},{r['parent_id'] or ''},{r['value']}" for r in sample_csv_data
+        ]
+        path.write_text("\n".join(rows) + "\n")
+
+        root_nodes = from_list(iter_csv(str(path)), "parent_id", "id", name_col="name")
+        assert [n.name for n in root_nodes] == ["A", "E"]
+        assert root_nodes[0].children[0].children[0].name == "D"
+
 class TestProperties:
     def test_add_update_remove_property(self, sample_book):
         node_a = sample_book.root_nodes[0]
@@ -140,6 +189,91 @@ class TestProperties:
         with pytest.raises(KeyError):
             get_property(node_child, book_with_global, "non_existent")
 
+class TestNodeIndex:
+    def test_lookups_follow_structural_changes(self, sample_book):
+        node_a, node_e = sample_book.root_nodes
+        node_b, node_c = node_a.children
+        node_d = node_b.children[0]
+
+        assert sample_book.get_node(node_d.id) is node_d
+        assert sample_book.get_parent(node_d) is node_b
+        assert sample_book.get_parent(node_a) is None
+        assert [n.name for n in sample_book.get_ancestors(node_d)] == ["B", "A"]
+
+        # Move D under E and add a new child without telling the book
+        node_b.children.remove(node_d)
+        node_e.children.append(node_d)
+        node_f = Node(name="F")
+        node_c.children.append(node_f)
+
+        assert sample_book.get_parent(node_d) is node_e
+        assert [n.name for n in sample_book.get_ancestors(node_f)] == ["C", "A"]
+        assert sample_book.get_node(node_f.id) is node_f
+
+        node_c.children.clear()
+        assert sample_book.get_node(node_f.id) is None
+
+    def test_detached_subtrees_are_not_found(self, sample_book):
+        node_a = sample_book.root_nodes[0]
+        node_b = node_a.children[0]
+        node_d = node_b.children[0]
+        index = sample_book.node_index()
+        assert index.is_attached(node_d)
+
+        # Detaching B leaves D at its indexed position under B
+        node_a.children.remove(node_b)
+        assert index.is_current(node_d)
+        assert not index.is_attached(node_d)
+        assert sample_book.get_node(node_d.id) is None
+        assert propagate_to_descendants_bulk(sample_book, [node_d.id], "flag", 1) == 0
+
+    def test_propagate_to_parents_with_book_index(self, sample_book):
+        node_d = sample_book.root_nodes[0].children[0].children[0]
+        propagate_to_parents(node_d, "ancestor_prop", "val", sample_book)
+        assert [n.name for n in sample_book.node_index().order if "ancestor_prop" in n.properties] == ["A", "B", "D"]
+
+    def test_bulk_propagation(self, sample_book):
+        node_a, node_e = sample_book.root_nodes
+        node_b, node_c = node_a.children
+        node_d = node_b.children[0]
+
+        assert propagate_to_ancestors_bulk(sample_book, [node_d.id, node_c.id, "missing"], "up", 1) == 4
+        assert "up" not in node_e.properties
+
+        assert propagate_to_descendants_bulk(sample_book, [node_a.id, node_b.id], "down", 2) == 4
+        assert node_d.properties["down"] == 2 and "down" not in node_e.properties
+
+    def test_inherit_properties(self, sample_book):
+        node_a = sample_book.root_nodes[0]
+        node_b, node_c = node_a.children
+        node_d = node_b.children[0]
+        node_a.properties["region"] = "EMEA"
+        node_b.properties["region"] = "UK"
+
+        inherit_properties(sample_book, keys=["region"])
+        assert node_c.properties["region"] == "EMEA"
+        assert node_d.properties["region"] == "UK"
+        assert node_d.properties["value"] == 40
+        assert "region" not in sample_book.root_nodes[1].properties
+
+        inherit_properties(sample_book, keys=["value"], overwrite=True)
+        assert node_d.properties["value"] == 10
+
+    def test_deep_hierarchy(self):
+        root = Node(name="0")
+        current = root
+        for i in range(1, 5000):
+            child = Node(name=str(i))
+            current.children.append(child)
+            current = child
+        book = Book(name="Deep", root_nodes=[root])
+
+        propagate_to_children(root, "down", True)
+        propagate_to_parents(current, "up", True, book)
+        assert current.properties["down"] is True
+        assert root.properties["up"] is True
+        assert len(book.get_ancestors(current)) == 4999
+
 class TestActions:
     def test_python_function(self, sample_book):
         node = sample_book.root_nodes[0] # Node A
@@ -227,3 +361,147 @@ class TestFormulas:
 
         execute_formulas(node_a, sample_book)
         assert node_a.properties["gross_margin"] == 0.4
+
+    def test_compile_formula_rejects_unsafe_syntax(self):
+        assert compile_formula("(a - b) / a") is compile_formula("(a - b) / a")
+        with pytest.raises(FormulaError):
+            compile_formula("__import__('os').getcwd()")
+        with pytest.raises(FormulaError):
+            compile_formula("a.__class__")
+
+    def test_execute_formulas_dependency_order(self, sample_book):
+        node_a = sample_book.root_nodes[0]
+        add_property(node_a, "revenue", 100)
+        add_property(node_a, "cogs", 60)
+        node_a.formulas.append(Formula(name="margin_pct", expression="margin * 100 / revenue", operands=["margin", "revenue"]))
+        node_a.formulas.append(Formula(name="margin", expression="revenue - cogs", operands=["revenue", "cogs"]))
+
+        execute_formulas(node_a, sample_book)
+        assert node_a.properties["margin"] == 40
+        assert node_a.properties["margin_pct"] == 40.0
+
+    def test_execute_formulas_bulk_matches_per_node(self):
+        values = [(100, 60), (50, 50.5), (0, 10), (7, 2), ("x", 1)]
+        nodes = []
+        for i, (revenue, cogs) in enumerate(values):
+            node = Node(name=f"N{i}", properties={"revenue": revenue, "cogs": cogs})
+            node.formulas.append(Formula(name="ratio", expression="(revenue - cogs) / revenue", operands=["revenue", "cogs"]))
+            node.formulas.append(Formula(name="floor", expression="revenue // cogs", operands=["revenue", "cogs"]))
+            nodes.append(node)
+        book = Book(name="Bulk", root_nodes=nodes)
+
+        assert execute_formulas_bulk(book) == 10
+        for node in nodes:
+            expected = Node(name=node.name, properties={"revenue": node.properties["revenue"], "cogs": node.properties["cogs"]}, formulas=node.formulas)
+            execute_formulas(expected, book)
+            assert node.properties == expected.properties
+            for key, value in expected.properties.items():
+                assert type(node.properties[key]) is type(value)
+        # Division by zero is skipped exactly like the per-node path
+        assert "ratio" not in nodes[2].properties
+
+    def test_execute_formulas_bulk_keeps_int_and_float_results_apart(self):
+        values = [(1, 2.5), (3, 0.5), (10 ** 6, 1e6)]
+        formulas = [
+            Formula(name="low", expression="min(a, b)", operands=["a", "b"]),
+            Formula(name="high", expression="max(b, 0)", operands=["b"]),
+            Formula(name="big", expression="a + 100000000000000000000", operands=["a"]),
+            Formula(name="scaled", expression="a * 4503599627370496", operands=["a"]),
+            Formula(name="square", expression="a ** 2", operands=["a"]),
+            Formula(name="huge", expression="2 ** 100", operands=[]),
+            Formula(name="half", expression="b ** 0.5", operands=["b"]),
+        ]
+        nodes = [Node(name=f"N{i}", properties={"a": a, "b": b}, formulas=list(formulas)) for i, (a, b) in enumerate(values)]
+        book = Book(name="Kinds", root_nodes=nodes)
+
+        execute_formulas_bulk(book)
+        for node, (a, b) in zip(nodes, values):
+            expected = Node(name=node.name, properties={"a": a, "b": b}, formulas=list(formulas))
+            execute_formulas(expected, book)
+            assert node.properties == expected.properties
+            for key, value in expected.properties.items():
+                assert type(node.properties[key]) is type(value)
+        assert nodes[0].properties["low"] == 1 and type(nodes[0].properties["low"]) is int
+        assert nodes[0].properties["big"] == 100000000000000000001
+        assert nodes[1].properties["square"] == 9 and type(nodes[1].properties["square"]) is int
+        assert nodes[0].properties["huge"] == 2 ** 100
+
+    def test_execute_formulas_bulk_skips_undeclared_names(self, capsys):
+        nodes = [Node(name=f"N{i}", properties={"a": i, "b": 1}) for i in range(3)]
+        for node in nodes:
+            node.formulas.append(Formula(name="total", expression="a + b", operands=["a"]))
+            node.formulas.append(Formula(name="double", expression="a * 2", operands=["a"]))
+        book = Book(name="Undeclared", root_nodes=nodes)
+
+        assert execute_formulas_bulk(book) == 6
+        assert all("total" not in node.properties for node in nodes)
+        assert [node.properties["double"] for node in nodes] == [0, 2, 4]
+        assert "Error executing formula 'total' on node 'N0'" in capsys.readouterr().out
+
+    def test_formula_evaluator_incremental(self):
+        nodes = [Node(name=f"N{i}", properties={"a": i, "b": 2}) for i in range(5)]
+        for node in nodes:
+            node.formulas.append(Formula(name="c", expression="a * b", operands=["a", "b"]))
+            node.formulas.append(Formula(name="d", expression="c + 1", operands=["c"]))
+        book = Book(name="Incremental", root_nodes=nodes)
+        evaluator = FormulaEvaluator(book)
+
+        assert evaluator.evaluate() == 10
+        assert evaluator.evaluate() == 0
+        update_property(nodes[3], "a", 10)
+        assert evaluator.evaluate() == 2
+        assert nodes[3].properties["d"] == 21
+        assert [n.properties["d"] for n in nodes] == [1, 3, 5, 21, 9]
+
+
+class TestLinkedBook:
+    def test_get_property_uses_latest_change(self, sample_book):
+        node_b = sample_book.root_nodes[0].children[0]
+        linked = LinkedBook(base_book=sample_book)
+        linked.add_change(node_b.id, "value", 21)
+        linked.add_change(node_b.id, "value", 22)
+
+        assert linked.get_property(node_b.id, "value") == 22
+        assert linked.get_property(sample_book.root_nodes[1].id, "value") == 50
+        assert [d.new_value for d in linked.get_history(node_b.id, "value")] == [21, 22]
+        with pytest.raises(KeyError):
+            linked.get_property("missing", "value")
+
+    def test_compact(self, sample_book):
+        node_a = sample_book.root_nodes[0]
+        node_e = sample_book.root_nodes[1]
+        linked = LinkedBook(base_book=sample_book)
+        linked.add_change(node_a.id, "value", 11)
+        linked.add_change(node_e.id, "value", 50)
+        linked.add_change(node_a.id, "value", 12)
+
+        assert linked.compact() == 1
+        assert [(d.node_id, d.new_value) for d in linked.deltas] == [(node_e.id, 50), (node_a.id, 12)]
+        assert linked.compact(drop_unchanged=True) == 1
+        assert linked.get_changes() == {node_a.id: {"value": 12}}
+
+    def test_to_book_copy_on_write(self, sample_book):
+        node_a = sample_book.root_nodes[0]
+        node_b, node_c = node_a.children
+        node_d = node_b.children[0]
+        linked = LinkedBook(base_book=sample_book)
+        linked.add_change(node_d.id, "value", 41)
+
+        linked.add_change("not-in-book", "value", 1)
+        index = sample_book.node_index()
+
+        new_book = linked.to_book("Scenario", deep_copy=False)
+        assert sample_book.node_index() is index  # unknown ids do not force a rebuild
+        new_a = new_book.root_nodes[0]
+        new_b, new_c = new_a.children
+        assert new_book.name == "Scenario"
+        assert new_b.children[0].properties["value"] == 41
+        assert node_d.properties["value"] == 40
+        # Only the changed node and its ancestors are cloned
+        assert new_a is not node_a and new_b is not node_b
+        assert new_c is node_c
+        assert new_book.root_nodes[1] is sample_book.root_nodes[1]
+
+        independent = linked.to_book("Copy")
+        assert independent.root_nodes[0].children[0].children[0].properties["value"] == 41
+        assert independent.root_nodes[1] is not sample_book.root_nodes[1]
@@ -9,9 +9,11 @@ from databridge_core.audit.logger import (
     get_audit_logger,
     log_action,
 )
+from databridge_core.audit.writer import AuditWriter
 
 __all__ = [
     "AuditLogger",
+    "AuditWriter",
     "get_audit_logger",
     "log_action",
 ]
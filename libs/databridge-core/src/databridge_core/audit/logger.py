@@ -6,6 +6,7 @@ across both Librarian and Researcher applications.
 """
 
 import csv
+import io
 import json
 from datetime import datetime, timezone
 from pathlib import Path
@@ -13,6 +14,8 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
 import threading
 
+from databridge_core.audit.writer import FSYNC_BATCH, get_audit_writer
+
 
 @dataclass
 class AuditEntry:
@@ -35,15 +38,32 @@ class AuditLogger:
     """
     Audit trail logger.
 
-    Logs actions to both a CSV file (for easy analysis) and optionally
-    to a database table.
+    Logs actions to a CSV file (for easy analysis). Entries are queued and
+    written by a background AuditWriter, which also rotates and compresses
+    old files; recent entries are read from the end of the file.
     """
 
+    COLUMNS = [
+        "timestamp",
+        "action",
+        "entity_type",
+        "entity_id",
+        "user_id",
+        "source",
+        "details",
+        "ip_address",
+    ]
+
     def __init__(
         self,
         log_path: Path,
         source: str = "mcp",
         buffer_size: int = 10,
+        flush_interval: float = 0.5,
+        fsync_policy: str = FSYNC_BATCH,
+        max_bytes: int = 10 * 1024 * 1024,
+        rotate_interval: Optional[float] = None,
+        backup_count: int = 10,
     ):
         """
         Initialize the audit logger.
@@ -52,12 +72,14 @@ class AuditLogger:
             log_path: Path to the audit log CSV file.
             source: Default source identifier (e.g., "mcp", "cli", "api").
             buffer_size: Number of entries to buffer before flushing.
+            flush_interval: Maximum seconds an entry stays buffered.
+            fsync_policy: "never", "batch" or "always".
+            max_bytes: Rotate the file at this size (0 disables).
+            rotate_interval: Rotate the file after this many seconds (optional).
+            backup_count: Compressed rotated files to keep (0 keeps all).
         """
         self._log_path = Path(log_path)
         self._source = source
-        self._buffer_size = buffer_size
-        self._buffer: List[AuditEntry] = []
-        self._lock = threading.Lock()
 
         # Ensure directory exists
         self._log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -66,20 +88,28 @@ class AuditLogger:
         if not self._log_path.exists():
             self._write_headers()
 
+        self._writer = get_audit_writer(
+            self._log_path,
+            header=self._format_row(self.COLUMNS),
+            batch_size=buffer_size,
+            flush_interval=flush_interval,
+            fsync_policy=fsync_policy,
+            max_bytes=max_bytes,
+            rotate_interval=rotate_interval,
+            backup_count=backup_count,
+        )
+
+    @staticmethod
+    def _format_row(values: List[Any]) -> str:
+        """Format one CSV row, including the line ending."""
+        out = io.StringIO()
+        csv.writer(out).writerow(values)
+        return out.getvalue()
+
     def _write_headers(self) -> None:
         """Write CSV headers to the log file."""
         with open(self._log_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "timestamp",
-                "action",
-                "entity_type",
-                "entity_id",
-                "user_id",
-                "source",
-                "details",
-                "ip_address",
-            ])
+            f.write(self._format_row(self.COLUMNS))
 
     def log(
         self,
@@ -117,70 +147,53 @@ class AuditLogger:
             ip_address=ip_address,
         )
 
-        with self._lock:
-            self._buffer.append(entry)
-            if len(self._buffer) >= self._buffer_size:
-                self._flush()
+        self._writer.write(self._format_row([
+            entry.timestamp,
+            entry.action,
+            entry.entity_type,
+            entry.entity_id or "",
+            entry.user_id or "",
+            entry.source,
+            json.dumps(entry.details) if entry.details else "",
+            entry.ip_address or "",
+        ]))
 
         return entry
 
-    def _flush(self) -> None:
-        """Flush buffered entries to the log file."""
-        if not self._buffer:
-            return
-
-        with open(self._log_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            for entry in self._buffer:
-                writer.writerow([
-                    entry.timestamp,
-                    entry.action,
-                    entry.entity_type,
-                    entry.entity_id or "",
-                    entry.user_id or "",
-                    entry.source,
-                    json.dumps(entry.details) if entry.details else "",
-                    entry.ip_address or "",
-                ])
-
-        self._buffer.clear()
-
     def flush(self) -> None:
         """Manually flush the buffer."""
-        with self._lock:
-            self._flush()
+        self._writer.flush()
 
     def get_recent_entries(self, limit: int = 100) -> List[AuditEntry]:
         """
         Get recent audit entries.
 
+        Only the end of the log file is read, so the cost depends on
+        ``limit`` rather than on the size of the file.
+
         Args:
             limit: Maximum number of entries to return.
 
         Returns:
             List of recent audit entries.
         """
-        entries = []
-
-        if not self._log_path.exists():
-            return entries
-
-        with open(self._log_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                entries.append(AuditEntry(
-                    timestamp=row["timestamp"],
-                    action=row["action"],
-                    entity_type=row["entity_type"],
-                    entity_id=row.get("entity_id") or None,
-                    user_id=row.get("user_id") or None,
-                    source=row["source"],
-                    details=json.loads(row["details"]) if row.get("details") else None,
-                    ip_address=row.get("ip_address") or None,
-                ))
-
-        # Return most recent entries
-        return entries[-limit:]
+        return [
+            AuditEntry(
+                timestamp=row["timestamp"],
+                action=row["action"],
+                entity_type=row["entity_type"],
+                entity_id=row.get("entity_id") or None,
+                user_id=row.get("user_id") or None,
+                source=row["source"],
+                details=json.loads(row["details"]) if row.get("details") else None,
+                ip_address=row.get("ip_address") or None,
+            )
+            for row in self._writer.tail(limit)
+        ]
+
+    def count_entries(self) -> int:
+        """Number of entries in the current (unrotated) log file."""
+        return self._writer.count()
 
     def __del__(self):
         """Flush buffer on destruction."""
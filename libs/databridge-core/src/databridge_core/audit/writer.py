@@ -0,0 +1,461 @@
+"""
+Background audit trail writer.
+
+Logging an action only appends to an in-memory queue; a background thread
+writes the queue to the audit CSV in batches. Reads start from the end of
+the file instead of parsing all of it.
+
+Components:
+- AuditWriter: queue + writer thread with batched flushes (by size or time),
+  an fsync policy, and size/time based rotation with gzip compression
+- read_tail_lines: read the last N lines of a file without scanning it
+- get_audit_writer: one shared writer per audit file path
+"""
+
+import atexit
+import csv
+import gzip
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# fsync policies
+FSYNC_NEVER = "never"    # leave durability to the OS page cache
+FSYNC_BATCH = "batch"    # one fsync per flushed batch
+FSYNC_ALWAYS = "always"  # one fsync per entry
+
+_READ_BLOCK = 8192
+_ROTATED_FORMAT = "%Y%m%d-%H%M%S-%f"  # timestamp in rotated file names
+
+
+def read_tail_lines(path: Union[str, Path], count: int) -> Tuple[List[str], bool]:
+    """
+    Read the last ``count`` lines of a text file, reading backwards in blocks.
+
+    Args:
+        path: File to read
+        count: Number of lines wanted
+
+    Returns:
+        Tuple of (lines without line endings, oldest first; True if the
+        start of the file was reached, i.e. the first line is the file's
+        first line)
+    """
+    if count <= 0:
+        return [], False
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return [], True
+
+    with f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # One extra newline: the last line ends with one, and the line before
+        # the first wanted line must be complete
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(_READ_BLOCK, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    reached_start = position == 0
+    if not reached_start:
+        lines = lines[1:]  # partial line at the block boundary
+    if len(lines) > count:
+        lines = lines[-count:]
+        reached_start = False
+    return lines, reached_start
+
+
+def count_lines(path: Union[str, Path]) -> int:
+    """Count newline-terminated lines in a file without decoding it."""
+    total = 0
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                total += block.count(b"\n")
+    except FileNotFoundError:
+        return 0
+    return total
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class AuditWriter:
+    """
+    Append-only CSV audit writer with a background flush thread.
+
+    ``write`` only appends to an in-memory queue. The writer thread flushes
+    when ``batch_size`` entries are pending or ``flush_interval`` seconds
+    have passed, whichever comes first. Readers call ``flush`` first, so
+    ``tail`` and ``count`` always include entries written before them.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        header: str = "",
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+        fsync_policy: str = FSYNC_BATCH,
+        max_bytes: int = 10 * 1024 * 1024,
+        rotate_interval: Optional[float] = None,
+        backup_count: int = 5,
+        compress: bool = True,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Audit CSV file
+            header: Header line written to new files (with or without newline)
+            batch_size: Pending entries that trigger an immediate flush
+            flush_interval: Maximum seconds an entry waits in the queue
+            fsync_policy: "never", "batch" or "always"
+            max_bytes: Rotate once the file reaches this size (0 disables)
+            rotate_interval: Rotate files older than this many seconds (optional),
+                measured from when the file was started, across restarts
+            backup_count: Rotated files to keep (0 keeps all)
+            compress: Gzip rotated files
+        """
+        if fsync_policy not in (FSYNC_NEVER, FSYNC_BATCH, FSYNC_ALWAYS):
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+
+        self.path = Path(path)
+        self.header = header if not header or header.endswith("\n") else header + "\n"
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fsync_policy = fsync_policy
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+
+        self._pending: Deque[str] = deque()
+        self._cond = threading.Condition()
+        self._io_lock = threading.RLock()
+        self._enqueued = 0
+        self._written = 0
+        self._flush_waiters = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._rows: Optional[int] = None  # data rows in the current file
+        self._stamp: Optional[Tuple[int, int]] = None  # file stamp _rows refers to
+        self._created_at: Optional[float] = None  # start of the current file, read lazily
+        self.rotations = 0
+        self.errors = 0
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    def write(self, line: str) -> None:
+        """
+        Queue one CSV line for the audit file.
+
+        Args:
+            line: Formatted CSV row (a trailing newline is added if missing)
+        """
+        if not line.endswith("\n"):
+            line += "\n"
+        with self._cond:
+            if self._closed:
+                self._write_batch([line])
+                return
+            self._pending.append(line)
+            self._enqueued += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"audit-writer:{self.path.name}", daemon=True
+                )
+                self._thread.start()
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every queued entry has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained in time
+        """
+        with self._cond:
+            target = self._enqueued
+            if self._written >= target:
+                return True
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(lambda: self._written >= target, timeout)
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush pending entries and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    @property
+    def pending(self) -> int:
+        """Entries queued but not yet written."""
+        with self._cond:
+            return self._enqueued - self._written
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue in batches."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                self._cond.wait_for(
+                    lambda: len(self._pending) >= self.batch_size or self._closed or self._flush_waiters,
+                    self.flush_interval,
+                )
+                batch = list(self._pending)
+                self._pending.clear()
+                if not batch and self._closed:
+                    return
+
+            self._write_batch(batch)
+            with self._cond:
+                self._written += len(batch)
+                self._cond.notify_all()
+
+    def _write_batch(self, batch: List[str]) -> None:
+        """Append a batch to the audit file, rotating first if due."""
+        with self._io_lock:
+            try:
+                self._maybe_rotate()
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                before = _file_stamp(self.path)
+                rows = self._rows if before is not None and before == self._stamp else None
+
+                with open(self.path, "a", encoding="utf-8") as f:
+                    if before is None:
+                        if self.header:
+                            f.write(self.header)
+                        rows = 0
+                    if self.fsync_policy == FSYNC_ALWAYS:
+                        for line in batch:
+                            f.write(line)
+                            f.flush()
+                            os.fsync(f.fileno())
+                    else:
+                        f.write("".join(batch))
+                        f.flush()
+                        if self.fsync_policy == FSYNC_BATCH:
+                            os.fsync(f.fileno())
+
+                self._rows = rows + len(batch) if rows is not None else None
+                self._stamp = _file_stamp(self.path)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Failed to write {len(batch)} audit entries to {self.path}: {e}")
+
+    # =========================================================================
+    # Rotation
+    # =========================================================================
+
+    def _maybe_rotate(self) -> None:
+        stamp = _file_stamp(self.path)
+        if stamp is None:
+            self._created_at = time.time()
+            return
+        too_big = self.max_bytes and stamp[1] >= self.max_bytes
+        too_old = False
+        if self.rotate_interval:
+            if self._created_at is None:
+                self._created_at = self._file_created_at()
+            too_old = time.time() - self._created_at >= self.rotate_interval
+        if too_big or too_old:
+            self.rotate()
+
+    def _file_created_at(self) -> float:
+        """
+        When the current file was started.
+
+        Uses the birth time where the platform reports it, else the time of
+        the latest rotation (encoded in the newest backup's name), else the
+        file's modification time.
+        """
+        stat = self.path.stat()
+        birth = getattr(stat, "st_birthtime", None)
+        if birth:
+            return birth
+        prefix = len(self.path.stem) + 1
+        for rotated in reversed(self.rotated_files()):
+            try:
+                return datetime.strptime(rotated.name[prefix:prefix + 22], _ROTATED_FORMAT).timestamp()
+            except ValueError:
+                continue
+        return stat.st_mtime
+
+    def rotate(self) -> Optional[Path]:
+        """
+        Move the current file aside (compressed if enabled) and start a new one.
+
+        Returns:
+            Path of the rotated file, or None if there was nothing to rotate
+        """
+        with self._io_lock:
+            if not self.path.exists():
+                return None
+            suffix = datetime.now().strftime(_ROTATED_FORMAT)
+            rotated = self.path.with_name(f"{self.path.stem}.{suffix}{self.path.suffix}")
+            os.replace(self.path, rotated)
+
+            if self.compress:
+                compressed = rotated.with_name(rotated.name + ".gz")
+                with open(rotated, "rb") as src, gzip.open(compressed, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                rotated.unlink()
+                rotated = compressed
+
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(self.header)
+            self._rows = 0
+            self._stamp = _file_stamp(self.path)
+            self._created_at = time.time()
+            self.rotations += 1
+            self._prune_backups()
+            logger.info(f"Rotated audit log to {rotated}")
+            return rotated
+
+    def rotated_files(self) -> List[Path]:
+        """Rotated audit files, oldest first."""
+        pattern = f"{self.path.stem}.*{self.path.suffix}*"
+        return sorted(p for p in self.path.parent.glob(pattern) if p != self.path)
+
+    def _prune_backups(self) -> None:
+        if self.backup_count <= 0:
+            return
+        backups = self.rotated_files()
+        for old in backups[:-self.backup_count]:
+            try:
+                old.unlink()
+            except OSError as e:
+                logger.debug(f"Could not remove old audit file {old}: {e}")
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    def columns(self) -> List[str]:
+        """Column names from the file's header line."""
+        with self._io_lock:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    first = f.readline()
+            except FileNotFoundError:
+                first = self.header
+        return next(csv.reader([first]), []) if first.strip() else []
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Most recent entries of the current file, oldest first.
+
+        Args:
+            limit: Maximum entries to return
+
+        Returns:
+            List of dicts keyed by the header columns
+        """
+        self.flush()
+        with self._io_lock:
+            columns = self.columns()
+            lines, reached_start = read_tail_lines(self.path, limit + 1)
+        if reached_start and self.header and lines:
+            lines = lines[1:]
+        lines = lines[-limit:] if limit > 0 else []
+        return [dict(zip(columns, row)) for row in csv.reader(lines)]
+
+    def count(self) -> int:
+        """Number of entries in the current file (counted once, then tracked)."""
+        self.flush()
+        with self._io_lock:
+            stamp = _file_stamp(self.path)
+            if stamp is None:
+                return 0
+            if self._rows is None or stamp != self._stamp:
+                lines = count_lines(self.path)
+                self._rows = max(0, lines - 1) if self.header else lines
+                self._stamp = stamp
+            return self._rows
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue and file statistics."""
+        with self._cond:
+            queued = self._enqueued - self._written
+            enqueued = self._enqueued
+        return {
+            "path": str(self.path),
+            "enqueued": enqueued,
+            "pending": queued,
+            "rotations": self.rotations,
+            "errors": self.errors,
+            "fsync_policy": self.fsync_policy,
+        }
+
+
+# =============================================================================
+# Shared Writers
+# =============================================================================
+
+_writers: Dict[str, AuditWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_audit_writer(path: Union[str, Path], **options: Any) -> AuditWriter:
+    """
+    Get the shared writer for an audit file, creating it on first use.
+
+    Args:
+        path: Audit CSV file
+        **options: AuditWriter options, used only when the writer is created
+
+    Returns:
+        AuditWriter for the path
+    """
+    key = str(Path(path).resolve())
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = AuditWriter(path, **options)
+            _writers[key] = writer
+        return writer
+
+
+def close_audit_writers() -> None:
+    """Flush and stop every shared writer."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_audit_writers)
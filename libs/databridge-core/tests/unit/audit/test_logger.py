@@ -0,0 +1,51 @@
+"""
+Unit tests for AuditLogger.
+
+Tests queued writes, tail reads and rotation of the audit CSV.
+"""
+
+import gzip
+
+import pytest
+
+from databridge_core.audit.logger import AuditLogger
+from databridge_core.audit.writer import close_audit_writers
+
+
+@pytest.fixture(autouse=True)
+def _close_writers():
+    yield
+    close_audit_writers()
+
+
+class TestAuditLogger:
+    """Tests for AuditLogger."""
+
+    def test_recent_entries_round_trip(self, tmp_path):
+        """Entries logged before a read are returned, newest last."""
+        audit = AuditLogger(tmp_path / "audit.csv", buffer_size=1000, flush_interval=60)
+        for i in range(25):
+            audit.log("update", "hierarchy", entity_id=f"h{i}", details={"n": i})
+
+        recent = audit.get_recent_entries(limit=3)
+
+        assert [e.entity_id for e in recent] == ["h22", "h23", "h24"]
+        assert recent[-1].details == {"n": 24}
+        assert recent[-1].source == "mcp"
+        assert audit.count_entries() == 25
+        assert len(audit.get_recent_entries(limit=100)) == 25
+
+    def test_rotation_compresses_old_file(self, tmp_path):
+        """Reaching max_bytes moves the file aside as gzip and starts a new one."""
+        log_path = tmp_path / "audit.csv"
+        audit = AuditLogger(log_path, buffer_size=1, max_bytes=400, backup_count=2)
+        for i in range(30):
+            audit.log("create", "project", entity_id=f"p{i}")
+            audit.flush()
+
+        backups = sorted(tmp_path.glob("audit.*.csv.gz"))
+        assert 1 <= len(backups) <= 2
+        with gzip.open(backups[-1], "rt", encoding="utf-8") as f:
+            assert f.readline().startswith("timestamp,action")
+        assert log_path.read_text(encoding="utf-8").startswith("timestamp,action")
+        assert audit.get_recent_entries(limit=1)[0].entity_id == "p29"
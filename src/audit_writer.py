@@ -0,0 +1,47 @@
+"""
+Background audit trail writer for the DataBridge MCP server.
+
+The implementation is shared with the core library and lives in
+``databridge_core.audit.writer``; this module re-exports it. In a source
+checkout without databridge-core installed, the module is loaded straight
+from libs/databridge-core (it only needs the standard library).
+"""
+
+try:
+    from databridge_core.audit import writer as _writer
+except ImportError:
+    import importlib.util
+    import sys
+    from pathlib import Path
+
+    _name = "databridge_core.audit.writer"
+    _writer = sys.modules.get(_name)
+    if _writer is None:
+        _path = (
+            Path(__file__).resolve().parents[1]
+            / "libs" / "databridge-core" / "src" / "databridge_core" / "audit" / "writer.py"
+        )
+        _spec = importlib.util.spec_from_file_location(_name, _path)
+        _writer = importlib.util.module_from_spec(_spec)
+        sys.modules[_name] = _writer
+        _spec.loader.exec_module(_writer)
+
+FSYNC_NEVER = _writer.FSYNC_NEVER
+FSYNC_BATCH = _writer.FSYNC_BATCH
+FSYNC_ALWAYS = _writer.FSYNC_ALWAYS
+AuditWriter = _writer.AuditWriter
+read_tail_lines = _writer.read_tail_lines
+count_lines = _writer.count_lines
+get_audit_writer = _writer.get_audit_writer
+close_audit_writers = _writer.close_audit_writers
+
+__all__ = [
+    "FSYNC_NEVER",
+    "FSYNC_BATCH",
+    "FSYNC_ALWAYS",
+    "AuditWriter",
+    "read_tail_lines",
+    "count_lines",
+    "get_audit_writer",
+    "close_audit_writers",
+]
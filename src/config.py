@@ -2,6 +2,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from pathlib import Path
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -21,6 +22,14 @@ class Settings(BaseSettings):
     workflow_file: Path = Field(default=Path("data/workflow.json"), description="Workflow recipes file")
     audit_log: Path = Field(default=Path("data/audit_trail.csv"), description="Audit trail log")
 
+    # Audit trail writer
+    audit_batch_size: int = Field(default=64, ge=1, description="Queued audit entries that trigger a flush")
+    audit_flush_interval: float = Field(default=0.5, gt=0, description="Maximum seconds an audit entry stays queued")
+    audit_fsync: Literal["never", "batch", "always"] = Field(default="batch", description="Audit fsync policy (never, batch, always)")
+    audit_max_bytes: int = Field(default=10 * 1024 * 1024, ge=0, description="Rotate the audit log at this size (0 disables)")
+    audit_rotate_hours: float = Field(default=0, ge=0, description="Rotate the audit log after this many hours (0 disables)")
+    audit_backup_count: int = Field(default=10, ge=0, description="Compressed audit logs to keep (0 keeps all)")
+
     # Fuzzy matching defaults
     fuzzy_threshold: int = Field(default=80, ge=0, le=100, description="Default fuzzy match threshold")
 
@@ -1,13 +1,28 @@
-"""HTTP client for NestJS connections API."""
+"""HTTP client for NestJS connections API.
+
+Requests go through a shared pooled session (keep-alive, retries with
+backoff). Database, schema, table and column listings are cached for
+``metadata_ttl`` seconds; call ``invalidate_metadata`` after DDL changes.
+"""
+import asyncio
 import json
 import requests
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+
+from .http_session import MetadataCache, get_session
 
 
 class ConnectionsApiClient:
     """HTTP client for managing database connections via NestJS backend."""
 
-    def __init__(self, base_url: str, api_key: str, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 30,
+        session: Optional[requests.Session] = None,
+        metadata_ttl: float = 300,
+    ):
         """
         Initialize the connections API client.
 
@@ -15,6 +30,8 @@ class ConnectionsApiClient:
             base_url: NestJS backend URL (e.g., 'http://localhost:3001/api')
             api_key: API key for authentication
             timeout: Request timeout in seconds
+            session: HTTP session to use (default: shared pooled session)
+            metadata_ttl: Seconds to cache metadata listings (0 disables)
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -23,6 +40,8 @@ class ConnectionsApiClient:
             'X-API-Key': api_key,
             'Content-Type': 'application/json',
         }
+        self.session = session or get_session()
+        self.metadata_cache = MetadataCache(ttl_seconds=metadata_ttl)
 
     def _request(
         self,
@@ -35,7 +54,7 @@ class ConnectionsApiClient:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers,
@@ -60,6 +79,47 @@ class ConnectionsApiClient:
         except Exception as e:
             return {"error": True, "message": str(e)}
 
+    def _cached_list(self, key: Tuple, endpoint: str, data: Dict[str, Any]) -> List[Any]:
+        """POST a metadata request, serving and storing successful lists in the cache."""
+        cached = self.metadata_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        result = self._request("POST", endpoint, data)
+        if isinstance(result, dict) and result.get("error"):
+            return []
+        if isinstance(result, dict) and "data" in result:
+            result = result.get("data", [])
+        items = result if isinstance(result, list) else []
+        self.metadata_cache.put(key, items)
+        return list(items)
+
+    def invalidate_metadata(
+        self,
+        connection_id: Optional[str] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+        table: Optional[str] = None,
+    ) -> int:
+        """
+        Drop cached metadata for a scope (everything when no scope is given).
+
+        Args:
+            connection_id: Connection UUID
+            database: Database name (requires connection_id)
+            schema: Schema name (requires database)
+            table: Table name (requires schema)
+
+        Returns:
+            Number of cache entries removed
+        """
+        prefix = []
+        for part in (connection_id, database, schema, table):
+            if part is None:
+                break
+            prefix.append(part)
+        return self.metadata_cache.invalidate(*prefix)
+
     # =========================================================================
     # Connection CRUD Operations
     # =========================================================================
@@ -120,14 +180,9 @@ class ConnectionsApiClient:
         Returns:
             List of database names
         """
-        result = self._request("POST", "/connections/databases", {
+        return self._cached_list((connection_id, "databases"), "/connections/databases", {
             "connectionId": connection_id
         })
-        if isinstance(result, dict) and result.get("error"):
-            return []
-        if isinstance(result, dict) and "data" in result:
-            return result.get("data", [])
-        return result if isinstance(result, list) else []
 
     def get_schemas(self, connection_id: str, database: str) -> List[str]:
         """
@@ -140,15 +195,10 @@ class ConnectionsApiClient:
         Returns:
             List of schema names
         """
-        result = self._request("POST", "/connections/schemas", {
+        return self._cached_list((connection_id, database, "schemas"), "/connections/schemas", {
             "connectionId": connection_id,
             "database": database
         })
-        if isinstance(result, dict) and result.get("error"):
-            return []
-        if isinstance(result, dict) and "data" in result:
-            return result.get("data", [])
-        return result if isinstance(result, list) else []
 
     def get_tables(
         self,
@@ -167,16 +217,11 @@ class ConnectionsApiClient:
         Returns:
             List of table names
         """
-        result = self._request("POST", "/connections/tables", {
+        return self._cached_list((connection_id, database, schema, "tables"), "/connections/tables", {
             "connectionId": connection_id,
             "database": database,
             "schema": schema
         })
-        if isinstance(result, dict) and result.get("error"):
-            return []
-        if isinstance(result, dict) and "data" in result:
-            return result.get("data", [])
-        return result if isinstance(result, list) else []
 
     def get_columns(
         self,
@@ -197,17 +242,53 @@ class ConnectionsApiClient:
         Returns:
             List of column objects with name, type, nullable, etc.
         """
-        result = self._request("POST", "/connections/columns", {
-            "connectionId": connection_id,
-            "database": database,
-            "schema": schema,
-            "table": table
-        })
-        if isinstance(result, dict) and result.get("error"):
-            return []
-        if isinstance(result, dict) and "data" in result:
-            return result.get("data", [])
-        return result if isinstance(result, list) else []
+        return self._cached_list(
+            (connection_id, database, schema, table, "columns"),
+            "/connections/columns",
+            {
+                "connectionId": connection_id,
+                "database": database,
+                "schema": schema,
+                "table": table
+            },
+        )
+
+    async def aget_columns(
+        self,
+        connection_id: str,
+        database: str,
+        schema: str,
+        table: str
+    ) -> List[Dict[str, Any]]:
+        """Async get_columns(); runs the request on a worker thread."""
+        return await asyncio.to_thread(self.get_columns, connection_id, database, schema, table)
+
+    async def aget_columns_many(
+        self,
+        connection_id: str,
+        tables: Sequence[Tuple[str, str, str]],
+        max_concurrency: int = 8,
+    ) -> Dict[Tuple[str, str, str], List[Dict[str, Any]]]:
+        """
+        Fetch columns for many tables in parallel.
+
+        Args:
+            connection_id: Connection UUID
+            tables: (database, schema, table) tuples
+            max_concurrency: Maximum requests in flight
+
+        Returns:
+            Dict mapping each (database, schema, table) to its columns
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(ref: Tuple[str, str, str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.aget_columns(connection_id, *ref)
+
+        refs = [tuple(ref) for ref in tables]
+        results = await asyncio.gather(*(fetch(ref) for ref in refs))
+        return dict(zip(refs, results))
 
     def get_column_values(
         self,
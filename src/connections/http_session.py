@@ -0,0 +1,156 @@
+"""Shared HTTP plumbing for the NestJS backend clients.
+
+Components:
+- get_session: process-wide pooled ``requests.Session`` with keep-alive
+  and retries with exponential backoff
+- MetadataCache: thread-safe TTL cache for catalog metadata lookups
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Status codes worth retrying: the backend or a proxy in front of it is busy
+RETRY_STATUSES = (429, 502, 503, 504)
+
+_sessions: Dict[Tuple[int, int, float], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(
+    pool_size: int = 16,
+    retries: int = 2,
+    backoff_factor: float = 0.3,
+) -> requests.Session:
+    """
+    Get the shared pooled session for the given pool and retry settings.
+
+    Connections are kept alive and reused across clients, so repeated calls
+    skip TCP/TLS setup. Connection errors are retried for every method;
+    retryable status codes only for idempotent methods.
+
+    Args:
+        pool_size: Maximum pooled connections per host
+        retries: Retry attempts for failed requests
+        backoff_factor: Exponential backoff factor between retries
+
+    Returns:
+        Shared requests.Session
+    """
+    key = (pool_size, retries, backoff_factor)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            retry = Retry(
+                total=retries,
+                connect=retries,
+                read=retries,
+                status=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+        return session
+
+
+def close_sessions() -> None:
+    """Close all shared sessions (e.g. on shutdown or in tests)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+class MetadataCache:
+    """
+    Thread-safe LRU cache with a TTL for catalog metadata.
+
+    Keys are tuples that start with the scope they describe, e.g.
+    ``(connection_id, database, schema, table, "columns")``, so a whole
+    connection, database, schema or table can be invalidated by prefix.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_size: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid (0 disables caching)
+            max_size: Maximum number of entries
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max(1, max_size)
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: Tuple[Hashable, ...], default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Store ``value`` under ``key``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *prefix: Hashable) -> int:
+        """
+        Drop entries whose key starts with ``prefix`` (all entries if empty).
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if not prefix:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            stale = [k for k in self._entries if k[:len(prefix)] == prefix]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
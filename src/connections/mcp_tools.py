@@ -80,17 +80,20 @@ def register_connection_tools(mcp, base_url: str, api_key: str):
     # =========================================================================
 
     @mcp.tool()
-    def get_connection_databases(connection_id: str) -> str:
+    def get_connection_databases(connection_id: str, refresh: bool = False) -> str:
         """
         List all databases available in a connection.
 
         Args:
             connection_id: Connection UUID
+            refresh: Bypass cached metadata for this connection
 
         Returns:
             JSON array of database names available in the connection.
         """
         try:
+            if refresh:
+                client.invalidate_metadata(connection_id)
             databases = client.get_databases(connection_id)
             return json.dumps({
                 "connection_id": connection_id,
@@ -101,18 +104,21 @@ def register_connection_tools(mcp, base_url: str, api_key: str):
             return json.dumps({"error": str(e)})
 
     @mcp.tool()
-    def get_connection_schemas(connection_id: str, database: str) -> str:
+    def get_connection_schemas(connection_id: str, database: str, refresh: bool = False) -> str:
         """
         List all schemas in a database.
 
         Args:
             connection_id: Connection UUID
             database: Database name
+            refresh: Bypass cached metadata for this database
 
         Returns:
             JSON array of schema names in the specified database.
         """
         try:
+            if refresh:
+                client.invalidate_metadata(connection_id, database)
             schemas = client.get_schemas(connection_id, database)
             return json.dumps({
                 "connection_id": connection_id,
@@ -127,7 +133,8 @@ def register_connection_tools(mcp, base_url: str, api_key: str):
     def get_connection_tables(
         connection_id: str,
         database: str,
-        schema: str
+        schema: str,
+        refresh: bool = False,
     ) -> str:
         """
         List all tables in a schema.
@@ -136,11 +143,14 @@ def register_connection_tools(mcp, base_url: str, api_key: str):
             connection_id: Connection UUID
             database: Database name
             schema: Schema name
+            refresh: Bypass cached metadata for this schema
 
         Returns:
             JSON array of table names in the specified schema.
         """
         try:
+            if refresh:
+                client.invalidate_metadata(connection_id, database, schema)
             tables = client.get_tables(connection_id, database, schema)
             return json.dumps({
                 "connection_id": connection_id,
@@ -157,7 +167,8 @@ def register_connection_tools(mcp, base_url: str, api_key: str):
         connection_id: str,
         database: str,
         schema: str,
-        table: str
+        table: str,
+        refresh: bool = False,
     ) -> str:
         """
         Get column details for a table.
@@ -167,11 +178,14 @@ def register_connection_tools(mcp, base_url: str, api_key: str):
             database: Database name
             schema: Schema name
             table: Table name
+            refresh: Bypass cached metadata for this table
 
         Returns:
             JSON array of columns with name, data type, nullable, and other metadata.
         """
         try:
+            if refresh:
+                client.invalidate_metadata(connection_id, database, schema, table)
             columns = client.get_columns(connection_id, database, schema, table)
             return json.dumps({
                 "connection_id": connection_id,
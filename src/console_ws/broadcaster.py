@@ -5,13 +5,20 @@ Handles message broadcasting between:
 - MCP tools (publishers)
 - WebSocket clients (subscribers)
 - Inter-agent communication
+
+In-memory history is held in per-channel ring buffers with a per-type
+index and global sequence numbers usable as resumable cursors.
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set
 import threading
 
 from .types import (
@@ -24,18 +31,123 @@ from .types import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class HistoryEntry:
+    """A published message with its sequence number and publish time."""
+    seq: int
+    published_at: float
+    channel: str
+    message: WebSocketMessage
+
+
+class MessageRing:
+    """
+    Fixed-capacity ring buffer of history entries in publish order.
+
+    Supports O(1) append/eviction and binary search by sequence number or
+    publish time. A per-type index is trimmed in step with eviction.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._buf: List[Optional[HistoryEntry]] = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self.by_type: Dict[WebSocketMessageType, Deque[HistoryEntry]] = {}
+        self.evicted_through = 0  # seq of the newest evicted entry
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> HistoryEntry:
+        return self._buf[(self._start + i) % self.capacity]
+
+    def append(self, entry: HistoryEntry) -> None:
+        """Append an entry, evicting the oldest when full."""
+        if self._count == self.capacity:
+            oldest = self._buf[self._start]
+            index = self.by_type[oldest.message.type]
+            index.popleft()
+            if not index:
+                del self.by_type[oldest.message.type]
+            self.evicted_through = oldest.seq
+            self._buf[self._start] = entry
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._buf[(self._start + self._count) % self.capacity] = entry
+            self._count += 1
+        self.by_type.setdefault(entry.message.type, deque()).append(entry)
+
+    def _bisect(self, value: float, key: Callable[[HistoryEntry], float], right: bool) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k = key(self[mid])
+            if k < value or (right and k == value):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def after_seq(self, seq: int) -> Iterator[HistoryEntry]:
+        """Entries with a sequence number greater than ``seq``, oldest first."""
+        for i in range(self._bisect(seq, lambda e: e.seq, right=True), self._count):
+            yield self[i]
+
+    def newest(
+        self,
+        message_type: Optional[WebSocketMessageType] = None,
+        since: Optional[float] = None,
+    ) -> Iterator[HistoryEntry]:
+        """Entries newest first, optionally of one type and published at/after ``since``."""
+        if message_type is not None:
+            entries: Iterable[HistoryEntry] = reversed(self.by_type.get(message_type, ()))
+        else:
+            first = self._bisect(since, lambda e: e.published_at, right=False) if since is not None else 0
+            entries = (self[i] for i in range(self._count - 1, first - 1, -1))
+        for entry in entries:
+            if since is not None and entry.published_at < since:
+                return
+            yield entry
+
+    def clear(self) -> None:
+        self._buf = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self.by_type.clear()
+
+
 class InMemoryBroadcaster:
     """
     In-memory message broadcaster (no Redis required).
 
     Useful for development and single-instance deployments.
     For multi-instance deployments, use RedisBroadcaster.
+
+    History is kept in one ring buffer per channel. Every published message
+    gets a global sequence number (set as ``seq`` on the stored and delivered
+    copy of the message) that clients can hand back as a cursor to replay
+    only what they missed.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_history: int = 1000,
+        channel_capacity: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            max_history: Default history capacity per channel
+            channel_capacity: Capacity overrides by channel name
+        """
         self._subscribers: Dict[str, Set[Callable]] = {}
-        self._message_history: List[WebSocketMessage] = []
-        self._max_history = 1000
+        self._max_history = max_history
+        self._channel_capacity = dict(channel_capacity or {})
+        self._history: Dict[str, MessageRing] = {}
+        self._seq = 0
+        self._last_published = 0.0
         self._lock = threading.Lock()
 
     def subscribe(self, channel: str, callback: Callable[[WebSocketMessage], None]) -> None:
@@ -54,6 +166,17 @@ class InMemoryBroadcaster:
                 if not self._subscribers[channel]:
                     del self._subscribers[channel]
 
+    def set_channel_capacity(self, channel: str, capacity: int) -> None:
+        """Change a channel's history capacity, keeping the newest entries."""
+        with self._lock:
+            self._channel_capacity[channel] = capacity
+            old = self._history.pop(channel, None)
+            if old is not None:
+                ring = self._history[channel] = MessageRing(capacity)
+                for i in range(len(old)):
+                    ring.append(old[i])
+                ring.evicted_through = max(ring.evicted_through, old.evicted_through)
+
     def publish(self, channel: str, message: WebSocketMessage) -> int:
         """
         Publish a message to a channel.
@@ -61,10 +184,16 @@ class InMemoryBroadcaster:
         Returns number of subscribers that received the message.
         """
         with self._lock:
-            # Store in history
-            self._message_history.append(message)
-            if len(self._message_history) > self._max_history:
-                self._message_history = self._message_history[-self._max_history:]
+            # Store in history; publish times are kept monotonic for bisection
+            self._seq += 1
+            self._last_published = max(self._last_published, message.timestamp.timestamp(), time.time())
+            # Stamp a copy: the caller may publish the same message to several channels
+            message = message.model_copy(update={"seq": self._seq})
+            ring = self._history.get(channel)
+            if ring is None:
+                capacity = self._channel_capacity.get(channel, self._max_history)
+                ring = self._history[channel] = MessageRing(capacity)
+            ring.append(HistoryEntry(self._seq, self._last_published, channel, message))
 
             # Get subscribers
             subscribers = self._subscribers.get(channel, set()).copy()
@@ -88,33 +217,97 @@ class InMemoryBroadcaster:
             total += self.publish(channel, message)
         return total
 
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the most recent message (the current cursor)."""
+        return self._seq
+
+    def _rings(self, channels: Optional[Iterable[str]]) -> List[MessageRing]:
+        if channels is None:
+            return list(self._history.values())
+        return [self._history[ch] for ch in channels if ch in self._history]
+
     def get_history(
         self,
         limit: int = 100,
         message_type: Optional[WebSocketMessageType] = None,
         since: Optional[datetime] = None,
+        channel: Optional[str] = None,
     ) -> List[WebSocketMessage]:
-        """Get message history with optional filters."""
-        with self._lock:
-            messages = self._message_history.copy()
+        """
+        Get message history with optional filters, oldest first.
 
-        if message_type:
-            messages = [m for m in messages if m.type == message_type]
+        Walks the channel rings newest-first and stops after ``limit``
+        matches, so cost depends on the result size, not on capacity.
+        """
+        if limit <= 0:
+            return []
+        since_ts = since.timestamp() if since else None
+        with self._lock:
+            streams = [
+                ring.newest(message_type, since_ts)
+                for ring in self._rings([channel] if channel else None)
+            ]
+            result: List[WebSocketMessage] = []
+            for entry in heapq.merge(*streams, key=lambda e: e.seq, reverse=True):
+                # Publish time bounds the search; filter on the message's own timestamp
+                if since is not None and entry.message.timestamp < since:
+                    continue
+                result.append(entry.message)
+                if len(result) >= limit:
+                    break
+
+        result.reverse()
+        return result
+
+    def replay(
+        self,
+        cursor: int,
+        channels: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the messages published after ``cursor``, oldest first.
 
-        if since:
-            messages = [m for m in messages if m.timestamp >= since]
+        Args:
+            cursor: Last sequence number the client has seen
+            channels: Channels to replay (default: all)
+            limit: Maximum messages to return (the oldest are returned first)
 
-        return messages[-limit:]
+        Returns:
+            Dict with messages, the cursor to resume from, and truncated=True
+            if part of the gap was already evicted from history
+        """
+        with self._lock:
+            rings = self._rings(channels)
+            truncated = any(ring.evicted_through > cursor for ring in rings)
+            entries = heapq.merge(*(ring.after_seq(cursor) for ring in rings), key=lambda e: e.seq)
+            messages = []
+            next_cursor = max(cursor, 0)
+            for entry in entries:
+                if limit is not None and len(messages) >= limit:
+                    break
+                messages.append(entry.message)
+                next_cursor = entry.seq
+            if limit is None or len(messages) < limit:
+                next_cursor = max(next_cursor, self._seq)
+
+        return {"messages": messages, "cursor": next_cursor, "truncated": truncated}
 
     def get_channel_count(self) -> Dict[str, int]:
         """Get subscriber count per channel."""
         with self._lock:
             return {ch: len(subs) for ch, subs in self._subscribers.items()}
 
+    def history_size(self) -> int:
+        """Number of messages currently held in history."""
+        with self._lock:
+            return sum(len(ring) for ring in self._history.values())
+
     def clear_history(self) -> None:
         """Clear message history."""
         with self._lock:
-            self._message_history.clear()
+            self._history.clear()
 
 
 class RedisBroadcaster:
@@ -244,9 +437,14 @@ class ConsoleBroadcaster:
     # Singleton instance
     _instance: Optional["ConsoleBroadcaster"] = None
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_history: int = 1000,
+        channel_capacity: Optional[Dict[str, int]] = None,
+    ):
         self._redis_broadcaster: Optional[RedisBroadcaster] = None
-        self._memory_broadcaster = InMemoryBroadcaster()
+        self._memory_broadcaster = InMemoryBroadcaster(max_history, channel_capacity)
         self._use_redis = False
 
         if redis_url:
@@ -365,6 +563,20 @@ class ConsoleBroadcaster:
             return self.broadcaster.get_history(limit, **kwargs)
         return []
 
+    def replay(self, cursor: int, channels: Optional[Iterable[str]] = None,
+               limit: Optional[int] = None) -> Dict[str, Any]:
+        """Get messages published after a cursor (in-memory only)."""
+        if isinstance(self.broadcaster, InMemoryBroadcaster):
+            return self.broadcaster.replay(cursor, channels, limit)
+        return {"messages": [], "cursor": cursor, "truncated": False}
+
+    @property
+    def last_sequence(self) -> Optional[int]:
+        """Current history cursor (in-memory only)."""
+        if isinstance(self.broadcaster, InMemoryBroadcaster):
+            return self.broadcaster.last_sequence
+        return None
+
     def get_stats(self) -> Dict[str, Any]:
         """Get broadcaster statistics."""
         stats = {
@@ -373,6 +585,7 @@ class ConsoleBroadcaster:
 
         if isinstance(self.broadcaster, InMemoryBroadcaster):
             stats["channels"] = self.broadcaster.get_channel_count()
-            stats["history_size"] = len(self.broadcaster._message_history)
+            stats["history_size"] = self.broadcaster.history_size()
+            stats["last_sequence"] = self.broadcaster.last_sequence
 
         return stats
@@ -4,15 +4,17 @@ WebSocket message handlers for the Console Dashboard.
 Handles:
 - Client connections and disconnections
 - Subscription management
-- Message routing
+- Message routing with serialize-once fan-out into bounded
+  per-connection send queues drained by writer tasks
 - Heartbeat/ping-pong
 """
 
 import asyncio
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
 import uuid
 
 from .types import (
@@ -27,6 +29,25 @@ from .broadcaster import ConsoleBroadcaster
 
 logger = logging.getLogger(__name__)
 
+# Overflow policies for slow clients: drop the oldest queued message, or
+# additionally replace a queued snapshot with a newer one of the same key
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+
+# Message types that are state snapshots; only the latest per key matters
+_COALESCE_FIELDS = {
+    WebSocketMessageType.AGENT_STATUS: "agent_id",
+}
+
+
+def coalesce_key(message: WebSocketMessage) -> Optional[Hashable]:
+    """Key under which a queued message may be replaced by a newer one."""
+    field_name = _COALESCE_FIELDS.get(message.type)
+    if field_name is None:
+        return None
+    value = message.payload.get(field_name)
+    return (message.type.value, value) if value is not None else None
+
 
 class WebSocketConnection:
     """Represents a single WebSocket connection."""
@@ -36,6 +57,8 @@ class WebSocketConnection:
         connection_id: str,
         websocket: Any,  # WebSocket instance (framework-agnostic)
         client_ip: str = "unknown",
+        max_queue_size: int = 1000,
+        overflow_policy: str = COALESCE,
     ):
         self.connection_id = connection_id
         self.websocket = websocket
@@ -45,7 +68,21 @@ class WebSocketConnection:
         self.filters: Dict[str, Any] = {}
         self.message_count = 0
         self.last_activity = datetime.now()
-        self._send_queue: asyncio.Queue = asyncio.Queue()
+
+        # Bounded outbound queue of serialized messages, drained by a writer task
+        self.max_queue_size = max(1, max_queue_size)
+        self.overflow_policy = overflow_policy
+        self.dropped_count = 0
+        self.coalesced_count = 0
+        self._queue: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._queue_seq = 0
+        self._queue_event = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._writer: Optional[asyncio.Task] = None
+        self._sending = False
+        self._closed = False
+        # Highest history sequence number replayed to this client
+        self.replayed_through = 0
 
     def to_info(self) -> ConnectionInfo:
         """Convert to ConnectionInfo."""
@@ -59,10 +96,14 @@ class WebSocketConnection:
         )
 
     async def send(self, message: WebSocketMessage) -> bool:
-        """Send a message to this connection."""
+        """Send a message to this connection immediately (bypasses the queue)."""
+        return await self._send_text(message.model_dump_json())
+
+    async def _send_text(self, data: str) -> bool:
+        """Write serialized data to the socket."""
         try:
-            data = message.model_dump_json()
-            await self.websocket.send_text(data)
+            async with self._send_lock:
+                await self.websocket.send_text(data)
             self.message_count += 1
             self.last_activity = datetime.now()
             return True
@@ -70,6 +111,91 @@ class WebSocketConnection:
             logger.error(f"Failed to send to {self.connection_id}: {e}")
             return False
 
+    @property
+    def pending(self) -> int:
+        """Number of queued messages not yet written."""
+        return len(self._queue)
+
+    def enqueue(self, data: str, key: Optional[Hashable] = None) -> bool:
+        """
+        Queue a serialized message for the writer task.
+
+        Never blocks: when the queue is full the oldest message is dropped.
+        Under the coalesce policy a message with a ``key`` replaces a queued
+        message with the same key. Must be called on the event loop thread.
+
+        Args:
+            data: Serialized message
+            key: Optional coalescing key (see ``coalesce_key``)
+
+        Returns:
+            False if the connection is closed
+        """
+        if self._closed:
+            return False
+
+        if key is not None and self.overflow_policy == COALESCE:
+            slot: Hashable = ("key", key)
+            if self._queue.pop(slot, None) is not None:
+                self.coalesced_count += 1
+        else:
+            self._queue_seq += 1
+            slot = self._queue_seq
+        self._queue[slot] = data
+
+        while len(self._queue) > self.max_queue_size:
+            self._queue.popitem(last=False)
+            self.dropped_count += 1
+
+        self._queue_event.set()
+        self._ensure_writer()
+        return True
+
+    def _ensure_writer(self) -> None:
+        """Start the writer task if it is not running."""
+        if self._writer is None or self._writer.done():
+            try:
+                self._writer = asyncio.get_running_loop().create_task(self._write_loop())
+            except RuntimeError:
+                # No running loop yet; the writer starts on the next enqueue
+                pass
+
+    async def _write_loop(self) -> None:
+        """Drain the send queue in order."""
+        while not self._closed:
+            await self._queue_event.wait()
+            self._queue_event.clear()
+            while self._queue and not self._closed:
+                _, data = self._queue.popitem(last=False)
+                self._sending = True
+                try:
+                    await self._send_text(data)
+                finally:
+                    self._sending = False
+
+    async def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until all queued messages are written. Returns False on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self._queue or self._sending:
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.001)
+        return True
+
+    async def close(self) -> None:
+        """Stop the writer task and discard queued messages."""
+        self._closed = True
+        self._queue.clear()
+        self._queue_event.set()
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+        self._writer = None
+
     def matches_filter(self, message: WebSocketMessage) -> bool:
         """Check if message passes connection filters."""
         payload = message.payload
@@ -90,12 +216,29 @@ class WebSocketConnection:
 
 
 class ConnectionManager:
-    """Manages all WebSocket connections."""
+    """
+    Manages all WebSocket connections.
 
-    def __init__(self, broadcaster: Optional[ConsoleBroadcaster] = None):
+    Subscribes one callback per channel to the broadcaster. Each published
+    message is serialized once and pushed into the bounded send queues of
+    the matching connections, so a slow client never blocks publishers or
+    other clients.
+    """
+
+    def __init__(
+        self,
+        broadcaster: Optional[ConsoleBroadcaster] = None,
+        max_queue_size: int = 1000,
+        overflow_policy: str = COALESCE,
+    ):
         self.connections: Dict[str, WebSocketConnection] = {}
         self.broadcaster = broadcaster or ConsoleBroadcaster.get_instance()
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
         self._lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._channel_members: Dict[str, Set[str]] = {}
+        self._channel_callbacks: Dict[str, Callable[[WebSocketMessage], None]] = {}
 
     async def connect(
         self,
@@ -103,11 +246,14 @@ class ConnectionManager:
         client_ip: str = "unknown",
     ) -> WebSocketConnection:
         """Register a new connection."""
+        self._loop = asyncio.get_running_loop()
         connection_id = str(uuid.uuid4())
         connection = WebSocketConnection(
             connection_id=connection_id,
             websocket=websocket,
             client_ip=client_ip,
+            max_queue_size=self.max_queue_size,
+            overflow_policy=self.overflow_policy,
         )
 
         async with self._lock:
@@ -130,18 +276,89 @@ class ConnectionManager:
     async def disconnect(self, connection_id: str) -> None:
         """Unregister a connection."""
         async with self._lock:
-            if connection_id in self.connections:
-                connection = self.connections[connection_id]
-
-                # Unsubscribe from all channels
-                for channel in connection.subscriptions:
-                    self.broadcaster.unsubscribe(
-                        channel,
-                        lambda msg, conn=connection: asyncio.create_task(conn.send(msg))
-                    )
+            connection = self.connections.pop(connection_id, None)
+        if connection is None:
+            return
+
+        # Unsubscribe from all channels
+        for channel in list(connection.subscriptions):
+            self._leave_channel(channel, connection_id)
+        await connection.close()
+        logger.info(f"Client disconnected: {connection_id}")
+
+    # =========================================================================
+    # Channel Fan-out
+    # =========================================================================
+
+    def _join_channel(self, channel: str, connection_id: str) -> None:
+        """Add a connection to a channel, subscribing to the broadcaster once."""
+        self._channel_members.setdefault(channel, set()).add(connection_id)
+        if channel not in self._channel_callbacks:
+            callback = self._make_channel_callback(channel)
+            self._channel_callbacks[channel] = callback
+            self.broadcaster.subscribe(channel, callback)
+
+    def _leave_channel(self, channel: str, connection_id: str) -> None:
+        """Remove a connection from a channel; drop the callback when empty."""
+        members = self._channel_members.get(channel)
+        if members is None:
+            return
+        members.discard(connection_id)
+        if not members:
+            del self._channel_members[channel]
+            callback = self._channel_callbacks.pop(channel, None)
+            if callback is not None:
+                self.broadcaster.unsubscribe(channel, callback)
+
+    def _make_channel_callback(self, channel: str) -> Callable[[WebSocketMessage], None]:
+        """Create the broadcaster callback for a channel."""
+        def callback(message: WebSocketMessage) -> None:
+            data = message.model_dump_json()
+            loop = self._loop
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if loop is None or running is loop:
+                self._fan_out(channel, message, data)
+            elif not loop.is_closed():
+                # Published from another thread (MCP tool, Redis listener)
+                loop.call_soon_threadsafe(self._fan_out, channel, message, data)
+        return callback
+
+    def _fan_out(self, channel: Optional[str], message: WebSocketMessage, data: str) -> int:
+        """Queue serialized data on every matching connection."""
+        if channel is None:
+            targets = list(self.connections.values())
+        else:
+            targets = [
+                self.connections[cid]
+                for cid in self._channel_members.get(channel, ())
+                if cid in self.connections
+            ]
+
+        key = coalesce_key(message)
+        seq = getattr(message, "seq", None)
+        count = 0
+        for connection in targets:
+            if seq is not None and seq <= connection.replayed_through:
+                continue  # Already delivered by a history replay
+            if connection.matches_filter(message) and connection.enqueue(data, key):
+                count += 1
+        return count
 
-                del self.connections[connection_id]
-                logger.info(f"Client disconnected: {connection_id}")
+    def _replay(self, connection: WebSocketConnection, cursor: int, channels: List[str]) -> Dict[str, Any]:
+        """Queue the history a reconnecting client missed since ``cursor``."""
+        if not channels or not hasattr(self.broadcaster, "replay"):
+            return {"replayed": 0}
+        result = self.broadcaster.replay(cursor, channels)
+        replayed = 0
+        for msg in result["messages"]:
+            if connection.matches_filter(msg):
+                connection.enqueue(msg.model_dump_json(), coalesce_key(msg))
+                replayed += 1
+        connection.replayed_through = max(connection.replayed_through, result["cursor"])
+        return {"replayed": replayed, "cursor": result["cursor"], "truncated": result["truncated"]}
 
     async def handle_message(
         self,
@@ -212,24 +429,25 @@ class ConnectionManager:
         for channel in channels:
             if channel not in connection.subscriptions:
                 connection.subscriptions.add(channel)
+                self._join_channel(channel, connection.connection_id)
+                subscribed.append(channel)
 
-                # Create callback that sends to this connection
-                def create_callback(conn: WebSocketConnection):
-                    def callback(msg: WebSocketMessage):
-                        if conn.matches_filter(msg):
-                            asyncio.create_task(conn.send(msg))
-                    return callback
+        response = {
+            "subscribed": subscribed,
+            "active_subscriptions": list(connection.subscriptions),
+            "filters": connection.filters,
+        }
 
-                self.broadcaster.subscribe(channel, create_callback(connection))
-                subscribed.append(channel)
+        # Resuming clients pass the last sequence number they saw
+        cursor = payload.get("cursor")
+        if isinstance(cursor, int) and not isinstance(cursor, bool):
+            response.update(self._replay(connection, cursor, subscribed))
+        elif getattr(self.broadcaster, "last_sequence", None) is not None:
+            response["cursor"] = self.broadcaster.last_sequence
 
         return WebSocketMessage(
             type=WebSocketMessageType.SUBSCRIBE,
-            payload={
-                "subscribed": subscribed,
-                "active_subscriptions": list(connection.subscriptions),
-                "filters": connection.filters,
-            },
+            payload=response,
         )
 
     async def _handle_unsubscribe(
@@ -244,7 +462,7 @@ class ConnectionManager:
         for channel in channels:
             if channel in connection.subscriptions:
                 connection.subscriptions.remove(channel)
-                # Note: We can't easily remove the specific callback without tracking it
+                self._leave_channel(channel, connection.connection_id)
                 unsubscribed.append(channel)
 
         return WebSocketMessage(
@@ -260,24 +478,14 @@ class ConnectionManager:
         message: WebSocketMessage,
         channel: Optional[str] = None,
     ) -> int:
-        """Broadcast a message to subscribed connections."""
-        count = 0
-        async with self._lock:
-            connections = list(self.connections.values())
-
-        for connection in connections:
-            # Check if subscribed to the channel
-            if channel and channel not in connection.subscriptions:
-                continue
+        """
+        Broadcast a message to subscribed connections.
 
-            # Check filters
-            if not connection.matches_filter(message):
-                continue
-
-            if await connection.send(message):
-                count += 1
-
-        return count
+        The message is serialized once and queued per connection; returns
+        the number of connections it was queued for.
+        """
+        async with self._lock:
+            return self._fan_out(channel or None, message, message.model_dump_json())
 
     def get_connections(self) -> List[ConnectionInfo]:
         """Get info about all connections."""
@@ -294,6 +502,9 @@ class ConnectionManager:
         return {
             "total_connections": len(connections),
             "total_messages_sent": sum(c.message_count for c in connections),
+            "queued_messages": sum(c.pending for c in connections),
+            "dropped_messages": sum(c.dropped_count for c in connections),
+            "coalesced_messages": sum(c.coalesced_count for c in connections),
             "subscriptions": {
                 channel: sum(1 for c in connections if channel in c.subscriptions)
                 for channel in ["console", "reasoning", "agents", "cortex"]
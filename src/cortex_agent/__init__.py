@@ -23,7 +23,7 @@ from .types import (
     Conversation,
     AgentResponse,
 )
-from .cortex_client import CortexClient
+from .cortex_client import CortexClient, CortexResponseCache
 from .context import CortexAgentContext, get_context
 from .console import (
     ConsoleOutput,
@@ -67,6 +67,7 @@ __all__ = [
     "AgentResponse",
     # Phase 19 Core classes
     "CortexClient",
+    "CortexResponseCache",
     "CortexAgentContext",
     "get_context",
     "CortexReasoningLoop",
@@ -10,11 +10,31 @@ Supported functions:
 - SENTIMENT() - Sentiment analysis (-1 to 1)
 - TRANSLATE() - Language translation
 - EXTRACT_ANSWER() - Question answering from context
+
+Every function has an async counterpart (acomplete, asummarize, ...)
+that awaits an async query function when one is given, and otherwise
+runs the blocking query function on a bounded thread pool so the event
+loop is never blocked. complete_batch() sends many prompts in a single
+set-based query instead of one round trip per prompt.
+
+Single-value calls go through an optional CortexResponseCache so a prompt
+repeated within its TTL (e.g. overlapping reflect/synthesize context) is
+answered without another warehouse round trip.
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
+import os
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 import logging
 
 from .types import CortexFunction, CortexQueryResult
@@ -22,6 +42,168 @@ from .types import CortexFunction, CortexQueryResult
 logger = logging.getLogger(__name__)
 
 
+class CortexResponseCache:
+    """
+    Thread-safe LRU cache of Cortex results with TTL and optional disk persistence.
+
+    Keys hash the function and the whitespace-normalized SQL, which embeds
+    the model, the escaped prompt and the options, so two calls share an
+    entry only when they would send the same request to Cortex.
+
+    With a path, the file is rewritten after every ``flush_every`` puts
+    (outside the lock), on flush()/close() and at interpreter exit, rather
+    than on each put; entries stored since the last write are lost if the
+    process is killed.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        ttl_seconds: float = 3600,
+        path: Optional[Union[str, Path]] = None,
+        flush_every: int = 32,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_seconds: Seconds a response stays valid (0 disables expiry)
+            path: Optional JSON file to load from and persist to
+            flush_every: Puts between writes of the JSON file
+        """
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self.path = Path(path) if path else None
+        self.flush_every = max(1, flush_every)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._unsaved = 0
+        self._hits = 0
+        self._misses = 0
+        self._load()
+        if self.path:
+            atexit.register(_flush_cache, weakref.ref(self))
+
+    @staticmethod
+    def make_key(function: CortexFunction, sql: str) -> str:
+        """Build the cache key for a Cortex query."""
+        normalized = " ".join(sql.split())
+        return hashlib.sha256(f"{function.value}\n{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Any, Optional[str]]]:
+        """Return ``(result, raw_response)`` for a live entry, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry["result"], entry.get("raw_response")
+
+    def put(self, key: str, result: Any, raw_response: Optional[str] = None) -> None:
+        """Store a successful response."""
+        with self._lock:
+            self._entries[key] = {
+                "result": result,
+                "raw_response": raw_response,
+                "stored_at": time.time(),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._unsaved += 1
+            due = self._unsaved >= self.flush_every
+        if due:
+            self.flush()
+
+    def clear(self) -> None:
+        """Drop all cached responses and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._unsaved += 1
+        self.flush()
+
+    def flush(self) -> None:
+        """Write unsaved entries to the JSON file, if persistence is enabled."""
+        if not self.path:
+            return
+        # Writers are serialized so an older snapshot never replaces a newer one
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved:
+                    return
+                self._unsaved = 0
+                snapshot = dict(self._entries)
+            self._save(snapshot)
+
+    def close(self) -> None:
+        """Flush unsaved entries."""
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        return bool(self.ttl_seconds) and time.time() - entry["stored_at"] > self.ttl_seconds
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable Cortex response cache {self.path}: {e}")
+            return
+        if data.get("version") != self.VERSION:
+            return
+        for key, entry in data.get("entries", {}).items():
+            if not self._expired(entry):
+                self._entries[key] = entry
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Write a snapshot of the entries atomically. Caller holds the save lock."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "entries": entries}, f, default=str)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to persist Cortex response cache: {e}")
+
+
+def _flush_cache(ref: "weakref.ref[CortexResponseCache]") -> None:
+    """atexit hook: flush a response cache that is still alive."""
+    cache = ref()
+    if cache is not None:
+        cache.flush()
+
+
 class CortexClient:
     """Execute Cortex LLM functions via SQL through existing connections."""
 
@@ -31,6 +213,9 @@ class CortexClient:
         query_func: callable,
         default_model: str = "mistral-large",
         temperature: float = 0.3,
+        async_query_func: Optional[callable] = None,
+        max_concurrency: int = 4,
+        cache: Optional[CortexResponseCache] = None,
     ):
         """
         Initialize CortexClient.
@@ -40,12 +225,22 @@ class CortexClient:
             query_func: Function to execute SQL queries (from connections API)
             default_model: Default model for COMPLETE()
             temperature: Default temperature for COMPLETE()
+            async_query_func: Optional coroutine function with the same
+                signature as query_func, used by the async methods
+            max_concurrency: Maximum blocking queries run in parallel by
+                the async methods when no async_query_func is given
+            cache: Optional response cache for single-value calls
         """
         self.connection_id = connection_id
         self.query_func = query_func
+        self.async_query_func = async_query_func
         self.default_model = default_model
         self.temperature = temperature
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache
         self._call_count = 0
+        self._count_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def complete(
         self,
@@ -53,6 +248,7 @@ class CortexClient:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        use_cache: bool = True,
     ) -> CortexQueryResult:
         """
         Generate text using Cortex COMPLETE().
@@ -62,10 +258,21 @@ class CortexClient:
             model: Model to use (default: mistral-large)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            use_cache: Set False to bypass the response cache
 
         Returns:
             CortexQueryResult with generated text
         """
+        sql = self._complete_sql(prompt, model, temperature, max_tokens)
+        return self._execute_cortex(CortexFunction.COMPLETE, sql, use_cache=use_cache)
+
+    def _complete_sql(
+        self,
+        prompt: str,
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> str:
         model = model or self.default_model
         temp = temperature if temperature is not None else self.temperature
 
@@ -85,50 +292,58 @@ class CortexClient:
             {options_json}
         ) AS result
         """
+        return sql
 
-        return self._execute_cortex(CortexFunction.COMPLETE, sql)
-
-    def summarize(self, text: str) -> CortexQueryResult:
+    def summarize(self, text: str, use_cache: bool = True) -> CortexQueryResult:
         """
         Summarize text using Cortex SUMMARIZE().
 
         Args:
             text: Text to summarize
+            use_cache: Set False to bypass the response cache
 
         Returns:
             CortexQueryResult with summary
         """
+        return self._execute_cortex(
+            CortexFunction.SUMMARIZE, self._summarize_sql(text), use_cache=use_cache
+        )
+
+    def _summarize_sql(self, text: str) -> str:
         safe_text = text.replace("'", "''")
 
-        sql = f"""
+        return f"""
         SELECT SNOWFLAKE.CORTEX.SUMMARIZE('{safe_text}') AS result
         """
 
-        return self._execute_cortex(CortexFunction.SUMMARIZE, sql)
-
-    def sentiment(self, text: str) -> CortexQueryResult:
+    def sentiment(self, text: str, use_cache: bool = True) -> CortexQueryResult:
         """
         Analyze sentiment using Cortex SENTIMENT().
 
         Args:
             text: Text to analyze
+            use_cache: Set False to bypass the response cache
 
         Returns:
             CortexQueryResult with sentiment score (-1 to 1)
         """
+        return self._execute_cortex(
+            CortexFunction.SENTIMENT, self._sentiment_sql(text), use_cache=use_cache
+        )
+
+    def _sentiment_sql(self, text: str) -> str:
         safe_text = text.replace("'", "''")
 
-        sql = f"""
+        return f"""
         SELECT SNOWFLAKE.CORTEX.SENTIMENT('{safe_text}') AS result
         """
 
-        return self._execute_cortex(CortexFunction.SENTIMENT, sql)
-
     def translate(
         self,
         text: str,
         from_lang: str,
         to_lang: str,
+        use_cache: bool = True,
     ) -> CortexQueryResult:
         """
         Translate text using Cortex TRANSLATE().
@@ -137,13 +352,19 @@ class CortexClient:
             text: Text to translate
             from_lang: Source language code (e.g., 'en', 'es', 'fr')
             to_lang: Target language code
+            use_cache: Set False to bypass the response cache
 
         Returns:
             CortexQueryResult with translation
         """
+        return self._execute_cortex(
+            CortexFunction.TRANSLATE, self._translate_sql(text, from_lang, to_lang), use_cache=use_cache
+        )
+
+    def _translate_sql(self, text: str, from_lang: str, to_lang: str) -> str:
         safe_text = text.replace("'", "''")
 
-        sql = f"""
+        return f"""
         SELECT SNOWFLAKE.CORTEX.TRANSLATE(
             '{safe_text}',
             '{from_lang}',
@@ -151,12 +372,11 @@ class CortexClient:
         ) AS result
         """
 
-        return self._execute_cortex(CortexFunction.TRANSLATE, sql)
-
     def extract_answer(
         self,
         context: str,
         question: str,
+        use_cache: bool = True,
     ) -> CortexQueryResult:
         """
         Extract answer from context using Cortex EXTRACT_ANSWER().
@@ -164,22 +384,26 @@ class CortexClient:
         Args:
             context: Context text to search
             question: Question to answer
+            use_cache: Set False to bypass the response cache
 
         Returns:
             CortexQueryResult with extracted answer
         """
+        return self._execute_cortex(
+            CortexFunction.EXTRACT_ANSWER, self._extract_answer_sql(context, question), use_cache=use_cache
+        )
+
+    def _extract_answer_sql(self, context: str, question: str) -> str:
         safe_context = context.replace("'", "''")
         safe_question = question.replace("'", "''")
 
-        sql = f"""
+        return f"""
         SELECT SNOWFLAKE.CORTEX.EXTRACT_ANSWER(
             '{safe_context}',
             '{safe_question}'
         ) AS result
         """
 
-        return self._execute_cortex(CortexFunction.EXTRACT_ANSWER, sql)
-
     def complete_on_table(
         self,
         table: str,
@@ -201,10 +425,21 @@ class CortexClient:
         Returns:
             CortexQueryResult with array of results
         """
+        sql = self._complete_on_table_sql(table, column, prompt_template, model, limit)
+        return self._execute_cortex(CortexFunction.COMPLETE, sql, rows=True)
+
+    def _complete_on_table_sql(
+        self,
+        table: str,
+        column: str,
+        prompt_template: str,
+        model: Optional[str],
+        limit: int,
+    ) -> str:
         model = model or self.default_model
         safe_template = prompt_template.replace("'", "''")
 
-        sql = f"""
+        return f"""
         SELECT
             {column} as original_value,
             SNOWFLAKE.CORTEX.COMPLETE(
@@ -215,7 +450,56 @@ class CortexClient:
         LIMIT {limit}
         """
 
-        return self._execute_cortex(CortexFunction.COMPLETE, sql)
+    def complete_batch(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> CortexQueryResult:
+        """
+        Apply COMPLETE() to many prompts in one set-based query.
+
+        Args:
+            prompts: Prompts to complete
+            model: Model to use
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per prompt
+
+        Returns:
+            CortexQueryResult with a list of results in prompt order
+        """
+        sql = self._complete_batch_sql(prompts, model, temperature, max_tokens)
+        return self._execute_cortex(CortexFunction.COMPLETE, sql, rows=True)
+
+    def _complete_batch_sql(
+        self,
+        prompts: List[str],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> str:
+        model = model or self.default_model
+        options = {"temperature": temperature if temperature is not None else self.temperature}
+        if max_tokens:
+            options["max_tokens"] = max_tokens
+
+        values = ",\n            ".join(
+            f"({i}, '{prompt.replace(chr(39), chr(39) * 2)}')" for i, prompt in enumerate(prompts)
+        )
+        return f"""
+        SELECT
+            P.IDX,
+            SNOWFLAKE.CORTEX.COMPLETE(
+                '{model}',
+                P.PROMPT,
+                {json.dumps(options)}
+            ) AS result
+        FROM (VALUES
+            {values}
+        ) AS P(IDX, PROMPT)
+        ORDER BY P.IDX
+        """
 
     def sentiment_on_table(
         self,
@@ -242,7 +526,74 @@ class CortexClient:
         LIMIT {limit}
         """
 
-        return self._execute_cortex(CortexFunction.SENTIMENT, sql)
+        return self._execute_cortex(CortexFunction.SENTIMENT, sql, rows=True)
+
+    # ----------------------------------------
+    # Async variants
+    # ----------------------------------------
+
+    async def acomplete(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> CortexQueryResult:
+        """Async COMPLETE(); see complete()."""
+        sql = self._complete_sql(prompt, model, temperature, max_tokens)
+        return await self._aexecute_cortex(CortexFunction.COMPLETE, sql, use_cache=use_cache)
+
+    async def asummarize(self, text: str, use_cache: bool = True) -> CortexQueryResult:
+        """Async SUMMARIZE(); see summarize()."""
+        return await self._aexecute_cortex(
+            CortexFunction.SUMMARIZE, self._summarize_sql(text), use_cache=use_cache
+        )
+
+    async def asentiment(self, text: str, use_cache: bool = True) -> CortexQueryResult:
+        """Async SENTIMENT(); see sentiment()."""
+        return await self._aexecute_cortex(
+            CortexFunction.SENTIMENT, self._sentiment_sql(text), use_cache=use_cache
+        )
+
+    async def atranslate(
+        self, text: str, from_lang: str, to_lang: str, use_cache: bool = True
+    ) -> CortexQueryResult:
+        """Async TRANSLATE(); see translate()."""
+        return await self._aexecute_cortex(
+            CortexFunction.TRANSLATE, self._translate_sql(text, from_lang, to_lang), use_cache=use_cache
+        )
+
+    async def aextract_answer(
+        self, context: str, question: str, use_cache: bool = True
+    ) -> CortexQueryResult:
+        """Async EXTRACT_ANSWER(); see extract_answer()."""
+        return await self._aexecute_cortex(
+            CortexFunction.EXTRACT_ANSWER, self._extract_answer_sql(context, question), use_cache=use_cache
+        )
+
+    async def acomplete_on_table(
+        self,
+        table: str,
+        column: str,
+        prompt_template: str,
+        model: Optional[str] = None,
+        limit: int = 10,
+    ) -> CortexQueryResult:
+        """Async complete_on_table()."""
+        sql = self._complete_on_table_sql(table, column, prompt_template, model, limit)
+        return await self._aexecute_cortex(CortexFunction.COMPLETE, sql, rows=True)
+
+    async def acomplete_batch(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> CortexQueryResult:
+        """Async complete_batch()."""
+        sql = self._complete_batch_sql(prompts, model, temperature, max_tokens)
+        return await self._aexecute_cortex(CortexFunction.COMPLETE, sql, rows=True)
 
     def execute_sql(self, sql: str) -> List[Dict[str, Any]]:
         """
@@ -268,6 +619,8 @@ class CortexClient:
         self,
         function: CortexFunction,
         sql: str,
+        rows: bool = False,
+        use_cache: bool = True,
     ) -> CortexQueryResult:
         """
         Execute a Cortex SQL query and wrap result.
@@ -275,56 +628,181 @@ class CortexClient:
         Args:
             function: The Cortex function being called
             sql: The SQL query
+            rows: Return every row's result instead of the first one
+            use_cache: Consult the response cache (single-value calls only)
 
         Returns:
             CortexQueryResult
         """
+        cache_key = self._cache_key(function, sql, rows, use_cache)
+        if cache_key:
+            cached = self._from_cache(function, sql, cache_key)
+            if cached:
+                return cached
+
         start_time = time.time()
-        self._call_count += 1
+        self._count_call()
 
         try:
             result = self.query_func(
                 connection_id=self.connection_id,
                 query=sql,
             )
+            return self._wrap_result(function, sql, result, start_time, rows, cache_key)
 
-            duration_ms = int((time.time() - start_time) * 1000)
+        except Exception as e:
+            return self._wrap_error(function, sql, e, start_time)
 
+    async def _aexecute_cortex(
+        self,
+        function: CortexFunction,
+        sql: str,
+        rows: bool = False,
+        use_cache: bool = True,
+    ) -> CortexQueryResult:
+        """Execute a Cortex SQL query without blocking the event loop."""
+        if self.async_query_func is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), self._execute_cortex, function, sql, rows, use_cache
+            )
+
+        cache_key = self._cache_key(function, sql, rows, use_cache)
+        if cache_key:
+            cached = self._from_cache(function, sql, cache_key)
+            if cached:
+                return cached
+
+        start_time = time.time()
+        self._count_call()
+        try:
+            result = await self.async_query_func(
+                connection_id=self.connection_id,
+                query=sql,
+            )
+            return self._wrap_result(function, sql, result, start_time, rows, cache_key)
+        except Exception as e:
+            return self._wrap_error(function, sql, e, start_time)
+
+    def _cache_key(
+        self,
+        function: CortexFunction,
+        sql: str,
+        rows: bool,
+        use_cache: bool,
+    ) -> Optional[str]:
+        # Table functions depend on table contents, so only single values are cached
+        if self.cache is None or not use_cache or rows:
+            return None
+        return self.cache.make_key(function, sql)
+
+    def _from_cache(
+        self,
+        function: CortexFunction,
+        sql: str,
+        cache_key: str,
+    ) -> Optional[CortexQueryResult]:
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        result, raw_response = cached
+        return CortexQueryResult(
+            function=function,
+            query=sql.strip(),
+            result=result,
+            duration_ms=0,
+            success=True,
+            raw_response=raw_response,
+            cached=True,
+        )
+
+    @staticmethod
+    def _parse_value(raw_result: Any) -> Any:
+        """Parse JSON result if applicable."""
+        if isinstance(raw_result, str):
+            try:
+                return json.loads(raw_result)
+            except (json.JSONDecodeError, TypeError):
+                return raw_result
+        return raw_result
+
+    def _wrap_result(
+        self,
+        function: CortexFunction,
+        sql: str,
+        result: Any,
+        start_time: float,
+        rows: bool,
+        cache_key: Optional[str] = None,
+    ) -> CortexQueryResult:
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        if rows and isinstance(result, list):
+            parsed_result = [
+                {**row, "RESULT": self._parse_value(row.get("RESULT", row.get("result")))}
+                if isinstance(row, dict) else self._parse_value(row)
+                for row in result
+            ]
+            raw_result = result
+        else:
             # Extract the result value
             if isinstance(result, list) and len(result) > 0:
                 raw_result = result[0].get("RESULT", result[0].get("result", result))
             else:
                 raw_result = result
+            parsed_result = self._parse_value(raw_result)
 
-            # Parse JSON result if applicable
-            parsed_result = raw_result
-            if isinstance(raw_result, str):
-                try:
-                    parsed_result = json.loads(raw_result)
-                except (json.JSONDecodeError, TypeError):
-                    parsed_result = raw_result
-
-            return CortexQueryResult(
-                function=function,
-                query=sql.strip(),
-                result=parsed_result,
-                duration_ms=duration_ms,
-                success=True,
-                raw_response=str(raw_result),
-            )
+        if cache_key:
+            self.cache.put(cache_key, parsed_result, str(raw_result))
 
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            logger.error(f"Cortex {function.value} failed: {e}")
-
-            return CortexQueryResult(
-                function=function,
-                query=sql.strip(),
-                result=None,
-                duration_ms=duration_ms,
-                success=False,
-                error=str(e),
-            )
+        return CortexQueryResult(
+            function=function,
+            query=sql.strip(),
+            result=parsed_result,
+            duration_ms=duration_ms,
+            success=True,
+            raw_response=str(raw_result),
+        )
+
+    def _wrap_error(
+        self,
+        function: CortexFunction,
+        sql: str,
+        error: Exception,
+        start_time: float,
+    ) -> CortexQueryResult:
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.error(f"Cortex {function.value} failed: {error}")
+
+        return CortexQueryResult(
+            function=function,
+            query=sql.strip(),
+            result=None,
+            duration_ms=duration_ms,
+            success=False,
+            error=str(error),
+        )
+
+    def _count_call(self) -> None:
+        with self._count_lock:
+            self._call_count += 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._count_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="cortex"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker threads used by the async methods and flush the cache."""
+        with self._count_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self.cache is not None:
+            self.cache.close()
 
     def get_call_count(self) -> int:
         """Get total number of Cortex calls made."""
@@ -334,6 +812,12 @@ class CortexClient:
         """Reset the call counter."""
         self._call_count = 0
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache hit/miss statistics."""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test the Cortex connection with a simple query.
@@ -345,6 +829,7 @@ class CortexClient:
             result = self.complete(
                 prompt="Say 'Hello from Cortex' in exactly 4 words.",
                 max_tokens=20,
+                use_cache=False,
             )
 
             return {
@@ -31,7 +31,7 @@ from typing import Any, Dict, List, Optional
 
 from .console import CommunicationConsole, CLIOutput, FileOutput
 from .context import CortexAgentContext, get_context
-from .cortex_client import CortexClient
+from .cortex_client import CortexClient, CortexResponseCache
 from .reasoning_loop import CortexReasoningLoop
 from .types import CortexAgentConfig, MessageType
 
@@ -81,11 +81,19 @@ def _ensure_initialized(settings) -> bool:
 
     if _cortex_client is None:
         query_func = _get_query_func(settings)
+        cache = None
+        if config.response_cache_enabled:
+            cache = CortexResponseCache(
+                max_size=config.response_cache_size,
+                ttl_seconds=config.response_cache_ttl_seconds,
+                path=config.response_cache_path,
+            )
         _cortex_client = CortexClient(
             connection_id=config.connection_id,
             query_func=query_func,
             default_model=config.cortex_model,
             temperature=config.temperature,
+            cache=cache,
         )
 
     if _console is None:
@@ -218,6 +226,7 @@ def register_cortex_agent_tools(mcp, settings):
 
         if _cortex_client:
             status["cortex_calls_made"] = _cortex_client.get_call_count()
+            status["response_cache"] = _cortex_client.get_cache_stats()
 
         return status
 
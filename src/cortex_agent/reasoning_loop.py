@@ -4,15 +4,21 @@ CortexReasoningLoop - Orchestrated reasoning loop for complex tasks.
 Implements the Observe → Plan → Execute → Reflect pattern:
 1. OBSERVE: Analyze goal and current state
 2. PLAN: Use Cortex to create execution plan
-3. EXECUTE: Run each step via Cortex SQL
+3. EXECUTE: Run each step via Cortex SQL (independent steps concurrently)
 4. UPDATE: Update internal scratchpad
 5. REFLECT: Check if goal is complete, repeat if needed
 6. SYNTHESIZE: Combine results into final response
 
 This simulates a conversation with Cortex by maintaining state
 and using the scratchpad as context for each Cortex call.
+
+Cortex calls never block the event loop: the client's async methods are
+awaited, or the blocking call is offloaded to a worker thread. Plan steps
+declaring ``depends_on`` run in waves, each wave executing every step
+whose dependencies are satisfied concurrently.
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -75,10 +81,13 @@ Create a step-by-step plan. For each step specify:
 2. Action description
 3. Which Cortex function to use (if any)
 4. What parameters to pass
+5. Which earlier steps it needs results from (depends_on)
+
+Steps that do not depend on each other are executed in parallel.
 
 Format as JSON array:
 [
-  {{"step": 1, "action": "description", "function": "COMPLETE", "parameters": {{"prompt": "..."}}}},
+  {{"step": 1, "action": "description", "function": "COMPLETE", "parameters": {{"prompt": "..."}}, "depends_on": []}},
   ...
 ]
 
@@ -184,18 +193,22 @@ Keep it concise but complete."""
 
             # 3-5. EXECUTE → UPDATE → REFLECT loop
             all_results: List[StepResult] = []
-            for step in plan.steps:
-                if self._step_count >= self.config.max_reasoning_steps:
+            for wave in self._schedule_waves(plan.steps):
+                remaining = self.config.max_reasoning_steps - self._step_count
+                if remaining < len(wave):
                     logger.warning(f"Reached max reasoning steps ({self.config.max_reasoning_steps})")
+                    wave = wave[:remaining]
+                if not wave:
                     break
 
                 # EXECUTE
                 self.context.update_state(conversation_id, AgentState.EXECUTING)
-                result = await self._execute_step(step, goal, all_results, conversation_id)
-                all_results.append(result)
+                wave_results = await self._execute_wave(wave, goal, all_results, conversation_id)
 
                 # UPDATE scratchpad
-                self._update_scratchpad(step, result, conversation_id)
+                for step, result in zip(wave, wave_results):
+                    all_results.append(result)
+                    self._update_scratchpad(step, result, conversation_id)
 
                 # REFLECT
                 self.context.update_state(conversation_id, AgentState.REFLECTING)
@@ -286,7 +299,7 @@ Keep it concise but complete."""
             thinking=f"Goal: {goal}\nContext: {context_str[:200]}...",
         )
 
-        result = self.cortex.complete(prompt)
+        result = await self._call_cortex("complete", prompt)
         self._cortex_call_count += 1
 
         observations = result.result if result.success else "Failed to analyze goal."
@@ -335,7 +348,7 @@ Keep it concise but complete."""
             thinking=f"Based on observations:\n{observations[:300]}...",
         )
 
-        result = self.cortex.complete(prompt)
+        result = await self._call_cortex("complete", prompt)
         self._cortex_call_count += 1
 
         # Parse plan from response
@@ -392,6 +405,9 @@ Keep it concise but complete."""
                     action = step_data.get("action", "Unknown action")
                     func_name = step_data.get("function", "")
                     params = step_data.get("parameters", {})
+                    depends_on = step_data.get("depends_on") or []
+                    if not isinstance(depends_on, list):
+                        depends_on = [depends_on]
 
                     cortex_func = None
                     if func_name:
@@ -406,6 +422,7 @@ Keep it concise but complete."""
                         description=action,
                         cortex_function=cortex_func,
                         parameters=params,
+                        depends_on=[int(d) for d in depends_on if str(d).isdigit()],
                     ))
 
                 return steps
@@ -422,6 +439,71 @@ Keep it concise but complete."""
             parameters={"prompt": "Execute this goal"},
         )]
 
+    def _schedule_waves(self, steps: List[PlanStep]) -> List[List[PlanStep]]:
+        """
+        Group plan steps into waves that can run concurrently.
+
+        A plan without any depends_on is treated as a sequential chain.
+
+        Args:
+            steps: Plan steps in plan order
+
+        Returns:
+            List of waves, each a list of steps in plan order
+        """
+        if not any(step.depends_on for step in steps):
+            return [[step] for step in steps]
+
+        known = {step.step_number for step in steps}
+        done: set = set()
+        pending = list(steps)
+        waves: List[List[PlanStep]] = []
+        while pending:
+            ready = [
+                step for step in pending
+                if all(dep in done or dep not in known for dep in step.depends_on)
+            ]
+            if not ready:
+                logger.warning("Plan has unsatisfiable step dependencies; running remaining steps in order")
+                waves.extend([step] for step in pending)
+                break
+            waves.append(ready)
+            done.update(step.step_number for step in ready)
+            pending = [step for step in pending if step.step_number not in done]
+        return waves
+
+    async def _execute_wave(
+        self,
+        steps: List[PlanStep],
+        goal: str,
+        previous_results: List[StepResult],
+        conversation_id: str,
+    ) -> List[StepResult]:
+        """Execute a wave of independent steps, at most max_parallel_steps at a time."""
+        if len(steps) == 1:
+            return [await self._execute_step(steps[0], goal, previous_results, conversation_id)]
+
+        semaphore = asyncio.Semaphore(self.config.max_parallel_steps)
+        snapshot = list(previous_results)
+
+        async def run_step(step: PlanStep) -> StepResult:
+            async with semaphore:
+                return await self._execute_step(step, goal, snapshot, conversation_id)
+
+        return list(await asyncio.gather(*(run_step(step) for step in steps)))
+
+    async def _call_cortex(self, function: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a CortexClient function without blocking the event loop.
+
+        Uses the client's async variant (``a<function>``) when available,
+        otherwise runs the blocking call in a worker thread.
+        """
+        async_func = getattr(self.cortex, f"a{function}", None)
+        if async_func is not None and asyncio.iscoroutinefunction(async_func):
+            return await async_func(*args, **kwargs)
+        return await asyncio.to_thread(getattr(self.cortex, function), *args, **kwargs)
+
     async def _execute_step(
         self,
         step: PlanStep,
@@ -442,6 +524,7 @@ Keep it concise but complete."""
             StepResult
         """
         self._step_count += 1
+        step_index = self._step_count
         start_time = time.time()
 
         # Format previous results for context
@@ -456,33 +539,46 @@ Keep it concise but complete."""
 
         try:
             # Execute based on Cortex function
-            if step.cortex_function == CortexFunction.COMPLETE:
+            if step.cortex_function == CortexFunction.COMPLETE and step.parameters.get("prompts"):
+                # Many prompts: one set-based query instead of a call per prompt
+                result = await self._call_cortex("complete_batch", list(step.parameters["prompts"]))
+
+            elif step.cortex_function == CortexFunction.COMPLETE and step.parameters.get("table"):
+                result = await self._call_cortex(
+                    "complete_on_table",
+                    step.parameters["table"],
+                    step.parameters.get("column", ""),
+                    step.parameters.get("prompt", step.description),
+                    limit=step.parameters.get("limit", 10),
+                )
+
+            elif step.cortex_function == CortexFunction.COMPLETE:
                 prompt = step.parameters.get("prompt", self.EXECUTE_PROMPT.format(
                     step_number=step.step_number,
                     goal=goal,
                     step_description=step.description,
                     previous_results=prev_results_str or "None yet",
                 ))
-                result = self.cortex.complete(prompt)
+                result = await self._call_cortex("complete", prompt)
 
             elif step.cortex_function == CortexFunction.SUMMARIZE:
                 text = step.parameters.get("text", prev_results_str)
-                result = self.cortex.summarize(text)
+                result = await self._call_cortex("summarize", text)
 
             elif step.cortex_function == CortexFunction.SENTIMENT:
                 text = step.parameters.get("text", "")
-                result = self.cortex.sentiment(text)
+                result = await self._call_cortex("sentiment", text)
 
             elif step.cortex_function == CortexFunction.TRANSLATE:
                 text = step.parameters.get("text", "")
                 from_lang = step.parameters.get("from", "en")
                 to_lang = step.parameters.get("to", "es")
-                result = self.cortex.translate(text, from_lang, to_lang)
+                result = await self._call_cortex("translate", text, from_lang, to_lang)
 
             elif step.cortex_function == CortexFunction.EXTRACT_ANSWER:
                 context = step.parameters.get("context", prev_results_str)
                 question = step.parameters.get("question", goal)
-                result = self.cortex.extract_answer(context, question)
+                result = await self._call_cortex("extract_answer", context, question)
 
             else:
                 # Default to COMPLETE
@@ -492,7 +588,7 @@ Keep it concise but complete."""
                     step_description=step.description,
                     previous_results=prev_results_str or "None yet",
                 )
-                result = self.cortex.complete(prompt)
+                result = await self._call_cortex("complete", prompt)
 
             self._cortex_call_count += 1
             duration_ms = int((time.time() - start_time) * 1000)
@@ -509,7 +605,7 @@ Keep it concise but complete."""
 
             # Record thinking step
             thinking_step = ThinkingStep(
-                step_number=self._step_count,
+                step_number=step_index,
                 phase=AgentState.EXECUTING,
                 content=f"Executed: {step.description}",
                 cortex_function=step.cortex_function or CortexFunction.COMPLETE,
@@ -585,7 +681,7 @@ Keep it concise but complete."""
             "Reflecting: Evaluating if goal is complete",
         )
 
-        result = self.cortex.complete(prompt)
+        result = await self._call_cortex("complete", prompt)
         self._cortex_call_count += 1
 
         # Parse reflection
@@ -659,7 +755,7 @@ Keep it concise but complete."""
             "Synthesizing: Creating final response",
         )
 
-        result = self.cortex.complete(prompt)
+        result = await self._call_cortex("complete", prompt)
         self._cortex_call_count += 1
 
         final_result = str(result.result) if result.success else f"Task completed with {len(results)} steps. {summary}"
@@ -297,6 +297,30 @@ class CortexAgentConfig(BaseModel):
         le=50,
         description="Maximum steps in reasoning loop"
     )
+    max_parallel_steps: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Maximum independent plan steps executed concurrently"
+    )
+    response_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse results of identical Cortex calls"
+    )
+    response_cache_size: int = Field(
+        default=512,
+        ge=1,
+        description="Maximum cached Cortex responses"
+    )
+    response_cache_ttl_seconds: float = Field(
+        default=3600,
+        ge=0,
+        description="Seconds a cached Cortex response stays valid (0 = no expiry)"
+    )
+    response_cache_path: Optional[str] = Field(
+        default=None,
+        description="Optional JSON file to persist the response cache"
+    )
     temperature: float = Field(
         default=0.3,
         ge=0.0,
@@ -325,5 +349,6 @@ class CortexQueryResult(BaseModel):
     success: bool
     error: Optional[str] = None
     raw_response: Optional[str] = None
+    cached: bool = False
 
     model_config = {"extra": "allow"}
@@ -51,6 +51,8 @@ from .types import (
     CatalogStats,
 )
 
+from .search_index import CatalogSearchIndex, SearchDocument, SearchFilter
+from .storage import CatalogStorage, LazyModelDict
 from .catalog_store import CatalogStore
 from .scanner import CatalogScanner
 from .lineage_extractor import (
@@ -87,6 +89,11 @@ __all__ = [
     "CatalogStats",
     # Classes
     "CatalogStore",
+    "CatalogSearchIndex",
+    "SearchDocument",
+    "SearchFilter",
+    "CatalogStorage",
+    "LazyModelDict",
     "CatalogScanner",
     # Lineage Extraction
     "SQLLineageExtractor",
@@ -6,27 +6,31 @@ Provides storage and retrieval for:
 - Business glossary terms and domains
 - Tags and classifications
 - Search indexing
+
+Records are persisted individually to a SQLite store (see storage.py) and
+the search index is snapshotted alongside them, so opening a large catalog
+only replays the changes made since the last snapshot.
 """
 
 import json
 import logging
-import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
 
+from .search_index import CatalogSearchIndex, SearchDocument, SearchFilter, tokenize
+from .storage import CatalogStorage, LazyModelDict
 from .types import (
     AssetType,
     CatalogStats,
-    ColumnProfile,
     DataAsset,
     DataClassification,
     DataQualityTier,
     GlossaryDomain,
     GlossaryTerm,
-    Owner,
     OwnershipRole,
-    QualityMetrics,
     SearchQuery,
     SearchResult,
     SearchResults,
@@ -40,6 +44,10 @@ logger = logging.getLogger(__name__)
 class CatalogStore:
     """Persistent storage for the data catalog."""
 
+    # Snapshot the search index after this many indexed changes (or 10% of
+    # the index, whichever is larger) so replay on startup stays short
+    SNAPSHOT_MIN_CHANGES = 1000
+
     def __init__(self, data_dir: str = "data/data_catalog"):
         """
         Initialize the catalog store.
@@ -50,24 +58,61 @@ class CatalogStore:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # File paths
+        # Record store; the JSON files are only read to migrate older catalogs
+        self.db_file = self.data_dir / "catalog.db"
         self.assets_file = self.data_dir / "assets.json"
         self.glossary_file = self.data_dir / "glossary.json"
         self.domains_file = self.data_dir / "domains.json"
         self.tags_file = self.data_dir / "tags.json"
+        self._storage = CatalogStorage(str(self.db_file))
+        self._changes_since_snapshot = 0
 
-        # In-memory stores
+        # In-memory stores (models are hydrated from storage on first access)
         self._assets: Dict[str, DataAsset] = {}
         self._glossary_terms: Dict[str, GlossaryTerm] = {}
         self._domains: Dict[str, GlossaryDomain] = {}
         self._tags: Dict[str, Tag] = {}
 
-        # Search index (simple inverted index)
-        self._search_index: Dict[str, Set[str]] = {}  # word -> asset_ids
+        # Search index (BM25 inverted index with facet filters)
+        self._search_index = CatalogSearchIndex()
+
+        # Change subscribers and a monotonically increasing change stamp
+        self._listeners: List[Callable[[str, Any], None]] = []
+        self.version = 0
 
         # Load from disk
         self._load_all()
 
+    # =========================================================================
+    # Change Subscriptions
+    # =========================================================================
+
+    def subscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """
+        Register a callback for catalog changes.
+
+        The callback receives ``(event, obj)`` where event is one of
+        ``asset_created``, ``asset_updated``, ``asset_deleted``,
+        ``term_created``, ``term_updated`` or ``term_deleted`` and obj is
+        the affected DataAsset or GlossaryTerm.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """Remove a previously registered change callback."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event: str, obj: Any) -> None:
+        """Bump the change stamp and notify subscribers."""
+        self.version += 1
+        for callback in list(self._listeners):
+            try:
+                callback(event, obj)
+            except Exception as e:
+                logger.warning(f"Catalog change listener failed on {event}: {e}")
+
     # =========================================================================
     # Asset Operations
     # =========================================================================
@@ -82,7 +127,8 @@ class CatalogStore:
 
         self._assets[asset.id] = asset
         self._index_asset(asset)
-        self._save_assets()
+        self._save_asset(asset)
+        self._notify("asset_created", asset)
 
         logger.info(f"Created asset: {asset.name} ({asset.asset_type.value})")
         return asset
@@ -129,7 +175,8 @@ class CatalogStore:
 
         # Re-index
         self._index_asset(asset)
-        self._save_assets()
+        self._save_asset(asset)
+        self._notify("asset_updated", asset)
 
         logger.info(f"Updated asset: {asset.name}")
         return asset
@@ -142,11 +189,18 @@ class CatalogStore:
 
         self._unindex_asset(asset)
         del self._assets[asset_id]
-        self._save_assets()
+        self._delete_record("asset", asset_id)
+        self._notify("asset_deleted", asset)
 
         logger.info(f"Deleted asset: {asset.name}")
         return True
 
+    def iter_assets(self, asset_types: Optional[List[AssetType]] = None) -> Iterator[DataAsset]:
+        """Iterate over all assets (unsorted, unpaginated), optionally by type."""
+        for asset in self._assets.values():
+            if asset_types is None or asset.asset_type in asset_types:
+                yield asset
+
     def list_assets(
         self,
         asset_type: Optional[AssetType] = None,
@@ -228,7 +282,7 @@ class CatalogStore:
     def create_tag(self, tag: Tag) -> Tag:
         """Create a new tag."""
         self._tags[tag.name.lower()] = tag
-        self._save_tags()
+        self._save_tag(tag)
         return tag
 
     def get_tag(self, name: str) -> Optional[Tag]:
@@ -249,12 +303,21 @@ class CatalogStore:
 
         del self._tags[name.lower()]
 
-        # Remove from all assets
-        for asset in self._assets.values():
-            asset.tags = [t for t in asset.tags if t.name.lower() != name.lower()]
-
-        self._save_tags()
-        self._save_assets()
+        updated = []
+        with self._storage.batch():
+            self._delete_record("tag", name.lower())
+
+            # Remove from all assets
+            for asset in self._assets.values():
+                tags = [t for t in asset.tags if t.name.lower() != name.lower()]
+                if len(tags) != len(asset.tags):
+                    asset.tags = tags
+                    self._index_asset(asset)
+                    self._save_asset(asset)
+                    updated.append(asset)
+
+        for asset in updated:
+            self._notify("asset_updated", asset)
         return True
 
     def add_tag_to_asset(self, asset_id: str, tag_name: str) -> bool:
@@ -269,7 +332,9 @@ class CatalogStore:
             self.create_tag(tag)
 
         asset.add_tag(tag)
-        self._save_assets()
+        self._index_asset(asset)
+        self._save_asset(asset)
+        self._notify("asset_updated", asset)
         return True
 
     def remove_tag_from_asset(self, asset_id: str, tag_name: str) -> bool:
@@ -279,7 +344,9 @@ class CatalogStore:
             return False
 
         if asset.remove_tag(tag_name):
-            self._save_assets()
+            self._index_asset(asset)
+            self._save_asset(asset)
+            self._notify("asset_updated", asset)
             return True
         return False
 
@@ -297,14 +364,15 @@ class CatalogStore:
 
         self._glossary_terms[term.id] = term
         self._index_term(term)
-        self._save_glossary()
+        self._save_term(term)
+        self._notify("term_created", term)
 
         # Update domain term count
         if term.domain:
             for domain in self._domains.values():
                 if domain.name.lower() == term.domain.lower():
                     domain.term_count += 1
-                    self._save_domains()
+                    self._save_domain(domain)
                     break
 
         logger.info(f"Created glossary term: {term.name}")
@@ -336,7 +404,8 @@ class CatalogStore:
         term.updated_at = datetime.now()
 
         self._index_term(term)
-        self._save_glossary()
+        self._save_term(term)
+        self._notify("term_updated", term)
 
         logger.info(f"Updated glossary term: {term.name}")
         return term
@@ -349,7 +418,8 @@ class CatalogStore:
 
         self._unindex_term(term)
         del self._glossary_terms[term_id]
-        self._save_glossary()
+        self._delete_record("term", term_id)
+        self._notify("term_deleted", term)
 
         logger.info(f"Deleted glossary term: {term.name}")
         return True
@@ -385,7 +455,7 @@ class CatalogStore:
         if asset_id not in term.linked_asset_ids:
             term.linked_asset_ids.append(asset_id)
             term.updated_at = datetime.now()
-            self._save_glossary()
+            self._save_term(term)
 
         return True
 
@@ -398,7 +468,7 @@ class CatalogStore:
         if column_ref not in term.linked_column_refs:
             term.linked_column_refs.append(column_ref)
             term.updated_at = datetime.now()
-            self._save_glossary()
+            self._save_term(term)
 
         return True
 
@@ -413,7 +483,7 @@ class CatalogStore:
 
         domain.created_at = datetime.now()
         self._domains[domain.id] = domain
-        self._save_domains()
+        self._save_domain(domain)
 
         logger.info(f"Created glossary domain: {domain.name}")
         return domain
@@ -432,7 +502,7 @@ class CatalogStore:
             return False
 
         del self._domains[domain_id]
-        self._save_domains()
+        self._delete_record("domain", domain_id)
         return True
 
     # =========================================================================
@@ -444,58 +514,66 @@ class CatalogStore:
         import time
         start_time = time.time()
 
-        results = []
         query_words = self._tokenize(query.query.lower())
 
-        # Find matching asset IDs from index
-        matching_ids: Set[str] = set()
-        for word in query_words:
-            for indexed_word, asset_ids in self._search_index.items():
-                if word in indexed_word or indexed_word.startswith(word):
-                    matching_ids.update(asset_ids)
-
-        # Score and filter results
-        for asset_id in matching_ids:
-            asset = self._assets.get(asset_id)
-            if not asset:
-                continue
-
-            # Apply filters
-            if query.asset_types and asset.asset_type not in query.asset_types:
-                continue
-            if query.classifications and asset.classification not in query.classifications:
-                continue
-            if query.quality_tier and asset.quality_tier != query.quality_tier:
-                continue
-            if query.databases and asset.database and asset.database.lower() not in [d.lower() for d in query.databases]:
-                continue
-            if query.schemas and asset.schema_name and asset.schema_name.lower() not in [s.lower() for s in query.schemas]:
-                continue
-
-            if query.tags:
-                asset_tag_names = {t.name.lower() for t in asset.tags}
-                if not all(t.lower() in asset_tag_names for t in query.tags):
-                    continue
+        # Facet filters (assets only; glossary terms are never filtered)
+        any_of: Dict[str, List[str]] = {"kind": ["asset"]}
+        if query.asset_types:
+            any_of["type"] = [t.value for t in query.asset_types]
+        if query.classifications:
+            any_of["classification"] = [c.value for c in query.classifications]
+        if query.quality_tier:
+            any_of["quality_tier"] = [query.quality_tier.value]
+        # Assets without a database/schema are not excluded by those filters
+        if query.databases:
+            any_of["database"] = [d.lower() for d in query.databases] + [""]
+        if query.schemas:
+            any_of["schema"] = [s.lower() for s in query.schemas] + [""]
+        if query.owners:
+            any_of["owner"] = list(query.owners)
+
+        asset_filter = SearchFilter(
+            any_of=any_of,
+            all_of={"tag": [t.lower() for t in query.tags]} if query.tags else {},
+            min_quality_score=query.min_quality_score or None,
+        )
+        mask = self._search_index.filter_mask(asset_filter)
 
-            if query.owners:
-                asset_owner_ids = {o.user_id for o in asset.owners}
-                if not any(o in asset_owner_ids for o in query.owners):
-                    continue
+        weights = None
+        if query.include_glossary:
+            term_mask = self._search_index.filter_mask(SearchFilter(any_of={"kind": ["term"]}))
+            mask |= term_mask
+            weights = np.where(term_mask, 0.8, 1.0)  # Slightly lower priority
+
+        ranked, total = self._search_index.search(
+            query.query,
+            top_k=query.offset + query.limit,
+            mask=mask,
+            weights=weights,
+        )
+        top_score = ranked[0][1] if ranked else 1.0
 
-            if query.min_quality_score:
-                if asset.quality_metrics:
-                    score = asset.quality_metrics.overall_score
-                    if score is None or score < query.min_quality_score:
-                        continue
-                else:
+        results = []
+        for key, raw_score in ranked[query.offset:]:
+            score = raw_score / top_score
+            if key.startswith("term:"):
+                term = self._glossary_terms.get(key[len("term:"):])
+                if not term:
                     continue
+                results.append(SearchResult(
+                    asset_id=term.id,
+                    asset_type=AssetType.HIERARCHY,  # Placeholder
+                    name=f"[Term] {term.name}",
+                    description=term.definition[:200],
+                    match_score=score,
+                    match_highlights=[term.definition[:100]],
+                    tags=[t.name for t in term.tags],
+                ))
+                continue
 
-            # Calculate relevance score
-            score = self._calculate_relevance(asset, query_words)
-
-            # Get match highlights
-            highlights = self._get_highlights(asset, query_words)
-
+            asset = self._assets.get(key)
+            if not asset:
+                continue
             results.append(SearchResult(
                 asset_id=asset.id,
                 asset_type=asset.asset_type,
@@ -503,35 +581,12 @@ class CatalogStore:
                 fully_qualified_name=asset.fully_qualified_name,
                 description=asset.description,
                 match_score=score,
-                match_highlights=highlights,
+                match_highlights=self._get_highlights(asset, query_words),
                 tags=[t.name for t in asset.tags],
                 owners=[o.name for o in asset.owners],
                 quality_tier=asset.quality_tier,
             ))
 
-        # Include glossary terms if requested
-        if query.include_glossary:
-            for term in self._glossary_terms.values():
-                term_text = f"{term.name} {term.definition}".lower()
-                if any(word in term_text for word in query_words):
-                    score = sum(1 for w in query_words if w in term_text) / len(query_words)
-                    results.append(SearchResult(
-                        asset_id=term.id,
-                        asset_type=AssetType.HIERARCHY,  # Placeholder
-                        name=f"[Term] {term.name}",
-                        description=term.definition[:200],
-                        match_score=score * 0.8,  # Slightly lower priority
-                        match_highlights=[term.definition[:100]],
-                        tags=[t.name for t in term.tags],
-                    ))
-
-        # Sort by relevance
-        results.sort(key=lambda r: r.match_score, reverse=True)
-
-        # Apply pagination
-        total = len(results)
-        results = results[query.offset:query.offset + query.limit]
-
         took_ms = int((time.time() - start_time) * 1000)
 
         return SearchResults(
@@ -543,44 +598,6 @@ class CatalogStore:
             took_ms=took_ms,
         )
 
-    def _calculate_relevance(self, asset: DataAsset, query_words: List[str]) -> float:
-        """Calculate relevance score for an asset."""
-        score = 0.0
-        total_words = len(query_words)
-        if total_words == 0:
-            return 0.0
-
-        # Name match (highest weight)
-        name_lower = asset.name.lower()
-        for word in query_words:
-            if word in name_lower:
-                score += 3.0
-            if name_lower.startswith(word):
-                score += 2.0
-
-        # Description match
-        if asset.description:
-            desc_lower = asset.description.lower()
-            for word in query_words:
-                if word in desc_lower:
-                    score += 1.0
-
-        # Tag match
-        tag_names = " ".join(t.name.lower() for t in asset.tags)
-        for word in query_words:
-            if word in tag_names:
-                score += 1.5
-
-        # Column match
-        if asset.columns:
-            col_text = " ".join(c.column_name.lower() for c in asset.columns)
-            for word in query_words:
-                if word in col_text:
-                    score += 0.5
-
-        # Normalize
-        return min(score / (total_words * 5), 1.0)
-
     def _get_highlights(self, asset: DataAsset, query_words: List[str]) -> List[str]:
         """Get text snippets that match the query."""
         highlights = []
@@ -609,10 +626,7 @@ class CatalogStore:
 
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text into searchable words."""
-        # Split on non-alphanumeric
-        words = re.split(r'[^a-zA-Z0-9]+', text.lower())
-        # Filter short words
-        return [w for w in words if len(w) >= 2]
+        return tokenize(text)
 
     # =========================================================================
     # Statistics
@@ -676,56 +690,48 @@ class CatalogStore:
 
     def _index_asset(self, asset: DataAsset) -> None:
         """Add an asset to the search index."""
-        words = set()
-
-        # Index name
-        words.update(self._tokenize(asset.name))
-
-        # Index description
-        if asset.description:
-            words.update(self._tokenize(asset.description))
-
-        # Index tags
-        for tag in asset.tags:
-            words.update(self._tokenize(tag.name))
-
-        # Index columns
-        for col in asset.columns:
-            words.update(self._tokenize(col.column_name))
-            if col.description:
-                words.update(self._tokenize(col.description))
-
-        # Index fully qualified name
-        if asset.fully_qualified_name:
-            words.update(self._tokenize(asset.fully_qualified_name))
-
-        # Add to index
-        for word in words:
-            if word not in self._search_index:
-                self._search_index[word] = set()
-            self._search_index[word].add(asset.id)
+        column_text = " ".join(
+            f"{col.column_name} {col.description or ''}" for col in asset.columns
+        )
+        quality = asset.quality_metrics.overall_score if asset.quality_metrics else None
+
+        self._search_index.add(SearchDocument(
+            key=asset.id,
+            fields={
+                "name": asset.name,
+                "fqn": asset.fully_qualified_name or "",
+                "description": asset.description or "",
+                "tags": " ".join(t.name for t in asset.tags),
+                "columns": column_text,
+            },
+            facets={
+                "kind": ["asset"],
+                "type": [asset.asset_type.value],
+                "classification": [asset.classification.value],
+                "quality_tier": [asset.quality_tier.value],
+                "database": [(asset.database or "").lower()],
+                "schema": [(asset.schema_name or "").lower()],
+                "tag": [t.name.lower() for t in asset.tags],
+                "owner": [o.user_id for o in asset.owners],
+            },
+            quality_score=quality,
+        ))
 
     def _unindex_asset(self, asset: DataAsset) -> None:
         """Remove an asset from the search index."""
-        for word_set in self._search_index.values():
-            word_set.discard(asset.id)
+        self._search_index.remove(asset.id)
 
     def _index_term(self, term: GlossaryTerm) -> None:
         """Add a term to the search index."""
-        words = set()
-        words.update(self._tokenize(term.name))
-        words.update(self._tokenize(term.definition))
-
-        for word in words:
-            if word not in self._search_index:
-                self._search_index[word] = set()
-            self._search_index[word].add(f"term:{term.id}")
+        self._search_index.add(SearchDocument(
+            key=f"term:{term.id}",
+            fields={"name": term.name, "description": term.definition},
+            facets={"kind": ["term"]},
+        ))
 
     def _unindex_term(self, term: GlossaryTerm) -> None:
         """Remove a term from the search index."""
-        term_key = f"term:{term.id}"
-        for word_set in self._search_index.values():
-            word_set.discard(term_key)
+        self._search_index.remove(f"term:{term.id}")
 
     def rebuild_index(self) -> int:
         """Rebuild the entire search index."""
@@ -737,145 +743,152 @@ class CatalogStore:
         for term in self._glossary_terms.values():
             self._index_term(term)
 
-        return len(self._search_index)
+        return self._search_index.term_count
 
     # =========================================================================
     # Persistence
     # =========================================================================
 
-    def _save_assets(self) -> None:
-        """Save assets to disk."""
-        data = {
-            asset_id: asset.model_dump(mode="json")
-            for asset_id, asset in self._assets.items()
-        }
-        with open(self.assets_file, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-
-    def _save_glossary(self) -> None:
-        """Save glossary terms to disk."""
-        data = {
-            term_id: term.model_dump(mode="json")
-            for term_id, term in self._glossary_terms.items()
-        }
-        with open(self.glossary_file, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-
-    def _save_domains(self) -> None:
-        """Save domains to disk."""
-        data = {
-            domain_id: domain.model_dump(mode="json")
-            for domain_id, domain in self._domains.items()
-        }
-        with open(self.domains_file, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-
-    def _save_tags(self) -> None:
-        """Save tags to disk."""
-        data = {
-            name: tag.model_dump(mode="json")
-            for name, tag in self._tags.items()
-        }
-        with open(self.tags_file, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+    def batch(self):
+        """
+        Group catalog writes into a single storage transaction.
 
-    def _load_all(self) -> None:
-        """Load all data from disk."""
-        self._load_assets()
-        self._load_glossary()
-        self._load_domains()
-        self._load_tags()
-        self.rebuild_index()
-
-    def _load_assets(self) -> None:
-        """Load assets from disk."""
-        if not self.assets_file.exists():
-            return
+        Use for bulk operations such as scans::
 
+            with store.batch():
+                for asset in assets:
+                    store.create_asset(asset)
+        """
+        return self._storage.batch()
+
+    def flush(self) -> None:
+        """Snapshot the search index so the next startup skips re-indexing."""
+        self._save_index_snapshot()
+
+    def close(self) -> None:
+        """Flush pending index state and close the underlying storage."""
+        if self._changes_since_snapshot:
+            self._save_index_snapshot()
+        self._storage.close()
+
+    def _save_asset(self, asset: DataAsset) -> None:
+        """Persist a single asset."""
+        self._storage.put("asset", asset.id, asset.model_dump_json())
+        self._record_change()
+
+    def _save_term(self, term: GlossaryTerm) -> None:
+        """Persist a single glossary term."""
+        self._storage.put("term", term.id, term.model_dump_json())
+        self._record_change()
+
+    def _save_domain(self, domain: GlossaryDomain) -> None:
+        """Persist a single domain."""
+        self._storage.put("domain", domain.id, domain.model_dump_json())
+
+    def _save_tag(self, tag: Tag) -> None:
+        """Persist a single tag."""
+        self._storage.put("tag", tag.name.lower(), tag.model_dump_json())
+
+    def _delete_record(self, kind: str, record_id: str) -> None:
+        """Delete a persisted record."""
+        self._storage.delete(kind, record_id)
+        if kind in ("asset", "term"):
+            self._record_change()
+
+    def _record_change(self) -> None:
+        """Count an indexed change and snapshot the index when enough accumulate."""
+        self._changes_since_snapshot += 1
+        threshold = max(self.SNAPSHOT_MIN_CHANGES, len(self._search_index) // 10)
+        if self._changes_since_snapshot >= threshold:
+            self._save_index_snapshot()
+
+    def _save_index_snapshot(self) -> None:
+        """Persist the search index together with the sequence it reflects."""
         try:
-            with open(self.assets_file, "r") as f:
-                data = json.load(f)
-
-            for asset_id, asset_data in data.items():
-                # Parse nested models
-                if "tags" in asset_data:
-                    asset_data["tags"] = [Tag(**t) for t in asset_data["tags"]]
-                if "owners" in asset_data:
-                    asset_data["owners"] = [Owner(**o) for o in asset_data["owners"]]
-                if "columns" in asset_data:
-                    asset_data["columns"] = [ColumnProfile(**c) for c in asset_data["columns"]]
-                if "quality_metrics" in asset_data and asset_data["quality_metrics"]:
-                    asset_data["quality_metrics"] = QualityMetrics(**asset_data["quality_metrics"])
-
-                # Handle datetime fields
-                for dt_field in ["created_at", "updated_at", "last_scanned_at", "last_accessed_at"]:
-                    if dt_field in asset_data and asset_data[dt_field]:
-                        if isinstance(asset_data[dt_field], str):
-                            asset_data[dt_field] = datetime.fromisoformat(asset_data[dt_field].replace("Z", "+00:00"))
-
-                self._assets[asset_id] = DataAsset(**asset_data)
-
+            self._storage.save_snapshot("search_index", self._search_index.to_bytes())
+            self._changes_since_snapshot = 0
         except Exception as e:
-            logger.error(f"Failed to load assets: {e}")
-
-    def _load_glossary(self) -> None:
-        """Load glossary terms from disk."""
-        if not self.glossary_file.exists():
-            return
-
-        try:
-            with open(self.glossary_file, "r") as f:
-                data = json.load(f)
+            logger.warning(f"Failed to snapshot search index: {e}")
 
-            for term_id, term_data in data.items():
-                if "tags" in term_data:
-                    term_data["tags"] = [Tag(**t) for t in term_data["tags"]]
-                if "owner" in term_data and term_data["owner"]:
-                    term_data["owner"] = Owner(**term_data["owner"])
-
-                for dt_field in ["created_at", "updated_at", "approved_at"]:
-                    if dt_field in term_data and term_data[dt_field]:
-                        if isinstance(term_data[dt_field], str):
-                            term_data[dt_field] = datetime.fromisoformat(term_data[dt_field].replace("Z", "+00:00"))
-
-                self._glossary_terms[term_id] = GlossaryTerm(**term_data)
-
-        except Exception as e:
-            logger.error(f"Failed to load glossary: {e}")
+    def _restore_index(self) -> bool:
+        """
+        Load the search index snapshot and replay changes made after it.
 
-    def _load_domains(self) -> None:
-        """Load domains from disk."""
-        if not self.domains_file.exists():
-            return
+        Returns:
+            True if the index was restored, False if it must be rebuilt
+        """
+        snapshot = self._storage.load_snapshot("search_index")
+        if snapshot is None:
+            return False
 
+        seq, blob = snapshot
         try:
-            with open(self.domains_file, "r") as f:
-                data = json.load(f)
-
-            for domain_id, domain_data in data.items():
-                if "owner" in domain_data and domain_data["owner"]:
-                    domain_data["owner"] = Owner(**domain_data["owner"])
-
-                if "created_at" in domain_data and domain_data["created_at"]:
-                    if isinstance(domain_data["created_at"], str):
-                        domain_data["created_at"] = datetime.fromisoformat(domain_data["created_at"].replace("Z", "+00:00"))
-
-                self._domains[domain_id] = GlossaryDomain(**domain_data)
-
+            index = CatalogSearchIndex.from_bytes(blob)
         except Exception as e:
-            logger.error(f"Failed to load domains: {e}")
+            logger.warning(f"Discarding unreadable search index snapshot: {e}")
+            return False
+
+        self._search_index = index
+        upserts, deletes = self._storage.changes_since(seq)
+        for kind, record_id in deletes:
+            if kind == "asset":
+                self._search_index.remove(record_id)
+            elif kind == "term":
+                self._search_index.remove(f"term:{record_id}")
+        for kind, record_id in upserts:
+            if kind == "asset" and record_id in self._assets:
+                self._index_asset(self._assets[record_id])
+            elif kind == "term" and record_id in self._glossary_terms:
+                self._index_term(self._glossary_terms[record_id])
+
+        self._changes_since_snapshot = len(upserts) + len(deletes)
+        logger.info(f"Restored search index ({len(index)} docs, {self._changes_since_snapshot} replayed)")
+        return True
 
-    def _load_tags(self) -> None:
-        """Load tags from disk."""
-        if not self.tags_file.exists():
+    def _load_all(self) -> None:
+        """Load all data from storage."""
+        if self._storage.seq == 0:
+            self._migrate_json_files()
+
+        self._assets = LazyModelDict(DataAsset, self._storage.load("asset"))
+        self._glossary_terms = LazyModelDict(GlossaryTerm, self._storage.load("term"))
+        self._domains = LazyModelDict(GlossaryDomain, self._storage.load("domain"))
+        self._tags = LazyModelDict(Tag, self._storage.load("tag"))
+
+        if not self._restore_index():
+            self.rebuild_index()
+            self._save_index_snapshot()
+
+    def _migrate_json_files(self) -> None:
+        """Import catalogs saved by the previous whole-file JSON format."""
+        sources = [
+            ("asset", self.assets_file, DataAsset),
+            ("term", self.glossary_file, GlossaryTerm),
+            ("domain", self.domains_file, GlossaryDomain),
+            ("tag", self.tags_file, Tag),
+        ]
+        if not any(path.exists() for _, path, _ in sources):
             return
 
-        try:
-            with open(self.tags_file, "r") as f:
-                data = json.load(f)
+        migrated = 0
+        with self._storage.batch():
+            for kind, path, model_cls in sources:
+                if not path.exists():
+                    continue
+                try:
+                    with open(path, "r") as f:
+                        data = json.load(f)
+                except Exception as e:
+                    logger.error(f"Failed to read {path.name}: {e}")
+                    continue
 
-            for name, tag_data in data.items():
-                self._tags[name] = Tag(**tag_data)
+                for record_id, record in data.items():
+                    try:
+                        model = model_cls.model_validate(record)
+                    except Exception as e:
+                        logger.error(f"Failed to migrate {kind} '{record_id}': {e}")
+                        continue
+                    self._storage.put(kind, record_id, model.model_dump_json())
+                    migrated += 1
 
-        except Exception as e:
-            logger.error(f"Failed to load tags: {e}")
+        logger.info(f"Migrated {migrated} catalog records from JSON files")
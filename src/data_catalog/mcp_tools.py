@@ -539,6 +539,8 @@ def register_data_catalog_tools(mcp, settings):
         include_views: bool = True,
         profile_columns: bool = False,
         detect_pii: bool = True,
+        incremental: bool = True,
+        max_workers: int = 8,
     ) -> Dict[str, Any]:
         """
         Scan a data connection and catalog discovered assets.
@@ -554,6 +556,8 @@ def register_data_catalog_tools(mcp, settings):
             include_views: Include views in scan
             profile_columns: Collect column statistics (slower)
             detect_pii: Detect PII columns by name patterns
+            incremental: Skip tables unchanged since the last scan
+            max_workers: Worker threads for introspection queries
 
         Returns:
             Scan results with statistics
@@ -578,6 +582,8 @@ def register_data_catalog_tools(mcp, settings):
                 include_columns=True,
                 profile_columns=profile_columns,
                 detect_pii=detect_pii,
+                incremental=incremental,
+                max_workers=max_workers,
             )
 
             result = scanner.scan_connection(config)
@@ -595,6 +601,9 @@ def register_data_catalog_tools(mcp, settings):
                     "assets_created": result.assets_created,
                     "assets_updated": result.assets_updated,
                     "pii_columns_detected": result.pii_columns_detected,
+                    "tables_skipped": result.tables_skipped,
+                    "queries_executed": result.queries_executed,
+                    "duration_seconds": result.duration_seconds,
                 },
                 "errors": result.errors,
             }
@@ -0,0 +1,343 @@
+"""
+Column Profiler - Set-based column statistics for the Data Catalog.
+
+Provides:
+- One aggregate statement per table (distinct/null counts, min/max) instead
+  of several full scans per column
+- Dialect-specific APPROX_COUNT_DISTINCT and TABLESAMPLE clauses
+- A single row-sample query for string sample values
+- Local profiling of files through DuckDB, falling back to pandas
+- An LRU cache of profiles keyed on table version
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional
+
+from .types import ColumnProfile
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Data type families used to pick aggregates
+DATE_TYPES = {"DATE", "DATETIME", "TIMESTAMP", "TIMESTAMP_NTZ", "TIMESTAMP_LTZ", "TIMESTAMP_TZ"}
+NUMERIC_TYPES = {"NUMBER", "NUMERIC", "DECIMAL", "FLOAT", "DOUBLE", "REAL", "INTEGER", "INT", "BIGINT", "SMALLINT"}
+STRING_TYPES = {"VARCHAR", "TEXT", "STRING", "CHAR", "NVARCHAR", "NCHAR"}
+
+# Keep generated statements to a reasonable width on very wide tables
+COLUMNS_PER_QUERY = 100
+SAMPLE_VALUES = 5
+
+
+@dataclass(frozen=True)
+class ProfileDialect:
+    """SQL fragments for profiling on one warehouse dialect."""
+    quote: str = '"'
+    approx_distinct: Optional[str] = None  # e.g. "APPROX_COUNT_DISTINCT({col})"
+    percent_sample: Optional[str] = None  # clause after FROM, e.g. "TABLESAMPLE BERNOULLI ({percent:g})"
+    row_sample: Optional[str] = None  # clause after FROM; LIMIT is used when None
+
+
+PROFILE_DIALECTS: Dict[str, ProfileDialect] = {
+    "snowflake": ProfileDialect(
+        approx_distinct="APPROX_COUNT_DISTINCT({col})",
+        percent_sample="TABLESAMPLE BERNOULLI ({percent:g})",
+        row_sample="SAMPLE ({rows} ROWS)",
+    ),
+    "duckdb": ProfileDialect(
+        approx_distinct="approx_count_distinct({col})",
+        percent_sample="USING SAMPLE {percent:g}%",
+        row_sample="USING SAMPLE {rows} ROWS",
+    ),
+    "postgres": ProfileDialect(
+        percent_sample="TABLESAMPLE SYSTEM ({percent:g})",
+    ),
+    "bigquery": ProfileDialect(
+        quote="`",
+        approx_distinct="APPROX_COUNT_DISTINCT({col})",
+        percent_sample="TABLESAMPLE SYSTEM ({percent:g} PERCENT)",
+    ),
+    "databricks": ProfileDialect(
+        quote="`",
+        approx_distinct="approx_count_distinct({col})",
+        percent_sample="TABLESAMPLE ({percent:g} PERCENT)",
+        row_sample="TABLESAMPLE ({rows} ROWS)",
+    ),
+}
+
+
+def get_dialect(name: Optional[str]) -> ProfileDialect:
+    """Look up a profiling dialect, defaulting to ANSI SQL."""
+    return PROFILE_DIALECTS.get((name or "").lower(), ProfileDialect())
+
+
+def base_type(data_type: str) -> str:
+    """Normalize a data type to its family name (``NUMBER(38,0)`` -> ``NUMBER``)."""
+    return (data_type or "").split("(")[0].strip().upper()
+
+
+def _quote(name: str, dialect: ProfileDialect) -> str:
+    q = dialect.quote
+    return f"{q}{name.replace(q, q + q)}{q}"
+
+
+def build_profile_query(
+    table_ref: str,
+    columns: List[ColumnProfile],
+    dialect: ProfileDialect,
+    approximate: bool = False,
+    sample_percent: Optional[float] = None,
+) -> str:
+    """
+    Build one aggregate statement profiling every given column.
+
+    Output columns are aliased by position: ``TOTAL_ROWS`` plus
+    ``C{i}_DISTINCT``, ``C{i}_NONNULL`` and, for numeric/date columns,
+    ``C{i}_MIN`` / ``C{i}_MAX``.
+    """
+    select = ["COUNT(*) AS TOTAL_ROWS"]
+    for i, col in enumerate(columns):
+        ref = _quote(col.column_name, dialect)
+        if approximate and dialect.approx_distinct:
+            distinct = dialect.approx_distinct.format(col=ref)
+        else:
+            distinct = f"COUNT(DISTINCT {ref})"
+        select.append(f"{distinct} AS C{i}_DISTINCT")
+        select.append(f"COUNT({ref}) AS C{i}_NONNULL")
+        if base_type(col.data_type) in NUMERIC_TYPES | DATE_TYPES:
+            select.append(f"MIN({ref}) AS C{i}_MIN")
+            select.append(f"MAX({ref}) AS C{i}_MAX")
+
+    sql = "SELECT\n    " + ",\n    ".join(select) + f"\nFROM {table_ref}"
+    if sample_percent and dialect.percent_sample:
+        sql += " " + dialect.percent_sample.format(percent=sample_percent)
+    return sql
+
+
+def build_sample_query(
+    table_ref: str,
+    columns: List[ColumnProfile],
+    dialect: ProfileDialect,
+    rows: int,
+) -> str:
+    """Build a single row-sample query over the given columns."""
+    refs = ", ".join(_quote(c.column_name, dialect) for c in columns)
+    sql = f"SELECT {refs}\nFROM {table_ref}"
+    if dialect.row_sample:
+        return sql + " " + dialect.row_sample.format(rows=rows)
+    return sql + f"\nLIMIT {rows}"
+
+
+def apply_profile_row(row: Dict[str, Any], columns: List[ColumnProfile]) -> None:
+    """Copy aggregate results from ``build_profile_query`` onto columns."""
+    values = {str(k).upper(): v for k, v in row.items()}
+    total = values.get("TOTAL_ROWS")
+    for i, col in enumerate(columns):
+        distinct = values.get(f"C{i}_DISTINCT")
+        nonnull = values.get(f"C{i}_NONNULL")
+        if distinct is not None:
+            col.distinct_count = int(distinct)
+        if total is not None and nonnull is not None:
+            col.null_count = int(total) - int(nonnull)
+        if f"C{i}_MIN" in values:
+            col.min_value = str(values[f"C{i}_MIN"])
+            col.max_value = str(values.get(f"C{i}_MAX"))
+
+
+def apply_sample_rows(rows: List[Dict[str, Any]], columns: List[ColumnProfile]) -> None:
+    """Set each column's sample values to its first distinct non-null values."""
+    for col in columns:
+        name = col.column_name
+        samples: List[str] = []
+        for row in rows:
+            value = row.get(name, row.get(name.upper(), row.get(name.lower())))
+            if value is None:
+                continue
+            value = str(value)
+            if value not in samples:
+                samples.append(value)
+                if len(samples) >= SAMPLE_VALUES:
+                    break
+        col.sample_values = samples
+
+
+# =============================================================================
+# Local Profiling
+# =============================================================================
+
+def _dtype_to_sql(dtype: Any) -> str:
+    import pandas as pd
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "DOUBLE"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "TIMESTAMP"
+    return "VARCHAR"
+
+
+def profile_dataframe(df: Any, columns: Optional[List[ColumnProfile]] = None) -> List[ColumnProfile]:
+    """
+    Profile a pandas DataFrame.
+
+    Args:
+        df: DataFrame to profile
+        columns: Columns to fill in; inferred from the DataFrame when omitted
+
+    Returns:
+        Profiled columns
+    """
+    if columns is None:
+        columns = [
+            ColumnProfile(column_name=str(name), data_type=_dtype_to_sql(dtype))
+            for name, dtype in df.dtypes.items()
+        ]
+
+    for col in columns:
+        if col.column_name not in df.columns:
+            continue
+        series = df[col.column_name]
+        non_null = series.dropna()
+        col.distinct_count = int(non_null.nunique())
+        col.null_count = int(len(series) - len(non_null))
+        family = base_type(col.data_type)
+        if family in NUMERIC_TYPES | DATE_TYPES and len(non_null):
+            col.min_value = str(non_null.min())
+            col.max_value = str(non_null.max())
+        if family in STRING_TYPES:
+            col.sample_values = [str(v) for v in non_null.unique()[:SAMPLE_VALUES]]
+
+    return columns
+
+
+def _file_reader(path: Path) -> str:
+    suffix = path.suffix.lower()
+    literal = str(path).replace("'", "''")
+    if suffix == ".parquet":
+        return f"read_parquet('{literal}')"
+    if suffix in (".json", ".jsonl", ".ndjson"):
+        return f"read_json_auto('{literal}')"
+    return f"read_csv_auto('{literal}')"
+
+
+def profile_file(
+    file_path: str,
+    approximate: bool = False,
+    sample_rows: int = 1000,
+) -> List[ColumnProfile]:
+    """
+    Profile a local CSV, Parquet or JSON file.
+
+    Uses DuckDB with the same single aggregate statement as warehouse
+    profiling when it is installed, and pandas otherwise.
+
+    Args:
+        file_path: Path to the file
+        approximate: Use approximate distinct counts (DuckDB only)
+        sample_rows: Rows to sample for string sample values
+
+    Returns:
+        Profiled columns
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if DUCKDB_AVAILABLE:
+        dialect = PROFILE_DIALECTS["duckdb"]
+        table_ref = _file_reader(path)
+        con = duckdb.connect()
+        try:
+            described = con.execute(f"DESCRIBE SELECT * FROM {table_ref}").fetchall()
+            columns = [ColumnProfile(column_name=name, data_type=dtype) for name, dtype, *_ in described]
+            for start in range(0, len(columns), COLUMNS_PER_QUERY):
+                chunk = columns[start:start + COLUMNS_PER_QUERY]
+                cursor = con.execute(build_profile_query(table_ref, chunk, dialect, approximate))
+                names = [d[0] for d in cursor.description]
+                apply_profile_row(dict(zip(names, cursor.fetchone())), chunk)
+
+            string_cols = [c for c in columns if base_type(c.data_type) in STRING_TYPES]
+            if string_cols and sample_rows > 0:
+                cursor = con.execute(build_sample_query(table_ref, string_cols, dialect, sample_rows))
+                names = [d[0] for d in cursor.description]
+                apply_sample_rows([dict(zip(names, r)) for r in cursor.fetchall()], string_cols)
+            return columns
+        finally:
+            con.close()
+
+    import pandas as pd
+
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        df = pd.read_parquet(path)
+    elif suffix in (".json", ".jsonl", ".ndjson"):
+        df = pd.read_json(path, lines=suffix != ".json")
+    elif suffix in (".xlsx", ".xls"):
+        df = pd.read_excel(path)
+    else:
+        df = pd.read_csv(path)
+    return profile_dataframe(df)
+
+
+# =============================================================================
+# Profile Cache
+# =============================================================================
+
+_PROFILE_FIELDS = ("distinct_count", "null_count", "min_value", "max_value", "sample_values")
+
+
+class ProfileCache:
+    """Thread-safe LRU cache of column statistics keyed on table version."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Dict[str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, columns: List[ColumnProfile]) -> bool:
+        """Apply cached statistics to ``columns``. Returns True on a hit."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or any(c.column_name not in entry for c in columns):
+                return False
+            self._entries.move_to_end(key)
+
+        for col in columns:
+            for name, value in entry[col.column_name].items():
+                setattr(col, name, list(value) if isinstance(value, list) else value)
+        return True
+
+    def put(self, key: Hashable, columns: List[ColumnProfile]) -> None:
+        """Store the statistics of profiled columns."""
+        entry = {
+            col.column_name: {
+                name: list(getattr(col, name)) if name == "sample_values" else getattr(col, name)
+                for name in _PROFILE_FIELDS
+            }
+            for col in columns
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached profiles."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -6,12 +6,19 @@ Scans data sources to automatically catalog:
 - Column metadata and statistics
 - PII detection
 - Data patterns
+
+Connection scans run introspection queries concurrently and skip tables
+whose metadata fingerprint hasn't changed since the previous scan.
 """
 
+import hashlib
 import logging
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .types import (
     AssetType,
@@ -25,6 +32,18 @@ from .types import (
     Tag,
 )
 from .catalog_store import CatalogStore
+from .profiler import (
+    COLUMNS_PER_QUERY,
+    STRING_TYPES,
+    ProfileCache,
+    apply_profile_row,
+    apply_sample_rows,
+    base_type,
+    build_profile_query,
+    build_sample_query,
+    get_dialect,
+    profile_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,11 +64,6 @@ PII_PATTERNS = {
     "medical": (r"diagnosis|medical|health|patient|prescription", DataClassification.PHI),
 }
 
-# Data type patterns for smart categorization
-DATE_TYPES = {"DATE", "DATETIME", "TIMESTAMP", "TIMESTAMP_NTZ", "TIMESTAMP_LTZ", "TIMESTAMP_TZ"}
-NUMERIC_TYPES = {"NUMBER", "NUMERIC", "DECIMAL", "FLOAT", "DOUBLE", "REAL", "INTEGER", "INT", "BIGINT", "SMALLINT"}
-STRING_TYPES = {"VARCHAR", "TEXT", "STRING", "CHAR", "NVARCHAR", "NCHAR"}
-
 
 class CatalogScanner:
     """Scans data sources to discover and catalog assets."""
@@ -70,12 +84,29 @@ class CatalogScanner:
         self.query_func = query_func
         self._current_scan: Optional[ScanResult] = None
 
-    def scan_connection(self, config: ScanConfig) -> ScanResult:
+        self._lock = threading.Lock()
+        self._connection_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._asset_lookup: Optional[Dict[tuple, DataAsset]] = None
+        self._profile_cache = ProfileCache()
+
+    def scan_connection(
+        self,
+        config: ScanConfig,
+        progress_callback: Optional[Callable[[ScanResult], None]] = None,
+    ) -> ScanResult:
         """
         Scan a data connection and catalog all discovered assets.
 
+        Schema listing, table listing and per-table column work fan out over
+        a pool of ``config.max_workers`` threads, with at most
+        ``config.max_concurrent_queries`` queries in flight per connection.
+        Catalog writes stay on the calling thread and are committed in
+        batches of ``config.batch_size`` tables. With ``config.incremental``
+        tables whose metadata fingerprint is unchanged are skipped.
+
         Args:
             config: Scan configuration
+            progress_callback: Called with the running ScanResult after each table
 
         Returns:
             Scan result with statistics
@@ -83,68 +114,267 @@ class CatalogScanner:
         if not self.query_func:
             raise ValueError("Query function required for scanning")
 
-        self._current_scan = ScanResult(connection_id=config.connection_id)
+        scan = self._current_scan = ScanResult(connection_id=config.connection_id)
+        started = time.monotonic()
+        self._asset_lookup = self._build_asset_lookup()
 
         try:
-            # Get databases
-            databases = self._get_databases(config)
-            self._current_scan.databases_scanned = len(databases)
-
-            for db_name in databases:
-                # Create database asset
-                db_asset = self._create_database_asset(config.connection_id, db_name)
-
-                # Get schemas
-                schemas = self._get_schemas(config, db_name)
-                self._current_scan.schemas_scanned += len(schemas)
-
-                for schema_name in schemas:
-                    # Create schema asset
-                    schema_asset = self._create_schema_asset(
-                        config.connection_id, db_name, schema_name, db_asset.id
-                    )
+            with ThreadPoolExecutor(
+                max_workers=max(1, config.max_workers),
+                thread_name_prefix="catalog-scan",
+            ) as pool:
+                self._scan_with_pool(config, pool, progress_callback)
+
+            scan.status = "completed"
+
+        except Exception as e:
+            logger.error(f"Scan failed: {e}")
+            scan.status = "failed"
+            scan.errors.append(str(e))
+
+        finally:
+            self._asset_lookup = None
+            scan.completed_at = datetime.now()
+            scan.duration_seconds = time.monotonic() - started
+
+        logger.info(
+            f"Scan {scan.scan_id} {scan.status}: {scan.tables_completed} tables scanned, "
+            f"{scan.tables_skipped} unchanged, {scan.queries_executed} queries "
+            f"in {scan.duration_seconds:.1f}s"
+        )
+        return scan
+
+    def _scan_with_pool(
+        self,
+        config: ScanConfig,
+        pool: ThreadPoolExecutor,
+        progress_callback: Optional[Callable[[ScanResult], None]],
+    ) -> None:
+        """Fan out introspection over the pool and apply results in batches."""
+        scan = self._current_scan
+
+        # Databases -> schemas
+        databases = self._get_databases(config)
+        scan.databases_scanned = len(databases)
+
+        db_assets = {db: self._create_database_asset(config.connection_id, db) for db in databases}
+        schema_futures = {pool.submit(self._get_schemas, config, db): db for db in databases}
+
+        # Schemas -> tables
+        table_list_futures: Dict[Future, tuple] = {}
+        for future in as_completed(schema_futures):
+            db_name = schema_futures[future]
+            schemas = future.result()
+            scan.schemas_scanned += len(schemas)
+            for schema_name in schemas:
+                schema_asset = self._create_schema_asset(
+                    config.connection_id, db_name, schema_name, db_assets[db_name].id
+                )
+                future = pool.submit(self._get_tables, config, db_name, schema_name)
+                table_list_futures[future] = (db_name, schema_name, schema_asset.id)
+
+        # Tables -> columns, skipping unchanged ones
+        table_futures: Dict[Future, tuple] = {}
+        for future in as_completed(table_list_futures):
+            db_name, schema_name, schema_id = table_list_futures[future]
+            tables = future.result()
+            scan.tables_scanned += len(tables)
+            for table_info in tables:
+                fingerprint = self._table_fingerprint(table_info)
+                existing = self._find_asset(
+                    table_info["name"], self._table_asset_type(table_info), db_name, schema_name
+                )
+                if config.incremental and self._is_unchanged(config, existing, fingerprint):
+                    scan.tables_skipped += 1
+                    continue
+                future = pool.submit(self._scan_table_details, config, db_name, schema_name, table_info)
+                table_futures[future] = (db_name, schema_name, table_info, schema_id, fingerprint)
+
+        # Apply table results on this thread, one transaction per batch
+        pending = []
+        for future in as_completed(table_futures):
+            pending.append((future, table_futures[future]))
+            if len(pending) >= config.batch_size:
+                self._apply_table_results(config, pending, progress_callback)
+                pending = []
+        if pending:
+            self._apply_table_results(config, pending, progress_callback)
+
+    def _apply_table_results(
+        self,
+        config: ScanConfig,
+        results: List[tuple],
+        progress_callback: Optional[Callable[[ScanResult], None]],
+    ) -> None:
+        """Write a batch of scanned tables to the catalog."""
+        scan = self._current_scan
+        with self.catalog.batch():
+            for future, (db_name, schema_name, table_info, schema_id, fingerprint) in results:
+                fqn = f"{db_name}.{schema_name}.{table_info['name']}"
+                try:
+                    columns, pii_count = future.result()
+                except Exception as e:
+                    scan.errors.append(f"{fqn}: {e}")
+                    continue
+
+                properties = {"scan_fingerprint": fingerprint}
+                if columns is not None:
+                    scan.columns_scanned += len(columns)
+                    scan.pii_columns_detected += pii_count
+                    properties["ddl_hash"] = self._columns_hash(columns)
+
+                self._create_table_asset(
+                    config, db_name, schema_name, table_info, schema_id,
+                    columns=columns, properties=properties,
+                )
+                scan.tables_completed += 1
+                if progress_callback:
+                    try:
+                        progress_callback(scan)
+                    except Exception as e:
+                        logger.debug(f"Scan progress callback failed: {e}")
+
+        logger.info(
+            f"Scan {scan.scan_id}: {scan.tables_completed + scan.tables_skipped}"
+            f"/{scan.tables_scanned} tables processed"
+        )
 
-                    # Get tables
-                    tables = self._get_tables(config, db_name, schema_name)
-                    self._current_scan.tables_scanned += len(tables)
+    def _scan_table_details(
+        self,
+        config: ScanConfig,
+        database: str,
+        schema_name: str,
+        table_info: Dict[str, Any],
+    ) -> Tuple[Optional[List[ColumnProfile]], int]:
+        """Collect columns, profiles and PII for one table (runs on a worker)."""
+        if not config.include_columns:
+            return None, 0
 
-                    for table_info in tables:
-                        # Create table asset
-                        table_asset = self._create_table_asset(
-                            config, db_name, schema_name, table_info, schema_asset.id
-                        )
+        table_name = table_info["name"]
+        columns = self._get_columns(config, database, schema_name, table_name)
+        if config.profile_columns:
+            columns = self._profile_columns(
+                config, database, schema_name, table_name, columns,
+                table_version=self._table_fingerprint(table_info),
+            )
 
-                        # Get columns if requested
-                        if config.include_columns:
-                            columns = self._get_columns(config, db_name, schema_name, table_info["name"])
-                            self._current_scan.columns_scanned += len(columns)
+        pii_count = self._detect_pii(columns) if config.detect_pii else 0
+        return columns, pii_count
 
-                            # Profile columns if requested
-                            if config.profile_columns:
-                                columns = self._profile_columns(
-                                    config, db_name, schema_name, table_info["name"], columns
-                                )
+    # =========================================================================
+    # Change Detection
+    # =========================================================================
 
-                            # Detect PII
-                            if config.detect_pii:
-                                pii_count = self._detect_pii(columns)
-                                self._current_scan.pii_columns_detected += pii_count
+    @staticmethod
+    def _table_fingerprint(table_info: Dict[str, Any]) -> Optional[str]:
+        """
+        Hash the table metadata that changes whenever the table does.
 
-                            # Update table with columns
-                            self.catalog.update_asset(table_asset.id, {
-                                "columns": columns,
-                            })
+        Returns None when the source doesn't report a last-altered
+        timestamp, in which case the table is always rescanned.
+        """
+        if not table_info.get("last_altered"):
+            return None
+        parts = [
+            table_info.get("type"),
+            table_info.get("last_altered"),
+            table_info.get("row_count"),
+            table_info.get("bytes"),
+            table_info.get("comment"),
+        ]
+        return hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()
+
+    @staticmethod
+    def _columns_hash(columns: List[ColumnProfile]) -> str:
+        """Hash the column definitions (name, type, nullability) of a table."""
+        ddl = "|".join(f"{c.column_name}:{c.data_type}:{c.nullable}" for c in columns)
+        return hashlib.sha256(ddl.encode()).hexdigest()
+
+    @staticmethod
+    def _is_unchanged(config: ScanConfig, existing: Optional[DataAsset], fingerprint: Optional[str]) -> bool:
+        """Whether an already cataloged table can be skipped."""
+        if existing is None or fingerprint is None:
+            return False
+        if existing.custom_properties.get("scan_fingerprint") != fingerprint:
+            return False
+        if config.include_columns and not existing.columns:
+            return False
+        if config.profile_columns and not any(c.distinct_count is not None for c in existing.columns):
+            return False
+        return True
 
-            self._current_scan.status = "completed"
-            self._current_scan.completed_at = datetime.now()
+    # =========================================================================
+    # Asset Lookup
+    # =========================================================================
 
-        except Exception as e:
-            logger.error(f"Scan failed: {e}")
-            self._current_scan.status = "failed"
-            self._current_scan.errors.append(str(e))
-            self._current_scan.completed_at = datetime.now()
+    @staticmethod
+    def _lookup_key(
+        name: str,
+        asset_type: AssetType,
+        database: Optional[str] = None,
+        schema_name: Optional[str] = None,
+    ) -> tuple:
+        if asset_type == AssetType.DATABASE:
+            database = schema_name = None
+        elif asset_type == AssetType.SCHEMA:
+            schema_name = None
+        return (asset_type, name.lower(), (database or "").lower(), (schema_name or "").lower())
+
+    def _build_asset_lookup(self) -> Dict[tuple, DataAsset]:
+        """Index existing database/schema/table/view assets by name for a scan."""
+        lookup: Dict[tuple, DataAsset] = {}
+        asset_types = [AssetType.DATABASE, AssetType.SCHEMA, AssetType.TABLE, AssetType.VIEW]
+        for asset in self.catalog.iter_assets(asset_types):
+            key = self._lookup_key(asset.name, asset.asset_type, asset.database, asset.schema_name)
+            lookup.setdefault(key, asset)
+        return lookup
+
+    def _find_asset(
+        self,
+        name: str,
+        asset_type: AssetType,
+        database: Optional[str] = None,
+        schema_name: Optional[str] = None,
+    ) -> Optional[DataAsset]:
+        """Find an existing asset, using the scan lookup when one is active."""
+        if self._asset_lookup is None:
+            return self.catalog.get_asset_by_name(
+                name, asset_type, database=database, schema_name=schema_name
+            )
+        return self._asset_lookup.get(self._lookup_key(name, asset_type, database, schema_name))
 
-        return self._current_scan
+    def _remember_asset(self, asset: DataAsset) -> None:
+        """Add a newly created asset to the scan lookup."""
+        if self._asset_lookup is not None:
+            key = self._lookup_key(asset.name, asset.asset_type, asset.database, asset.schema_name)
+            self._asset_lookup[key] = asset
+
+    @staticmethod
+    def _table_asset_type(table_info: Dict[str, Any]) -> AssetType:
+        table_type = table_info.get("type") or "BASE TABLE"
+        return AssetType.VIEW if "VIEW" in table_type.upper() else AssetType.TABLE
+
+    # =========================================================================
+    # Query Execution
+    # =========================================================================
+
+    def _run_query(self, config: ScanConfig, sql: str) -> List[Dict]:
+        """Execute a query within the connection's concurrency limit."""
+        with self._connection_slot(config):
+            result = self.query_func(config.connection_id, sql)
+        with self._lock:
+            if self._current_scan:
+                self._current_scan.queries_executed += 1
+        return result
+
+    def _connection_slot(self, config: ScanConfig) -> threading.BoundedSemaphore:
+        """Get the semaphore capping concurrent queries on a connection."""
+        with self._lock:
+            slot = self._connection_slots.get(config.connection_id)
+            if slot is None:
+                slot = threading.BoundedSemaphore(max(1, config.max_concurrent_queries))
+                self._connection_slots[config.connection_id] = slot
+            return slot
 
     def scan_table(
         self,
@@ -203,7 +433,10 @@ class CatalogScanner:
         columns = self._get_columns(config, database, schema_name, table_name)
 
         if profile:
-            columns = self._profile_columns(config, database, schema_name, table_name, columns)
+            columns = self._profile_columns(
+                config, database, schema_name, table_name, columns,
+                table_version=self._table_fingerprint(table_info),
+            )
 
         if detect_pii:
             self._detect_pii(columns)
@@ -256,7 +489,7 @@ class CatalogScanner:
 
         try:
             sql = "SHOW DATABASES"
-            results = self.query_func(config.connection_id, sql)
+            results = self._run_query(config, sql)
             return [r.get("name", r.get("DATABASE_NAME", "")) for r in results if r]
         except Exception as e:
             logger.warning(f"Failed to list databases: {e}")
@@ -266,7 +499,7 @@ class CatalogScanner:
         """Get list of schemas in a database."""
         try:
             sql = f"SHOW SCHEMAS IN DATABASE {database}"
-            results = self.query_func(config.connection_id, sql)
+            results = self._run_query(config, sql)
             schemas = [r.get("name", r.get("SCHEMA_NAME", "")) for r in results if r]
 
             # Apply pattern filter
@@ -309,7 +542,7 @@ class CatalogScanner:
 
             sql += " ORDER BY TABLE_NAME"
 
-            results = self.query_func(config.connection_id, sql)
+            results = self._run_query(config, sql)
 
             tables = []
             for r in results:
@@ -354,7 +587,7 @@ class CatalogScanner:
             ORDER BY ORDINAL_POSITION
             """
 
-            results = self.query_func(config.connection_id, sql)
+            results = self._run_query(config, sql)
 
             columns = []
             for r in results:
@@ -393,58 +626,72 @@ class CatalogScanner:
         schema_name: str,
         table_name: str,
         columns: List[ColumnProfile],
+        table_version: Optional[str] = None,
     ) -> List[ColumnProfile]:
-        """Profile columns to get statistics."""
-        fqn = f"{database}.{schema_name}.{table_name}"
+        """
+        Profile columns to get statistics.
 
-        for col in columns:
+        All columns are profiled with one aggregate statement (split every
+        COLUMNS_PER_QUERY columns) plus one row-sample query for string
+        sample values. With ``config.profile_sample_percent`` the aggregate
+        runs over a TABLESAMPLE, so counts reflect the sample. Results are
+        cached per ``table_version`` when one is given.
+        """
+        fqn = f"{database}.{schema_name}.{table_name}"
+        cache_key = None
+        if table_version:
+            cache_key = (config.connection_id, fqn, table_version, config.profile_sample_percent)
+            if self._profile_cache.get(cache_key, columns):
+                return columns
+
+        dialect = get_dialect(config.profile_dialect)
+        complete = True
+
+        for start in range(0, len(columns), COLUMNS_PER_QUERY):
+            chunk = columns[start:start + COLUMNS_PER_QUERY]
+            sql = build_profile_query(
+                fqn, chunk, dialect,
+                approximate=config.approximate_distinct,
+                sample_percent=config.profile_sample_percent,
+            )
             try:
-                # Get distinct count and null count
-                sql = f"""
-                SELECT
-                    COUNT(DISTINCT "{col.column_name}") as distinct_count,
-                    COUNT(*) - COUNT("{col.column_name}") as null_count,
-                    COUNT(*) as total_count
-                FROM {fqn}
-                """
-                result = self.query_func(config.connection_id, sql)
+                result = self._run_query(config, sql)
                 if result:
-                    col.distinct_count = result[0].get("DISTINCT_COUNT", result[0].get("distinct_count"))
-                    col.null_count = result[0].get("NULL_COUNT", result[0].get("null_count"))
-
-                # Get min/max for appropriate types
-                if col.data_type.upper() in NUMERIC_TYPES | DATE_TYPES:
-                    sql = f"""
-                    SELECT
-                        MIN("{col.column_name}") as min_val,
-                        MAX("{col.column_name}") as max_val
-                    FROM {fqn}
-                    """
-                    result = self.query_func(config.connection_id, sql)
-                    if result:
-                        col.min_value = str(result[0].get("MIN_VAL", result[0].get("min_val", "")))
-                        col.max_value = str(result[0].get("MAX_VAL", result[0].get("max_val", "")))
-
-                # Get sample values for string columns
-                if col.data_type.upper() in STRING_TYPES and config.sample_size > 0:
-                    sql = f"""
-                    SELECT DISTINCT "{col.column_name}" as val
-                    FROM {fqn}
-                    WHERE "{col.column_name}" IS NOT NULL
-                    LIMIT 5
-                    """
-                    result = self.query_func(config.connection_id, sql)
-                    if result:
-                        col.sample_values = [
-                            str(r.get("VAL", r.get("val", "")))
-                            for r in result
-                        ][:5]
+                    apply_profile_row(result[0], chunk)
+            except Exception as e:
+                complete = False
+                logger.debug(f"Failed to profile columns of {fqn}: {e}")
 
+        string_cols = [c for c in columns if base_type(c.data_type) in STRING_TYPES]
+        if string_cols and config.sample_size > 0:
+            sql = build_sample_query(fqn, string_cols, dialect, rows=config.sample_size)
+            try:
+                apply_sample_rows(self._run_query(config, sql) or [], string_cols)
             except Exception as e:
-                logger.debug(f"Failed to profile column {col.column_name}: {e}")
+                complete = False
+                logger.debug(f"Failed to sample values of {fqn}: {e}")
+
+        if cache_key and complete:
+            self._profile_cache.put(cache_key, columns)
 
         return columns
 
+    def profile_file(self, file_path: str, detect_pii: bool = True) -> List[ColumnProfile]:
+        """
+        Profile a local file source (CSV, Parquet, JSON).
+
+        Args:
+            file_path: Path to the file
+            detect_pii: Whether to detect PII columns
+
+        Returns:
+            Profiled columns
+        """
+        columns = profile_file(file_path)
+        if detect_pii:
+            self._detect_pii(columns)
+        return columns
+
     def _detect_pii(self, columns: List[ColumnProfile]) -> int:
         """Detect PII in column names and classify them."""
         pii_count = 0
@@ -467,7 +714,7 @@ class CatalogScanner:
 
     def _create_database_asset(self, connection_id: str, db_name: str) -> DataAsset:
         """Create or update a database asset."""
-        existing = self.catalog.get_asset_by_name(db_name, AssetType.DATABASE)
+        existing = self._find_asset(db_name, AssetType.DATABASE)
 
         if existing:
             self.catalog.update_asset(existing.id, {
@@ -485,6 +732,7 @@ class CatalogScanner:
         )
 
         self.catalog.create_asset(asset)
+        self._remember_asset(asset)
         if self._current_scan:
             self._current_scan.assets_created += 1
 
@@ -498,9 +746,7 @@ class CatalogScanner:
         parent_id: str,
     ) -> DataAsset:
         """Create or update a schema asset."""
-        existing = self.catalog.get_asset_by_name(
-            schema_name, AssetType.SCHEMA, database=db_name
-        )
+        existing = self._find_asset(schema_name, AssetType.SCHEMA, database=db_name)
 
         if existing:
             self.catalog.update_asset(existing.id, {
@@ -520,6 +766,7 @@ class CatalogScanner:
         )
 
         self.catalog.create_asset(asset)
+        self._remember_asset(asset)
         if self._current_scan:
             self._current_scan.assets_created += 1
 
@@ -532,25 +779,45 @@ class CatalogScanner:
         schema_name: str,
         table_info: Dict[str, Any],
         parent_id: str,
+        columns: Optional[List[ColumnProfile]] = None,
+        properties: Optional[Dict[str, Any]] = None,
     ) -> DataAsset:
-        """Create or update a table/view asset."""
+        """
+        Create or update a table/view asset.
+
+        Args:
+            columns: Scanned columns to store with the asset. For an existing
+                asset whose column DDL hash is unchanged and that wasn't
+                profiled, the stored columns (with any earlier statistics and
+                tags) are kept.
+            properties: Custom properties to merge into the asset
+        """
         table_name = table_info["name"]
-        table_type = table_info.get("type", "BASE TABLE")
-        asset_type = AssetType.VIEW if "VIEW" in table_type.upper() else AssetType.TABLE
+        asset_type = self._table_asset_type(table_info)
 
-        existing = self.catalog.get_asset_by_name(
-            table_name, asset_type, database=db_name, schema_name=schema_name
-        )
+        existing = self._find_asset(table_name, asset_type, database=db_name, schema_name=schema_name)
 
         fqn = f"{db_name}.{schema_name}.{table_name}"
 
         if existing:
-            self.catalog.update_asset(existing.id, {
+            updates: Dict[str, Any] = {
                 "row_count": table_info.get("row_count"),
                 "size_bytes": table_info.get("bytes"),
                 "description": table_info.get("comment"),
                 "last_scanned_at": datetime.now(),
-            })
+            }
+            if properties:
+                unchanged_ddl = (
+                    properties.get("ddl_hash") is not None
+                    and properties.get("ddl_hash") == existing.custom_properties.get("ddl_hash")
+                )
+                if unchanged_ddl and not config.profile_columns and existing.columns:
+                    columns = None
+                updates["custom_properties"] = {**existing.custom_properties, **properties}
+            if columns is not None:
+                updates["columns"] = columns
+
+            self.catalog.update_asset(existing.id, updates)
             if self._current_scan:
                 self._current_scan.assets_updated += 1
             return existing
@@ -567,9 +834,12 @@ class CatalogScanner:
             parent_id=parent_id,
             source_connection_id=config.connection_id,
             last_scanned_at=datetime.now(),
+            columns=columns or [],
+            custom_properties=dict(properties or {}),
         )
 
         self.catalog.create_asset(asset)
+        self._remember_asset(asset)
         if self._current_scan:
             self._current_scan.assets_created += 1
 
@@ -0,0 +1,240 @@
+"""
+Catalog Storage - Record-level SQLite persistence for the Data Catalog.
+
+Each asset, glossary term, domain and tag is stored as its own row, so a
+mutation writes one record instead of re-serializing the whole catalog.
+SQLite runs in WAL mode, which makes single-row commits cheap and keeps
+readers unblocked during bulk scans.
+
+Every write is stamped with a monotonically increasing sequence number
+and deletes leave a tombstone. Snapshots (e.g. the search index as .npz arrays)
+are saved with the sequence they reflect, so on startup a snapshot can be
+restored and only the changes made after it replayed.
+
+LazyModelDict keeps loaded records as raw JSON and only builds the
+Pydantic model for a record when it is first accessed.
+"""
+
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, MutableMapping, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModelDict(MutableMapping):
+    """
+    Dict of Pydantic models hydrated on first access.
+
+    Records that fail validation are logged and dropped, matching the
+    tolerant behavior of the previous JSON loaders.
+    """
+
+    def __init__(self, model_cls: Type[BaseModel], raw: Optional[Dict[str, str]] = None):
+        self._model_cls = model_cls
+        self._raw: Dict[str, str] = dict(raw or {})
+        self._models: Dict[str, BaseModel] = {}
+
+    def _hydrate(self, key: str) -> Optional[BaseModel]:
+        raw = self._raw.pop(key, None)
+        if raw is None:
+            return None
+        try:
+            model = self._model_cls.model_validate_json(raw)
+        except Exception as e:
+            logger.error(f"Failed to load {self._model_cls.__name__} '{key}': {e}")
+            return None
+        self._models[key] = model
+        return model
+
+    def __getitem__(self, key: str) -> BaseModel:
+        model = self._models.get(key)
+        if model is None:
+            model = self._hydrate(key)
+            if model is None:
+                raise KeyError(key)
+        return model
+
+    def __setitem__(self, key: str, value: BaseModel) -> None:
+        self._raw.pop(key, None)
+        self._models[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        found = self._models.pop(key, None) is not None
+        found = self._raw.pop(key, None) is not None or found
+        if not found:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._models or key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._models) + list(self._raw))
+
+    def __len__(self) -> int:
+        return len(self._models) + len(self._raw)
+
+    def values(self) -> List[BaseModel]:  # type: ignore[override]
+        """Hydrate (once) and return every valid model."""
+        for key in list(self._raw):
+            self._hydrate(key)
+        return list(self._models.values())
+
+    def items(self) -> List[Tuple[str, BaseModel]]:  # type: ignore[override]
+        """Hydrate (once) and return every valid (key, model) pair."""
+        self.values()
+        return list(self._models.items())
+
+    @property
+    def hydrated_count(self) -> int:
+        """Number of records that have been parsed into models."""
+        return len(self._models)
+
+
+class CatalogStorage:
+    """SQLite-backed record store with sequence-stamped changes and snapshots."""
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+        row = self.conn.execute(
+            "SELECT MAX(s) FROM (SELECT MAX(seq) AS s FROM records UNION ALL SELECT MAX(seq) FROM tombstones)"
+        ).fetchone()
+        self._seq = row[0] or 0
+
+    def _init_schema(self) -> None:
+        """Create tables if they don't exist."""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                kind TEXT NOT NULL,
+                id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                PRIMARY KEY (kind, id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_seq ON records(seq);
+            CREATE TABLE IF NOT EXISTS tombstones (
+                kind TEXT NOT NULL,
+                id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                PRIMARY KEY (kind, id)
+            );
+            CREATE TABLE IF NOT EXISTS snapshots (
+                name TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                data BLOB NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the latest write."""
+        return self._seq
+
+    def _commit(self) -> None:
+        if self._batch_depth == 0:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        """Group writes into a single transaction."""
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except Exception:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.conn.rollback()
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.commit()
+
+    def put(self, kind: str, record_id: str, data: str) -> int:
+        """Insert or replace a record. Returns its sequence number."""
+        with self._lock:
+            self._seq += 1
+            self.conn.execute(
+                "INSERT OR REPLACE INTO records (kind, id, data, seq) VALUES (?, ?, ?, ?)",
+                (kind, record_id, data, self._seq),
+            )
+            self.conn.execute("DELETE FROM tombstones WHERE kind = ? AND id = ?", (kind, record_id))
+            self._commit()
+            return self._seq
+
+    def delete(self, kind: str, record_id: str) -> int:
+        """Delete a record, leaving a tombstone. Returns the sequence number."""
+        with self._lock:
+            self._seq += 1
+            self.conn.execute("DELETE FROM records WHERE kind = ? AND id = ?", (kind, record_id))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tombstones (kind, id, seq) VALUES (?, ?, ?)",
+                (kind, record_id, self._seq),
+            )
+            self._commit()
+            return self._seq
+
+    def load(self, kind: str) -> Dict[str, str]:
+        """Return all raw records of a kind as {id: json}."""
+        with self._lock:
+            rows = self.conn.execute("SELECT id, data FROM records WHERE kind = ?", (kind,))
+            return dict(rows.fetchall())
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Number of stored records, optionally of one kind."""
+        with self._lock:
+            if kind is None:
+                return self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+            return self.conn.execute("SELECT COUNT(*) FROM records WHERE kind = ?", (kind,)).fetchone()[0]
+
+    def changes_since(self, seq: int) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """Return ([(kind, id) upserted], [(kind, id) deleted]) after ``seq``."""
+        with self._lock:
+            upserts = self.conn.execute(
+                "SELECT kind, id FROM records WHERE seq > ? ORDER BY seq", (seq,)
+            ).fetchall()
+            deletes = self.conn.execute(
+                "SELECT kind, id FROM tombstones WHERE seq > ? ORDER BY seq", (seq,)
+            ).fetchall()
+            return upserts, deletes
+
+    def save_snapshot(self, name: str, data: bytes, seq: Optional[int] = None) -> None:
+        """Store a snapshot blob reflecting all writes up to ``seq``."""
+        seq = self._seq if seq is None else seq
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO snapshots (name, seq, data) VALUES (?, ?, ?)",
+                (name, seq, sqlite3.Binary(data)),
+            )
+            # Tombstones older than every snapshot are no longer needed
+            oldest = self.conn.execute("SELECT MIN(seq) FROM snapshots").fetchone()[0]
+            self.conn.execute("DELETE FROM tombstones WHERE seq <= ?", (oldest,))
+            self._commit()
+
+    def load_snapshot(self, name: str) -> Optional[Tuple[int, bytes]]:
+        """Return (seq, data) of a snapshot, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT seq, data FROM snapshots WHERE name = ?", (name,)
+            ).fetchone()
+            return (row[0], bytes(row[1])) if row else None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
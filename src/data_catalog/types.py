@@ -334,8 +334,15 @@ class ScanConfig(BaseModel):
     include_columns: bool = Field(default=True)
     profile_columns: bool = Field(default=False, description="Collect column statistics")
     sample_size: int = Field(default=1000, description="Rows to sample for profiling")
+    profile_dialect: str = Field(default="snowflake", description="SQL dialect for profiling queries")
+    approximate_distinct: bool = Field(default=False, description="Use APPROX_COUNT_DISTINCT where supported")
+    profile_sample_percent: Optional[float] = Field(default=None, description="TABLESAMPLE percent for profiling")
     detect_pii: bool = Field(default=True, description="Detect PII columns")
     detect_patterns: bool = Field(default=True, description="Detect data patterns")
+    incremental: bool = Field(default=True, description="Skip tables unchanged since the last scan")
+    max_workers: int = Field(default=8, description="Worker threads for introspection queries")
+    max_concurrent_queries: int = Field(default=4, description="Concurrent queries per connection")
+    batch_size: int = Field(default=500, description="Tables written per catalog transaction")
 
     model_config = {"extra": "allow"}
 
@@ -358,6 +365,12 @@ class ScanResult(BaseModel):
     assets_created: int = Field(default=0)
     assets_updated: int = Field(default=0)
     pii_columns_detected: int = Field(default=0)
+    tables_skipped: int = Field(default=0, description="Unchanged tables not rescanned")
+
+    # Progress
+    tables_completed: int = Field(default=0)
+    queries_executed: int = Field(default=0)
+    duration_seconds: Optional[float] = None
 
     # Errors
     errors: List[str] = Field(default_factory=list)
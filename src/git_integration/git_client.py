@@ -3,11 +3,19 @@ Git Client.
 
 Local git operations wrapper using subprocess.
 Handles commits, branches, push/pull, and status.
+
+Read paths that agents poll are kept cheap: status is one
+``git status --porcelain=v2 --branch`` call cached on the index/ref file
+stamps (with a short TTL for working tree edits), branch listings are cached
+the same way, and history is read through a persistent
+``git cat-file --batch`` process (GitObjectReader).
 """
 
+import copy
 import logging
 import os
 import subprocess
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -20,27 +28,65 @@ from .types import (
     GitOperationResult,
 )
 
+from .object_reader import GitObjectReader
+
 logger = logging.getLogger(__name__)
 
+# Commands (with leading arguments) that never change repository state;
+# anything else invalidates the client's caches
+_READ_ONLY_COMMANDS = {
+    ("rev-parse",), ("status",), ("log",), ("diff",), ("show",), ("cat-file",),
+    ("for-each-ref",), ("branch", "--show-current"), ("remote", "get-url"),
+}
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
 
 class GitClient:
     """Client for local git operations."""
 
-    def __init__(self, config: Optional[GitConfig] = None):
+    def __init__(self, config: Optional[GitConfig] = None, status_cache_ttl: float = 2.0):
         """
         Initialize the git client.
 
         Args:
             config: Git configuration
+            status_cache_ttl: Seconds a cached status/branch listing may be
+                reused while the index and refs are unchanged (0 disables)
         """
         self.config = config
+        self.status_cache_ttl = status_cache_ttl
         self._repo_path: Optional[Path] = None
         if config and config.repo_path:
             self._repo_path = Path(config.repo_path)
 
+        self._git_dir: Optional[Path] = None
+        self._git_dir_for: Optional[str] = None
+        self._cache: Dict[Any, Tuple[Any, float, Any]] = {}  # key -> (stamp, time, value)
+        self._reader: Optional[GitObjectReader] = None
+
     def set_repo_path(self, path: str) -> None:
         """Set the repository path."""
         self._repo_path = Path(path)
+        self._git_dir_for = None
+        self.invalidate_cache()
+        self.close()
+
+    def close(self) -> None:
+        """Stop the persistent git object reader, if running."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def invalidate_cache(self) -> None:
+        """Drop cached status, branch and remote information."""
+        self._cache.clear()
 
     @property
     def repo_path(self) -> Path:
@@ -78,6 +124,10 @@ class GitClient:
                 env["GIT_AUTHOR_EMAIL"] = self.config.email
                 env["GIT_COMMITTER_EMAIL"] = self.config.email
 
+        if not any(tuple(args[:len(prefix)]) == prefix for prefix in _READ_ONLY_COMMANDS):
+            self.invalidate_cache()
+            self._git_dir_for = None
+
         return subprocess.run(
             cmd,
             cwd=str(self.repo_path),
@@ -87,11 +137,67 @@ class GitClient:
             env=env,
         )
 
+    # =========================================================================
+    # Caching helpers
+    # =========================================================================
+
+    def _resolve_git_dir(self) -> Optional[Path]:
+        """Locate the git directory (cached per repository path)."""
+        key = str(self.repo_path)
+        if self._git_dir_for == key:
+            return self._git_dir
+
+        git_dir = None
+        dot_git = self.repo_path / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        else:
+            result = self._run_git(["rev-parse", "--absolute-git-dir"], check=False)
+            if result.returncode == 0 and result.stdout.strip():
+                git_dir = Path(result.stdout.strip())
+
+        # Only positive answers are cached; init/clone may create a repo later
+        if git_dir is not None:
+            self._git_dir, self._git_dir_for = git_dir, key
+        return git_dir
+
+    def _repo_stamp(self) -> Optional[Tuple[Any, ...]]:
+        """File stamps that change when the index, HEAD or refs change."""
+        git_dir = self._resolve_git_dir()
+        if git_dir is None:
+            return None
+        head = git_dir / "HEAD"
+        paths = [git_dir / "index", head, git_dir / "packed-refs", git_dir / "FETCH_HEAD", git_dir / "config"]
+        try:
+            content = head.read_text(encoding="utf-8").strip()
+            if content.startswith("ref: "):
+                paths.append(git_dir / content[5:])
+        except OSError:
+            pass
+        return (str(self.repo_path),) + tuple(_file_stamp(p) for p in paths)
+
+    def _cached(self, key: Any, stamp: Any) -> Any:
+        entry = self._cache.get(key)
+        if entry is None or stamp is None or entry[0] != stamp:
+            return None
+        if time.monotonic() - entry[1] >= self.status_cache_ttl:
+            return None
+        return copy.deepcopy(entry[2])
+
+    def _store(self, key: Any, stamp: Any, value: Any) -> None:
+        if self.status_cache_ttl > 0 and stamp is not None:
+            self._cache[key] = (stamp, time.monotonic(), copy.deepcopy(value))
+
+    def _object_reader(self) -> GitObjectReader:
+        if self._reader is None or self._reader.repo_path != self.repo_path:
+            self.close()
+            self._reader = GitObjectReader(self.repo_path)
+        return self._reader
+
     def is_repo(self) -> bool:
         """Check if the path is a git repository."""
         try:
-            result = self._run_git(["rev-parse", "--git-dir"], check=False)
-            return result.returncode == 0
+            return self._resolve_git_dir() is not None
         except Exception:
             return False
 
@@ -148,59 +254,48 @@ class GitClient:
             if not self.is_repo():
                 return {"error": "Not a git repository"}
 
-            # Get current branch
-            branch_result = self._run_git(["branch", "--show-current"])
-            current_branch = branch_result.stdout.strip()
+            cached = self._cached("status", self._repo_stamp())
+            if cached is not None:
+                return cached
 
-            # Get status porcelain
-            status_result = self._run_git(["status", "--porcelain"])
-            status_lines = status_result.stdout.strip().split("\n") if status_result.stdout.strip() else []
+            # One call for branch, upstream ahead/behind and file states
+            status_result = self._run_git(["status", "--porcelain=v2", "--branch"])
 
-            # Parse status
+            current_branch = ""
+            ahead = 0
+            behind = 0
             staged = []
             modified = []
             untracked = []
 
-            for line in status_lines:
-                if len(line) < 3:
-                    continue
-                index_status = line[0]
-                worktree_status = line[1]
-                filename = line[3:]
-
-                if index_status in "MADRC":
-                    staged.append(filename)
-                if worktree_status == "M":
-                    modified.append(filename)
-                if index_status == "?" and worktree_status == "?":
-                    untracked.append(filename)
-
-            # Get ahead/behind
-            ahead = 0
-            behind = 0
-            try:
-                ab_result = self._run_git(
-                    ["rev-list", "--left-right", "--count", f"{current_branch}...@{{u}}"],
-                    check=False
-                )
-                if ab_result.returncode == 0:
-                    parts = ab_result.stdout.strip().split("\t")
-                    if len(parts) == 2:
-                        ahead = int(parts[0])
-                        behind = int(parts[1])
-            except Exception:
-                pass
-
-            # Get remote
-            remote_url = None
-            try:
-                remote_result = self._run_git(["remote", "get-url", "origin"], check=False)
-                if remote_result.returncode == 0:
-                    remote_url = remote_result.stdout.strip()
-            except Exception:
-                pass
-
-            return {
+            for line in status_result.stdout.split("\n"):
+                if line.startswith("# branch.head "):
+                    head = line[len("# branch.head "):]
+                    current_branch = "" if head == "(detached)" else head
+                elif line.startswith("# branch.ab "):
+                    parts = line.split()
+                    ahead = int(parts[2].lstrip("+"))
+                    behind = int(parts[3].lstrip("-"))
+                elif line.startswith("? "):
+                    untracked.append(line[2:])
+                elif line[:2] in ("1 ", "2 ", "u "):
+                    # Ordinary, renamed/copied and unmerged entries differ in field count
+                    fields = {"1": 8, "2": 9, "u": 10}[line[0]]
+                    parts = line.split(" ", fields)
+                    index_status, worktree_status = parts[1][0], parts[1][1]
+                    filename = parts[-1]
+                    if line[0] == "2":
+                        new_path, _, orig_path = filename.partition("\t")
+                        filename = f"{orig_path} -> {new_path}"
+
+                    if index_status in "MADRC":
+                        staged.append(filename)
+                    if worktree_status == "M":
+                        modified.append(filename)
+
+            remote_url = self._remote_url()
+
+            result = {
                 "branch": current_branch,
                 "remote_url": remote_url,
                 "staged_count": len(staged),
@@ -213,10 +308,31 @@ class GitClient:
                 "behind": behind,
                 "clean": len(staged) == 0 and len(modified) == 0,
             }
+            # Stamp after the call: git status may refresh the index itself
+            self._store("status", self._repo_stamp(), result)
+            return result
 
         except Exception as e:
             return {"error": str(e)}
 
+    def _remote_url(self, name: str = "origin") -> Optional[str]:
+        """URL of a remote, cached until the repository config changes."""
+        git_dir = self._resolve_git_dir()
+        stamp = (str(self.repo_path), _file_stamp(git_dir / "config")) if git_dir else None
+        entry = self._cache.get(("remote", name))
+        if entry is not None and stamp is not None and entry[0] == stamp:
+            return entry[2]
+        remote_url = None
+        try:
+            remote_result = self._run_git(["remote", "get-url", name], check=False)
+            if remote_result.returncode == 0:
+                remote_url = remote_result.stdout.strip()
+        except Exception:
+            pass
+        if stamp is not None:
+            self._cache[("remote", name)] = (stamp, time.monotonic(), remote_url)
+        return remote_url
+
     def add(
         self,
         files: Optional[List[str]] = None,
@@ -495,31 +611,35 @@ class GitClient:
             List of branch info
         """
         try:
-            args = ["branch", "-v"]
+            stamp = self._repo_stamp()
+            cached = self._cached(("branches", include_remote), stamp)
+            if cached is not None:
+                return [BranchInfo(**b) for b in cached]
+
+            args = ["for-each-ref", "--format=%(HEAD)%(refname)", "refs/heads"]
             if include_remote:
-                args.append("-a")
+                args.append("refs/remotes")
 
             result = self._run_git(args)
             branches = []
 
-            for line in result.stdout.strip().split("\n"):
-                if not line.strip():
+            for line in result.stdout.split("\n"):
+                if len(line) < 2:
                     continue
 
                 is_current = line.startswith("*")
-                line = line.lstrip("* ").strip()
-
-                parts = line.split()
-                if len(parts) >= 2:
-                    name = parts[0]
-                    is_remote = name.startswith("remotes/")
-
-                    branches.append(BranchInfo(
-                        name=name,
-                        is_current=is_current,
-                        is_remote=is_remote,
-                    ))
-
+                refname = line[1:]
+                is_remote = refname.startswith("refs/remotes/")
+                # Same names as `git branch -a`: "main", "remotes/origin/main"
+                name = refname[len("refs/"):] if is_remote else refname[len("refs/heads/"):]
+
+                branches.append(BranchInfo(
+                    name=name,
+                    is_current=is_current,
+                    is_remote=is_remote,
+                ))
+
+            self._store(("branches", include_remote), stamp, [b.model_dump() for b in branches])
             return branches
 
         except Exception as e:
@@ -530,12 +650,30 @@ class GitClient:
         """
         Get commit log.
 
+        Commits are read through a persistent ``git cat-file --batch``
+        process; ``git log`` is used if that fails.
+
         Args:
             count: Number of commits to return
 
         Returns:
             List of commit info
         """
+        try:
+            return [
+                CommitInfo(
+                    sha=commit["sha"],
+                    message=commit["subject"],
+                    author=commit["author"],
+                    email=commit["email"],
+                    timestamp=commit["author_time"],
+                )
+                for commit in self._object_reader().log("HEAD", count)
+            ]
+        except Exception as e:
+            logger.debug(f"Object reader failed, falling back to git log: {e}")
+            self.close()
+
         try:
             result = self._run_git([
                 "log",
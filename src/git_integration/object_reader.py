@@ -0,0 +1,197 @@
+"""
+Git Object Reader.
+
+Long-lived ``git cat-file --batch`` helper. One git process per repository
+answers any number of object lookups over a pipe, so reading commit history
+repeatedly does not pay the process-spawn cost on every call.
+"""
+
+import heapq
+import logging
+import subprocess
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class GitObjectReader:
+    """Reads raw git objects through a persistent ``git cat-file --batch`` process."""
+
+    def __init__(self, repo_path: Path):
+        """
+        Initialize the reader (the git process starts on first use).
+
+        Args:
+            repo_path: Repository working directory
+        """
+        self.repo_path = Path(repo_path)
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=str(self.repo_path),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    def close(self) -> None:
+        """Stop the git process."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=2)
+            except Exception:
+                process.kill()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def read(self, name: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Read one object.
+
+        Args:
+            name: Object name or revision (e.g. "HEAD", a SHA)
+
+        Returns:
+            Tuple of (sha, object type, raw content), or None if missing
+        """
+        with self._lock:
+            for attempt in range(2):
+                process = self._ensure_process()
+                try:
+                    process.stdin.write(name.encode("utf-8") + b"\n")
+                    process.stdin.flush()
+                    header = process.stdout.readline()
+                    if not header:
+                        raise BrokenPipeError("git cat-file exited")
+                    parts = header.decode("utf-8").split()
+                    if len(parts) != 3:
+                        return None  # "<name> missing" / "<name> ambiguous"
+                    sha, obj_type, size = parts
+                    content = process.stdout.read(int(size))
+                    process.stdout.read(1)  # trailing newline
+                    return sha, obj_type, content
+                except (BrokenPipeError, OSError, ValueError) as e:
+                    logger.debug(f"git cat-file failed ({e}), restarting")
+                    self._process = None
+                    if attempt:
+                        raise
+        return None
+
+    def read_commit(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Read and parse a commit.
+
+        Args:
+            name: Commit SHA or revision
+
+        Returns:
+            Dict with sha, parents, author, email, author_time (naive, in the
+            author's timezone), commit_time (epoch seconds) and message, or
+            None if the object is missing or not a commit
+        """
+        obj = self.read(name)
+        if obj is None or obj[1] != "commit":
+            return None
+        sha, _, content = obj
+        return parse_commit(sha, content)
+
+    def log(self, start: str = "HEAD", count: int = 10) -> List[Dict[str, Any]]:
+        """
+        Walk history from ``start``, newest commit date first (like ``git log``).
+
+        Args:
+            start: Revision to start from
+            count: Maximum commits to return
+
+        Returns:
+            List of parsed commits
+        """
+        first = self.read_commit(start)
+        if first is None:
+            return []
+        seen = {first["sha"]}
+        queue = [(-first["commit_time"], 0, first)]
+        order = 1
+        commits = []
+        while queue and len(commits) < count:
+            _, _, commit = heapq.heappop(queue)
+            commits.append(commit)
+            for parent_sha in commit["parents"]:
+                if parent_sha in seen:
+                    continue
+                seen.add(parent_sha)
+                parent = self.read_commit(parent_sha)
+                if parent is not None:
+                    heapq.heappush(queue, (-parent["commit_time"], order, parent))
+                    order += 1
+        return commits
+
+
+def _parse_signature(value: str) -> Tuple[str, str, int, timezone]:
+    """Parse "Name <email> 1700000000 +0100"."""
+    name, _, rest = value.partition(" <")
+    email, _, when = rest.partition("> ")
+    seconds, _, offset = when.partition(" ")
+    sign = -1 if offset.startswith("-") else 1
+    digits = offset.lstrip("+-").rjust(4, "0")
+    tz = timezone(sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:4])))
+    return name, email, int(seconds), tz
+
+
+def parse_commit(sha: str, content: bytes) -> Dict[str, Any]:
+    """
+    Parse a raw commit object.
+
+    Args:
+        sha: Commit SHA
+        content: Raw object content from cat-file
+
+    Returns:
+        Parsed commit dict (see GitObjectReader.read_commit)
+    """
+    text = content.decode("utf-8", errors="replace")
+    headers, _, message = text.partition("\n\n")
+    parents: List[str] = []
+    author = email = ""
+    author_time = datetime.fromtimestamp(0)
+    commit_time = 0
+
+    for line in headers.split("\n"):
+        if line.startswith(" "):
+            continue  # continuation of a multi-line header (e.g. gpgsig)
+        key, _, value = line.partition(" ")
+        if key == "parent":
+            parents.append(value)
+        elif key == "author":
+            author, email, seconds, tz = _parse_signature(value)
+            author_time = datetime.fromtimestamp(seconds, tz).replace(tzinfo=None)
+        elif key == "committer":
+            commit_time = _parse_signature(value)[2]
+
+    # Same as git's %s: the first paragraph, joined onto one line
+    subject = " ".join(line.strip() for line in message.strip("\n").split("\n\n")[0].split("\n"))
+    return {
+        "sha": sha,
+        "parents": parents,
+        "author": author,
+        "email": email,
+        "author_time": author_time,
+        "commit_time": commit_time,
+        "subject": subject,
+        "message": message,
+    }
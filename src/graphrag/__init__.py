@@ -7,6 +7,7 @@ Key Components:
 - EmbeddingProvider: Unified embedding interface (OpenAI, HuggingFace)
 - VectorStore: Vector database abstraction (SQLite, ChromaDB)
 - EntityExtractor: Extract entities from natural language
+- EntityIndex: Aho-Corasick + n-gram index over known entity names
 - ProofOfGraph: Validate AI outputs against knowledge graph
 - HybridRetriever: Combine vector, graph, and lexical search
 - MCP Tools: 10 tools for RAG-enhanced AI interactions
@@ -45,6 +46,7 @@ from .vector_store import (
     ChromaVectorStore,
     get_vector_store,
 )
+from .entity_index import AhoCorasickMatcher, NGramIndex, EntityIndex
 from .entity_extractor import EntityExtractor
 from .proof_of_graph import ProofOfGraph
 from .retriever import HybridRetriever
@@ -78,6 +80,9 @@ __all__ = [
     "ChromaVectorStore",
     "get_vector_store",
     # Core Components
+    "AhoCorasickMatcher",
+    "NGramIndex",
+    "EntityIndex",
     "EntityExtractor",
     "ProofOfGraph",
     "HybridRetriever",
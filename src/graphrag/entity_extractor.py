@@ -9,11 +9,15 @@ Identifies:
 - Business terms from glossary
 
 Provides entity linking to connect extracted entities to catalog/hierarchy IDs.
+Known names are matched with a compiled Aho-Corasick automaton (see
+entity_index.py), so lookup cost does not grow with catalog size.
 """
 import logging
 import re
+from collections import Counter
 from typing import Dict, List, Optional, Set, Any
 
+from .entity_index import EntityIndex
 from .types import ExtractedEntity, EntityType, RAGQuery
 
 logger = logging.getLogger(__name__)
@@ -93,27 +97,34 @@ class EntityExtractor:
         self.hierarchy = hierarchy_service
         self.glossary_terms = glossary_terms or []
 
-        # Build lookup sets from catalog/hierarchy
-        self._known_tables: Set[str] = set()
-        self._known_columns: Set[str] = set()
-        self._known_hierarchies: Set[str] = set()
-        self._term_map: Dict[str, str] = {}  # term_name -> term_id
+        # Compiled lookup structures for catalog/hierarchy/glossary names
+        self.index = EntityIndex()
+        self._asset_names: Dict[str, str] = {}  # asset_id -> indexed table name
+        self._hierarchy_names: Dict[str, Dict[str, Any]] = {}  # uuid -> indexed record
+        self._table_columns: Dict[str, Set[str]] = {}  # table -> indexed columns
+        self._column_refs: Counter = Counter()  # column -> number of tables
 
         self._build_lookups()
 
+        # Keep the index current as the catalog/hierarchies change
+        if self.catalog is not None and hasattr(self.catalog, "subscribe"):
+            self.catalog.subscribe(self._on_catalog_change)
+        if self.hierarchy is not None and hasattr(self.hierarchy, "subscribe"):
+            self.hierarchy.subscribe(self._on_hierarchy_change)
+
     def _build_lookups(self) -> None:
         """Build lookup tables from catalog and hierarchy."""
+        self.index.clear()
+        self._asset_names.clear()
+        self._hierarchy_names.clear()
+        self._table_columns.clear()
+        self._column_refs.clear()
+
         # Tables from catalog
         if self.catalog:
             try:
-                assets = self.catalog.list_assets(asset_types=["TABLE", "VIEW"])
-                for asset in assets.get("assets", []):
-                    name = asset.get("name", "").upper()
-                    self._known_tables.add(name)
-
-                    # Index columns
-                    for col in asset.get("columns", []):
-                        self._known_columns.add(col.get("name", "").upper())
+                for asset in self.catalog.iter_assets():
+                    self._index_asset(asset)
             except Exception as e:
                 logger.debug(f"Catalog lookup build failed: {e}")
 
@@ -124,20 +135,107 @@ class EntityExtractor:
                 for proj in projects:
                     hierarchies = self.hierarchy.list_hierarchies(proj["id"])
                     for h in hierarchies:
-                        name = h.get("hierarchy_name", "").upper()
-                        if name:
-                            self._known_hierarchies.add(name)
-                        # Also index hierarchy_id for direct matching
-                        hier_id = h.get("hierarchy_id", "").upper()
-                        if hier_id:
-                            self._known_hierarchies.add(hier_id)
+                        self._index_hierarchy(h)
             except Exception as e:
                 logger.debug(f"Hierarchy lookup build failed: {e}")
 
         # Glossary terms
         for term in self.glossary_terms:
-            name = term.get("name", "").lower()
-            self._term_map[name] = term.get("id", "")
+            self.add_glossary_term(term.get("name", ""), term.get("id", ""))
+
+    def refresh(self) -> None:
+        """Rebuild all lookups from the catalog, hierarchy service and glossary."""
+        self._build_lookups()
+
+    def _index_asset(self, asset: Any) -> None:
+        """Index a catalog table/view, replacing any previous entry for it."""
+        previous = self._asset_names.pop(asset.id, None)
+        if previous:
+            self.remove_table(previous)
+
+        asset_type = getattr(asset.asset_type, "value", asset.asset_type)
+        if asset_type in ("table", "view") and asset.name:
+            self.add_table(asset.name, [c.column_name for c in asset.columns])
+            self._asset_names[asset.id] = asset.name
+
+    def _index_hierarchy(self, hierarchy: Dict[str, Any]) -> None:
+        """Index a hierarchy, replacing any previous entry for it."""
+        key = hierarchy.get("id") or hierarchy.get("hierarchy_id", "")
+        previous = self._hierarchy_names.pop(key, None)
+        if previous:
+            self.remove_hierarchy(previous)
+        self.add_hierarchy(hierarchy)
+        self._hierarchy_names[key] = {
+            "hierarchy_name": hierarchy.get("hierarchy_name"),
+            "hierarchy_id": hierarchy.get("hierarchy_id"),
+        }
+
+    def _on_catalog_change(self, event: str, obj: Any) -> None:
+        """Apply a CatalogStore change event."""
+        if event == "asset_deleted":
+            name = self._asset_names.pop(obj.id, None)
+            if name:
+                self.remove_table(name)
+        elif event in ("asset_created", "asset_updated"):
+            self._index_asset(obj)
+
+    def _on_hierarchy_change(self, event: str, record: Dict[str, Any]) -> None:
+        """Apply a HierarchyService change event."""
+        if event == "hierarchy_deleted":
+            previous = self._hierarchy_names.pop(record.get("id") or record.get("hierarchy_id", ""), None)
+            if previous:
+                self.remove_hierarchy(previous)
+        elif event in ("hierarchy_created", "hierarchy_updated"):
+            self._index_hierarchy(record)
+
+    def add_table(self, name: str, columns: Optional[List[str]] = None) -> None:
+        """Register a table (and optionally its columns) for linking."""
+        if name:
+            self.index.add(EntityIndex.TABLES, name.upper(), name.upper())
+        if columns:
+            known = self._table_columns.setdefault(name.upper(), set())
+            added = []
+            for col in columns:
+                col = (col or "").upper()
+                if col and col not in known:
+                    known.add(col)
+                    self._column_refs[col] += 1
+                    if self._column_refs[col] == 1:
+                        added.append(col)
+            if added:
+                self.index.add_many(EntityIndex.COLUMNS, added)
+
+    def remove_table(self, name: str) -> None:
+        """Unregister a table and any columns no other table still has."""
+        self.index.remove(EntityIndex.TABLES, name.upper())
+        for col in self._table_columns.pop(name.upper(), ()):
+            self._column_refs[col] -= 1
+            if self._column_refs[col] <= 0:
+                del self._column_refs[col]
+                self.index.remove(EntityIndex.COLUMNS, col)
+
+    def add_hierarchy(self, hierarchy: Dict[str, Any]) -> None:
+        """Register a hierarchy's name and ID for linking."""
+        for key in ("hierarchy_name", "hierarchy_id"):
+            value = (hierarchy.get(key) or "").upper()
+            if value:
+                self.index.add(EntityIndex.HIERARCHIES, value, value)
+
+    def remove_hierarchy(self, hierarchy: Dict[str, Any]) -> None:
+        """Unregister a hierarchy's name and ID."""
+        for key in ("hierarchy_name", "hierarchy_id"):
+            value = (hierarchy.get(key) or "").upper()
+            if value:
+                self.index.remove(EntityIndex.HIERARCHIES, value)
+
+    def add_glossary_term(self, name: str, term_id: str = "") -> None:
+        """Register a glossary term for linking."""
+        if name:
+            self.index.add(EntityIndex.TERMS, name.lower(), term_id)
+
+    def remove_glossary_term(self, name: str) -> None:
+        """Unregister a glossary term."""
+        self.index.remove(EntityIndex.TERMS, name.lower())
 
     def extract(self, query: str) -> List[ExtractedEntity]:
         """
@@ -174,7 +272,7 @@ class EntityExtractor:
         # Extract tables
         tables = self._extract_tables(query)
         for table, pos in tables:
-            linked_id = table.upper() if table.upper() in self._known_tables else None
+            linked_id = self.index.get(EntityIndex.TABLES, table)
             entities.append(ExtractedEntity(
                 text=table,
                 entity_type=EntityType.TABLE,
@@ -186,7 +284,7 @@ class EntityExtractor:
         # Extract columns
         columns = self._extract_columns(query)
         for col, pos in columns:
-            linked = col.upper() in self._known_columns
+            linked = self.index.contains(EntityIndex.COLUMNS, col)
             entities.append(ExtractedEntity(
                 text=col,
                 entity_type=EntityType.COLUMN,
@@ -197,7 +295,7 @@ class EntityExtractor:
         # Extract hierarchy references
         hierarchies = self._extract_hierarchies(query)
         for hier, pos in hierarchies:
-            linked_id = hier.upper() if hier.upper() in self._known_hierarchies else None
+            linked_id = self.index.get(EntityIndex.HIERARCHIES, hier)
             entities.append(ExtractedEntity(
                 text=hier,
                 entity_type=EntityType.HIERARCHY,
@@ -260,6 +358,10 @@ class EntityExtractor:
         for match in re.finditer(quoted_pattern, query):
             results.append((match.group(1), match.start(1)))
 
+        # Known catalog tables mentioned anywhere in the query
+        for start, end, _key, _linked in self.index.find(EntityIndex.TABLES, query):
+            results.append((query[start:end], start))
+
         return results
 
     def _extract_columns(self, query: str) -> List[tuple]:
@@ -295,10 +397,10 @@ class EntityExtractor:
                     found_names.add(hier.upper())
 
         # Direct matching against known hierarchies
-        query_upper = query.upper()
-        for known in self._known_hierarchies:
-            if known not in found_names and known in query_upper:
-                pos = query_upper.index(known)
+        positions = self.index.first_positions(EntityIndex.HIERARCHIES, query, whole_words=False)
+        for key, pos in sorted(positions.items(), key=lambda item: item[1]):
+            known = key.upper()
+            if known not in found_names:
                 results.append((known, pos))
                 found_names.add(known)
 
@@ -307,11 +409,12 @@ class EntityExtractor:
     def _extract_glossary_terms(self, query: str) -> List[tuple]:
         """Extract glossary terms. Returns [(term_name, term_id), ...]"""
         results = []
+        seen = set()
 
-        for term_name, term_id in self._term_map.items():
-            # Case-insensitive whole word match
-            pattern = rf'\b{re.escape(term_name)}\b'
-            if re.search(pattern, query, re.IGNORECASE):
+        # Case-insensitive whole word match
+        for _start, _end, term_name, term_id in self.index.find(EntityIndex.TERMS, query):
+            if term_name not in seen:
+                seen.add(term_name)
                 results.append((term_name, term_id))
 
         return results
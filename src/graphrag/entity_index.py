@@ -0,0 +1,485 @@
+"""
+Entity Index - Compiled lookup structures for entity linking.
+
+Provides:
+- AhoCorasickMatcher: multi-pattern automaton that finds every known
+  entity name in a query in a single pass, independent of catalog size
+- NGramIndex: character n-gram + sorted-prefix index used to shortlist
+  candidates for fuzzy "did you mean" suggestions
+- EntityIndex: per-kind registry (tables, columns, hierarchies, terms)
+  combining both, updated incrementally as entities are added/removed
+
+The automaton is compiled lazily on the first match, so bulk loads pay for
+a single compile instead of one per entity. Later single-entity changes
+are applied incrementally (see AhoCorasickMatcher).
+"""
+import bisect
+import heapq
+import logging
+from collections import Counter, deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _is_word_char(ch: str) -> bool:
+    """Match the regex notion of a word character (\\w)."""
+    return ch.isalnum() or ch == "_"
+
+
+def _at_word_boundary(text: str, pos: int) -> bool:
+    """Return True if a regex \\b would match at ``pos`` in ``text``."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class _Automaton:
+    """Compiled Aho-Corasick trie with failure and dictionary suffix links."""
+
+    def __init__(self, keys: Iterable[str]):
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Optional[str]] = [None]
+        terminal: Dict[str, int] = {}
+
+        for key in keys:
+            node = 0
+            for ch in key:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    output.append(None)
+                node = nxt
+            output[node] = key
+            terminal[key] = node
+
+        fail = [0] * len(goto)
+        dict_link = [-1] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(ch, 0)
+                fail[child] = target if target != child else 0
+                link = fail[child]
+                dict_link[child] = link if output[link] is not None else dict_link[link]
+
+        self.goto = goto
+        self.fail = fail
+        self.output = output
+        self.dict_link = dict_link
+        self.terminal = terminal
+
+    def __len__(self) -> int:
+        return len(self.goto)
+
+    def discard(self, key: str) -> bool:
+        """
+        Stop reporting ``key`` without recompiling (O(1)).
+
+        The trie states stay in place; dictionary links that pointed at the
+        keyword are skipped during the scan.
+        """
+        node = self.terminal.pop(key, None)
+        if node is None:
+            return False
+        self.output[node] = None
+        return True
+
+    def scan(self, haystack: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, keyword) in order of end position."""
+        goto, fail, output, dict_link = self.goto, self.fail, self.output, self.dict_link
+        state = 0
+        for i, ch in enumerate(haystack):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            node = state
+            while node > 0:
+                key = output[node]
+                if key is not None:
+                    yield i + 1 - len(key), i + 1, key
+                node = dict_link[node]
+
+
+class AhoCorasickMatcher:
+    """
+    Aho-Corasick automaton over a set of keywords.
+
+    Matching cost is O(len(text) + matches) regardless of how many
+    keywords are registered. Keywords may be added or removed at any
+    time, and single changes do not recompile the main automaton:
+
+    - remove() clears the keyword's output state in place (O(1)).
+    - add() puts the keyword in a small pending automaton that is
+      recompiled on the next search. That costs O(total length of the
+      pending keywords), and each search also scans the pending automaton.
+
+    Once the pending keywords plus the removed keywords exceed
+    ``rebuild_ratio`` of the compiled keywords (and at least
+    ``min_rebuild``), everything is merged into one automaton. That full
+    rebuild is O(total keyword length), so it runs only after a number of
+    changes proportional to the catalog size.
+    """
+
+    def __init__(self, case_sensitive: bool = False, rebuild_ratio: float = 0.1, min_rebuild: int = 256):
+        self.case_sensitive = case_sensitive
+        self.rebuild_ratio = rebuild_ratio
+        self.min_rebuild = min_rebuild
+        self._patterns: Dict[str, Any] = {}  # normalized keyword -> payload
+
+        # Compiled state: the main automaton plus keywords added since it was built
+        self._main: Optional[_Automaton] = None
+        self._pending: Set[str] = set()
+        self._delta: Optional[_Automaton] = None
+        self._delta_dirty = False
+        self._removed = 0  # keywords discarded from the main automaton since it was built
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def add(self, keyword: str, payload: Any = None) -> None:
+        """Register a keyword with an optional payload (e.g. linked ID)."""
+        if not keyword:
+            return
+        key = self._normalize(keyword)
+        if key not in self._patterns and self._main is not None:
+            self._pending.add(key)
+            self._delta_dirty = True
+        self._patterns[key] = payload
+
+    def remove(self, keyword: str) -> bool:
+        """Remove a keyword. Returns True if it was registered."""
+        key = self._normalize(keyword)
+        if key not in self._patterns:
+            return False
+        del self._patterns[key]
+        if key in self._pending:
+            self._pending.discard(key)
+            self._delta_dirty = True
+        elif self._main is not None and self._main.discard(key):
+            self._removed += 1
+        return True
+
+    def clear(self) -> None:
+        """Remove all keywords."""
+        self._patterns.clear()
+        self._main = self._delta = None
+        self._pending.clear()
+        self._delta_dirty = False
+        self._removed = 0
+
+    def get(self, keyword: str, default: Any = None) -> Any:
+        """Return the payload registered for a keyword."""
+        return self._patterns.get(self._normalize(keyword), default)
+
+    def keywords(self) -> Iterable[str]:
+        """Iterate over registered (normalized) keywords."""
+        return self._patterns.keys()
+
+    def __contains__(self, keyword: str) -> bool:
+        return self._normalize(keyword) in self._patterns
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _build(self) -> None:
+        """Compile every keyword into the main automaton."""
+        self._main = _Automaton(self._patterns)
+        self._pending.clear()
+        self._delta = None
+        self._delta_dirty = False
+        self._removed = 0
+        logger.debug(f"Compiled Aho-Corasick automaton: {len(self._patterns)} keywords, {len(self._main)} states")
+
+    def _prepare(self) -> List[_Automaton]:
+        """Bring the compiled state up to date and return the automata to scan."""
+        changes = len(self._pending) + self._removed
+        if self._main is None or changes > max(self.min_rebuild, self.rebuild_ratio * len(self._patterns)):
+            self._build()
+        elif self._delta_dirty:
+            self._delta = _Automaton(self._pending) if self._pending else None
+            self._delta_dirty = False
+        return [self._main] if self._delta is None else [self._main, self._delta]
+
+    def iter_matches(
+        self,
+        text: str,
+        whole_words: bool = False,
+    ) -> Iterator[Tuple[int, int, str, Any]]:
+        """
+        Yield every keyword occurrence in ``text``.
+
+        Args:
+            text: Text to scan
+            whole_words: Only yield matches bounded like regex ``\\b...\\b``
+
+        Yields:
+            (start, end, keyword, payload) tuples in order of end position
+        """
+        if not self._patterns:
+            return
+        automata = self._prepare()
+        haystack = self._normalize(text)
+        scans = [automaton.scan(haystack) for automaton in automata]
+        matches = scans[0] if len(scans) == 1 else heapq.merge(*scans, key=lambda m: m[1])
+
+        for start, end, key in matches:
+            if not whole_words or (
+                _at_word_boundary(haystack, start) and _at_word_boundary(haystack, end)
+            ):
+                yield start, end, key, self._patterns[key]
+
+    def find_all(self, text: str, whole_words: bool = False) -> List[Tuple[int, int, str, Any]]:
+        """Return all matches sorted by start position."""
+        return sorted(self.iter_matches(text, whole_words=whole_words))
+
+    def first_positions(self, text: str, whole_words: bool = False) -> Dict[str, int]:
+        """Return the first start position of each keyword found in ``text``."""
+        positions: Dict[str, int] = {}
+        for start, _end, key, _payload in self.iter_matches(text, whole_words=whole_words):
+            if key not in positions or start < positions[key]:
+                positions[key] = start
+        return positions
+
+
+class NGramIndex:
+    """
+    Character n-gram and prefix index for approximate name lookup.
+
+    Keys are padded with boundary markers so short names and shared
+    prefixes/suffixes contribute grams. ``candidates`` ranks keys by the
+    number of grams shared with the query, which bounds the set that
+    needs a full similarity score. Grams shared by more than
+    ``max_posting`` keys carry little signal and are skipped.
+    """
+
+    def __init__(self, n: int = 3, max_posting: int = 5000):
+        self.n = n
+        self.max_posting = max_posting
+        self._postings: Dict[str, Set[str]] = {}
+        self._keys: Set[str] = set()
+        self._sorted: List[str] = []
+        self._sorted_dirty = False
+
+    def _grams(self, key: str) -> Set[str]:
+        padded = f"${key}$"
+        if len(padded) <= self.n:
+            return {padded}
+        return {padded[i:i + self.n] for i in range(len(padded) - self.n + 1)}
+
+    def add(self, key: str) -> None:
+        """Index a key."""
+        if not key or key in self._keys:
+            return
+        self._keys.add(key)
+        for gram in self._grams(key):
+            self._postings.setdefault(gram, set()).add(key)
+        self._sorted_dirty = True
+
+    def remove(self, key: str) -> None:
+        """Remove a key from the index."""
+        if key not in self._keys:
+            return
+        self._keys.discard(key)
+        for gram in self._grams(key):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+        self._sorted_dirty = True
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        self._postings.clear()
+        self._keys.clear()
+        self._sorted = []
+        self._sorted_dirty = False
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def candidates(self, query: str, limit: int = 50) -> List[str]:
+        """Return up to ``limit`` keys sharing the most n-grams with ``query``."""
+        postings = sorted(
+            (p for p in (self._postings.get(g) for g in self._grams(query)) if p),
+            key=len,
+        )
+        selective = [p for p in postings if len(p) <= self.max_posting] or postings[:1]
+
+        counts: Counter = Counter()
+        for posting in selective:
+            counts.update(posting)
+        return [key for key, _ in counts.most_common(limit)]
+
+    def prefix(self, prefix: str, limit: int = 50) -> List[str]:
+        """Return up to ``limit`` keys starting with ``prefix`` in sorted order."""
+        if self._sorted_dirty:
+            self._sorted = sorted(self._keys)
+            self._sorted_dirty = False
+        start = bisect.bisect_left(self._sorted, prefix)
+        results = []
+        for key in self._sorted[start:]:
+            if not key.startswith(prefix) or len(results) >= limit:
+                break
+            results.append(key)
+        return results
+
+    def suggest(
+        self,
+        query: str,
+        threshold: float = 0.6,
+        max_candidates: int = 50,
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed key.
+
+        Args:
+            query: Name to look up
+            threshold: Minimum similarity (0-1) for a suggestion
+            max_candidates: Number of n-gram candidates to score
+
+        Returns:
+            (key, score) of the best match, or None
+        """
+        try:
+            from rapidfuzz import fuzz
+        except ImportError:
+            return None
+
+        best_match = None
+        best_score = 0.0
+        for key in self.candidates(query, limit=max_candidates):
+            score = fuzz.ratio(query, key) / 100
+            if score > best_score and score >= threshold:
+                best_score = score
+                best_match = key
+
+        if best_match is None:
+            return None
+        return best_match, best_score
+
+
+class EntityIndex:
+    """
+    Registry of known entity names grouped by kind.
+
+    Each kind gets an Aho-Corasick matcher for in-text detection and an
+    n-gram index for fuzzy suggestions. Names are stored upper-cased to
+    match catalog/hierarchy conventions; matching is case-insensitive.
+
+    ``version`` increments on every change so callers can detect a
+    stale view cheaply.
+    """
+
+    TABLES = "tables"
+    COLUMNS = "columns"
+    HIERARCHIES = "hierarchies"
+    PROJECTS = "projects"
+    TERMS = "terms"
+
+    def __init__(self):
+        self._matchers: Dict[str, AhoCorasickMatcher] = {}
+        self._ngrams: Dict[str, NGramIndex] = {}
+        self.version = 0
+
+    def _matcher(self, kind: str) -> AhoCorasickMatcher:
+        matcher = self._matchers.get(kind)
+        if matcher is None:
+            matcher = self._matchers[kind] = AhoCorasickMatcher()
+            self._ngrams[kind] = NGramIndex()
+        return matcher
+
+    def add(self, kind: str, name: str, payload: Any = None) -> None:
+        """Register an entity name under ``kind``."""
+        if not name:
+            return
+        self._matcher(kind).add(name, payload)
+        self._ngrams[kind].add(name.upper())
+        self.version += 1
+
+    def add_many(self, kind: str, names: Iterable[str]) -> None:
+        """Register several names without payloads."""
+        matcher = self._matcher(kind)
+        ngrams = self._ngrams[kind]
+        for name in names:
+            if name:
+                matcher.add(name)
+                ngrams.add(name.upper())
+        self.version += 1
+
+    def remove(self, kind: str, name: str) -> None:
+        """Unregister an entity name."""
+        matcher = self._matchers.get(kind)
+        if matcher is not None and matcher.remove(name):
+            self._ngrams[kind].remove(name.upper())
+            self.version += 1
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Clear one kind, or every kind when ``kind`` is None."""
+        kinds = [kind] if kind else list(self._matchers)
+        for k in kinds:
+            if k in self._matchers:
+                self._matchers[k].clear()
+                self._ngrams[k].clear()
+        self.version += 1
+
+    def contains(self, kind: str, name: str) -> bool:
+        """Check whether ``name`` is a known entity of ``kind``."""
+        matcher = self._matchers.get(kind)
+        return matcher is not None and name in matcher
+
+    def get(self, kind: str, name: str, default: Any = None) -> Any:
+        """Return the payload registered for ``name``."""
+        matcher = self._matchers.get(kind)
+        return default if matcher is None else matcher.get(name, default)
+
+    def size(self, kind: str) -> int:
+        """Number of names registered under ``kind``."""
+        matcher = self._matchers.get(kind)
+        return 0 if matcher is None else len(matcher)
+
+    def find(
+        self,
+        kind: str,
+        text: str,
+        whole_words: bool = True,
+    ) -> List[Tuple[int, int, str, Any]]:
+        """Find all occurrences of known ``kind`` names in ``text``."""
+        matcher = self._matchers.get(kind)
+        if matcher is None:
+            return []
+        return matcher.find_all(text, whole_words=whole_words)
+
+    def first_positions(self, kind: str, text: str, whole_words: bool = True) -> Dict[str, int]:
+        """Map each known ``kind`` name found in ``text`` to its first position."""
+        matcher = self._matchers.get(kind)
+        if matcher is None:
+            return {}
+        return matcher.first_positions(text, whole_words=whole_words)
+
+    def suggest(self, kind: str, name: str, threshold: float = 0.6) -> Optional[str]:
+        """Return the closest known ``kind`` name (upper-cased), if similar enough."""
+        ngrams = self._ngrams.get(kind)
+        if ngrams is None:
+            return None
+        match = ngrams.suggest(name.upper(), threshold=threshold)
+        return match[0] if match else None
+
+    def prefix(self, kind: str, prefix: str, limit: int = 50) -> List[str]:
+        """Return known ``kind`` names (upper-cased) starting with ``prefix``."""
+        ngrams = self._ngrams.get(kind)
+        if ngrams is None:
+            return []
+        return ngrams.prefix(prefix.upper(), limit=limit)
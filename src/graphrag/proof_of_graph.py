@@ -9,11 +9,26 @@ Validates AI-generated content against the knowledge graph:
 
 This is the key differentiator from pure LLM generation -
 we anchor outputs in verified data structures.
+
+The entity index is built once and then maintained from change events
+published by CatalogStore and HierarchyService; a version stamp check
+before each validation catches writes that bypassed the subscription.
 """
+import hashlib
 import logging
 import re
-from typing import Dict, List, Optional, Set, Any
-
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Any, Tuple
+
+try:
+    import sqlglot
+    from sqlglot import exp
+    SQLGLOT_AVAILABLE = True
+except ImportError:
+    SQLGLOT_AVAILABLE = False
+
+from .entity_index import EntityIndex
 from .types import (
     ValidationResult, ValidationIssue, ValidationSeverity,
     RAGContext,
@@ -21,6 +36,18 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+_CATALOG_TABLE_TYPES = ("table", "view")
+_SQL_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class SQLReferences:
+    """Table, column and CTE names referenced by a SQL string."""
+    tables: Tuple[str, ...]
+    columns: Tuple[str, ...]
+    ctes: FrozenSet[str]
+    parsed: bool = True  # False when the regex fallback was used
+
 
 class ProofOfGraph:
     """
@@ -39,6 +66,7 @@ class ProofOfGraph:
         hierarchy_service=None,
         lineage_tracker=None,
         strict_mode: bool = False,
+        sql_dialect: str = "snowflake",
     ):
         """
         Initialize the Proof of Graph validator.
@@ -48,11 +76,13 @@ class ProofOfGraph:
             hierarchy_service: HierarchyService for hierarchy validation
             lineage_tracker: LineageTracker for relationship validation
             strict_mode: If True, warnings are treated as errors
+            sql_dialect: sqlglot dialect used to parse generated SQL
         """
         self.catalog = catalog_store
         self.hierarchy = hierarchy_service
         self.lineage = lineage_tracker
         self.strict_mode = strict_mode
+        self.sql_dialect = sql_dialect
 
         # Build entity index
         self._known_tables: Set[str] = set()
@@ -61,69 +91,270 @@ class ProofOfGraph:
         self._known_projects: Set[str] = set()
         self._cte_aliases: Set[str] = set()  # Track CTEs during validation
 
+        # Reference counts per name, and what each source contributed, so a
+        # single asset/hierarchy can be withdrawn without a full rebuild
+        self._table_refs: Counter = Counter()
+        self._hierarchy_refs: Counter = Counter()
+        self._project_refs: Counter = Counter()
+        self._table_column_refs: Counter = Counter()  # (table, column) -> count
+        self._column_refs: Counter = Counter()  # column -> number of tables
+        self._contributions: Dict[str, Dict[str, List[Any]]] = {}
+
+        # N-gram/prefix index over known names for fuzzy suggestions
+        self.index = EntityIndex()
+
+        # Parsed SQL references keyed by SQL hash
+        self._sql_cache: "OrderedDict[str, SQLReferences]" = OrderedDict()
+
+        # Version stamps of the sources the index was last synced with
+        self._catalog_version: Any = None
+        self._hierarchy_version: Any = None
+
         self._refresh_index()
 
+        if self.catalog is not None and hasattr(self.catalog, "subscribe"):
+            self.catalog.subscribe(self._on_catalog_change)
+        if self.hierarchy is not None and hasattr(self.hierarchy, "subscribe"):
+            self.hierarchy.subscribe(self._on_hierarchy_change)
+
+    def close(self) -> None:
+        """Stop listening to catalog/hierarchy change events."""
+        if self.catalog is not None and hasattr(self.catalog, "unsubscribe"):
+            self.catalog.unsubscribe(self._on_catalog_change)
+        if self.hierarchy is not None and hasattr(self.hierarchy, "unsubscribe"):
+            self.hierarchy.unsubscribe(self._on_hierarchy_change)
+
+    # =========================================================================
+    # Entity Index Maintenance
+    # =========================================================================
+
+    @staticmethod
+    def _incr(refs: Counter, known: Set[str], name: str) -> bool:
+        """Increment a name's refcount. Returns True if it became known."""
+        refs[name] += 1
+        if refs[name] == 1:
+            known.add(name)
+            return True
+        return False
+
+    @staticmethod
+    def _decr(refs: Counter, known: Set[str], name: str) -> bool:
+        """Decrement a name's refcount. Returns True if it became unknown."""
+        if refs[name] <= 1:
+            refs.pop(name, None)
+            known.discard(name)
+            return True
+        refs[name] -= 1
+        return False
+
+    def _contribute(
+        self,
+        source: str,
+        tables: Iterable[str] = (),
+        columns: Optional[Dict[str, Iterable[str]]] = None,
+        hierarchies: Iterable[str] = (),
+        projects: Iterable[str] = (),
+        replace: bool = True,
+    ) -> None:
+        """
+        Register the entities a source (asset, hierarchy, project) provides.
+
+        With ``replace`` the source's previous contribution is withdrawn
+        first, so updates are applied as a diff-free swap.
+        """
+        if replace:
+            self._withdraw(source)
+        record = self._contributions.setdefault(
+            source, {"tables": [], "columns": [], "hierarchies": [], "projects": []}
+        )
+
+        for name in tables:
+            if name:
+                record["tables"].append(name)
+                if self._incr(self._table_refs, self._known_tables, name):
+                    self.index.add(EntityIndex.TABLES, name)
+
+        for table, cols in (columns or {}).items():
+            for col in cols:
+                if not col:
+                    continue
+                record["columns"].append((table, col))
+                self._table_column_refs[(table, col)] += 1
+                if self._table_column_refs[(table, col)] == 1:
+                    self._known_columns.setdefault(table, set()).add(col)
+                    self._column_refs[col] += 1
+
+        for name in hierarchies:
+            if name:
+                record["hierarchies"].append(name)
+                self._incr(self._hierarchy_refs, self._known_hierarchies, name)
+
+        for name in projects:
+            if name:
+                record["projects"].append(name)
+                self._incr(self._project_refs, self._known_projects, name)
+
+    def _withdraw(self, source: str) -> None:
+        """Remove everything a source previously contributed."""
+        record = self._contributions.pop(source, None)
+        if not record:
+            return
+
+        for name in record["tables"]:
+            if self._decr(self._table_refs, self._known_tables, name):
+                self.index.remove(EntityIndex.TABLES, name)
+
+        for table, col in record["columns"]:
+            self._table_column_refs[(table, col)] -= 1
+            if self._table_column_refs[(table, col)] <= 0:
+                del self._table_column_refs[(table, col)]
+                cols = self._known_columns.get(table)
+                if cols is not None:
+                    cols.discard(col)
+                    if not cols:
+                        del self._known_columns[table]
+                self._column_refs[col] -= 1
+                if self._column_refs[col] <= 0:
+                    del self._column_refs[col]
+
+        for name in record["hierarchies"]:
+            self._decr(self._hierarchy_refs, self._known_hierarchies, name)
+
+        for name in record["projects"]:
+            self._decr(self._project_refs, self._known_projects, name)
+
+    def _withdraw_prefix(self, prefix: str) -> None:
+        """Withdraw every source whose key starts with ``prefix``."""
+        for source in [s for s in self._contributions if s.startswith(prefix)]:
+            self._withdraw(source)
+
+    def _add_context_entities(
+        self,
+        tables: Iterable[str] = (),
+        hierarchies: Iterable[str] = (),
+    ) -> None:
+        """Register names supplied by a RAG context (kept for the validator's lifetime)."""
+        record = self._contributions.get("context", {})
+        new_tables = [t for t in tables if t not in record.get("tables", ())]
+        new_hiers = [h for h in hierarchies if h not in record.get("hierarchies", ())]
+        if new_tables or new_hiers:
+            self._contribute("context", tables=new_tables, hierarchies=new_hiers, replace=False)
+
+    def _add_known_table(self, name: str) -> None:
+        """Register a table name that is not owned by a catalog/hierarchy source."""
+        self._add_context_entities(tables=[name])
+
+    def _index_asset(self, asset: Any) -> None:
+        """Index a catalog DataAsset (tables and views only)."""
+        source = f"asset:{asset.id}"
+        asset_type = getattr(asset.asset_type, "value", asset.asset_type)
+        if asset_type not in _CATALOG_TABLE_TYPES:
+            self._withdraw(source)
+            return
+
+        table_name = (asset.name or "").upper()
+        fqn = (asset.fully_qualified_name or "").upper()
+        self._contribute(
+            source,
+            tables=[table_name, fqn],
+            columns={table_name: [(c.column_name or "").upper() for c in asset.columns]},
+        )
+
+    def _index_project(self, project: Dict[str, Any]) -> None:
+        """Index a hierarchy project by ID and name."""
+        proj_id = project.get("id", "")
+        self._contribute(
+            f"project:{proj_id}",
+            projects=[proj_id, project.get("name", "").upper()],
+        )
+
+    def _index_hierarchy(self, h: Dict[str, Any]) -> None:
+        """Index a hierarchy node and its source mapping tables."""
+        tables = []
+        for m in h.get("mapping", []):
+            tbl = (m.get("source_table") or "").upper()
+            if tbl:
+                tables.append(tbl)
+                # Also add fully qualified
+                db = (m.get("source_database") or "").upper()
+                schema = (m.get("source_schema") or "").upper()
+                if db and schema:
+                    tables.append(f"{db}.{schema}.{tbl}")
+
+        self._contribute(
+            f"hierarchy:{h.get('id') or h.get('hierarchy_id', '')}",
+            tables=tables,
+            hierarchies=[
+                (h.get("hierarchy_name") or "").upper(),
+                (h.get("hierarchy_id") or "").upper(),
+            ],
+        )
+
+    def _refresh_catalog(self) -> None:
+        """Rebuild the catalog part of the index."""
+        self._withdraw_prefix("asset:")
+        if not self.catalog:
+            return
+        try:
+            for asset in self.catalog.iter_assets():
+                self._index_asset(asset)
+            self._catalog_version = getattr(self.catalog, "version", None)
+            logger.debug(f"Indexed {len(self._known_tables)} tables from catalog")
+        except Exception as e:
+            logger.debug(f"Failed to index catalog: {e}")
+
+    def _refresh_hierarchies(self) -> None:
+        """Rebuild the hierarchy part of the index."""
+        self._withdraw_prefix("project:")
+        self._withdraw_prefix("hierarchy:")
+        if not self.hierarchy:
+            return
+        try:
+            if hasattr(self.hierarchy, "data_version"):
+                self._hierarchy_version = self.hierarchy.data_version()
+            for proj in self.hierarchy.list_projects():
+                self._index_project(proj)
+                for h in self.hierarchy.list_hierarchies(proj.get("id", "")):
+                    self._index_hierarchy(h)
+            logger.debug(f"Indexed {len(self._known_hierarchies)} hierarchies")
+        except Exception as e:
+            logger.debug(f"Failed to index hierarchies: {e}")
+
     def _refresh_index(self) -> None:
         """Refresh the index of known entities from catalog/hierarchy."""
-        # Index tables and columns from catalog
-        if self.catalog:
-            try:
-                assets = self.catalog.list_assets(asset_types=["TABLE", "VIEW"])
-                for asset in assets.get("assets", []):
-                    table_name = asset.get("name", "").upper()
-                    self._known_tables.add(table_name)
-
-                    # Also add fully qualified name
-                    fqn = asset.get("fully_qualified_name", "")
-                    if fqn:
-                        self._known_tables.add(fqn.upper())
-
-                    # Index columns
-                    cols = set()
-                    for col in asset.get("columns", []):
-                        cols.add(col.get("name", "").upper())
-                    if cols:
-                        self._known_columns[table_name] = cols
-
-                logger.debug(f"Indexed {len(self._known_tables)} tables from catalog")
-
-            except Exception as e:
-                logger.debug(f"Failed to index catalog: {e}")
-
-        # Index hierarchies
-        if self.hierarchy:
-            try:
-                projects = self.hierarchy.list_projects()
-                for proj in projects:
-                    proj_id = proj.get("id", "")
-                    proj_name = proj.get("name", "").upper()
-                    self._known_projects.add(proj_id)
-                    self._known_projects.add(proj_name)
-
-                    hierarchies = self.hierarchy.list_hierarchies(proj_id)
-                    for h in hierarchies:
-                        hier_name = h.get("hierarchy_name", "").upper()
-                        hier_id = h.get("hierarchy_id", "").upper()
-                        if hier_name:
-                            self._known_hierarchies.add(hier_name)
-                        if hier_id:
-                            self._known_hierarchies.add(hier_id)
-
-                        # Index source mapping table references into _known_tables
-                        for m in h.get("mapping", []):
-                            tbl = m.get("source_table", "").upper()
-                            if tbl:
-                                self._known_tables.add(tbl)
-                                # Also add fully qualified
-                                db = m.get("source_database", "").upper()
-                                schema = m.get("source_schema", "").upper()
-                                if db and schema:
-                                    self._known_tables.add(f"{db}.{schema}.{tbl}")
-
-                logger.debug(f"Indexed {len(self._known_hierarchies)} hierarchies")
-
-            except Exception as e:
-                logger.debug(f"Failed to index hierarchies: {e}")
+        self._refresh_catalog()
+        self._refresh_hierarchies()
+
+    def _ensure_current(self) -> None:
+        """Rebuild any part of the index whose source changed without an event."""
+        if self.catalog is not None and hasattr(self.catalog, "version"):
+            if self.catalog.version != self._catalog_version:
+                self._refresh_catalog()
+        if self.hierarchy is not None and hasattr(self.hierarchy, "data_version"):
+            if self.hierarchy.data_version() != self._hierarchy_version:
+                self._refresh_hierarchies()
+
+    def _on_catalog_change(self, event: str, obj: Any) -> None:
+        """Apply a CatalogStore change event to the index."""
+        if event.startswith("asset_"):
+            if event == "asset_deleted":
+                self._withdraw(f"asset:{obj.id}")
+            else:
+                self._index_asset(obj)
+        self._catalog_version = getattr(self.catalog, "version", None)
+
+    def _on_hierarchy_change(self, event: str, record: Dict[str, Any]) -> None:
+        """Apply a HierarchyService change event to the index."""
+        if event == "project_created":
+            self._index_project(record)
+        elif event == "project_deleted":
+            self._withdraw(f"project:{record.get('id', '')}")
+        elif event in ("hierarchy_created", "hierarchy_updated"):
+            self._index_hierarchy(record)
+        elif event == "hierarchy_deleted":
+            self._withdraw(f"hierarchy:{record.get('id') or record.get('hierarchy_id', '')}")
+        if hasattr(self.hierarchy, "data_version"):
+            self._hierarchy_version = self.hierarchy.data_version()
 
     def validate(
         self,
@@ -151,12 +382,15 @@ class ProofOfGraph:
         # Reset CTE tracking
         self._cte_aliases = set()
 
+        # Pick up catalog/hierarchy writes that didn't reach us as events
+        self._ensure_current()
+
         # Add context entities to known sets
         if context:
-            for table in context.available_tables:
-                self._known_tables.add(table.upper())
-            for hier in context.available_hierarchies:
-                self._known_hierarchies.add(hier.upper())
+            self._add_context_entities(
+                tables=[t.upper() for t in context.available_tables],
+                hierarchies=[h.upper() for h in context.available_hierarchies],
+            )
 
         # Validate based on content type
         if content_type == "sql":
@@ -197,12 +431,13 @@ class ProofOfGraph:
         suggestions: List[str],
     ) -> None:
         """Validate SQL content."""
-        # First, extract CTEs so we don't flag them as unknown tables
-        self._extract_ctes(sql)
+        refs = self.parse_sql_references(sql)
 
-        # Extract and validate table references
-        tables = self._extract_table_references(sql)
-        for table in tables:
+        # CTEs are not flagged as unknown tables
+        self._cte_aliases.update(refs.ctes)
+
+        # Validate table references
+        for table in refs.tables:
             table_upper = table.upper()
             referenced.append(f"TABLE:{table}")
 
@@ -228,20 +463,13 @@ class ProofOfGraph:
                     ))
 
         # Validate column references against known columns
-        columns = self._extract_column_references(sql)
-        for col in columns:
-            col_upper = col.upper()
+        for col in refs.columns:
             referenced.append(f"COLUMN:{col}")
 
             # Check if column exists in any known table
-            found = False
-            for table_cols in self._known_columns.values():
-                if col_upper in table_cols:
-                    found = True
-                    verified.append(f"COLUMN:{col}")
-                    break
-
-            if not found:
+            if col.upper() in self._column_refs:
+                verified.append(f"COLUMN:{col}")
+            else:
                 # Only warn, don't error - column might be from a CTE or subquery
                 issues.append(ValidationIssue(
                     severity=ValidationSeverity.INFO,
@@ -393,6 +621,76 @@ class ProofOfGraph:
                         entity=table,
                     ))
 
+    def parse_sql_references(self, sql: str) -> SQLReferences:
+        """
+        Extract table, column and CTE references from SQL.
+
+        Uses sqlglot when available and falls back to regex extraction for
+        SQL it cannot parse (e.g. dbt models with Jinja). Results are cached
+        by SQL hash, so re-validating the same statement is a dict lookup.
+        """
+        key = hashlib.sha256(sql.encode("utf-8")).hexdigest()
+        cached = self._sql_cache.get(key)
+        if cached is not None:
+            self._sql_cache.move_to_end(key)
+            return cached
+
+        refs = self._parse_with_sqlglot(sql) if SQLGLOT_AVAILABLE else None
+        if refs is None:
+            refs = self._parse_with_regex(sql)
+
+        self._sql_cache[key] = refs
+        if len(self._sql_cache) > _SQL_CACHE_SIZE:
+            self._sql_cache.popitem(last=False)
+        return refs
+
+    def _parse_with_sqlglot(self, sql: str) -> Optional[SQLReferences]:
+        """Extract references with sqlglot. Returns None if parsing fails."""
+        try:
+            statements = sqlglot.parse(sql, read=self.sql_dialect)
+        except Exception as e:
+            logger.debug(f"sqlglot could not parse SQL, using regex fallback: {e}")
+            return None
+
+        tables: Dict[str, None] = {}
+        columns: Dict[str, None] = {}
+        ctes: Set[str] = set()
+        for statement in statements:
+            if statement is None:
+                continue
+            for cte in statement.find_all(exp.CTE):
+                if cte.alias:
+                    ctes.add(cte.alias.upper())
+            for table in statement.find_all(exp.Table):
+                name = ".".join(part for part in (table.catalog, table.db, table.name) if part)
+                if name:
+                    tables[name] = None
+            for column in statement.find_all(exp.Column):
+                if column.name and not isinstance(column.this, exp.Star):
+                    columns[column.name] = None
+
+        return SQLReferences(
+            tables=tuple(tables),
+            columns=tuple(columns),
+            ctes=frozenset(ctes),
+        )
+
+    def _parse_with_regex(self, sql: str) -> SQLReferences:
+        """Extract references with the regex heuristics."""
+        saved, self._cte_aliases = self._cte_aliases, set()
+        try:
+            self._extract_ctes(sql)
+            ctes = frozenset(self._cte_aliases)
+        finally:
+            self._cte_aliases = saved
+
+        return SQLReferences(
+            tables=tuple(self._extract_table_references(sql)),
+            columns=tuple(self._extract_column_references(sql)),
+            ctes=ctes,
+            parsed=False,
+        )
+
     def _extract_ctes(self, sql: str) -> None:
         """Extract CTE names from SQL."""
         # Match WITH ... AS patterns
@@ -470,25 +768,11 @@ class ProofOfGraph:
         return bool(re.search(pattern, sql, re.IGNORECASE))
 
     def _suggest_similar_table(self, table: str, threshold: float = 0.6) -> Optional[str]:
-        """Find similar table name using fuzzy matching."""
-        try:
-            from rapidfuzz import fuzz
-
-            best_match = None
-            best_score = 0
-
-            for known in self._known_tables:
-                score = fuzz.ratio(table.upper(), known) / 100
-                if score > best_score and score >= threshold:
-                    best_score = score
-                    best_match = known
-
-            if best_match:
-                return f"Did you mean '{best_match}'?"
-            return None
-
-        except ImportError:
-            return None
+        """Find similar table name using the n-gram index and fuzzy matching."""
+        best_match = self.index.suggest(EntityIndex.TABLES, table, threshold=threshold)
+        if best_match:
+            return f"Did you mean '{best_match}'?"
+        return None
 
     def _check_sql_antipatterns(
         self,
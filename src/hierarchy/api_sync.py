@@ -7,19 +7,188 @@ AUTO-SYNC FEATURE:
 When auto_sync is enabled, changes made via MCP tools are automatically
 pushed to the backend, and vice versa. This ensures the MCP server and
 the Web UI stay in sync without manual intervention.
+
+Local changes are queued in a SyncOutbox and pushed by a background
+worker, so editing never waits on the backend. The outbox coalesces
+repeated changes to the same hierarchy, persists pending operations to
+a JSONL journal and retries failures with exponential backoff.
 """
 import json
+import os
 import requests
+import tempfile
 import threading
+import time
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Callable
 from pathlib import Path
 
+try:
+    from ..connections.http_session import get_session
+except ImportError:
+    from connections.http_session import get_session
+
 # Configure logging for auto-sync
 logger = logging.getLogger("hierarchy_sync")
 
 
+class SyncOutbox:
+    """Durable queue of pending backend sync operations.
+
+    Operations are grouped into per-hierarchy slots (project-level
+    operations use ``(project_id, None)``) and coalesced on enqueue:
+
+    - consecutive updates that both carry the full hierarchy state keep
+      only the latest; marker payloads such as ``{"property_added": name}``
+      are never merged, since neither side supersedes the other
+    - consecutive mappings are merged into one batch
+    - a delete cancels pending work for the hierarchy, and everything
+      if the create never reached the backend
+    - a project delete cancels all pending work for the project
+
+    When ``path`` is set, every enqueue is appended to a JSONL journal
+    that is compacted after each drained batch and replayed on startup.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._slots: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self.coalesced = 0
+        self._load()
+
+    @staticmethod
+    def _key(op: Dict[str, Any]) -> tuple:
+        return (op["project_id"], op.get("hierarchy_id"))
+
+    @staticmethod
+    def _is_full_state(op: Dict[str, Any]) -> bool:
+        data = op.get("data")
+        return isinstance(data, dict) and "hierarchy_name" in data
+
+    def put(self, op: Dict[str, Any], persist: bool = True) -> None:
+        """Add an operation, coalescing it with pending work."""
+        if persist and self.path:
+            self._append(op)
+
+        key = self._key(op)
+        operation = op["operation"]
+
+        if operation == "delete_project":
+            project_slots = [k for k in self._slots if k[0] == key[0]]
+            created_here = any(
+                o["operation"] == "create_project" for o in self._slots.get((key[0], None), [])
+            )
+            for k in project_slots:
+                self.coalesced += len(self._slots.pop(k))
+            if created_here:
+                self.coalesced += 1
+                return
+            self._slots[key] = [op]
+            return
+
+        slot = self._slots.setdefault(key, [])
+        last = slot[-1] if slot else None
+
+        if (
+            operation == "update_hierarchy" and last and last["operation"] == operation
+            and self._is_full_state(last) and self._is_full_state(op)
+        ):
+            last["data"] = op.get("data")
+            self.coalesced += 1
+        elif operation == "add_mapping":
+            if last and last["operation"] == operation:
+                last["mappings"].extend(op.get("mappings") or [op.get("data")])
+                self.coalesced += 1
+            else:
+                slot.append({**op, "mappings": list(op.get("mappings") or [op.get("data")])})
+        elif operation == "delete_hierarchy" and slot:
+            created_here = any(o["operation"] == "create_hierarchy" for o in slot)
+            self.coalesced += len(slot)
+            if created_here:
+                self.coalesced += 1
+                del self._slots[key]
+            else:
+                slot[:] = [op]
+        else:
+            slot.append(op)
+
+        if not slot:
+            self._slots.pop(key, None)
+
+    def take_ready(self, limit: int, now: float) -> List[List[Dict[str, Any]]]:
+        """Remove and return up to ``limit`` slots whose first operation is due."""
+        taken = []
+        for key in list(self._slots):
+            if len(taken) >= limit:
+                break
+            slot = self._slots[key]
+            if slot[0].get("next_attempt_at", 0) <= now:
+                taken.append(self._slots.pop(key))
+        return taken
+
+    def requeue(self, ops: List[Dict[str, Any]]) -> None:
+        """Put unsent operations back at the front of their slot."""
+        if not ops:
+            return
+        key = self._key(ops[0])
+        self._slots[key] = ops + self._slots.get(key, [])
+        self._slots.move_to_end(key, last=False)
+
+    def next_due(self) -> Optional[float]:
+        """Earliest time any pending slot becomes ready."""
+        return min((slot[0].get("next_attempt_at", 0) for slot in self._slots.values()), default=None)
+
+    def oldest_enqueued_at(self) -> Optional[float]:
+        return min(
+            (op["enqueued_at"] for slot in self._slots.values() for op in slot),
+            default=None,
+        )
+
+    def __len__(self) -> int:
+        return sum(len(slot) for slot in self._slots.values())
+
+    def _append(self, op: Dict[str, Any]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(op, default=str) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to journal sync operation: {e}")
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the pending operations."""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for slot in self._slots.values():
+                    for op in slot:
+                        f.write(json.dumps(op, default=str) + "\n")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to compact sync outbox: {e}")
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self.put(json.loads(line), persist=False)
+                except (json.JSONDecodeError, KeyError) as e:
+                    logger.warning(f"Skipping corrupt sync outbox entry: {e}")
+        if self._slots:
+            logger.info(f"Recovered {len(self)} pending sync operations from {self.path}")
+        self.compact()
+
+
 class AutoSyncManager:
     """Manages automatic synchronization between MCP and backend.
 
@@ -37,13 +206,28 @@ class AutoSyncManager:
     EVENT_MAPPING_ADDED = "hierarchy.mapping.added"
     EVENT_SYNC_COMPLETED = "sync.completed"
 
-    def __init__(self, sync_service: 'HierarchyApiSync', local_service: Any = None):
+    def __init__(
+        self,
+        sync_service: 'HierarchyApiSync',
+        local_service: Any = None,
+        background: bool = True,
+        outbox_path: Optional[Path] = None,
+        batch_size: int = 50,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+    ):
         """
         Initialize auto-sync manager.
 
         Args:
             sync_service: HierarchyApiSync instance for backend communication
             local_service: HierarchyService instance for local operations
+            background: Queue changes for the background worker instead of
+                syncing inside on_local_change
+            outbox_path: Optional JSONL journal making the queue durable
+            batch_size: Maximum hierarchies drained per worker pass
+            max_attempts: Attempts before an operation is dead-lettered
+            retry_backoff: Base delay in seconds, doubled on each retry
         """
         self.sync_service = sync_service
         self.local_service = local_service
@@ -54,6 +238,20 @@ class AutoSyncManager:
         self._event_bus_enabled = True
         self._agent_id = "mcp-hierarchy-service"  # This agent's ID for event publishing
 
+        self.background = background
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+        self.outbox = SyncOutbox(outbox_path)
+        self.dead_letters: List[Dict[str, Any]] = []
+        self._outbox_cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._in_flight = 0
+        self._stopping = False
+        self._stats = {"enqueued": 0, "sent": 0, "failed_attempts": 0, "last_error": None, "last_sync_at": None}
+        if len(self.outbox):
+            self._ensure_worker()
+
     def set_local_service(self, service: Any):
         """Set the local hierarchy service."""
         self.local_service = service
@@ -140,7 +338,8 @@ class AutoSyncManager:
             if not orchestrator_url.endswith("/api"):
                 orchestrator_url = f"{orchestrator_url}/api"
 
-            response = requests.post(
+            # Events are best-effort: no retries, so an absent orchestrator fails fast
+            response = get_session(retries=0).post(
                 f"{orchestrator_url}/orchestrator/events/publish",
                 headers=self.sync_service.headers,
                 json=event_payload,
@@ -184,38 +383,13 @@ class AutoSyncManager:
         if not self.is_enabled:
             return {"auto_sync": "disabled", "synced": False}
 
+        if self.background:
+            return self.enqueue(operation, project_id, hierarchy_id, data)
+
         with self._sync_lock:
             try:
-                result = self._sync_to_backend(operation, project_id, hierarchy_id, data)
-                result["auto_sync"] = "enabled"
-                result["synced"] = not result.get("error", False)
-
-                # Publish event to orchestrator Event Bus
-                if result["synced"]:
-                    event_type = self._get_event_type(operation)
-                    event_published = self._publish_event(
-                        event_type=event_type,
-                        project_id=project_id,
-                        hierarchy_id=hierarchy_id,
-                        data=data,
-                    )
-                    result["event_published"] = event_published
-
-                # Call registered callbacks with rich event data
-                event_data = {
-                    "operation": operation,
-                    "project_id": project_id,
-                    "hierarchy_id": hierarchy_id,
-                    "data": data,
-                    "timestamp": datetime.now().isoformat(),
-                    "sync_result": result,
-                }
-                for callback in self._callbacks:
-                    try:
-                        callback(event_data)
-                    except Exception as e:
-                        logger.warning(f"Callback error: {e}")
-
+                result = self._apply(operation, project_id, hierarchy_id, data)
+                self._notify(operation, project_id, hierarchy_id, data, result)
                 return result
 
             except Exception as e:
@@ -226,6 +400,241 @@ class AutoSyncManager:
                     "error": str(e),
                 }
 
+    def _apply(
+        self,
+        operation: str,
+        project_id: str,
+        hierarchy_id: Optional[str],
+        data: Optional[Dict],
+        mappings: Optional[List[Dict]] = None,
+    ) -> Dict[str, Any]:
+        """Push one operation to the backend and publish its event."""
+        if mappings and len(mappings) > 1:
+            result = self.sync_service.add_source_mappings(project_id, hierarchy_id, mappings)
+        else:
+            result = self._sync_to_backend(operation, project_id, hierarchy_id, data)
+        if not isinstance(result, dict):
+            result = {"response": result}
+        result["auto_sync"] = "enabled"
+        result["synced"] = not result.get("error", False)
+
+        # Publish event to orchestrator Event Bus
+        if result["synced"]:
+            event_type = self._get_event_type(operation)
+            event_published = self._publish_event(
+                event_type=event_type,
+                project_id=project_id,
+                hierarchy_id=hierarchy_id,
+                data={"mappings": mappings} if mappings and len(mappings) > 1 else data,
+            )
+            result["event_published"] = event_published
+        return result
+
+    def _notify(
+        self,
+        operation: str,
+        project_id: str,
+        hierarchy_id: Optional[str],
+        data: Optional[Dict],
+        result: Dict[str, Any],
+    ) -> None:
+        """Call registered callbacks with rich event data."""
+        event_data = {
+            "operation": operation,
+            "project_id": project_id,
+            "hierarchy_id": hierarchy_id,
+            "data": data,
+            "timestamp": datetime.now().isoformat(),
+            "sync_result": result,
+        }
+        for callback in self._callbacks:
+            try:
+                callback(event_data)
+            except Exception as e:
+                logger.warning(f"Callback error: {e}")
+
+    # =========================================================================
+    # Background Outbox
+    # =========================================================================
+
+    def enqueue(
+        self,
+        operation: str,
+        project_id: str,
+        hierarchy_id: Optional[str] = None,
+        data: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """
+        Queue a local change for the background worker.
+
+        Returns:
+            Queued status with the current queue depth
+        """
+        op = {
+            "operation": operation,
+            "project_id": project_id,
+            "hierarchy_id": hierarchy_id,
+            "data": data,
+            "enqueued_at": time.time(),
+            "attempts": 0,
+        }
+        with self._outbox_cond:
+            self.outbox.put(op)
+            self._stats["enqueued"] += 1
+            depth = len(self.outbox)
+            self._outbox_cond.notify_all()
+        self._ensure_worker()
+        return {"auto_sync": "enabled", "synced": False, "queued": True, "queue_depth": depth}
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every due operation has been attempted.
+
+        Operations waiting on a retry backoff still count as pending.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the outbox drained
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._outbox_cond:
+            self._outbox_cond.notify_all()
+            while len(self.outbox) or self._in_flight:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._outbox_cond.wait(remaining if remaining is not None else 0.5)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background worker; pending operations stay journaled."""
+        with self._outbox_cond:
+            self._stopping = True
+            self._outbox_cond.notify_all()
+        if self._worker:
+            self._worker.join(timeout)
+        self._worker = None
+        self._stopping = False
+
+    def get_outbox_stats(self) -> Dict[str, Any]:
+        """Get queue depth, lag and delivery counters for the outbox."""
+        with self._outbox_cond:
+            oldest = self.outbox.oldest_enqueued_at()
+            return {
+                "mode": "background" if self.background else "inline",
+                "queue_depth": len(self.outbox),
+                "in_flight": self._in_flight,
+                "lag_seconds": round(time.time() - oldest, 3) if oldest else 0.0,
+                "coalesced": self.outbox.coalesced,
+                "dead_letters": len(self.dead_letters),
+                "durable": self.outbox.path is not None,
+                **self._stats,
+            }
+
+    def _ensure_worker(self) -> None:
+        with self._outbox_cond:
+            if self._worker and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._run_worker, name="hierarchy-sync-outbox", daemon=True
+            )
+            self._worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._outbox_cond:
+                while not self._stopping:
+                    batch = self.outbox.take_ready(self.batch_size, time.time())
+                    if batch:
+                        self._in_flight = sum(len(slot) for slot in batch)
+                        break
+                    due = self.outbox.next_due()
+                    self._outbox_cond.notify_all()
+                    self._outbox_cond.wait(None if due is None else max(0.01, due - time.time()))
+                if self._stopping:
+                    return
+
+            try:
+                self._drain(batch)
+            except Exception as e:
+                logger.error(f"Sync outbox worker error: {e}")
+
+            with self._outbox_cond:
+                self._in_flight = 0
+                self.outbox.compact()
+                self._outbox_cond.notify_all()
+
+    def _drain(self, batch: List[List[Dict[str, Any]]]) -> None:
+        """Send a batch of slots, grouping single deletes per project."""
+        deletes: Dict[str, List[Dict[str, Any]]] = {}
+        for slot in batch:
+            if len(slot) == 1 and slot[0]["operation"] == "delete_hierarchy" and slot[0].get("hierarchy_id"):
+                deletes.setdefault(slot[0]["project_id"], []).append(slot[0])
+                continue
+            for i, op in enumerate(slot):
+                if not self._send(op):
+                    with self._outbox_cond:
+                        self.outbox.requeue(slot[i:])
+                    break
+
+        for project_id, ops in deletes.items():
+            if len(ops) == 1:
+                if not self._send(ops[0]):
+                    with self._outbox_cond:
+                        self.outbox.requeue(ops)
+                continue
+            ids = [op["hierarchy_id"] for op in ops]
+            result = self.sync_service.delete_hierarchies(project_id, ids)
+            if isinstance(result, dict) and result.get("error"):
+                # Fall back to individual deletes so one bad id cannot block the rest
+                for op in ops:
+                    if not self._send(op):
+                        with self._outbox_cond:
+                            self.outbox.requeue([op])
+                continue
+            for op in ops:
+                self._delivered(op, {"success": True, "auto_sync": "enabled", "synced": True, "bulk": True})
+                self._publish_event(
+                    self._get_event_type(op["operation"]), project_id, op["hierarchy_id"], op.get("data"),
+                )
+
+    def _send(self, op: Dict[str, Any]) -> bool:
+        """Send one operation. Returns False if it should be retried."""
+        try:
+            result = self._apply(
+                op["operation"], op["project_id"], op.get("hierarchy_id"), op.get("data"), op.get("mappings"),
+            )
+        except Exception as e:
+            result = {"error": True, "message": str(e), "synced": False}
+
+        if result.get("synced"):
+            self._delivered(op, result)
+            return True
+
+        op["attempts"] = op.get("attempts", 0) + 1
+        self._stats["failed_attempts"] += 1
+        self._stats["last_error"] = result.get("message") or result.get("error")
+        if not op.get("notified"):
+            op["notified"] = True
+            self._notify(op["operation"], op["project_id"], op.get("hierarchy_id"), op.get("data"), result)
+
+        if op["attempts"] >= self.max_attempts:
+            logger.error(f"Giving up on {op['operation']} for {op.get('hierarchy_id') or op['project_id']}")
+            self.dead_letters = (self.dead_letters + [op])[-100:]
+            return True
+
+        op["next_attempt_at"] = time.time() + self.retry_backoff * (2 ** (op["attempts"] - 1))
+        return False
+
+    def _delivered(self, op: Dict[str, Any], result: Dict[str, Any]) -> None:
+        self._stats["sent"] += 1
+        self._stats["last_sync_at"] = datetime.now().isoformat()
+        if not op.get("notified"):
+            op["notified"] = True
+            self._notify(op["operation"], op["project_id"], op.get("hierarchy_id"), op.get("data"), result)
+
     def _sync_to_backend(
         self,
         operation: str,
@@ -309,6 +718,9 @@ class HierarchyApiSync:
         api_key: str,
         timeout: int = 30,
         auto_sync: bool = True,
+        session: Optional[requests.Session] = None,
+        background_sync: bool = True,
+        outbox_path: Optional[Path] = None,
     ):
         """
         Initialize the sync service.
@@ -318,6 +730,11 @@ class HierarchyApiSync:
             api_key: API key for authentication
             timeout: Request timeout in seconds
             auto_sync: Enable automatic synchronization (default: True)
+            session: HTTP session to use (default: shared pooled session
+                with keep-alive and retries)
+            background_sync: Push auto-sync changes from a background
+                outbox worker instead of inline
+            outbox_path: Optional JSONL journal for pending auto-sync changes
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -327,8 +744,10 @@ class HierarchyApiSync:
             'X-API-Key': api_key,
             'Content-Type': 'application/json',
         }
+        self.session = session or get_session()
+        self._sync_options = {"background": background_sync, "outbox_path": outbox_path}
         # Initialize auto-sync manager (local_service set later)
-        self.auto_sync_manager = AutoSyncManager(self) if auto_sync else None
+        self.auto_sync_manager = AutoSyncManager(self, **self._sync_options) if auto_sync else None
 
     def set_local_service(self, service: Any):
         """Set the local hierarchy service for auto-sync."""
@@ -341,7 +760,7 @@ class HierarchyApiSync:
         if self.auto_sync_manager:
             self.auto_sync_manager.enable()
         else:
-            self.auto_sync_manager = AutoSyncManager(self)
+            self.auto_sync_manager = AutoSyncManager(self, **self._sync_options)
         logger.info("Auto-sync enabled")
 
     def disable_auto_sync(self):
@@ -362,7 +781,7 @@ class HierarchyApiSync:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers,
@@ -481,6 +900,14 @@ class HierarchyApiSync:
         )
         return not result.get("error", False)
 
+    def delete_hierarchies(self, project_id: str, hierarchy_ids: List[str]) -> Dict[str, Any]:
+        """Delete several hierarchies in one request."""
+        return self._request(
+            "POST",
+            f"/smart-hierarchy/project/{project_id}/bulk-delete",
+            {"hierarchyIds": hierarchy_ids},
+        )
+
     def get_hierarchy(self, project_id: str, hierarchy_id: str) -> Optional[Dict]:
         """Get a single hierarchy."""
         result = self._request(
@@ -520,6 +947,15 @@ class HierarchyApiSync:
         mapping: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Add a source mapping to a hierarchy."""
+        return self.add_source_mappings(project_id, hierarchy_id, [mapping])
+
+    def add_source_mappings(
+        self,
+        project_id: str,
+        hierarchy_id: str,
+        mappings: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Append several source mappings with a single read and update."""
         # Get current hierarchy
         hierarchy = self.get_hierarchy(project_id, hierarchy_id)
         if not hierarchy:
@@ -532,9 +968,9 @@ class HierarchyApiSync:
 
         # Calculate next mapping index
         max_index = max([m.get("mapping_index", 0) for m in current_mappings], default=0)
-        mapping["mapping_index"] = max_index + 1
-
-        current_mappings.append(mapping)
+        for offset, mapping in enumerate(mappings, start=1):
+            mapping["mapping_index"] = max_index + offset
+            current_mappings.append(mapping)
 
         # Update hierarchy with new mappings
         return self.update_hierarchy(project_id, hierarchy_id, {"mapping": current_mappings})
@@ -995,6 +1431,7 @@ class HierarchyApiSync:
             "backend_url": self.base_url,
             "has_local_service": self.auto_sync_manager is not None and
                                   self.auto_sync_manager.local_service is not None,
+            "outbox": self.auto_sync_manager.get_outbox_stats() if self.auto_sync_manager else None,
             "description": (
                 "Changes made via MCP are automatically synced to the backend. "
                 "Changes in the UI are visible via backend-prefixed tools."
@@ -9,6 +9,7 @@ import json
 import logging
 import threading
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 from .service import HierarchyService
@@ -33,6 +34,7 @@ def register_hierarchy_tools(mcp, data_dir: str = "data"):
             base_url=settings.nestjs_backend_url,
             api_key=settings.nestjs_api_key,
             auto_sync=True,  # Enable auto-sync by default
+            outbox_path=Path(data_dir) / "hierarchy_sync_outbox.jsonl",
         )
         # Connect local service for auto-sync
         sync_service.set_local_service(service)
@@ -4,8 +4,9 @@ import uuid
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import hashlib
+import logging
 
 from .types import (
     SmartHierarchy,
@@ -22,6 +23,8 @@ from .types import (
     DeploymentConfig,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class HierarchyService:
     """Service for managing hierarchy projects and hierarchies."""
@@ -32,6 +35,7 @@ class HierarchyService:
         self.projects_file = self.data_dir / "hierarchy_projects.json"
         self.hierarchies_file = self.data_dir / "hierarchies.json"
         self.deployments_file = self.data_dir / "deployment_history.json"
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
         self._init_storage()
 
     def _init_storage(self):
@@ -53,6 +57,51 @@ class HierarchyService:
         with open(path, "w") as f:
             json.dump(data, f, indent=2, default=str)
 
+    # =========================================================================
+    # Change Subscriptions
+    # =========================================================================
+
+    def subscribe(self, callback: Callable[[str, Dict[str, Any]], None]) -> None:
+        """
+        Register a callback for project/hierarchy changes made by this service.
+
+        The callback receives ``(event, record)`` where event is one of
+        ``project_created``, ``project_deleted``, ``hierarchy_created``,
+        ``hierarchy_updated`` or ``hierarchy_deleted`` and record is the
+        affected project or hierarchy dict.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, Dict[str, Any]], None]) -> None:
+        """Remove a previously registered change callback."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event: str, record: Dict[str, Any]) -> None:
+        """Notify subscribers of a change."""
+        for callback in list(self._listeners):
+            try:
+                callback(event, record)
+            except Exception as e:
+                logger.warning(f"Hierarchy change listener failed on {event}: {e}")
+
+    def data_version(self) -> Tuple[int, ...]:
+        """
+        Return a stamp that changes whenever project/hierarchy storage is written.
+
+        Covers writes from other service instances, which don't emit events
+        to this instance's subscribers.
+        """
+        stamp: List[int] = []
+        for path in (self.projects_file, self.hierarchies_file):
+            try:
+                st = path.stat()
+                stamp.extend((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.extend((0, 0))
+        return tuple(stamp)
+
     def _generate_id(self) -> str:
         """Generate a UUID."""
         return str(uuid.uuid4())
@@ -87,6 +136,7 @@ class HierarchyService:
 
         data["projects"][project.id] = project.model_dump()
         self._save_json(self.projects_file, data)
+        self._notify("project_created", data["projects"][project.id])
 
         return project
 
@@ -115,17 +165,22 @@ class HierarchyService:
         if project_id not in data["projects"]:
             return False
 
-        del data["projects"][project_id]
+        project = data["projects"].pop(project_id)
         self._save_json(self.projects_file, data)
 
         # Delete associated hierarchies
         hier_data = self._load_json(self.hierarchies_file)
+        removed = [v for v in hier_data["hierarchies"].values() if v.get("project_id") == project_id]
         hier_data["hierarchies"] = {
             k: v for k, v in hier_data["hierarchies"].items()
             if v.get("project_id") != project_id
         }
         self._save_json(self.hierarchies_file, hier_data)
 
+        for h in removed:
+            self._notify("hierarchy_deleted", h)
+        self._notify("project_deleted", project)
+
         return True
 
     # =========================================================================
@@ -186,6 +241,7 @@ class HierarchyService:
 
         data["hierarchies"][hierarchy.id] = hierarchy.model_dump()
         self._save_json(self.hierarchies_file, data)
+        self._notify("hierarchy_created", data["hierarchies"][hierarchy.id])
 
         return hierarchy
 
@@ -265,6 +321,7 @@ class HierarchyService:
                 h["updated_at"] = datetime.now().isoformat()
                 data["hierarchies"][id] = h
                 self._save_json(self.hierarchies_file, data)
+                self._notify("hierarchy_updated", h)
                 return h
 
         return None
@@ -280,8 +337,9 @@ class HierarchyService:
                 break
 
         if to_delete:
-            del data["hierarchies"][to_delete]
+            removed = data["hierarchies"].pop(to_delete)
             self._save_json(self.hierarchies_file, data)
+            self._notify("hierarchy_deleted", removed)
             return True
 
         return False
@@ -9,14 +9,37 @@ Discovery order:
 3. private_plugins/ — proprietary extensions
 4. ~/.databridge/plugins/ — user-installed plugins
 5. $DATABRIDGE_PLUGINS_PATH — env override
+
+Lazy loading:
+A plugin.json may declare its tools under "tool_signatures" (name,
+description, parameters with type strings and JSON defaults). For such
+plugins the loader registers lightweight stub tools with the declared
+signatures and only imports mcp_tools.py on the first call to one of its
+tools. Generate the signatures with:
+
+    python -m src.plugins.loader --write-signatures [plugin_name ...]
+
+Plugins without declared signatures are imported eagerly once; their tool
+signatures are then stored in a ToolManifestCache (keyed by a hash of the
+plugin's sources) so later starts can register stubs for them too.
+
+Set DATABRIDGE_LAZY_PLUGINS=0 to import every plugin eagerly.
 """
+import hashlib
 import importlib
 import importlib.util
+import inspect
 import json
+import logging
 import os
 import sys
+import threading
+import time
+import typing
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
 
 
 # Argument pattern types for register functions
@@ -26,6 +49,18 @@ ARG_PATTERN_MCP_DATA_DIR = "mcp_data_dir"
 ARG_PATTERN_MCP_BACKEND = "mcp_backend"
 ARG_PATTERN_TEMPLATES = "templates"
 
+# Plugins whose register function returns an object other plugins need.
+# These always load eagerly so the context is populated.
+CONTEXT_PROVIDERS = {"hierarchy": "hierarchy_service"}
+
+# Names available when resolving parameter type strings from manifests
+_TYPE_NAMESPACE: Dict[str, Any] = {
+    "Any": Any, "Optional": Optional, "List": List, "Dict": Dict,
+    "Union": typing.Union, "Literal": typing.Literal, "Tuple": typing.Tuple,
+    "str": str, "int": int, "float": float, "bool": bool,
+    "dict": dict, "list": list, "tuple": tuple, "None": None,
+}
+
 
 def _read_manifest(plugin_dir: Path) -> Optional[Dict]:
     """Read and parse a plugin.json manifest from a directory.
@@ -151,6 +186,342 @@ def _call_register_function(module, func_name: str, mcp: Any,
             return func(mcp)
 
 
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+# =============================================================================
+# Lazy Loading
+# =============================================================================
+
+class _ToolRecorder:
+    """Stand-in for FastMCP that captures ``@mcp.tool()`` functions.
+
+    With ``forward=True`` tools are also registered on the real server.
+    Any other attribute access is forwarded to the real server.
+    """
+
+    def __init__(self, mcp: Any, forward: bool = False):
+        self._mcp = mcp
+        self._forward = forward
+        self.tools: Dict[str, Callable] = {}
+
+    def tool(self, *args, **kwargs):
+        if args and callable(args[0]):
+            return self._record(args[0], args[1:], kwargs)
+        return lambda fn: self._record(fn, args, kwargs)
+
+    def _record(self, fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        name = kwargs.get("name") or (args[0] if args and isinstance(args[0], str) else fn.__name__)
+        self.tools[name] = fn
+        if self._forward:
+            return self._mcp.tool(*args, **kwargs)(fn)
+        return fn
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._mcp, name)
+
+
+def _resolve_type(type_str: Optional[str]) -> Any:
+    """Turn a manifest type string like 'Optional[int]' into a type.
+
+    Raises:
+        ValueError: If the type cannot be resolved.
+    """
+    if not type_str:
+        return Any
+    try:
+        return eval(type_str, {"__builtins__": {}}, _TYPE_NAMESPACE)  # noqa: S307 - fixed namespace
+    except Exception as e:
+        raise ValueError(f"Unsupported parameter type '{type_str}'") from e
+
+
+def _type_to_str(annotation: Any) -> Optional[str]:
+    """Render an annotation as a manifest type string, or None if unsupported."""
+    if annotation is inspect.Parameter.empty:
+        return "Any"
+    if isinstance(annotation, str):
+        text = annotation
+    elif isinstance(annotation, type) and annotation.__module__ == "builtins":
+        text = annotation.__name__
+    else:
+        text = repr(annotation).replace("typing.", "")
+    try:
+        _resolve_type(text)
+    except ValueError:
+        return None
+    return text
+
+
+class _LazyPlugin:
+    """Plugin whose module is imported on the first call to one of its tools."""
+
+    def __init__(self, manifest: Dict, signatures: List[Dict], mcp: Any,
+                 settings: Any, context: Dict[str, Any], result: Dict[str, Any]):
+        self.manifest = manifest
+        self.name = manifest.get("name", "unknown")
+        self.signatures = signatures
+        self.mcp = mcp
+        self.settings = settings
+        self.context = context
+        self.result = result
+        self._tools: Optional[Dict[str, Callable]] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_manifest(cls, manifest: Dict, mcp: Any, settings: Any,
+                      context: Dict[str, Any], result: Dict[str, Any],
+                      signatures: Optional[List[Dict]] = None) -> Optional["_LazyPlugin"]:
+        """Create a lazy plugin if the manifest (or cache) has usable tool signatures."""
+        signatures = manifest.get("tool_signatures") or signatures
+        if not signatures:
+            return None
+        try:
+            for spec in signatures:
+                for param in spec.get("parameters", []):
+                    _resolve_type(param.get("type"))
+        except ValueError as e:
+            logger.info(f"Plugin {manifest.get('name')} loads eagerly: {e}")
+            return None
+        return cls(manifest, signatures, mcp, settings, context, result)
+
+    def register_stubs(self) -> None:
+        """Register one stub tool per declared signature."""
+        for spec in self.signatures:
+            self.mcp.tool()(self._make_stub(spec))
+
+    def _make_stub(self, spec: Dict) -> Callable:
+        tool_name = spec["name"]
+        plugin = self
+
+        if spec.get("async"):
+            async def stub(**kwargs):
+                value = plugin.call(tool_name, kwargs)
+                if inspect.isawaitable(value):
+                    value = await value
+                return value
+        else:
+            def stub(**kwargs):
+                return plugin.call(tool_name, kwargs)
+
+        params = []
+        annotations: Dict[str, Any] = {}
+        for param in spec.get("parameters", []):
+            annotation = _resolve_type(param.get("type"))
+            default = param["default"] if "default" in param else inspect.Parameter.empty
+            params.append(inspect.Parameter(
+                param["name"], inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=default, annotation=annotation,
+            ))
+            annotations[param["name"]] = annotation
+        returns = _resolve_type(spec.get("returns")) if spec.get("returns") else inspect.Signature.empty
+        if returns is not inspect.Signature.empty:
+            annotations["return"] = returns
+
+        stub.__name__ = tool_name
+        stub.__qualname__ = tool_name
+        stub.__doc__ = spec.get("description", "")
+        stub.__signature__ = inspect.Signature(params, return_annotation=returns)
+        stub.__annotations__ = annotations
+        return stub
+
+    def load(self) -> Dict[str, Callable]:
+        """Import the plugin module and capture its tool functions (once)."""
+        with self._lock:
+            if self._tools is not None:
+                return self._tools
+
+            started = time.perf_counter()
+            module = _import_module(self.manifest["_dir"], self.manifest.get("module_file", "mcp_tools.py"))
+            recorder = _ToolRecorder(self.mcp)
+            register_func_name = self.manifest.get("register_function", f"register_{self.name}_tools")
+            _call_register_function(
+                module, register_func_name, recorder, self.settings,
+                self.manifest.get("arg_pattern", ARG_PATTERN_MCP_SETTINGS), self.context,
+            )
+
+            # Tools added since the signatures were generated get registered directly
+            declared = {spec["name"] for spec in self.signatures}
+            for tool_name, fn in recorder.tools.items():
+                if tool_name not in declared:
+                    logger.warning(f"Plugin {self.name}: tool {tool_name} missing from tool_signatures")
+                    self.mcp.tool()(fn)
+
+            self._tools = recorder.tools
+            self.result["import_ms"] = _elapsed_ms(started)
+            logger.info(f"Plugin {self.name} imported on first use in {self.result['import_ms']} ms")
+            return self._tools
+
+    def call(self, tool_name: str, kwargs: Dict[str, Any]) -> Any:
+        """Forward a stub call to the real tool function."""
+        fn = self.load().get(tool_name)
+        if fn is None:
+            raise RuntimeError(f"Plugin {self.name} no longer provides tool {tool_name}")
+        return fn(**kwargs)
+
+
+def _describe_tools(tools: Dict[str, Callable]) -> Optional[List[Dict]]:
+    """Describe captured tool functions as manifest signatures.
+
+    Returns None if a parameter type or default cannot be expressed.
+    """
+    signatures = []
+    for tool_name, fn in tools.items():
+        sig = inspect.signature(fn)
+        params = []
+        for param in sig.parameters.values():
+            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                return None
+            type_str = _type_to_str(param.annotation)
+            if type_str is None:
+                return None
+            entry: Dict[str, Any] = {"name": param.name, "type": type_str}
+            if param.default is not param.empty:
+                try:
+                    json.dumps(param.default)
+                except (TypeError, ValueError):
+                    return None
+                entry["default"] = param.default
+            params.append(entry)
+
+        spec: Dict[str, Any] = {
+            "name": tool_name,
+            "description": inspect.getdoc(fn) or "",
+            "parameters": params,
+        }
+        returns = _type_to_str(sig.return_annotation)
+        if sig.return_annotation is not sig.empty and returns:
+            spec["returns"] = returns
+        if inspect.iscoroutinefunction(fn):
+            spec["async"] = True
+        signatures.append(spec)
+
+    return signatures
+
+
+def generate_tool_signatures(manifest: Dict, settings: Any = None,
+                             context: Optional[Dict[str, Any]] = None) -> Optional[List[Dict]]:
+    """Import a plugin and describe its tools for a plugin.json manifest.
+
+    Args:
+        manifest: Plugin manifest (with "_dir" as set by discover_plugins)
+        settings: Application settings passed to the register function
+        context: Extra context for the register function
+
+    Returns:
+        List of tool signature dicts, or None if a parameter type or default
+        cannot be expressed in the manifest (the plugin then stays eager).
+    """
+    module = _import_module(manifest["_dir"], manifest.get("module_file", "mcp_tools.py"))
+    recorder = _ToolRecorder(None)
+    name = manifest.get("name", "unknown")
+    _call_register_function(
+        module, manifest.get("register_function", f"register_{name}_tools"), recorder,
+        settings, manifest.get("arg_pattern", ARG_PATTERN_MCP_SETTINGS), context or {},
+    )
+
+    return _describe_tools(recorder.tools)
+
+
+# =============================================================================
+# Tool Manifest Cache
+# =============================================================================
+
+class ToolManifestCache:
+    """Persisted tool signatures for plugins without "tool_signatures".
+
+    When a plugin is imported eagerly its tools are described and stored
+    under a hash of the plugin's source files. On the next start, a plugin
+    whose sources are unchanged is advertised from the cache with lazy
+    stubs, so its module (and its heavy dependencies) are not imported
+    until a tool is called. Editing any ``.py`` file in the plugin
+    directory or its plugin.json invalidates the entry.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._hashes: Dict[str, str] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable tool manifest cache {self.path}: {e}")
+            return
+        if data.get("version") == self.VERSION:
+            self._entries = data.get("plugins", {})
+
+    def source_hash(self, manifest: Dict) -> str:
+        """Hash the plugin's manifest entry and every Python source in its directory."""
+        plugin_dir = Path(manifest["_dir"])
+        if str(plugin_dir) not in self._hashes:
+            digest = hashlib.sha256()
+            files = sorted(plugin_dir.rglob("*.py")) + [plugin_dir / "plugin.json"]
+            for file_path in files:
+                if "__pycache__" in file_path.parts or not file_path.exists():
+                    continue
+                digest.update(file_path.relative_to(plugin_dir).as_posix().encode())
+                digest.update(file_path.read_bytes())
+            self._hashes[str(plugin_dir)] = digest.hexdigest()
+
+        key = {k: v for k, v in manifest.items() if not k.startswith("_")}
+        return hashlib.sha256(
+            (self._hashes[str(plugin_dir)] + json.dumps(key, sort_keys=True, default=str)).encode()
+        ).hexdigest()
+
+    def get(self, manifest: Dict) -> Optional[List[Dict]]:
+        """Return cached signatures if the plugin's sources are unchanged."""
+        entry = self._entries.get(manifest.get("name", "unknown"))
+        if not entry:
+            return None
+        if entry.get("source_hash") != self.source_hash(manifest):
+            return None
+        return entry.get("tool_signatures")
+
+    def put(self, manifest: Dict, signatures: List[Dict]) -> None:
+        """Store signatures for a plugin under its current source hash."""
+        self._entries[manifest.get("name", "unknown")] = {
+            "source_hash": self.source_hash(manifest),
+            "tool_signatures": signatures,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": self.VERSION, "plugins": self._entries}, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def format_timing_report(results: Dict[str, Dict[str, Any]], top: int = 10) -> str:
+    """Summarize per-plugin startup times, slowest first."""
+    timed = sorted(
+        ((name, r) for name, r in results.items() if "load_ms" in r),
+        key=lambda item: item[1]["load_ms"],
+        reverse=True,
+    )
+    total = sum(r["load_ms"] for _, r in timed)
+    lazy = sum(1 for _, r in timed if r.get("lazy"))
+    lines = [f"[Plugins] Startup {total:.0f} ms across {len(timed)} plugins ({lazy} lazy)"]
+    for name, r in timed[:top]:
+        mode = "stubs" if r.get("lazy") else ("eager" if r.get("loaded") else "failed")
+        lines.append(f"  {name:<24} {r['load_ms']:>9.1f} ms  {mode}")
+    return "\n".join(lines)
+
+
 def discover_plugins(plugin_dirs: List[Path]) -> List[Dict]:
     """Discover all plugins with manifests from given directories.
 
@@ -223,6 +594,8 @@ def load_all_plugins(
     plugin_dirs: Optional[List[Path]] = None,
     context: Optional[Dict[str, Any]] = None,
     license_manager: Any = "AUTO",
+    lazy: Optional[bool] = None,
+    manifest_cache: Any = "AUTO",
 ) -> Dict[str, Dict[str, Any]]:
     """Discover and load all plugins from given directories.
 
@@ -237,6 +610,12 @@ def load_all_plugins(
         settings: Application settings object
         plugin_dirs: Directories to scan. Defaults to standard locations.
         context: Extra context dict (e.g. hierarchy_service for templates).
+        lazy: Register stubs for plugins declaring tool_signatures and import
+            them on first call. Defaults to $DATABRIDGE_LAZY_PLUGINS (on).
+        manifest_cache: Path of the ToolManifestCache used to make plugins
+            without declared signatures lazy after their first import.
+            Defaults to <settings.data_dir>/tool_manifest_cache.json; None
+            disables it.
 
     Returns:
         Dict mapping plugin names to result dicts with keys:
@@ -245,9 +624,15 @@ def load_all_plugins(
         - skipped (bool) — True if license-gated
         - tier (str) — required tier
         - error (str) — error message if failed
+        - load_ms (float) — time spent registering at startup
+        - lazy (bool) — True if only stubs were registered
+        - import_ms (float) — time of the deferred import, once it happened
+        - cached (bool) — True if the stubs came from the manifest cache
     """
     if context is None:
         context = {}
+    if lazy is None:
+        lazy = os.environ.get("DATABRIDGE_LAZY_PLUGINS", "1").lower() not in ("0", "false", "no")
 
     if plugin_dirs is None:
         src_dir = Path(__file__).parent.parent
@@ -273,6 +658,12 @@ def load_all_plugins(
     else:
         license_mgr = license_manager
 
+    # Resolve tool manifest cache
+    if manifest_cache == "AUTO":
+        data_dir = getattr(settings, "data_dir", None)
+        manifest_cache = Path(data_dir) / "tool_manifest_cache.json" if data_dir else None
+    cache = ToolManifestCache(manifest_cache) if lazy and manifest_cache else None
+
     # Discover all plugins
     plugins = discover_plugins(plugin_dirs)
     results = {}
@@ -309,47 +700,120 @@ def load_all_plugins(
             }
             continue
 
+        results[name] = {"tools": tool_count, "tier": tier, "phase": phase}
+        started = time.perf_counter()
+
+        # Register stubs now and import the module on first use
+        lazy_plugin = None
+        can_be_lazy = lazy and name not in CONTEXT_PROVIDERS and manifest.get("lazy", True)
+        if can_be_lazy:
+            cached = None
+            if cache is not None and not manifest.get("tool_signatures"):
+                cached = cache.get(manifest)
+            lazy_plugin = _LazyPlugin.from_manifest(
+                manifest, mcp, settings, context, results[name], signatures=cached,
+            )
+            if cached and lazy_plugin is not None:
+                results[name]["cached"] = True
+
+        if lazy_plugin is not None:
+            try:
+                lazy_plugin.register_stubs()
+                results[name].update({"loaded": True, "lazy": True})
+            except Exception as e:
+                results[name].update({"loaded": False, "error": f"{type(e).__name__}: {e}", "tools": 0})
+            results[name]["load_ms"] = _elapsed_ms(started)
+            continue
+
         # Try to load the plugin
         try:
             module = _import_module(plugin_dir, module_file)
             if not hasattr(module, register_func_name):
-                results[name] = {
+                results[name].update({
                     "loaded": False,
                     "error": f"Function {register_func_name} not found in {module_file}",
                     "tools": 0,
-                    "phase": phase,
-                }
+                })
                 continue
 
+            # Record the tools so the next start can advertise them lazily
+            recorder = _ToolRecorder(mcp, forward=True) if can_be_lazy and cache is not None else None
             return_value = _call_register_function(
-                module, register_func_name, mcp, settings, arg_pattern, context
+                module, register_func_name, recorder or mcp, settings, arg_pattern, context
             )
+            if recorder is not None:
+                signatures = _describe_tools(recorder.tools)
+                if signatures:
+                    cache.put(manifest, signatures)
 
             # Store return value in context for downstream plugins
             # (e.g. hierarchy_service used by templates)
-            if name == "hierarchy" and return_value is not None:
-                context["hierarchy_service"] = return_value
+            context_key = CONTEXT_PROVIDERS.get(name)
+            if context_key and return_value is not None:
+                context[context_key] = return_value
 
-            results[name] = {
-                "loaded": True,
-                "tools": tool_count,
-                "tier": tier,
-                "phase": phase,
-            }
+            results[name]["loaded"] = True
 
         except ImportError as e:
-            results[name] = {
+            results[name].update({
                 "loaded": False,
                 "error": f"ImportError: {e}",
                 "tools": 0,
-                "phase": phase,
-            }
+            })
         except Exception as e:
-            results[name] = {
+            results[name].update({
                 "loaded": False,
                 "error": f"{type(e).__name__}: {e}",
                 "tools": 0,
-                "phase": phase,
-            }
+            })
+        finally:
+            results[name]["load_ms"] = _elapsed_ms(started)
+
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            logger.warning(f"Could not write tool manifest cache: {e}")
 
     return results
+
+
+def _write_signatures(names: List[str]) -> None:
+    """Regenerate tool_signatures in the plugin.json of built-in plugins."""
+    src_dir = Path(__file__).parent.parent
+    try:
+        from src.config import settings
+    except ImportError:
+        from config import settings
+
+    for manifest in discover_plugins([src_dir]):
+        name = manifest.get("name")
+        if names and name not in names:
+            continue
+        manifest_path = manifest["_dir"] / "plugin.json"
+        try:
+            signatures = generate_tool_signatures(manifest, settings)
+        except Exception as e:
+            print(f"{name}: skipped ({type(e).__name__}: {e})")
+            continue
+        if signatures is None:
+            print(f"{name}: skipped (tool signatures not expressible in plugin.json)")
+            continue
+
+        with open(manifest_path, "r") as f:
+            data = json.load(f)
+        if data.get("name", manifest["_dir"].name) != name:
+            print(f"{name}: skipped (sub-plugin)")
+            continue
+        data["tool_signatures"] = signatures
+        with open(manifest_path, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        print(f"{name}: wrote {len(signatures)} tool signatures")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--write-signatures":
+        _write_signatures(sys.argv[2:])
+    else:
+        print("usage: python -m src.plugins.loader --write-signatures [plugin_name ...]")
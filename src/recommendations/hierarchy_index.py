@@ -0,0 +1,308 @@
+"""
+Column-to-hierarchy match index for the Recommendation Engine.
+
+Matching incoming CSV columns against every hierarchy of every project used
+to be a nested scan per upload. This index keeps the normalized names, ids
+and source-mapping columns of all hierarchies in memory and answers a whole
+column list in one pass.
+
+Components:
+- HierarchyMatchIndex: maintained from HierarchyService change events, with
+  a storage version check for writes made by other service instances
+"""
+
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lengths of the n-grams indexed for "column contained in hierarchy name"
+_GRAM_SIZES = (1, 2, 3)
+
+
+def normalize_column(column: str) -> str:
+    """Normalize a column name for matching against hierarchy names."""
+    return column.upper().replace("_", " ").replace("-", " ")
+
+
+def normalize_hierarchy_name(name: str) -> str:
+    """Normalize a hierarchy name for matching against column names."""
+    return name.upper().replace("_", " ")
+
+
+@dataclass
+class _IndexedHierarchy:
+    """Match-relevant fields of one hierarchy node."""
+    uid: str
+    project_id: str
+    hierarchy_id: str
+    hierarchy_name: str
+    name_key: str
+    id_key: str
+    sort_key: Tuple[Any, ...]
+    source_columns: List[str] = field(default_factory=list)
+
+
+class HierarchyMatchIndex:
+    """
+    In-memory index of hierarchy names, ids and mapped source columns.
+
+    Results are identical to scanning ``list_projects``/``list_hierarchies``:
+    same matches, same order (project order, then hierarchy listing order).
+    """
+
+    def __init__(self, hierarchy_service: Any = None):
+        """
+        Initialize the index and subscribe to hierarchy changes.
+
+        Args:
+            hierarchy_service: HierarchyService to index (optional)
+        """
+        self.hierarchy_service = hierarchy_service
+        self._lock = threading.RLock()
+        self._projects: Dict[str, Tuple[int, str]] = {}  # project_id -> (order, name)
+        self._nodes: Dict[str, _IndexedHierarchy] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._by_id: Dict[str, Set[str]] = {}
+        self._by_source: Dict[str, Set[str]] = {}
+        self._grams: Dict[str, Set[str]] = {}  # n-gram -> normalized names
+        self._name_lengths: Counter = Counter()
+        self._seq = 0
+        self._version: Any = None
+
+        if hierarchy_service is not None:
+            self.rebuild()
+            if hasattr(hierarchy_service, "subscribe"):
+                hierarchy_service.subscribe(self._on_change)
+
+    def close(self) -> None:
+        """Stop listening to hierarchy change events."""
+        if self.hierarchy_service is not None and hasattr(self.hierarchy_service, "unsubscribe"):
+            self.hierarchy_service.unsubscribe(self._on_change)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def _data_version(self) -> Any:
+        if hasattr(self.hierarchy_service, "data_version"):
+            return self.hierarchy_service.data_version()
+        return None
+
+    def rebuild(self) -> None:
+        """Rebuild the whole index from the hierarchy service."""
+        with self._lock:
+            self._projects.clear()
+            self._nodes.clear()
+            self._by_name.clear()
+            self._by_id.clear()
+            self._by_source.clear()
+            self._grams.clear()
+            self._name_lengths.clear()
+            if self.hierarchy_service is None:
+                return
+            try:
+                self._version = self._data_version()
+                for proj in self.hierarchy_service.list_projects():
+                    self.add_project(proj)
+                    for h in self.hierarchy_service.list_hierarchies(proj.get("id", "")):
+                        self.add_hierarchy(h)
+                logger.debug(f"Indexed {len(self._nodes)} hierarchies for column matching")
+            except Exception as e:
+                logger.debug(f"Failed to index hierarchies: {e}")
+
+    def ensure_current(self) -> None:
+        """Rebuild if storage changed without an event reaching this index."""
+        if self.hierarchy_service is not None and self._data_version() != self._version:
+            self.rebuild()
+
+    def _on_change(self, event: str, record: Dict[str, Any]) -> None:
+        """Apply a HierarchyService change event."""
+        with self._lock:
+            if event == "project_created":
+                self.add_project(record)
+            elif event == "project_deleted":
+                self._projects.pop(record.get("id", ""), None)
+            elif event in ("hierarchy_created", "hierarchy_updated"):
+                self.add_hierarchy(record)
+            elif event == "hierarchy_deleted":
+                self.remove_hierarchy(record.get("id", ""))
+            self._version = self._data_version()
+
+    def add_project(self, project: Dict[str, Any]) -> None:
+        """Register a project (keeps its original position on re-add)."""
+        pid = project.get("id", "")
+        with self._lock:
+            order = self._projects.get(pid, (self._next_seq(), ""))[0]
+            self._projects[pid] = (order, project.get("name", ""))
+
+    def add_hierarchy(self, hierarchy: Dict[str, Any]) -> None:
+        """Add or replace a hierarchy node."""
+        uid = hierarchy.get("id") or hierarchy.get("hierarchy_id", "")
+        with self._lock:
+            previous = self._nodes.get(uid)
+            seq = previous.sort_key[-1] if previous else self._next_seq()
+            if previous:
+                self.remove_hierarchy(uid)
+
+            name = hierarchy.get("hierarchy_name", "")
+            node = _IndexedHierarchy(
+                uid=uid,
+                project_id=hierarchy.get("project_id", ""),
+                hierarchy_id=hierarchy.get("hierarchy_id", ""),
+                hierarchy_name=name,
+                name_key=normalize_hierarchy_name(name),
+                id_key=hierarchy.get("hierarchy_id", "").upper(),
+                # Same order as HierarchyService.list_hierarchies (stable sort)
+                sort_key=(hierarchy.get("sort_order", 0), name, seq),
+                source_columns=[m.get("source_column", "").upper() for m in hierarchy.get("mapping", [])],
+            )
+            self._nodes[uid] = node
+
+            if node.name_key not in self._by_name:
+                self._by_name[node.name_key] = set()
+                self._name_lengths[len(node.name_key)] += 1
+                for gram in self._name_grams(node.name_key):
+                    self._grams.setdefault(gram, set()).add(node.name_key)
+            self._by_name[node.name_key].add(uid)
+            self._by_id.setdefault(node.id_key, set()).add(uid)
+            for source in set(node.source_columns):
+                if source:
+                    self._by_source.setdefault(source, set()).add(uid)
+
+    def remove_hierarchy(self, uid: str) -> None:
+        """Remove a hierarchy node."""
+        with self._lock:
+            node = self._nodes.pop(uid, None)
+            if node is None:
+                return
+            self._discard(self._by_id, node.id_key, uid)
+            for source in set(node.source_columns):
+                self._discard(self._by_source, source, uid)
+            if self._discard(self._by_name, node.name_key, uid):
+                self._name_lengths[len(node.name_key)] -= 1
+                if not self._name_lengths[len(node.name_key)]:
+                    del self._name_lengths[len(node.name_key)]
+                for gram in self._name_grams(node.name_key):
+                    self._discard(self._grams, gram, node.name_key)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, value: str) -> bool:
+        """Remove ``value`` from ``index[key]``. Returns True if the key emptied."""
+        values = index.get(key)
+        if values is None:
+            return False
+        values.discard(value)
+        if not values:
+            del index[key]
+            return True
+        return False
+
+    @staticmethod
+    def _name_grams(name: str) -> Set[str]:
+        return {name[i:i + n] for n in _GRAM_SIZES for i in range(len(name) - n + 1)}
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def _names_within(self, column: str) -> Set[str]:
+        """Indexed names that are substrings of ``column``."""
+        found = set()
+        for length in self._name_lengths:
+            if length > len(column):
+                continue
+            for i in range(len(column) - length + 1):
+                candidate = column[i:i + length]
+                if candidate in self._by_name:
+                    found.add(candidate)
+        return found
+
+    def _names_containing(self, column: str) -> Set[str]:
+        """Indexed names that contain ``column`` as a substring."""
+        if not column:
+            return set(self._by_name)
+        n = min(len(column), _GRAM_SIZES[-1])
+        postings = sorted(
+            (self._grams.get(column[i:i + n], set()) for i in range(len(column) - n + 1)),
+            key=len,
+        )
+        candidates = set(postings[0]).intersection(*postings[1:])
+        if len(column) <= n:
+            return candidates
+        return {name for name in candidates if column in name}
+
+    def match_columns(self, columns: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Match columns against hierarchy names, ids and source mappings.
+
+        Args:
+            columns: Column names from an incoming file
+
+        Returns:
+            List of dicts with hierarchy_name, hierarchy_id, project_name,
+            project_id, match_type (exact, partial or mapping_match), column
+            and recommendation
+        """
+        self.ensure_current()
+        columns = list(columns)
+        hits: List[Tuple[Tuple[Any, ...], int, Tuple[int, ...], str, str]] = []
+
+        with self._lock:
+            for ci, col in enumerate(columns):
+                col_key = normalize_column(col)
+                exact = set(self._by_id.get(col_key, ()))
+                exact |= self._by_name.get(col_key, set())
+                partial: Set[str] = set()
+                for name in self._names_within(col_key) | self._names_containing(col_key):
+                    partial |= self._by_name[name]
+
+                for uid in exact:
+                    hits.append((uid, 0, (ci,), "exact", col))
+                for uid in partial - exact:
+                    hits.append((uid, 0, (ci,), "partial", col))
+                for uid in self._by_source.get(col.upper(), ()):
+                    node = self._nodes[uid]
+                    for mi, source in enumerate(node.source_columns):
+                        if source == col.upper():
+                            hits.append((uid, 1, (mi, ci), "mapping_match", col))
+
+            ordered = []
+            for uid, phase, sub, match_type, col in hits:
+                node = self._nodes[uid]
+                project = self._projects.get(node.project_id)
+                if project is None:
+                    continue
+                ordered.append(((project[0],) + node.sort_key, phase, sub, match_type, col, node, project[1]))
+
+        ordered.sort(key=lambda hit: hit[:3])
+        return [self._to_match(node, pname, match_type, col)
+                for _, _, _, match_type, col, node, pname in ordered]
+
+    @staticmethod
+    def _to_match(node: _IndexedHierarchy, pname: str, match_type: str, col: str) -> Dict[str, Any]:
+        if match_type == "exact":
+            recommendation = f"Map column '{col}' to existing hierarchy '{node.hierarchy_name}' in project '{pname}'"
+        elif match_type == "partial":
+            recommendation = f"Consider mapping '{col}' to hierarchy '{node.hierarchy_name}' in project '{pname}'"
+        else:
+            recommendation = f"Column '{col}' already mapped in hierarchy '{node.hierarchy_name}' via source mapping"
+        return {
+            "hierarchy_name": node.hierarchy_name,
+            "hierarchy_id": node.hierarchy_id,
+            "project_name": pname,
+            "project_id": node.project_id,
+            "match_type": match_type,
+            "column": col,
+            "recommendation": recommendation,
+        }
@@ -192,6 +192,7 @@ class RecommendationEngine:
         """
         self._template_service = template_service
         self._hierarchy_service = hierarchy_service
+        self._hierarchy_index = None
 
     @property
     def template_service(self):
@@ -209,6 +210,14 @@ class RecommendationEngine:
             self._hierarchy_service = HierarchyService()
         return self._hierarchy_service
 
+    @property
+    def hierarchy_index(self):
+        """Lazy load the column-to-hierarchy match index."""
+        if self._hierarchy_index is None:
+            from .hierarchy_index import HierarchyMatchIndex
+            self._hierarchy_index = HierarchyMatchIndex(self.hierarchy_service)
+        return self._hierarchy_index
+
     def profile_csv(self, file_path: str = None, content: str = None,
                     sample_rows: int = 100) -> DataProfile:
         """
@@ -547,7 +556,8 @@ class RecommendationEngine:
         """
         Cross-reference incoming CSV columns against existing hierarchy names/mappings.
 
-        Returns recommendations for mapping to existing hierarchies.
+        Returns recommendations for mapping to existing hierarchies. Lookups are
+        served from a HierarchyMatchIndex kept current by hierarchy change events.
 
         Args:
             columns: List of column names from CSV
@@ -555,64 +565,11 @@ class RecommendationEngine:
         Returns:
             List of dicts with hierarchy_name, project_name, match_type, column
         """
-        matches = []
         try:
-            projects = self.hierarchy_service.list_projects()
-            for proj in projects:
-                pid = proj.get("id", "")
-                pname = proj.get("name", "")
-                hierarchies = self.hierarchy_service.list_hierarchies(pid)
-
-                for h in hierarchies:
-                    hier_name = h.get("hierarchy_name", "").upper()
-                    hier_id = h.get("hierarchy_id", "").upper()
-
-                    for col in columns:
-                        col_upper = col.upper().replace("_", " ").replace("-", " ")
-                        hier_name_clean = hier_name.replace("_", " ")
-
-                        # Direct name match
-                        if col_upper == hier_name_clean or col_upper == hier_id:
-                            matches.append({
-                                "hierarchy_name": h.get("hierarchy_name"),
-                                "hierarchy_id": h.get("hierarchy_id"),
-                                "project_name": pname,
-                                "project_id": pid,
-                                "match_type": "exact",
-                                "column": col,
-                                "recommendation": f"Map column '{col}' to existing hierarchy '{h.get('hierarchy_name')}' in project '{pname}'",
-                            })
-                        # Partial match (hierarchy name contained in column or vice versa)
-                        elif hier_name_clean in col_upper or col_upper in hier_name_clean:
-                            matches.append({
-                                "hierarchy_name": h.get("hierarchy_name"),
-                                "hierarchy_id": h.get("hierarchy_id"),
-                                "project_name": pname,
-                                "project_id": pid,
-                                "match_type": "partial",
-                                "column": col,
-                                "recommendation": f"Consider mapping '{col}' to hierarchy '{h.get('hierarchy_name')}' in project '{pname}'",
-                            })
-
-                    # Also check source mappings
-                    for m in h.get("mapping", []):
-                        src_col = m.get("source_column", "").upper()
-                        if src_col:
-                            for col in columns:
-                                if col.upper() == src_col:
-                                    matches.append({
-                                        "hierarchy_name": h.get("hierarchy_name"),
-                                        "hierarchy_id": h.get("hierarchy_id"),
-                                        "project_name": pname,
-                                        "project_id": pid,
-                                        "match_type": "mapping_match",
-                                        "column": col,
-                                        "recommendation": f"Column '{col}' already mapped in hierarchy '{h.get('hierarchy_name')}' via source mapping",
-                                    })
-        except Exception:
-            pass
-
-        return matches
+            return self.hierarchy_index.match_columns(columns)
+        except Exception as e:
+            logger.debug(f"Hierarchy match lookup failed: {e}")
+            return []
 
     def get_recommendations(
         self,
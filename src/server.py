@@ -4,46 +4,57 @@ A headless, MCP-native data reconciliation engine that bridges messy sources
 (OCR/PDF/SQL) with a structured Python-based comparison pipeline.
 """
 from fastmcp import FastMCP
-import pandas as pd
 import hashlib
+import importlib.util
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 import re
 
-# Conditional imports for optional dependencies
-try:
-    from rapidfuzz import fuzz, process
-    RAPIDFUZZ_AVAILABLE = True
-except ImportError:
-    RAPIDFUZZ_AVAILABLE = False
 
-try:
-    from sqlalchemy import create_engine, text
-    SQLALCHEMY_AVAILABLE = True
-except ImportError:
-    SQLALCHEMY_AVAILABLE = False
+def _lazy_import(name: str):
+    """Return a module whose code only runs on first attribute access.
 
-try:
-    import pytesseract
-    from PIL import Image
-    TESSERACT_AVAILABLE = True
-except ImportError:
-    TESSERACT_AVAILABLE = False
+    Keeps heavy dependencies out of server startup while leaving call sites
+    (``pd.read_csv(...)``) unchanged.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def _has_module(*names: str) -> bool:
+    """Check that optional dependencies are installed without importing them."""
+    try:
+        return all(importlib.util.find_spec(name) is not None for name in names)
+    except (ImportError, ValueError):
+        return False
 
-try:
-    from pypdf import PdfReader
-    PYPDF_AVAILABLE = True
-except ImportError:
-    PYPDF_AVAILABLE = False
+
+pd = _lazy_import("pandas")
+
+# Optional dependencies are imported inside the tools that use them
+RAPIDFUZZ_AVAILABLE = _has_module("rapidfuzz")
+SQLALCHEMY_AVAILABLE = _has_module("sqlalchemy")
+TESSERACT_AVAILABLE = _has_module("pytesseract", "PIL")
+PYPDF_AVAILABLE = _has_module("pypdf")
 
 # Handle imports for both module and direct execution
 try:
     from src.config import settings
+    from src.audit_writer import get_audit_writer
 except ImportError:
     from config import settings
+    from audit_writer import get_audit_writer
 
 # License Management - Import the plugin system
 try:
@@ -111,9 +122,10 @@ Use me for data quality checks, building financial hierarchies, and managing com
 Path(settings.data_dir).mkdir(parents=True, exist_ok=True)
 
 # Initialize audit log with headers if it doesn't exist
+AUDIT_HEADER = "timestamp,user,action,impact\n"
 if not Path(settings.audit_log).exists():
     with open(settings.audit_log, "w") as f:
-        f.write("timestamp,user,action,impact\n")
+        f.write(AUDIT_HEADER)
 
 # Initialize workflow file if it doesn't exist
 if not Path(settings.workflow_file).exists():
@@ -125,24 +137,36 @@ if not Path(settings.workflow_file).exists():
 # Internal Helpers
 # =============================================================================
 
+def _audit_writer():
+    """Background writer for the configured audit trail file."""
+    return get_audit_writer(
+        settings.audit_log,
+        header=AUDIT_HEADER,
+        batch_size=settings.audit_batch_size,
+        flush_interval=settings.audit_flush_interval,
+        fsync_policy=settings.audit_fsync,
+        max_bytes=settings.audit_max_bytes,
+        rotate_interval=settings.audit_rotate_hours * 3600 or None,
+        backup_count=settings.audit_backup_count,
+    )
+
+
 def log_action(user: str, action: str, impact: str) -> None:
     """Record an action to the audit trail (no PII)."""
     timestamp = datetime.now().isoformat()
     # Sanitize to prevent CSV injection
     action = action.replace(",", ";").replace("\n", " ")[:100]
     impact = impact.replace(",", ";").replace("\n", " ")[:200]
-    log_entry = f"{timestamp},{user},{action},{impact}\n"
-    with open(settings.audit_log, "a") as f:
-        f.write(log_entry)
+    _audit_writer().write(f"{timestamp},{user},{action},{impact}\n")
 
 
-def compute_row_hash(row: pd.Series, columns: list) -> str:
+def compute_row_hash(row: "pd.Series", columns: list) -> str:
     """Compute a deterministic SHA-256 hash for a row (truncated to 16 chars)."""
     values = "|".join(str(row[col]) for col in columns)
     return hashlib.sha256(values.encode()).hexdigest()[:16]
 
 
-def truncate_dataframe(df: pd.DataFrame, max_rows: int = None) -> pd.DataFrame:
+def truncate_dataframe(df: "pd.DataFrame", max_rows: int = None) -> "pd.DataFrame":
     """Truncate DataFrame to respect context sensitivity rules."""
     max_rows = max_rows or settings.max_rows_display
     return df.head(max_rows)
@@ -528,6 +552,8 @@ def query_database(connection_string: str, query: str, preview_rows: int = 10) -
         return json.dumps({"error": "Only SELECT queries are allowed"})
 
     try:
+        from sqlalchemy import create_engine
+
         engine = create_engine(connection_string)
         df = pd.read_sql(query, engine)
         preview_rows = min(preview_rows, settings.max_rows_display)
@@ -961,6 +987,8 @@ def fuzzy_match_columns(
     if not RAPIDFUZZ_AVAILABLE:
         return json.dumps({"error": "RapidFuzz not installed. Run: pip install rapidfuzz"})
 
+    from rapidfuzz import fuzz, process
+
     try:
         df_a = pd.read_csv(source_a_path)
         df_b = pd.read_csv(source_b_path)
@@ -1045,6 +1073,8 @@ def fuzzy_deduplicate(
     if not RAPIDFUZZ_AVAILABLE:
         return json.dumps({"error": "RapidFuzz not installed. Run: pip install rapidfuzz"})
 
+    from rapidfuzz import fuzz
+
     try:
         df = pd.read_csv(source_path)
         limit = min(limit, settings.max_rows_display)
@@ -1108,6 +1138,8 @@ def extract_text_from_pdf(file_path: str, pages: str = "all") -> str:
         return json.dumps({"error": "pypdf not installed. Run: pip install pypdf"})
 
     try:
+        from pypdf import PdfReader
+
         reader = PdfReader(file_path)
         total_pages = len(reader.pages)
 
@@ -1159,6 +1191,9 @@ def ocr_image(file_path: str, language: str = "eng") -> str:
         return json.dumps({"error": "pytesseract/Pillow not installed. Run: pip install pytesseract Pillow"})
 
     try:
+        import pytesseract
+        from PIL import Image
+
         # Configure tesseract path if set
         if settings.tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = settings.tesseract_path
@@ -1353,12 +1388,13 @@ def get_audit_log(limit: int = 10) -> str:
     """
     try:
         limit = min(limit, settings.max_rows_display)
-        df = pd.read_csv(settings.audit_log)
+        writer = _audit_writer()
 
-        recent = df.tail(limit).to_dict(orient="records")
+        # Reads only the end of the file; the entry count is tracked by the writer
+        recent = writer.tail(limit)
 
         return json.dumps({
-            "total_entries": len(df),
+            "total_entries": writer.count(),
             "showing": len(recent),
             "entries": recent
         }, indent=2)
@@ -1616,9 +1652,9 @@ def get_license_status() -> str:
 
 try:
     try:
-        from src.plugins.loader import load_all_plugins
+        from src.plugins.loader import load_all_plugins, format_timing_report
     except ImportError:
-        from plugins.loader import load_all_plugins
+        from plugins.loader import load_all_plugins, format_timing_report
 
     _src_dir = Path(__file__).parent
     _project_root = _src_dir.parent
@@ -1649,6 +1685,8 @@ try:
             _failed += 1
 
     print(f"[Plugins] Loaded {_loaded} plugins, {_skipped} skipped (license), {_failed} failed")
+    if os.environ.get("DATABRIDGE_STARTUP_REPORT"):
+        print(format_timing_report(plugin_results))
 
 except Exception as _plugin_err:
     print(f"[Plugins] Plugin loader failed: {_plugin_err}")
@@ -0,0 +1,234 @@
+"""In-memory catalogs for templates, skills and client knowledge.
+
+The template service is hit on every GraphRAG query and recommendation, so
+the JSON indexes are parsed once and kept in memory until the files on
+disk change.
+
+Components:
+- file_stamp / directory_stamp: cheap ``stat``-based change detection
+- ParsedFileCache: thread-safe LRU of parsed files validated by stamp
+- TemplateCatalog: template index with lookups by id, industry (including
+  sub-industry prefixes), domain, hierarchy type and category
+- SkillCatalog: skill index with lookups by id and domain
+"""
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .types import SkillDefinition, TemplateMetadata
+
+Stamp = Optional[Tuple[int, int]]
+
+
+def file_stamp(path: Path) -> Stamp:
+    """Return ``(mtime_ns, size)`` of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def directory_stamp(directory: Path, index_name: str = "index.json") -> Tuple[Stamp, Stamp]:
+    """
+    Stamp a catalog directory.
+
+    The directory mtime changes when entries are added, removed or replaced
+    (e.g. atomic renames); the index file stamp catches in-place rewrites.
+    """
+    return (file_stamp(directory), file_stamp(directory / index_name))
+
+
+class ParsedFileCache:
+    """Thread-safe LRU of parsed file contents keyed on file stamps."""
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max(1, max_size)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, stamp: Any) -> Any:
+        """Return the cached value if it was stored with the same stamp."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, stamp: Any, value: Any) -> None:
+        """Store a parsed value together with the stamp it was read at."""
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or all entries if ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _industry_prefixes(industry: str) -> List[str]:
+    """Proper ``_``-delimited prefixes, e.g. oil_gas_upstream -> [oil, oil_gas]."""
+    parts = industry.split("_")
+    return ["_".join(parts[:i]) for i in range(1, len(parts))]
+
+
+class TemplateCatalog:
+    """Indexed view of ``templates/index.json``."""
+
+    def __init__(self, index: Dict[str, Any], stamp: Any = None):
+        """
+        Build the catalog.
+
+        Args:
+            index: Parsed templates index
+            stamp: Directory stamp the index was read at
+        """
+        self.stamp = stamp
+        self.entries: List[Dict[str, Any]] = list(index.get("templates", []))
+        self.metadata: List[TemplateMetadata] = []
+        self.positions: Dict[str, int] = {}
+        self.by_category: Dict[str, Set[int]] = {}
+        self.by_domain: Dict[str, Set[int]] = {}
+        self.by_hierarchy_type: Dict[str, Set[int]] = {}
+        self.by_industry: Dict[str, Set[int]] = {}
+        self.by_parent_industry: Dict[str, Set[int]] = {}
+        # Resolved template file per id, filled lazily by the service
+        self.paths: Dict[str, Path] = {}
+
+        for pos, entry in enumerate(self.entries):
+            # First entry wins, matching the previous linear scan
+            self.positions.setdefault(entry["id"], pos)
+            self.metadata.append(TemplateMetadata(
+                id=entry["id"],
+                name=entry["name"],
+                category=entry.get("category", "custom"),
+                industry=entry.get("industry", "general"),
+                description=entry.get("description", ""),
+                hierarchy_count=entry.get("hierarchy_count", 0),
+                domain=entry.get("domain", "accounting"),
+                hierarchy_type=entry.get("hierarchy_type", "custom"),
+            ))
+            self.by_category.setdefault(entry.get("category"), set()).add(pos)
+            self.by_domain.setdefault(entry.get("domain"), set()).add(pos)
+            self.by_hierarchy_type.setdefault(entry.get("hierarchy_type"), set()).add(pos)
+            industry = entry.get("industry", "general")
+            self.by_industry.setdefault(industry, set()).add(pos)
+            for prefix in _industry_prefixes(industry):
+                self.by_parent_industry.setdefault(prefix, set()).add(pos)
+
+    def entry(self, template_id: str) -> Optional[Dict[str, Any]]:
+        """Get the raw index entry for a template."""
+        pos = self.positions.get(template_id)
+        return self.entries[pos] if pos is not None else None
+
+    def industry_positions(self, industry: str) -> Set[int]:
+        """
+        Positions of templates applicable to ``industry``.
+
+        Includes general templates, exact matches, parent industries
+        (oil_gas for oil_gas_upstream) and sub-industries (oil_gas_upstream
+        for oil_gas).
+        """
+        positions = set(self.by_industry.get(industry, ()))
+        positions |= self.by_industry.get("general", set())
+        positions |= self.by_parent_industry.get(industry, set())
+        for prefix in _industry_prefixes(industry):
+            positions |= self.by_industry.get(prefix, set())
+        return positions
+
+    def query(self, category: Optional[str] = None,
+              industry: Optional[str] = None,
+              domain: Optional[str] = None,
+              hierarchy_type: Optional[str] = None) -> List[TemplateMetadata]:
+        """Return copies of the matching template metadata in index order."""
+        candidates: Optional[Set[int]] = None
+        for index, value in ((self.by_category, category),
+                             (self.by_domain, domain),
+                             (self.by_hierarchy_type, hierarchy_type)):
+            if value:
+                matched = index.get(value, set())
+                candidates = matched if candidates is None else candidates & matched
+        if industry:
+            matched = self.industry_positions(industry)
+            candidates = matched if candidates is None else candidates & matched
+
+        positions: Iterable[int] = range(len(self.metadata)) if candidates is None else sorted(candidates)
+        return [self.metadata[pos].model_copy() for pos in positions]
+
+
+class SkillCatalog:
+    """Indexed view of ``skills/index.json``."""
+
+    def __init__(self, index: Dict[str, Any], stamp: Any = None):
+        """
+        Build the catalog.
+
+        Args:
+            index: Parsed skills index
+            stamp: Directory stamp the index was read at
+        """
+        self.stamp = stamp
+        self.industry_map: Dict[str, List[str]] = index.get("industries", {})
+        self.entries: List[Dict[str, Any]] = list(index.get("skills", []))
+        self.skills: List[SkillDefinition] = [SkillDefinition(**entry) for entry in self.entries]
+        self.positions: Dict[str, int] = {}
+        self.by_domain: Dict[str, List[int]] = {}
+        self._queries: Dict[Tuple[Optional[str], Optional[str]], List[int]] = {}
+        self._lock = threading.Lock()
+
+        for pos, entry in enumerate(self.entries):
+            self.positions.setdefault(entry["id"], pos)
+            self.by_domain.setdefault(entry.get("domain"), []).append(pos)
+
+    def get(self, skill_id: str) -> Optional[SkillDefinition]:
+        """Get a copy of a skill by id."""
+        pos = self.positions.get(skill_id)
+        return self.skills[pos].model_copy(deep=True) if pos is not None else None
+
+    def _matches_industry(self, pos: int, industry: str) -> bool:
+        skill_industries = self.entries[pos].get("industries", ["general"])
+        if industry in skill_industries or "all" in skill_industries or "general" in skill_industries:
+            return True
+        return any(industry.startswith(s) or s.startswith(industry) for s in skill_industries)
+
+    def query(self, domain: Optional[str] = None,
+              industry: Optional[str] = None) -> List[SkillDefinition]:
+        """Return copies of the matching skills in index order."""
+        key = (domain or None, industry or None)
+        with self._lock:
+            positions = self._queries.get(key)
+        if positions is None:
+            positions = self.by_domain.get(domain, []) if domain else range(len(self.entries))
+            if industry:
+                positions = [pos for pos in positions if self._matches_industry(pos, industry)]
+            positions = list(positions)
+            with self._lock:
+                self._queries[key] = positions
+        return [self.skills[pos].model_copy(deep=True) for pos in positions]
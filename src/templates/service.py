@@ -1,5 +1,6 @@
 """Template, Skills, and Knowledge Base Service - Core business logic."""
 import json
+import threading
 import uuid
 import re
 from datetime import datetime
@@ -18,6 +19,13 @@ from .types import (
     CustomPrompt,
     TemplateRecommendation,
 )
+from .catalog import (
+    ParsedFileCache,
+    SkillCatalog,
+    TemplateCatalog,
+    directory_stamp,
+    file_stamp,
+)
 
 
 class TemplateService:
@@ -25,11 +33,20 @@ class TemplateService:
 
     def __init__(self, templates_dir: str = "templates",
                  skills_dir: str = "skills",
-                 kb_dir: str = "knowledge_base"):
+                 kb_dir: str = "knowledge_base",
+                 cache_size: int = 128):
         self.templates_dir = Path(templates_dir)
         self.skills_dir = Path(skills_dir)
         self.kb_dir = Path(kb_dir)
 
+        # Indexes are parsed once and rebuilt when the directory stamps change;
+        # template bodies, prompts and client profiles share one LRU
+        self._catalog_lock = threading.Lock()
+        self._template_catalog: Optional[TemplateCatalog] = None
+        self._skill_catalog: Optional[SkillCatalog] = None
+        self._client_catalog: Optional[tuple] = None
+        self._cache = ParsedFileCache(max_size=cache_size)
+
         # Ensure directories exist
         self.templates_dir.mkdir(parents=True, exist_ok=True)
         self.skills_dir.mkdir(parents=True, exist_ok=True)
@@ -65,6 +82,65 @@ class TemplateService:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, default=str)
 
+    def _templates(self) -> TemplateCatalog:
+        """Get the template catalog, rebuilding it if the index changed."""
+        stamp = directory_stamp(self.templates_dir)
+        catalog = self._template_catalog
+        if catalog is None or catalog.stamp != stamp:
+            with self._catalog_lock:
+                catalog = self._template_catalog
+                if catalog is None or catalog.stamp != stamp:
+                    catalog = TemplateCatalog(self._load_json(self.templates_dir / "index.json"), stamp)
+                    self._template_catalog = catalog
+        return catalog
+
+    def _skills(self) -> SkillCatalog:
+        """Get the skill catalog, rebuilding it if the index changed."""
+        stamp = directory_stamp(self.skills_dir)
+        catalog = self._skill_catalog
+        if catalog is None or catalog.stamp != stamp:
+            with self._catalog_lock:
+                catalog = self._skill_catalog
+                if catalog is None or catalog.stamp != stamp:
+                    catalog = SkillCatalog(self._load_json(self.skills_dir / "index.json"), stamp)
+                    self._skill_catalog = catalog
+        return catalog
+
+    def _read_text(self, path: Path) -> Optional[str]:
+        """Read a text file through the LRU, or None if it does not exist."""
+        stamp = file_stamp(path)
+        if stamp is None:
+            return None
+        key = ("text", str(path))
+        text = self._cache.get(key, stamp)
+        if text is None:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            self._cache.put(key, stamp, text)
+        return text
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached indexes and parsed files.
+
+        Changes on disk are picked up automatically through file stamps; this
+        is only needed when files are replaced without changing mtime or size.
+        """
+        with self._catalog_lock:
+            self._template_catalog = None
+            self._skill_catalog = None
+            self._client_catalog = None
+        self._cache.invalidate()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get catalog and LRU statistics."""
+        templates = self._template_catalog
+        skills = self._skill_catalog
+        return {
+            "templates_indexed": len(templates.entries) if templates else 0,
+            "skills_indexed": len(skills.entries) if skills else 0,
+            "parsed_files": self._cache.stats(),
+        }
+
     def _generate_id(self) -> str:
         """Generate a UUID."""
         return str(uuid.uuid4())
@@ -93,73 +169,55 @@ class TemplateService:
         Returns:
             List of matching template metadata
         """
-        index = self._load_json(self.templates_dir / "index.json")
-        templates = []
-
-        for entry in index.get("templates", []):
-            # Apply filters
-            if category and entry.get("category") != category:
-                continue
-            if domain and entry.get("domain") != domain:
-                continue
-            if hierarchy_type and entry.get("hierarchy_type") != hierarchy_type:
-                continue
-
-            # Industry filter: include general templates or exact matches
-            # Also include parent industry matches (e.g., oil_gas matches oil_gas_upstream)
-            if industry:
-                entry_industry = entry.get("industry", "general")
-                if entry_industry != industry and entry_industry != "general":
-                    # Check if it's a sub-industry match
-                    if not (industry.startswith(entry_industry + "_") or entry_industry.startswith(industry + "_")):
-                        continue
-
-            templates.append(TemplateMetadata(
-                id=entry["id"],
-                name=entry["name"],
-                category=entry.get("category", "custom"),
-                industry=entry.get("industry", "general"),
-                description=entry.get("description", ""),
-                hierarchy_count=entry.get("hierarchy_count", 0),
-                domain=entry.get("domain", "accounting"),
-                hierarchy_type=entry.get("hierarchy_type", "custom")
-            ))
-
-        return templates
+        return self._templates().query(
+            category=category,
+            industry=industry,
+            domain=domain,
+            hierarchy_type=hierarchy_type,
+        )
 
     def get_template(self, template_id: str) -> Optional[FinancialTemplate]:
         """Get full details of a template."""
-        index = self._load_json(self.templates_dir / "index.json")
-
-        for entry in index.get("templates", []):
-            if entry["id"] == template_id:
-                # Try loading from file path in index first
-                if "file" in entry:
-                    template_path = self.templates_dir / entry["file"]
-                    if template_path.exists():
-                        data = self._load_json(template_path)
-                        return FinancialTemplate(**data)
-
-                # Try domain-based directory (new structure)
-                domain = entry.get("domain", "accounting")
-                template_path = self.templates_dir / domain / f"{template_id}.json"
-                if template_path.exists():
-                    data = self._load_json(template_path)
-                    return FinancialTemplate(**data)
-
-                # Try category-based directory (legacy structure)
-                template_path = self.templates_dir / entry.get("category", "custom") / f"{template_id}.json"
-                if template_path.exists():
-                    data = self._load_json(template_path)
-                    return FinancialTemplate(**data)
-
-                # Try without subfolder
-                template_path = self.templates_dir / f"{template_id}.json"
-                if template_path.exists():
-                    data = self._load_json(template_path)
-                    return FinancialTemplate(**data)
+        catalog = self._templates()
+        entry = catalog.entry(template_id)
+        if entry is None:
+            return None
 
-        return None
+        template_path = catalog.paths.get(template_id)
+        stamp = file_stamp(template_path) if template_path else None
+        if stamp is None:
+            template_path, stamp = self._resolve_template_path(entry)
+            if template_path is None:
+                return None
+            catalog.paths[template_id] = template_path
+
+        key = ("template", template_id)
+        template = self._cache.get(key, (template_path, stamp))
+        if template is None:
+            template = FinancialTemplate(**self._load_json(template_path))
+            self._cache.put(key, (template_path, stamp), template)
+        return template.model_copy(deep=True)
+
+    def _resolve_template_path(self, entry: Dict[str, Any]):
+        """Find the file holding a template body.
+
+        Tries the file path in the index, then the domain-based directory (new
+        structure), the category-based directory (legacy structure) and
+        finally the templates root.
+        """
+        template_id = entry["id"]
+        candidates = []
+        if "file" in entry:
+            candidates.append(self.templates_dir / entry["file"])
+        candidates.append(self.templates_dir / entry.get("domain", "accounting") / f"{template_id}.json")
+        candidates.append(self.templates_dir / entry.get("category", "custom") / f"{template_id}.json")
+        candidates.append(self.templates_dir / f"{template_id}.json")
+
+        for path in candidates:
+            stamp = file_stamp(path)
+            if stamp is not None:
+                return path, stamp
+        return None, None
 
     def save_template(self, template: FinancialTemplate) -> FinancialTemplate:
         """Save a template to disk."""
@@ -196,6 +254,7 @@ class TemplateService:
 
         index["templates"] = templates
         self._save_json(self.templates_dir / "index.json", index)
+        self._template_catalog = None
 
         return template
 
@@ -273,54 +332,23 @@ class TemplateService:
         Returns:
             List of matching skill definitions
         """
-        index = self._load_json(self.skills_dir / "index.json")
-        skills = []
-
-        for entry in index.get("skills", []):
-            # Apply domain filter
-            if domain and entry.get("domain") != domain:
-                continue
-
-            # Apply industry filter
-            if industry:
-                skill_industries = entry.get("industries", ["general"])
-                if industry not in skill_industries and "all" not in skill_industries and "general" not in skill_industries:
-                    # Check sub-industry match
-                    matched = False
-                    for skill_ind in skill_industries:
-                        if industry.startswith(skill_ind) or skill_ind.startswith(industry):
-                            matched = True
-                            break
-                    if not matched:
-                        continue
-
-            skills.append(SkillDefinition(**entry))
-
-        return skills
+        return self._skills().query(domain=domain, industry=industry)
 
     def get_skills_for_industry(self, industry: str) -> List[SkillDefinition]:
         """Get recommended skills for a specific industry."""
-        index = self._load_json(self.skills_dir / "index.json")
-        industry_map = index.get("industries", {})
+        catalog = self._skills()
+        industry_map = catalog.industry_map
 
         skill_ids = industry_map.get(industry, [])
         if not skill_ids:
             skill_ids = industry_map.get("general", [])
 
-        skills = []
-        for skill in self.list_skills():
-            if skill.id in skill_ids:
-                skills.append(skill)
-
-        return skills
+        skill_ids = set(skill_ids)
+        return [skill for skill in catalog.query() if skill.id in skill_ids]
 
     def get_skill(self, skill_id: str) -> Optional[SkillDefinition]:
         """Get detailed information about a specific skill."""
-        skills = self.list_skills()
-        for skill in skills:
-            if skill.id == skill_id:
-                return skill
-        return None
+        return self._skills().get(skill_id)
 
     def get_skill_prompt(self, skill_id: str) -> Optional[str]:
         """Get the system prompt content for a skill."""
@@ -328,11 +356,7 @@ class TemplateService:
         if not skill:
             return None
 
-        prompt_path = self.skills_dir / skill.prompt_file
-        if prompt_path.exists():
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                return f.read()
-        return None
+        return self._read_text(self.skills_dir / skill.prompt_file)
 
     def get_skill_documentation(self, skill_id: str) -> Optional[str]:
         """Get the documentation content for a skill."""
@@ -340,11 +364,7 @@ class TemplateService:
         if not skill:
             return None
 
-        doc_path = self.skills_dir / skill.documentation_file
-        if doc_path.exists():
-            with open(doc_path, "r", encoding="utf-8") as f:
-                return f.read()
-        return None
+        return self._read_text(self.skills_dir / skill.documentation_file)
 
     # =========================================================================
     # Knowledge Base Operations
@@ -352,48 +372,61 @@ class TemplateService:
 
     def list_clients(self) -> List[ClientMetadata]:
         """List all client knowledge base profiles."""
-        index = self._load_json(self.kb_dir / "index.json")
-        clients = []
-
-        for entry in index.get("clients", []):
-            clients.append(ClientMetadata(
-                client_id=entry["client_id"],
-                client_name=entry["client_name"],
-                industry=entry.get("industry", "general"),
-                erp_system=entry.get("erp_system"),
-                prompt_count=entry.get("prompt_count", 0)
-            ))
-
-        return clients
+        stamp = directory_stamp(self.kb_dir)
+        cached = self._client_catalog
+        if cached is None or cached[0] != stamp:
+            index = self._load_json(self.kb_dir / "index.json")
+            clients = [
+                ClientMetadata(
+                    client_id=entry["client_id"],
+                    client_name=entry["client_name"],
+                    industry=entry.get("industry", "general"),
+                    erp_system=entry.get("erp_system"),
+                    prompt_count=entry.get("prompt_count", 0)
+                )
+                for entry in index.get("clients", [])
+            ]
+            cached = (stamp, clients)
+            self._client_catalog = cached
+
+        return [client.model_copy() for client in cached[1]]
 
     def get_client_knowledge(self, client_id: str) -> Optional[ClientKnowledge]:
         """Get full client knowledge base profile."""
         client_dir = self.kb_dir / "clients" / client_id
         config_path = client_dir / "config.json"
+        prompts_path = client_dir / "prompts.json"
+        mappings_path = client_dir / "mappings.json"
+        notes_path = client_dir / "notes.md"
 
-        if not config_path.exists():
+        stamp = tuple(file_stamp(p) for p in (config_path, prompts_path, mappings_path, notes_path))
+        if stamp[0] is None:
             return None
 
+        key = ("client", client_id)
+        knowledge = self._cache.get(key, stamp)
+        if knowledge is not None:
+            return knowledge.model_copy(deep=True)
+
         config = self._load_json(config_path)
 
         # Load prompts
-        prompts_path = client_dir / "prompts.json"
-        if prompts_path.exists():
+        if stamp[1] is not None:
             prompts_data = self._load_json(prompts_path)
             config["custom_prompts"] = [CustomPrompt(**p) for p in prompts_data.get("prompts", [])]
 
         # Load mappings
-        mappings_path = client_dir / "mappings.json"
-        if mappings_path.exists():
+        if stamp[2] is not None:
             config["gl_patterns"] = self._load_json(mappings_path).get("mappings", {})
 
         # Load notes
-        notes_path = client_dir / "notes.md"
-        if notes_path.exists():
+        if stamp[3] is not None:
             with open(notes_path, "r", encoding="utf-8") as f:
                 config["notes"] = f.read()
 
-        return ClientKnowledge(**config)
+        knowledge = ClientKnowledge(**config)
+        self._cache.put(key, stamp, knowledge)
+        return knowledge.model_copy(deep=True)
 
     def create_client(self, client_id: str, client_name: str,
                       industry: str = "general", erp_system: Optional[str] = None) -> ClientKnowledge:
@@ -456,6 +489,7 @@ class TemplateService:
 
         index["clients"] = clients
         self._save_json(self.kb_dir / "index.json", index)
+        self._client_catalog = None
 
         return client
 
@@ -488,6 +522,7 @@ class TemplateService:
                         client[field] = value
                         break
                 self._save_json(self.kb_dir / "index.json", index)
+                self._client_catalog = None
         elif field == "notes":
             # Save notes to markdown file
             with open(client_dir / "notes.md", "w", encoding="utf-8") as f:
@@ -529,6 +564,7 @@ class TemplateService:
                 client["prompt_count"] = len(prompts_data["prompts"])
                 break
         self._save_json(self.kb_dir / "index.json", index)
+        self._client_catalog = None
 
         return self.get_client_knowledge(client_id)
 
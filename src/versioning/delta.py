@@ -0,0 +1,136 @@
+"""
+Structural deltas between JSON snapshots.
+
+Used by the VersionStore to keep most versions as small deltas against the
+previous version instead of full copies.
+
+Delta nodes are single-key dicts:
+- {"v": value}: replace the value
+- {"d": {"set": {...}, "del": [...], "sub": {...}, "order": [...]}}: patch a dict
+  (``sub`` holds nested deltas; ``order`` is only present when key order changed)
+- {"l": [op, ...]}: rebuild a list from ["c", start, end] (copy from base),
+  ["i", [items]] (insert) and ["p", start, [deltas]] (patch items in place)
+"""
+
+import json
+from difflib import SequenceMatcher
+from typing import Any, Dict, List
+
+
+def _element_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    """
+    Equality of JSON values that also requires matching types at every level.
+
+    Python treats True == 1 == 1.0, but they serialize (and hash) differently,
+    so a change between them must not be dropped.
+    """
+    if a is b:
+        return True
+    if type(a) is not type(b) or a != b:
+        return False
+    if isinstance(a, dict):
+        return all(json_equal(value, b[key]) for key, value in a.items())
+    if isinstance(a, list):
+        return all(json_equal(x, y) for x, y in zip(a, b))
+    return True
+
+
+def compute_delta(old: Any, new: Any) -> Dict[str, Any]:
+    """
+    Compute a delta that turns ``old`` into ``new``.
+
+    Args:
+        old: Base JSON value
+        new: Target JSON value
+
+    Returns:
+        Delta node (see module docstring)
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        return {"d": _dict_delta(old, new)}
+    if isinstance(old, list) and isinstance(new, list):
+        return {"l": _list_delta(old, new)}
+    return {"v": new}
+
+
+def _dict_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    patch: Dict[str, Any] = {}
+    removed = [k for k in old if k not in new]
+    if removed:
+        patch["del"] = removed
+
+    changed: Dict[str, Any] = {}
+    nested: Dict[str, Any] = {}
+    for key, value in new.items():
+        if key not in old:
+            changed[key] = value
+        elif not json_equal(old[key], value):
+            if isinstance(value, (dict, list)) and type(old[key]) is type(value):
+                nested[key] = compute_delta(old[key], value)
+            else:
+                changed[key] = value
+    if changed:
+        patch["set"] = changed
+    if nested:
+        patch["sub"] = nested
+
+    expected = [k for k in old if k in new] + [k for k in new if k not in old]
+    if list(new) != expected:
+        patch["order"] = list(new)
+    return patch
+
+
+def _list_delta(old: List[Any], new: List[Any]) -> List[Any]:
+    matcher = SequenceMatcher(None, [_element_key(x) for x in old], [_element_key(x) for x in new])
+    ops: List[Any] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["c", i1, i2])
+        elif tag == "replace" and i2 - i1 == j2 - j1 and all(
+            isinstance(a, (dict, list)) and type(a) is type(b)
+            for a, b in zip(old[i1:i2], new[j1:j2])
+        ):
+            ops.append(["p", i1, [compute_delta(a, b) for a, b in zip(old[i1:i2], new[j1:j2])]])
+        elif tag in ("replace", "insert"):
+            ops.append(["i", new[j1:j2]])
+    return ops
+
+
+def apply_delta(base: Any, delta: Dict[str, Any]) -> Any:
+    """
+    Apply a delta produced by ``compute_delta``.
+
+    Args:
+        base: Value the delta was computed against (not modified)
+        delta: Delta node
+
+    Returns:
+        The target value
+    """
+    if "v" in delta:
+        return delta["v"]
+
+    if "d" in delta:
+        patch = delta["d"]
+        result = {k: v for k, v in base.items() if k not in set(patch.get("del", ()))}
+        for key, sub in patch.get("sub", {}).items():
+            result[key] = apply_delta(base[key], sub)
+        result.update(patch.get("set", {}))
+        if "order" in patch:
+            result = {k: result[k] for k in patch["order"]}
+        return result
+
+    result: List[Any] = []
+    for op in delta["l"]:
+        if op[0] == "c":
+            result.extend(base[op[1]:op[2]])
+        elif op[0] == "i":
+            result.extend(op[1])
+        else:
+            start = op[1]
+            result.extend(apply_delta(base[start + k], sub) for k, sub in enumerate(op[2]))
+    return result
@@ -0,0 +1,239 @@
+"""
+Structural diff and JSON Patch operations for version snapshots.
+
+Components:
+- diff_snapshots: recursive diff producing RFC 6902 style operations
+  (add / remove / replace / move). List elements that carry an identity
+  key (``id`` or ``hierarchy_id``) are matched by identity, so an edit
+  inside one hierarchy node yields a single nested operation. Other lists
+  are aligned on element digests.
+- apply_patch: apply operations to a copy of a document
+- invert_patch: operations that undo a patch (used for rollback previews)
+
+``remove`` and ``replace`` operations carry the previous value under
+``old`` so a patch can be inverted without the original document.
+"""
+
+import copy
+import json
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional
+
+from .delta import json_equal
+
+# Keys that identify list elements across versions, in order of preference
+IDENTITY_KEYS = ("id", "hierarchy_id")
+
+
+def escape_pointer(token: Any) -> str:
+    """Escape one JSON Pointer reference token."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def unescape_pointer(token: str) -> str:
+    """Unescape one JSON Pointer reference token."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _element_digest(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _identity_key(items: List[Any]) -> Optional[str]:
+    """Identity key shared (uniquely) by every element of a list, if any."""
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for key in IDENTITY_KEYS:
+        try:
+            ids = [item[key] for item in items]
+            if len(set(ids)) == len(ids):
+                return key
+        except (KeyError, TypeError):
+            continue
+    return None
+
+
+def diff_snapshots(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute JSON Patch operations that turn ``old`` into ``new``.
+
+    Unchanged subtrees are skipped with a type-strict equality check before any
+    recursion, so the work done is proportional to the changed branches.
+
+    Args:
+        old: Source document
+        new: Target document
+        path: JSON Pointer of the documents (for nested calls)
+
+    Returns:
+        List of operation dicts (op, path, value/old/from)
+    """
+    ops: List[Dict[str, Any]] = []
+    _diff(old, new, path, ops)
+    return ops
+
+
+def _diff(old: Any, new: Any, path: str, ops: List[Dict[str, Any]]) -> None:
+    if json_equal(old, new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        _diff_dict(old, new, path, ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        key = _identity_key(old)
+        if key and key == _identity_key(new):
+            _diff_identity_list(old, new, key, path, ops)
+        else:
+            _diff_list(old, new, path, ops)
+    else:
+        ops.append({"op": "replace", "path": path, "value": new, "old": old})
+
+
+def _diff_dict(old: Dict[str, Any], new: Dict[str, Any], path: str, ops: List[Dict[str, Any]]) -> None:
+    for key in old:
+        if key not in new:
+            ops.append({"op": "remove", "path": f"{path}/{escape_pointer(key)}", "old": old[key]})
+    for key, value in new.items():
+        child = f"{path}/{escape_pointer(key)}"
+        if key not in old:
+            ops.append({"op": "add", "path": child, "value": value})
+        else:
+            _diff(old[key], value, child, ops)
+
+
+def _diff_list(old: List[Any], new: List[Any], path: str, ops: List[Dict[str, Any]]) -> None:
+    """Align elements by digest; emit operations back to front so indices stay valid."""
+    matcher = SequenceMatcher(None, [_element_digest(x) for x in old], [_element_digest(x) for x in new])
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        if tag == "equal":
+            continue
+        if tag == "replace" and i2 - i1 == j2 - j1:
+            for k in reversed(range(i2 - i1)):
+                _diff(old[i1 + k], new[j1 + k], f"{path}/{i1 + k}", ops)
+            continue
+        for i in reversed(range(i1, i2)):
+            ops.append({"op": "remove", "path": f"{path}/{i}", "old": old[i]})
+        for k, j in enumerate(range(j1, j2)):
+            ops.append({"op": "add", "path": f"{path}/{i1 + k}", "value": new[j]})
+
+
+def _diff_identity_list(
+    old: List[Dict[str, Any]],
+    new: List[Dict[str, Any]],
+    key: str,
+    path: str,
+    ops: List[Dict[str, Any]],
+) -> None:
+    """Match elements by identity: removals, then adds/moves, then nested edits."""
+    new_ids = {item[key] for item in new}
+    for i in reversed(range(len(old))):
+        if old[i][key] not in new_ids:
+            ops.append({"op": "remove", "path": f"{path}/{i}", "old": old[i]})
+
+    old_by_id = {item[key]: item for item in old if item[key] in new_ids}
+    current = [item[key] for item in old if item[key] in new_ids]
+    for j, item in enumerate(new):
+        ident = item[key]
+        if j < len(current) and current[j] == ident:
+            continue
+        if ident in old_by_id:
+            k = current.index(ident, j)
+            ops.append({"op": "move", "from": f"{path}/{k}", "path": f"{path}/{j}"})
+            current.insert(j, current.pop(k))
+        else:
+            ops.append({"op": "add", "path": f"{path}/{j}", "value": item})
+            current.insert(j, ident)
+
+    for j, item in enumerate(new):
+        previous = old_by_id.get(item[key])
+        if previous is not None:
+            _diff(previous, item, f"{path}/{j}", ops)
+
+
+# =============================================================================
+# Applying patches
+# =============================================================================
+
+def _resolve(doc: Any, path: str):
+    """Return (container, last token) for a JSON Pointer."""
+    tokens = [unescape_pointer(t) for t in path.split("/")[1:]]
+    if not tokens:
+        raise ValueError("Operation on the document root needs a container path")
+    target = doc
+    for token in tokens[:-1]:
+        target = target[int(token)] if isinstance(target, list) else target[token]
+    return target, tokens[-1]
+
+
+def _remove(doc: Any, path: str) -> Any:
+    container, token = _resolve(doc, path)
+    if isinstance(container, list):
+        return container.pop(int(token))
+    return container.pop(token)
+
+
+def _add(doc: Any, path: str, value: Any) -> None:
+    container, token = _resolve(doc, path)
+    if isinstance(container, list):
+        index = len(container) if token == "-" else int(token)
+        container.insert(index, value)
+    else:
+        container[token] = value
+
+
+def apply_patch(doc: Any, ops: List[Dict[str, Any]]) -> Any:
+    """
+    Apply JSON Patch operations to a copy of ``doc``.
+
+    Args:
+        doc: Document to patch (not modified)
+        ops: Operations from ``diff_snapshots`` or ``invert_patch``
+
+    Returns:
+        The patched document
+    """
+    result = copy.deepcopy(doc)
+    for op in ops:
+        kind = op["op"]
+        if op["path"] == "" and kind in ("add", "replace"):
+            result = copy.deepcopy(op["value"])
+        elif kind == "add":
+            _add(result, op["path"], copy.deepcopy(op["value"]))
+        elif kind == "remove":
+            _remove(result, op["path"])
+        elif kind == "replace":
+            container, token = _resolve(result, op["path"])
+            if isinstance(container, list):
+                container[int(token)] = copy.deepcopy(op["value"])
+            else:
+                container[token] = copy.deepcopy(op["value"])
+        elif kind == "move":
+            _add(result, op["path"], _remove(result, op["from"]))
+        else:
+            raise ValueError(f"Unsupported patch operation: {kind}")
+    return result
+
+
+def invert_patch(ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Build the operations that undo ``ops``.
+
+    Args:
+        ops: Operations from ``diff_snapshots``
+
+    Returns:
+        Operations that turn the patched document back into the original
+    """
+    inverse = []
+    for op in reversed(ops):
+        kind = op["op"]
+        if kind == "add":
+            inverse.append({"op": "remove", "path": op["path"], "old": op["value"]})
+        elif kind == "remove":
+            inverse.append({"op": "add", "path": op["path"], "value": op["old"]})
+        elif kind == "replace":
+            inverse.append({"op": "replace", "path": op["path"], "value": op["old"], "old": op["value"]})
+        elif kind == "move":
+            inverse.append({"op": "move", "from": op["path"], "path": op["from"]})
+        else:
+            raise ValueError(f"Unsupported patch operation: {kind}")
+    return inverse
@@ -8,6 +8,7 @@ from .types import (
     VersionHistory, VersionDiff, VersionQuery,
     VersionStats, RollbackPreview
 )
+from .patch import diff_snapshots, unescape_pointer
 from .version_store import VersionStore
 
 
@@ -173,20 +174,22 @@ class VersionManager:
         removed = {}
         modified = {}
 
-        s1 = v1.snapshot
-        s2 = v2.snapshot
-
-        all_keys = set(s1.keys()) | set(s2.keys())
-
-        for key in all_keys:
-            if key not in s1:
-                added[key] = s2[key]
-            elif key not in s2:
-                removed[key] = s1[key]
-            elif s1[key] != s2[key]:
-                modified[key] = {"old": s1[key], "new": s2[key]}
-
-        total = len(added) + len(removed) + len(modified)
+        # path_changes is a JSON Patch that turns v1's snapshot into v2's
+        ops = diff_snapshots(v1.snapshot, v2.snapshot)
+
+        for op in ops:
+            tokens = op["path"].split("/")
+            key = unescape_pointer(tokens[1]) if len(tokens) > 1 else ""
+            if len(tokens) == 2 and op["op"] == "add":
+                added[key] = op["value"]
+            elif len(tokens) == 2 and op["op"] == "remove":
+                removed[key] = op["old"]
+            elif len(tokens) == 2 and op["op"] == "replace":
+                modified[key] = {"old": op["old"], "new": op["value"]}
+            else:
+                # Nested changes are summarized; the details are in path_changes
+                entry = modified.setdefault(key, {"changes": 0})
+                entry["changes"] += 1
 
         return VersionDiff(
             object_type=v1.object_type,
@@ -196,6 +199,7 @@ class VersionManager:
             added=added,
             removed=removed,
             modified=modified,
-            total_changes=total,
+            total_changes=len(ops),
             change_summary=f"{len(added)} added, {len(removed)} removed, {len(modified)} modified",
+            path_changes=ops,
         )
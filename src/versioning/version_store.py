@@ -1,11 +1,29 @@
 """
 Version Store - Persistence layer for version history.
+
+Layout under ``data_dir``:
+- blobs/: content-addressed, gzip-compressed snapshots. Most blobs hold a
+  delta against the previous version's blob; every KEYFRAME_INTERVAL-th
+  link in a chain (or any version whose delta is not much smaller) is
+  stored in full.
+- histories/<object_type>/<object_id>.jsonl: append-only log of version
+  metadata, tag and delete events for one object.
+
+Only metadata is kept in memory; snapshots are loaded on demand through a
+small LRU cache.
 """
+import copy
+import gzip
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
+from urllib.parse import quote
 
+from .delta import apply_delta, compute_delta
 from .types import (
     VersionedObjectType, ChangeType, VersionBump, Version,
     VersionHistory, VersionQuery, VersionStats
@@ -15,15 +33,26 @@ from .types import (
 class VersionStore:
     """Persistence layer for version history."""
 
-    # Threshold for storing snapshots in separate files (10KB)
-    SNAPSHOT_FILE_THRESHOLD = 10000
+    # Every Nth link of a delta chain is stored as a full snapshot
+    KEYFRAME_INTERVAL = 10
+    # Store a delta only if it is at most this fraction of the full snapshot
+    DELTA_MAX_RATIO = 0.5
+    # Materialized snapshots kept in memory
+    SNAPSHOT_CACHE_SIZE = 32
 
     def __init__(self, data_dir: str = "data/versioning"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.snapshots_dir = self.data_dir / "snapshots"
-        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs_dir = self.data_dir / "blobs"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.histories_dir = self.data_dir / "histories"
+        self.histories_dir.mkdir(parents=True, exist_ok=True)
+
         self._histories: Dict[str, VersionHistory] = {}
+        self._refs: Dict[str, str] = {}  # version id -> snapshot blob hash
+        self._depths: Dict[str, int] = {}  # blob hash -> position in its delta chain
+        self._snapshot_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
         self._load()
 
     def _get_key(self, object_type: VersionedObjectType, object_id: str) -> str:
@@ -31,9 +60,13 @@ class VersionStore:
         return f"{object_type.value}:{object_id}"
 
     def _get_history_file(self) -> Path:
-        """Get path to histories file."""
+        """Get path to the legacy single-file histories (migrated on load)."""
         return self.data_dir / "histories.json"
 
+    def _get_log_file(self, object_type: VersionedObjectType, object_id: str) -> Path:
+        """Get path to an object's append-only history log."""
+        return self.histories_dir / object_type.value / f"{quote(object_id, safe='')}.jsonl"
+
     def create_version(
         self,
         object_type: VersionedObjectType,
@@ -53,65 +86,73 @@ class VersionStore:
 
         key = self._get_key(object_type, object_id)
 
-        if key not in self._histories:
-            history = VersionHistory(
+        with self._lock:
+            is_new = key not in self._histories
+            if is_new:
+                history = VersionHistory(
+                    object_type=object_type,
+                    object_id=object_id,
+                    object_name=object_name,
+                    current_version="0.0.0",
+                    current_version_number=0,
+                )
+                self._histories[key] = history
+            else:
+                history = self._histories[key]
+                if object_name:
+                    history.object_name = object_name
+
+            new_version = self._bump_version(history.current_version, version_bump)
+            new_version_number = history.current_version_number + 1
+
+            version = Version(
                 object_type=object_type,
                 object_id=object_id,
-                object_name=object_name,
-                current_version="0.0.0",
-                current_version_number=0,
+                version=new_version,
+                version_number=new_version_number,
+                change_type=change_type,
+                change_description=change_description,
+                changed_by=changed_by,
+                snapshot=snapshot,
+                tags=tags or [],
+                is_major=version_bump == "major",
             )
-            self._histories[key] = history
-        else:
-            history = self._histories[key]
-            if object_name:
-                history.object_name = object_name
-
-        new_version = self._bump_version(history.current_version, version_bump)
-        new_version_number = history.current_version_number + 1
-
-        version = Version(
-            object_type=object_type,
-            object_id=object_id,
-            version=new_version,
-            version_number=new_version_number,
-            change_type=change_type,
-            change_description=change_description,
-            changed_by=changed_by,
-            snapshot=snapshot,
-            tags=tags or [],
-            is_major=version_bump == "major",
-        )
 
-        history.versions.append(version)
-        history.current_version = new_version
-        history.current_version_number = new_version_number
+            base_ref = self._refs.get(history.versions[-1].id) if history.versions else None
+            ref = self._put_snapshot(snapshot, base_ref)
 
-        # Save large snapshots to separate files
-        snapshot_str = json.dumps(snapshot, default=str)
-        if len(snapshot_str) > self.SNAPSHOT_FILE_THRESHOLD:
-            self._save_snapshot_file(object_type, object_id, new_version, snapshot)
+            history.versions.append(version.model_copy(update={"snapshot": {}}))
+            history.current_version = new_version
+            history.current_version_number = new_version_number
+            self._refs[version.id] = ref
 
-        self._save()
+            if is_new:
+                self._append_event(history, self._history_event(history))
+            self._append_event(history, {
+                "op": "version",
+                "ref": ref,
+                "object_name": object_name,
+                "version": version.model_dump(mode="json", exclude={"snapshot"}),
+            })
         return version
 
     def get_version(self, object_type: VersionedObjectType, object_id: str, version: Optional[str] = None) -> Optional[Version]:
         """Get a specific version or latest."""
-        key = self._get_key(object_type, object_id)
-        history = self._histories.get(key)
-        if not history or not history.versions:
-            return None
-        if version is None:
-            return history.versions[-1]
-        for v in history.versions:
-            if v.version == version:
-                return v
-        return None
+        stored = self._find_version(object_type, object_id, version)
+        return self._with_snapshot(stored) if stored else None
 
-    def get_history(self, object_type: VersionedObjectType, object_id: str) -> Optional[VersionHistory]:
-        """Get full version history for an object."""
+    def get_history(
+        self,
+        object_type: VersionedObjectType,
+        object_id: str,
+        load_snapshots: bool = True,
+    ) -> Optional[VersionHistory]:
+        """Get full version history for an object (snapshots only if requested)."""
         key = self._get_key(object_type, object_id)
-        return self._histories.get(key)
+        history = self._histories.get(key)
+        if not history or not load_snapshots:
+            return history
+        return history.model_copy(update={"versions": [self._with_snapshot(v) for v in history.versions]})
 
     def list_versions(self, object_type: VersionedObjectType, object_id: str, limit: int = 20) -> List[Version]:
         """List versions for an object."""
@@ -119,7 +160,7 @@ class VersionStore:
         history = self._histories.get(key)
         if not history:
             return []
-        return list(reversed(history.versions[-limit:]))
+        return [self._with_snapshot(v) for v in reversed(history.versions[-limit:])]
 
     def search_versions(self, query: VersionQuery) -> List[Version]:
         """Search versions across all objects."""
@@ -138,43 +179,48 @@ class VersionStore:
                     continue
                 results.append(version)
         results.sort(key=lambda v: v.changed_at, reverse=True)
-        return results[:query.limit]
+        return [self._with_snapshot(v) for v in results[:query.limit]]
 
     def add_tag(self, object_type: VersionedObjectType, object_id: str, version: str, tag: str) -> bool:
         """Add a tag to a version."""
-        v = self.get_version(object_type, object_id, version)
-        if v and tag not in v.tags:
-            v.tags.append(tag)
-            self._save()
-            return True
+        with self._lock:
+            v = self._find_version(object_type, object_id, version)
+            if v and tag not in v.tags:
+                v.tags.append(tag)
+                self._append_tags(object_type, object_id, v)
+                return True
         return False
 
     def remove_tag(self, object_type: VersionedObjectType, object_id: str, version: str, tag: str) -> bool:
         """Remove a tag from a version."""
-        v = self.get_version(object_type, object_id, version)
-        if v and tag in v.tags:
-            v.tags.remove(tag)
-            self._save()
-            return True
+        with self._lock:
+            v = self._find_version(object_type, object_id, version)
+            if v and tag in v.tags:
+                v.tags.remove(tag)
+                self._append_tags(object_type, object_id, v)
+                return True
         return False
 
     def delete_version(self, object_type: VersionedObjectType, object_id: str, version: str) -> bool:
         """Delete a specific version."""
         key = self._get_key(object_type, object_id)
-        history = self._histories.get(key)
-        if not history:
-            return False
-        for i, v in enumerate(history.versions):
-            if v.version == version:
-                history.versions.pop(i)
-                if history.versions:
-                    history.current_version = history.versions[-1].version
-                    history.current_version_number = history.versions[-1].version_number
-                else:
-                    history.current_version = "0.0.0"
-                    history.current_version_number = 0
-                self._save()
-                return True
+        with self._lock:
+            history = self._histories.get(key)
+            if not history:
+                return False
+            for i, v in enumerate(history.versions):
+                if v.version == version:
+                    history.versions.pop(i)
+                    if history.versions:
+                        history.current_version = history.versions[-1].version
+                        history.current_version_number = history.versions[-1].version_number
+                    else:
+                        history.current_version = "0.0.0"
+                        history.current_version_number = 0
+                    # Blobs stay: later versions may be stored as deltas against it
+                    self._refs.pop(v.id, None)
+                    self._rewrite_log(history)
+                    return True
         return False
 
     def get_stats(self) -> VersionStats:
@@ -206,50 +252,230 @@ class VersionStore:
         else:
             return f"{parts[0]}.{parts[1]}.{parts[2] + 1}"
 
-    def _save_snapshot_file(
-        self,
-        object_type: VersionedObjectType,
-        object_id: str,
-        version: str,
-        snapshot: Dict[str, Any],
-    ) -> None:
-        """Save large snapshot to separate file."""
-        snapshot_dir = self.snapshots_dir / object_type.value / object_id
-        snapshot_dir.mkdir(parents=True, exist_ok=True)
-        snapshot_file = snapshot_dir / f"v{version}.json"
-        with open(snapshot_file, "w", encoding="utf-8") as f:
-            json.dump(snapshot, f, indent=2, default=str)
-
-    def _load_snapshot_file(
+    def _find_version(
         self,
         object_type: VersionedObjectType,
         object_id: str,
-        version: str,
-    ) -> Optional[Dict[str, Any]]:
-        """Load snapshot from file if it exists."""
-        snapshot_file = self.snapshots_dir / object_type.value / object_id / f"v{version}.json"
-        if snapshot_file.exists():
-            with open(snapshot_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+        version: Optional[str] = None,
+    ) -> Optional[Version]:
+        """Find the stored (snapshot-less) version record."""
+        key = self._get_key(object_type, object_id)
+        history = self._histories.get(key)
+        if not history or not history.versions:
+            return None
+        if version is None:
+            return history.versions[-1]
+        for v in history.versions:
+            if v.version == version:
+                return v
         return None
 
-    def _save(self) -> None:
-        """Persist to disk."""
-        data = {}
-        for key, history in self._histories.items():
-            data[key] = history.model_dump(mode="json")
-        with open(self._get_history_file(), "w") as f:
-            json.dump(data, f, indent=2, default=str)
+    def _with_snapshot(self, version: Version) -> Version:
+        """Copy of a stored version record with its snapshot loaded."""
+        ref = self._refs.get(version.id)
+        snapshot = self.load_snapshot(ref) if ref else None
+        return version.model_copy(update={"snapshot": snapshot or {}})
+
+    # =========================================================================
+    # Snapshot blobs
+    # =========================================================================
+
+    def _blob_path(self, ref: str) -> Path:
+        return self.blobs_dir / ref[:2] / f"{ref}.json.gz"
+
+    @staticmethod
+    def _snapshot_hash(snapshot: Dict[str, Any]) -> str:
+        text = json.dumps(snapshot, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _read_blob(self, ref: str) -> Dict[str, Any]:
+        with gzip.open(self._blob_path(ref), "rt", encoding="utf-8") as f:
+            blob = json.load(f)
+        self._depths[ref] = blob.get("depth", 0)
+        return blob
+
+    def _write_blob(self, ref: str, blob: Dict[str, Any]) -> None:
+        path = self._blob_path(ref)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(blob, f, separators=(",", ":"), default=str)
+        os.replace(tmp, path)
+        self._depths[ref] = blob.get("depth", 0)
+
+    def _chain_depth(self, ref: str) -> int:
+        if ref not in self._depths:
+            self._read_blob(ref)
+        return self._depths[ref]
+
+    def _put_snapshot(self, snapshot: Dict[str, Any], base_ref: Optional[str]) -> str:
+        """Store a snapshot blob (as a delta against ``base_ref`` when worthwhile)."""
+        # Round-trip through JSON so stored and restored snapshots compare equal
+        snapshot = json.loads(json.dumps(snapshot, default=str))
+        ref = self._snapshot_hash(snapshot)
+        if self._blob_path(ref).exists():
+            return ref
+
+        blob: Dict[str, Any] = {"depth": 0, "data": snapshot}
+        if base_ref and self.KEYFRAME_INTERVAL > 1:
+            try:
+                depth = self._chain_depth(base_ref) + 1
+                base = self.load_snapshot(base_ref) if depth < self.KEYFRAME_INTERVAL else None
+            except (OSError, ValueError):
+                base = None
+            if base is not None:
+                delta = compute_delta(base, snapshot)
+                full_size = len(json.dumps(snapshot, default=str))
+                if len(json.dumps(delta, default=str)) <= full_size * self.DELTA_MAX_RATIO:
+                    blob = {"depth": depth, "base": base_ref, "delta": delta}
+
+        self._write_blob(ref, blob)
+        self._cache_snapshot(ref, snapshot)
+        return ref
+
+    def load_snapshot(self, ref: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a snapshot by blob hash, replaying its delta chain if needed.
+
+        Returns a private copy, or None if the blob is missing or unreadable.
+        """
+        with self._lock:
+            chain: List[tuple] = []
+            current: Optional[str] = ref
+            snapshot = None
+            try:
+                while current is not None:
+                    if current in self._snapshot_cache:
+                        self._snapshot_cache.move_to_end(current)
+                        snapshot = self._snapshot_cache[current]
+                        break
+                    blob = self._read_blob(current)
+                    if "data" in blob:
+                        snapshot = blob["data"]
+                        self._cache_snapshot(current, snapshot)
+                        break
+                    chain.append((current, blob))
+                    current = blob["base"]
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: Could not load snapshot {ref}: {e}")
+                return None
+
+            for blob_ref, blob in reversed(chain):
+                snapshot = apply_delta(snapshot, blob["delta"])
+                self._cache_snapshot(blob_ref, snapshot)
+            return copy.deepcopy(snapshot)
+
+    def _cache_snapshot(self, ref: str, snapshot: Dict[str, Any]) -> None:
+        self._snapshot_cache[ref] = snapshot
+        self._snapshot_cache.move_to_end(ref)
+        while len(self._snapshot_cache) > self.SNAPSHOT_CACHE_SIZE:
+            self._snapshot_cache.popitem(last=False)
+
+    # =========================================================================
+    # History logs
+    # =========================================================================
+
+    @staticmethod
+    def _history_event(history: VersionHistory) -> Dict[str, Any]:
+        return {
+            "op": "history",
+            "object_type": history.object_type.value,
+            "object_id": history.object_id,
+            "object_name": history.object_name,
+            "created_at": history.created_at.isoformat(),
+        }
+
+    def _append_event(self, history: VersionHistory, event: Dict[str, Any]) -> None:
+        path = self._get_log_file(history.object_type, history.object_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, default=str) + "\n")
+
+    def _append_tags(self, object_type: VersionedObjectType, object_id: str, version: Version) -> None:
+        history = self._histories[self._get_key(object_type, object_id)]
+        self._append_event(history, {"op": "tags", "id": version.id, "tags": list(version.tags)})
+
+    def _rewrite_log(self, history: VersionHistory) -> None:
+        """Rewrite an object's log with only its live versions."""
+        path = self._get_log_file(history.object_type, history.object_id)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self._history_event(history), default=str) + "\n")
+            for v in history.versions:
+                f.write(json.dumps({
+                    "op": "version",
+                    "ref": self._refs.get(v.id),
+                    "version": v.model_dump(mode="json", exclude={"snapshot"}),
+                }, default=str) + "\n")
+        os.replace(tmp, path)
+
+    def _load_log(self, path: Path) -> None:
+        """Replay one object's history log."""
+        history: Optional[VersionHistory] = None
+        by_id: Dict[str, Version] = {}
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                op = event.get("op")
+                if op == "history":
+                    history = VersionHistory(
+                        object_type=event["object_type"],
+                        object_id=event["object_id"],
+                        object_name=event.get("object_name"),
+                        current_version="0.0.0",
+                        current_version_number=0,
+                        created_at=event["created_at"],
+                    )
+                elif history is None:
+                    continue
+                elif op == "version":
+                    version = Version(**event["version"], snapshot={})
+                    history.versions.append(version)
+                    by_id[version.id] = version
+                    self._refs[version.id] = event["ref"]
+                    if event.get("object_name"):
+                        history.object_name = event["object_name"]
+                elif op == "tags" and event["id"] in by_id:
+                    by_id[event["id"]].tags = list(event["tags"])
+
+        if history is not None:
+            if history.versions:
+                history.current_version = history.versions[-1].version
+                history.current_version_number = history.versions[-1].version_number
+            self._histories[self._get_key(history.object_type, history.object_id)] = history
 
     def _load(self) -> None:
-        """Load from disk."""
+        """Load history metadata from disk (snapshots stay on disk)."""
+        self._migrate_legacy()
+        for path in sorted(self.histories_dir.glob("*/*.jsonl")):
+            try:
+                self._load_log(path)
+            except Exception as e:
+                print(f"Warning: Could not load version history {path.name}: {e}")
+
+    def _migrate_legacy(self) -> None:
+        """Convert a histories.json written by older releases to the log layout."""
         history_file = self._get_history_file()
         if not history_file.exists():
             return
         try:
             with open(history_file, "r") as f:
                 data = json.load(f)
-            for key, hist_data in data.items():
-                self._histories[key] = VersionHistory(**hist_data)
+            for hist_data in data.values():
+                history = VersionHistory(**hist_data)
+                versions, history.versions = history.versions, []
+                self._get_log_file(history.object_type, history.object_id).unlink(missing_ok=True)
+                self._append_event(history, self._history_event(history))
+                base_ref = None
+                for v in versions:
+                    base_ref = self._put_snapshot(v.snapshot, base_ref)
+                    self._append_event(history, {
+                        "op": "version",
+                        "ref": base_ref,
+                        "version": v.model_dump(mode="json", exclude={"snapshot"}),
+                    })
+            history_file.rename(history_file.with_name("histories.json.migrated"))
         except Exception as e:
             print(f"Warning: Could not load version history: {e}")
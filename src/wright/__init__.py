@@ -40,6 +40,7 @@ Components:
 - IDSourceNormalizer: ID_SOURCE alias handling (Phase 31)
 - GroupFilterPrecedenceEngine: Multi-round filtering (Phase 31)
 - DDLDiffComparator: DDL comparison (Phase 31)
+- LocalPipelineExecutor: In-process pipeline execution on local extracts
 """
 
 from .types import (
@@ -65,6 +66,7 @@ from .formula_engine import (
     create_standard_los_formulas,
 )
 from .cortex_discovery import CortexDiscoveryAgent
+from .local_executor import LocalPipelineExecutor
 from .mcp_tools import register_mart_factory_tools
 
 # Phase 31 enhancements
@@ -120,6 +122,7 @@ __all__ = [
     "FormulaPrecedenceEngine",
     "create_standard_los_formulas",
     "CortexDiscoveryAgent",
+    "LocalPipelineExecutor",
     # Phase 31: Quality Validation
     "HierarchyQualityValidator",
     "HierarchyValidationResult",
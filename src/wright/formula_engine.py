@@ -5,17 +5,21 @@ Manages 5-level formula precedence for data mart calculations:
 - Extract formula definitions from hierarchy data
 - Build precedence chains
 - Generate calculation SQL
+- Evaluate the cascade locally on a DataFrame
 - Validate formula dependencies
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .types import (
     FormulaPrecedence,
     FormulaLogic,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -307,6 +311,95 @@ class FormulaPrecedenceEngine:
             "levels_used": sorted(set(f.precedence_level for f in formulas)),
         }
 
+    def evaluate_cascade(
+        self,
+        base: "pd.DataFrame",
+        formulas: List[FormulaPrecedence],
+        measure_prefix: str = "GROSS",
+    ) -> "pd.DataFrame":
+        """
+        Evaluate the 5-level cascade on DT_3A-shaped data.
+
+        Each level aggregates its source rows once per FORMULA_GROUP and
+        computes every formula at that level from those totals, so the
+        cost is one groupby per level rather than one scan per formula.
+        Calculated rows are appended with IS_CALCULATED = 1 and are
+        visible to higher levels.
+
+        Args:
+            base: Rows with FORMULA_GROUP and <prefix>_AMOUNT/VOLUME/MCFE
+            formulas: Formula definitions
+            measure_prefix: Column name prefix
+
+        Returns:
+            Base rows followed by the calculated rows of each level
+        """
+        import numpy as np
+        import pandas as pd
+
+        measures = [f"{measure_prefix}_{m}" for m in ("AMOUNT", "VOLUME", "MCFE")]
+        frame = base.copy()
+        if "IS_CALCULATED" not in frame.columns:
+            frame["IS_CALCULATED"] = 0
+        frame[measures] = frame[measures].apply(pd.to_numeric, errors="coerce").fillna(0.0)
+
+        chain = self.build_precedence_chain(formulas)
+        for level in range(1, 6):
+            if not chain[level]:
+                continue
+
+            totals = frame.groupby("FORMULA_GROUP", sort=False)[measures].sum()
+            rows = []
+            for formula in chain[level]:
+                refs = self._formula_refs(formula)
+                values = totals.reindex(refs).to_numpy(dtype=float)
+                found = ~np.isnan(values[:, 0])
+                values = np.nan_to_num(values)
+
+                logic = formula.logic
+                if not refs:
+                    result = np.zeros(len(measures))
+                elif logic == FormulaLogic.SUBTRACT:
+                    result = values[0] - values[1:].sum(axis=0)
+                elif logic == FormulaLogic.MULTIPLY:
+                    factors = np.where(found[1:], values[1:, 0], 1.0)
+                    result = np.array([values[0, 0] * factors.prod(), 0.0, 0.0])
+                elif logic == FormulaLogic.DIVIDE:
+                    denominator = values[1:, 0].prod() if len(refs) > 1 else 0.0
+                    amount = values[0, 0] / denominator if denominator else 0.0
+                    result = np.array([amount, 0.0, 0.0])
+                elif logic == FormulaLogic.AVERAGE:
+                    selected = frame.loc[frame["FORMULA_GROUP"].isin(refs), measures]
+                    result = selected.mean().fillna(0.0).to_numpy()
+                else:
+                    result = values.sum(axis=0)
+
+                row = {
+                    "FK_REPORT_KEY": formula.hierarchy_key or f"CALC_{formula.formula_group}",
+                    "FORMULA_GROUP": formula.formula_group,
+                    "FORMULA_PRECEDENCE": formula.precedence_level,
+                    "FORMULA_PARAM_REF": formula.param_ref,
+                    "FORMULA_LOGIC": formula.logic.value,
+                    "FORMULA_PARAM2_REF": formula.param2_ref or "",
+                    "IS_CALCULATED": 1,
+                }
+                row.update(zip(measures, result.tolist()))
+                rows.append(row)
+
+            calculated = pd.DataFrame(rows).reindex(columns=frame.columns)
+            frame = pd.concat([frame, calculated], ignore_index=True)
+
+        return frame
+
+    @staticmethod
+    def _formula_refs(formula: FormulaPrecedence) -> List[str]:
+        """Referenced formula groups in order (param_ref first)."""
+        refs = [formula.param_ref]
+        if formula.param2_ref:
+            refs.extend(p.strip() for p in str(formula.param2_ref).split(","))
+        refs.extend(formula.additional_params)
+        return [r for r in refs if r]
+
     def get_formulas(self, project_name: str = "default") -> List[FormulaPrecedence]:
         """Get stored formulas for a project."""
         return self._formulas.get(project_name, [])
@@ -317,99 +410,90 @@ class FormulaPrecedenceEngine:
         source_table: str,
         measure_prefix: str,
     ) -> str:
-        """Generate SQL for a single formula calculation."""
+        """
+        Generate SQL for a single formula calculation.
+
+        References follow _formula_refs (param_ref, every comma-separated
+        param2_ref, then additional_params), and each formula aggregates
+        to exactly one row, matching evaluate_cascade.
+        """
         logic = formula.logic
+        refs = self._formula_refs(formula)
+        measures = [f"{measure_prefix}_{m}" for m in ("AMOUNT", "VOLUME", "MCFE")]
+
+        def ref_sum(measure: str, ref: str, default: str = "0") -> str:
+            return (
+                f"COALESCE(SUM(CASE WHEN FORMULA_GROUP = {_sql_literal(ref)} "
+                f"THEN {measure} END), {default})"
+            )
 
         # Build measure expressions based on logic type
-        if logic == FormulaLogic.SUM:
-            amount_expr = f"SUM({measure_prefix}_AMOUNT)"
-            volume_expr = f"SUM({measure_prefix}_VOLUME)"
-            mcfe_expr = f"SUM({measure_prefix}_MCFE)"
-            where_clause = f"WHERE FORMULA_GROUP IN ('{formula.param_ref}')"
+        if not refs:
+            exprs = ["0", "0", "0"]
 
         elif logic == FormulaLogic.SUBTRACT:
-            # Subtract: param_ref - param2_ref
-            amount_expr = f"""(
-        SELECT SUM({measure_prefix}_AMOUNT) FROM {source_table}
-        WHERE FORMULA_GROUP = '{formula.param_ref}'
-    ) - (
-        SELECT COALESCE(SUM({measure_prefix}_AMOUNT), 0) FROM {source_table}
-        WHERE FORMULA_GROUP = '{formula.param2_ref}'
-    )"""
-            volume_expr = f"""(
-        SELECT SUM({measure_prefix}_VOLUME) FROM {source_table}
-        WHERE FORMULA_GROUP = '{formula.param_ref}'
-    ) - (
-        SELECT COALESCE(SUM({measure_prefix}_VOLUME), 0) FROM {source_table}
-        WHERE FORMULA_GROUP = '{formula.param2_ref}'
-    )"""
-            mcfe_expr = f"""(
-        SELECT SUM({measure_prefix}_MCFE) FROM {source_table}
-        WHERE FORMULA_GROUP = '{formula.param_ref}'
-    ) - (
-        SELECT COALESCE(SUM({measure_prefix}_MCFE), 0) FROM {source_table}
-        WHERE FORMULA_GROUP = '{formula.param2_ref}'
-    )"""
-            where_clause = ""
+            # Subtract: param_ref - (each param2_ref / additional param)
+            exprs = [
+                " - ".join(ref_sum(m, ref) for ref in refs)
+                for m in measures
+            ]
 
         elif logic == FormulaLogic.MULTIPLY:
-            amount_expr = f"""(
-        SELECT SUM({measure_prefix}_AMOUNT) FROM {source_table}
-        WHERE FORMULA_GROUP = '{formula.param_ref}'
-    ) * (
-        SELECT COALESCE(SUM({measure_prefix}_AMOUNT), 1) FROM {source_table}
-        WHERE FORMULA_GROUP = '{formula.param2_ref}'
-    )"""
-            volume_expr = f"0"
-            mcfe_expr = f"0"
-            where_clause = ""
+            # Missing multipliers count as 1
+            amount = measures[0]
+            factors = [ref_sum(amount, refs[0])] + [ref_sum(amount, ref, "1") for ref in refs[1:]]
+            exprs = [" * ".join(factors), "0", "0"]
 
         elif logic == FormulaLogic.DIVIDE:
-            amount_expr = f"""CASE
-        WHEN (SELECT SUM({measure_prefix}_AMOUNT) FROM {source_table}
-              WHERE FORMULA_GROUP = '{formula.param2_ref}') = 0 THEN 0
-        ELSE (
-            SELECT SUM({measure_prefix}_AMOUNT) FROM {source_table}
-            WHERE FORMULA_GROUP = '{formula.param_ref}'
-        ) / NULLIF((
-            SELECT SUM({measure_prefix}_AMOUNT) FROM {source_table}
-            WHERE FORMULA_GROUP = '{formula.param2_ref}'
-        ), 0)
-    END"""
-            volume_expr = f"0"
-            mcfe_expr = f"0"
-            where_clause = ""
+            amount = measures[0]
+            if len(refs) > 1:
+                denominator = " * ".join(ref_sum(amount, ref) for ref in refs[1:])
+                exprs = [
+                    f"CASE WHEN {denominator} = 0 THEN 0 "
+                    f"ELSE {ref_sum(amount, refs[0])} / ({denominator}) END",
+                    "0",
+                    "0",
+                ]
+            else:
+                exprs = ["0", "0", "0"]
 
         elif logic == FormulaLogic.AVERAGE:
-            amount_expr = f"AVG({measure_prefix}_AMOUNT)"
-            volume_expr = f"AVG({measure_prefix}_VOLUME)"
-            mcfe_expr = f"AVG({measure_prefix}_MCFE)"
-            where_clause = f"WHERE FORMULA_GROUP = '{formula.param_ref}'"
+            # Average over every row of the referenced groups
+            exprs = [f"COALESCE(AVG(COALESCE({m}, 0)), 0)" for m in measures]
 
         else:
-            # Default to SUM
-            amount_expr = f"SUM({measure_prefix}_AMOUNT)"
-            volume_expr = f"SUM({measure_prefix}_VOLUME)"
-            mcfe_expr = f"SUM({measure_prefix}_MCFE)"
-            where_clause = f"WHERE FORMULA_GROUP = '{formula.param_ref}'"
+            # SUM (and unknown logic): total of all referenced groups
+            exprs = [
+                " + ".join(ref_sum(m, ref) for ref in refs)
+                for m in measures
+            ]
+
+        where_clause = ""
+        if refs:
+            where_clause = f"WHERE FORMULA_GROUP IN ({', '.join(_sql_literal(ref) for ref in refs)})"
 
         return f"""SELECT
-    '{formula.hierarchy_key or "CALC_" + formula.formula_group}' AS FK_REPORT_KEY,
+    {_sql_literal(formula.hierarchy_key or "CALC_" + formula.formula_group)} AS FK_REPORT_KEY,
     NULL AS LEVEL_1, NULL AS LEVEL_2, NULL AS LEVEL_3, NULL AS LEVEL_4, NULL AS LEVEL_5,
     NULL AS LEVEL_6, NULL AS LEVEL_7, NULL AS LEVEL_8, NULL AS LEVEL_9,
-    '{formula.formula_group}' AS FORMULA_GROUP,
+    {_sql_literal(formula.formula_group)} AS FORMULA_GROUP,
     {formula.precedence_level} AS FORMULA_PRECEDENCE,
-    '{formula.param_ref}' AS FORMULA_PARAM_REF,
+    {_sql_literal(formula.param_ref)} AS FORMULA_PARAM_REF,
     '{formula.logic.value}' AS FORMULA_LOGIC,
-    '{formula.param2_ref or ""}' AS FORMULA_PARAM2_REF,
-    {amount_expr} AS {measure_prefix}_AMOUNT,
-    {volume_expr} AS {measure_prefix}_VOLUME,
-    {mcfe_expr} AS {measure_prefix}_MCFE,
+    {_sql_literal(formula.param2_ref or "")} AS FORMULA_PARAM2_REF,
+    {exprs[0]} AS {measure_prefix}_AMOUNT,
+    {exprs[1]} AS {measure_prefix}_VOLUME,
+    {exprs[2]} AS {measure_prefix}_MCFE,
     1 AS IS_CALCULATED
 FROM {source_table}
 {where_clause}"""
 
 
+def _sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
 def create_standard_los_formulas(
     report_type: str = "GROSS",
 ) -> List[FormulaPrecedence]:
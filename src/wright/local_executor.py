@@ -0,0 +1,527 @@
+"""
+Local Pipeline Executor.
+
+Runs the 4-object mart pipeline in-process on local extracts, so a
+MartConfig can be validated and regression-tested without a warehouse:
+- VW_1: Join mapping to hierarchy, resolve ID_SOURCE to RESOLVED_VALUE
+- DT_2: Drop calculated/excluded rows, derive join filter columns
+- DT_3A: One join per JoinPattern against the fact extract, SUM by key
+- DT_3: Formula cascade, DENSE_RANK surrogate keys, level backfill
+
+Every stage is a vectorized pandas operation that mirrors the SQL
+produced by MartPipelineGenerator. Sources may be DataFrames, lists of
+row dicts, or CSV/JSON/Parquet paths. DuckDB (optional) is used to read
+Parquet without pyarrow and to evaluate JoinPattern.filter predicates.
+"""
+
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .formula_engine import FormulaPrecedenceEngine
+from .types import (
+    FormulaPrecedence,
+    MartConfig,
+    PipelineLayer,
+    PipelineValidationResult,
+)
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+LEVEL_COLUMNS = [f"LEVEL_{i}" for i in range(1, 10)]
+FORMULA_COLUMNS = [
+    "FORMULA_GROUP",
+    "FORMULA_PRECEDENCE",
+    "FORMULA_PARAM_REF",
+    "FORMULA_LOGIC",
+    "FORMULA_PARAM2_REF",
+]
+FILTER_GROUP_COLUMNS = [f"FILTER_GROUP_{i}" for i in range(1, 5)]
+GROUP_COLUMNS = ["FK_REPORT_KEY"] + LEVEL_COLUMNS + FORMULA_COLUMNS
+TRUE_VALUES = {"TRUE", "T", "Y", "YES", "1"}
+FALSE_VALUES = {"FALSE", "F", "N", "NO", "0"}
+
+
+def object_names(config: MartConfig) -> Dict[str, str]:
+    """Pipeline object names by layer, as generated by MartPipelineGenerator."""
+    project = config.project_name.upper()
+    return {
+        PipelineLayer.VW_1.value: f"VW_1_{project}_TRANSLATED",
+        PipelineLayer.DT_2.value: f"DT_2_{project}_GRANULARITY",
+        PipelineLayer.DT_3A.value: f"DT_3A_{project}",
+        PipelineLayer.DT_3.value: f"DT_3_{project}",
+    }
+
+
+def load_table(source: Any) -> pd.DataFrame:
+    """
+    Load a local extract as a DataFrame with upper-cased column names.
+
+    Args:
+        source: DataFrame, list of row dicts, or CSV/JSON/Parquet path
+
+    Returns:
+        DataFrame
+    """
+    if isinstance(source, pd.DataFrame):
+        df = source.copy()
+    elif isinstance(source, list):
+        df = pd.DataFrame(source)
+    else:
+        path = Path(source)
+        suffix = path.suffix.lower()
+        if suffix == ".parquet":
+            if DUCKDB_AVAILABLE:
+                df = duckdb.read_parquet(str(path)).df()
+            else:
+                df = pd.read_parquet(path)
+        elif suffix == ".json":
+            df = pd.read_json(path)
+        else:
+            df = pd.read_csv(path)
+
+    df.columns = [str(c).upper() for c in df.columns]
+    return df
+
+
+def _flag(df: pd.DataFrame, column: str) -> pd.Series:
+    """Boolean flag column; missing columns and NULLs compare as FALSE."""
+    if column not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype="boolean")
+    values = df[column]
+    if values.dtype == bool:
+        return values.astype("boolean")
+    text = values.astype(str).str.strip().str.upper()
+    result = pd.Series(pd.NA, index=df.index, dtype="boolean")
+    result[text.isin(TRUE_VALUES)] = True
+    result[text.isin(FALSE_VALUES)] = False
+    result[values.isna()] = pd.NA
+    return result
+
+
+def _is_true(df: pd.DataFrame, column: str) -> pd.Series:
+    """SQL ``column = TRUE``."""
+    return _flag(df, column).eq(True).fillna(False).astype(bool)
+
+
+def _is_false(df: pd.DataFrame, column: str) -> pd.Series:
+    """SQL ``column = FALSE``."""
+    return _flag(df, column).eq(False).fillna(False).astype(bool)
+
+
+def _with_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Select columns in order, adding missing ones as NULL."""
+    return df.reindex(columns=columns)
+
+
+def _align_keys(left: pd.DataFrame, right: pd.DataFrame,
+                left_keys: List[str], right_keys: List[str]) -> None:
+    """Cast join keys to strings where the two sides disagree on type."""
+    for lk, rk in zip(left_keys, right_keys):
+        if left[lk].dtype != right[rk].dtype:
+            left[lk] = left[lk].astype("string")
+            right[rk] = right[rk].astype("string")
+
+
+def _sql_to_query(expression: str) -> str:
+    """Translate a simple SQL predicate to DataFrame.query syntax."""
+    expr = expression.replace("<>", "!=")
+    expr = re.sub(r"(?<![<>!=])=(?!=)", "==", expr)
+    for word, replacement in (("AND", "and"), ("OR", "or"), ("NOT", "not"),
+                              ("TRUE", "True"), ("FALSE", "False")):
+        expr = re.sub(rf"\b{word}\b", replacement, expr, flags=re.IGNORECASE)
+    return expr
+
+
+def apply_sql_filter(df: pd.DataFrame, expression: str) -> pd.DataFrame:
+    """
+    Keep the rows matching a SQL WHERE predicate.
+
+    Uses DuckDB when installed; otherwise simple comparisons joined by
+    AND/OR are translated to DataFrame.query.
+
+    Args:
+        df: Rows to filter
+        expression: SQL predicate, e.g. "ROYALTY_FILTER = 'Y'"
+
+    Returns:
+        Filtered DataFrame
+    """
+    expression = re.sub(r"\b(DT2|FACT)\.", "", expression)
+    if df.empty:
+        return df
+
+    if DUCKDB_AVAILABLE:
+        frame = df.reset_index(drop=True).assign(__ROW_ID=lambda d: np.arange(len(d)))
+        con = duckdb.connect()
+        try:
+            con.register("branch", frame)
+            rows = con.execute(f"SELECT __ROW_ID FROM branch WHERE {expression}").fetchnumpy()["__ROW_ID"]
+        finally:
+            con.close()
+        return df.iloc[np.sort(rows)]
+
+    return df.query(_sql_to_query(expression), engine="python")
+
+
+class LocalPipelineExecutor:
+    """Executes a mart pipeline in-process against local extracts."""
+
+    def __init__(self, formula_engine: Optional[FormulaPrecedenceEngine] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            formula_engine: Engine used for the DT_3 cascade
+        """
+        self.formula_engine = formula_engine or FormulaPrecedenceEngine()
+        self.stage_stats: Dict[str, Dict[str, Any]] = {}
+        self.warnings: List[str] = []
+        self.last_outputs: Dict[str, pd.DataFrame] = {}
+
+    # ----------------------------------------
+    # Sources
+    # ----------------------------------------
+
+    def resolve_sources(self, config: MartConfig, sources: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+        """
+        Map the config's tables to loaded extracts.
+
+        Keys in ``sources`` may be the table names used in the config (fully
+        qualified or not, case-insensitive) or the roles "mapping",
+        "hierarchy" and "fact". Dimension tables are optional.
+
+        Returns:
+            Dict with "mapping", "hierarchy", "fact" and "dim:<table>" frames
+
+        Raises:
+            ValueError: If a required extract is missing
+        """
+        by_name = {str(k).upper(): v for k, v in sources.items()}
+
+        def find(role: str, table: Optional[str]) -> Optional[Any]:
+            candidates = [role.upper()]
+            if table:
+                candidates = [table.upper(), table.split(".")[-1].upper()] + candidates
+            for key in candidates:
+                if key in by_name:
+                    return by_name[key]
+            return None
+
+        fact_table = config.fact_table or "FACT_FINANCIAL_ACTUALS"
+        resolved: Dict[str, pd.DataFrame] = {}
+        for role, table in (("mapping", config.mapping_table),
+                            ("hierarchy", config.hierarchy_table),
+                            ("fact", fact_table)):
+            source = find(role, table)
+            if source is None:
+                raise ValueError(f"No local extract for {role} table '{table}'")
+            resolved[role] = load_table(source)
+
+        for mapping in config.dynamic_column_map:
+            table = mapping.dimension_table
+            if table and f"dim:{table}" not in resolved:
+                source = find(table, table)
+                if source is not None:
+                    resolved[f"dim:{table}"] = load_table(source)
+
+        return resolved
+
+    # ----------------------------------------
+    # Stages
+    # ----------------------------------------
+
+    def run_vw1(
+        self,
+        config: MartConfig,
+        mapping: pd.DataFrame,
+        hierarchy: pd.DataFrame,
+        dimensions: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> pd.DataFrame:
+        """VW_1: mapping joined to active hierarchy rows with RESOLVED_VALUE."""
+        mapping = mapping.copy()
+        hierarchy = hierarchy[_is_true(hierarchy, "ACTIVE_FLAG")].copy()
+        _align_keys(mapping, hierarchy, ["FK_REPORT_KEY"], ["HIERARCHY_ID"])
+        df = mapping.merge(
+            hierarchy, left_on="FK_REPORT_KEY", right_on="HIERARCHY_ID",
+            how="inner", suffixes=("", "_HIER"),
+        )
+
+        for table, dim in (dimensions or {}).items():
+            alias = table.split("_")[-1][:4].upper()
+            dim = dim.add_prefix(f"{alias}.")
+            _align_keys(df, dim, ["ID"], [f"{alias}.ID"])
+            df = df.merge(dim, left_on="ID", right_on=f"{alias}.ID", how="left")
+
+        resolved = pd.Series(None, index=df.index, dtype=object)
+        id_source = df["ID_SOURCE"] if "ID_SOURCE" in df.columns else pd.Series(None, index=df.index)
+        for column_map in config.dynamic_column_map:
+            column = self._find_column(df, column_map.physical_column)
+            if column is None:
+                self.warnings.append(
+                    f"VW_1: column '{column_map.physical_column}' for ID_SOURCE "
+                    f"'{column_map.id_source}' not found in local extracts"
+                )
+                continue
+            mask = id_source == column_map.id_source
+            resolved = resolved.mask(mask, df[column])
+        df["RESOLVED_VALUE"] = resolved
+
+        columns = (
+            ["FK_REPORT_KEY", "ID", "ID_NAME", "ID_SOURCE", "ID_TABLE", "EXCLUSION_FLAG"]
+            + FILTER_GROUP_COLUMNS
+            + (["GROUP_FILTER_PRECEDENCE"] if config.has_group_filter_precedence else [])
+            + ["RESOLVED_VALUE"] + LEVEL_COLUMNS + FORMULA_COLUMNS
+            + ["ACTIVE_FLAG", "CALCULATION_FLAG"]
+            + (["SIGN_CHANGE_FLAG"] if config.has_sign_change else [])
+            + ["INCLUDE_FLAG", "EXCLUDE_FLAG"]
+        )
+        return _with_columns(df, columns)
+
+    def run_dt2(self, config: MartConfig, vw1: pd.DataFrame) -> pd.DataFrame:
+        """DT_2: one row per FK_REPORT_KEY with join filter columns."""
+        rows = vw1[_is_false(vw1, "CALCULATION_FLAG") & _is_false(vw1, "EXCLUSION_FLAG")]
+
+        if config.has_exclusions:
+            excluded = vw1.loc[_is_true(vw1, "EXCLUSION_FLAG"), ["FK_REPORT_KEY", "RESOLVED_VALUE"]]
+            if not excluded.empty:
+                keys = pd.MultiIndex.from_frame(excluded.dropna().drop_duplicates())
+                current = pd.MultiIndex.from_frame(rows[["FK_REPORT_KEY", "RESOLVED_VALUE"]])
+                rows = rows[~current.isin(keys)]
+
+        fg1 = rows["FILTER_GROUP_1"].astype("string")
+        value = rows["RESOLVED_VALUE"]
+        work = pd.DataFrame({
+            "FK_REPORT_KEY": rows["FK_REPORT_KEY"],
+            "LOS_ACCOUNT_ID_FILTER": value.where(rows["FILTER_GROUP_1"].notna()),
+            "LOS_DEDUCT_CODE_FILTER": value.where(
+                rows["FILTER_GROUP_2"].notna() & fg1.str.contains("Deduct", regex=False).fillna(False)
+            ),
+            "LOS_PRODUCT_CODE_FILTER": value.where(
+                rows["FILTER_GROUP_3"].notna() | fg1.str.contains("Product", regex=False).fillna(False)
+            ),
+            "ROYALTY_FILTER": pd.Series("Y", index=rows.index).where(
+                fg1.str.contains("Royalt", regex=False).fillna(False)
+            ),
+        })
+        for column in LEVEL_COLUMNS + FORMULA_COLUMNS:
+            work[column] = rows[column]
+        work["CALCULATION_FLAG"] = _is_true(rows, "CALCULATION_FLAG")
+        if config.has_sign_change:
+            work["SIGN_CHANGE_FLAG"] = _is_true(rows, "SIGN_CHANGE_FLAG")
+
+        return work.groupby("FK_REPORT_KEY", sort=False, dropna=False).max().reset_index()
+
+    def run_dt3a(self, config: MartConfig, dt2: pd.DataFrame, fact: pd.DataFrame) -> pd.DataFrame:
+        """DT_3A: fact measures summed per hierarchy key across join branches."""
+        prefix = config.effective_measure_prefix
+        measures = [f"{prefix}_AMOUNT", f"{prefix}_VOLUME", f"{prefix}_MCFE"]
+
+        if not config.join_patterns:
+            df = _with_columns(dt2, GROUP_COLUMNS)
+            for measure in measures:
+                df[measure] = 0
+            df["JOIN_BRANCHES"] = "none"
+            return df
+
+        if "ACCOUNT_SEGMENT" not in fact.columns:
+            raise ValueError("Fact extract has no ACCOUNT_SEGMENT column")
+        fact = fact[fact["ACCOUNT_SEGMENT"] == config.account_segment]
+        fact = fact.assign(**{
+            measure: pd.to_numeric(fact[source], errors="coerce") if source in fact.columns else 0.0
+            for measure, source in zip(measures, ("AMOUNT", "VOLUME", "MCFE"))
+        })
+
+        branches = []
+        for pattern in config.join_patterns:
+            left, right = dt2.copy(), fact.copy()
+            missing = [k for k in pattern.join_keys if k not in left.columns]
+            missing += [k for k in pattern.fact_keys if k not in right.columns]
+            if missing:
+                raise ValueError(f"Join pattern '{pattern.name}' references unknown columns: {missing}")
+            _align_keys(left, right, pattern.join_keys, pattern.fact_keys)
+            joined = left.merge(
+                right, left_on=pattern.join_keys, right_on=pattern.fact_keys,
+                how="inner", suffixes=("", "_FACT"),
+            )
+            if pattern.filter:
+                joined = apply_sql_filter(joined, pattern.filter)
+            if config.has_sign_change:
+                sign = np.where(_is_true(joined, "SIGN_CHANGE_FLAG"), -1, 1)
+                joined = joined.assign(**{m: joined[m] * sign for m in measures})
+
+            branch = joined.groupby(GROUP_COLUMNS, sort=False, dropna=False)[measures].sum().reset_index()
+            branch["JOIN_BRANCH"] = pattern.name
+            branches.append(branch)
+
+        combined = pd.concat(branches, ignore_index=True)
+        grouped = combined.groupby(GROUP_COLUMNS, sort=False, dropna=False)
+        result = grouped[measures].sum()
+        result["JOIN_BRANCHES"] = grouped["JOIN_BRANCH"].agg(lambda s: ",".join(sorted(set(s))))
+        return result.reset_index()
+
+    def run_dt3(
+        self,
+        config: MartConfig,
+        dt3a: pd.DataFrame,
+        formulas: Optional[List[FormulaPrecedence]] = None,
+    ) -> pd.DataFrame:
+        """DT_3: formula cascade, surrogate keys and backfilled levels."""
+        prefix = config.effective_measure_prefix
+        base = dt3a.drop(columns=["JOIN_BRANCHES"], errors="ignore").assign(IS_CALCULATED=0)
+        df = self.formula_engine.evaluate_cascade(base, formulas or [], prefix)
+
+        # DENSE_RANK() OVER (ORDER BY LEVEL_1, ..., LEVEL_n)
+        for n in range(2, 6):
+            df[f"LEVEL_{n}_KEY"] = df.groupby(LEVEL_COLUMNS[:n], sort=True, dropna=False).ngroup() + 1
+
+        # COALESCE(LEVEL_n, LEVEL_n-1, ..., LEVEL_1)
+        df[LEVEL_COLUMNS] = df[LEVEL_COLUMNS].astype(object).ffill(axis=1)
+
+        columns = (
+            ["FK_REPORT_KEY"] + LEVEL_COLUMNS
+            + [f"LEVEL_{n}_KEY" for n in range(2, 6)]
+            + [f"{prefix}_AMOUNT", f"{prefix}_VOLUME", f"{prefix}_MCFE"]
+            + ["FORMULA_GROUP", "IS_CALCULATED"]
+        )
+        return _with_columns(df, columns)
+
+    # ----------------------------------------
+    # Pipeline
+    # ----------------------------------------
+
+    def run(
+        self,
+        config: MartConfig,
+        sources: Dict[str, Any],
+        formulas: Optional[List[FormulaPrecedence]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Run all four stages.
+
+        Per-stage row counts and timings are recorded in ``stage_stats``,
+        non-fatal problems in ``warnings`` and the stage outputs (also
+        partial ones if a stage fails) in ``last_outputs``.
+
+        Args:
+            config: Mart configuration
+            sources: Local extracts (see resolve_sources)
+            formulas: Optional formula definitions for DT_3
+
+        Returns:
+            Dict mapping layer ("VW_1", "DT_2", "DT_3A", "DT_3") to its output
+        """
+        self.stage_stats = {}
+        self.warnings = []
+        self.last_outputs = {}
+        names = object_names(config)
+
+        started = time.perf_counter()
+        tables = self.resolve_sources(config, sources)
+        self._record("SOURCES", "sources", started, sum(len(t) for t in tables.values()))
+
+        dimensions = {k[4:]: v for k, v in tables.items() if k.startswith("dim:")}
+        outputs: Dict[str, pd.DataFrame] = {}
+        self.last_outputs = outputs
+        stages = [
+            (PipelineLayer.VW_1, lambda: self.run_vw1(config, tables["mapping"], tables["hierarchy"], dimensions)),
+            (PipelineLayer.DT_2, lambda: self.run_dt2(config, outputs["VW_1"])),
+            (PipelineLayer.DT_3A, lambda: self.run_dt3a(config, outputs["DT_2"], tables["fact"])),
+            (PipelineLayer.DT_3, lambda: self.run_dt3(config, outputs["DT_3A"], formulas)),
+        ]
+        for layer, stage in stages:
+            started = time.perf_counter()
+            outputs[layer.value] = stage()
+            self._record(layer.value, names[layer.value], started, len(outputs[layer.value]))
+
+        logger.info(
+            f"Ran {config.project_name} locally: "
+            + ", ".join(f"{k}={v['rows']}" for k, v in self.stage_stats.items())
+        )
+        return outputs
+
+    def validate(
+        self,
+        config: MartConfig,
+        sources: Dict[str, Any],
+        formulas: Optional[List[FormulaPrecedence]] = None,
+        expected_rows: Optional[Dict[str, int]] = None,
+    ) -> PipelineValidationResult:
+        """
+        Run the pipeline and report per-layer row counts and timings.
+
+        Args:
+            config: Mart configuration
+            sources: Local extracts (see resolve_sources)
+            formulas: Optional formula definitions for DT_3
+            expected_rows: Optional expected row count per layer
+
+        Returns:
+            PipelineValidationResult with layer_results per stage
+        """
+        result = PipelineValidationResult(config_name=config.project_name)
+        started = time.perf_counter()
+
+        if formulas:
+            deps = self.formula_engine.validate_dependencies(formulas)
+            result.errors.extend(deps["errors"])
+            result.warnings.extend(deps["warnings"])
+
+        try:
+            self.run(config, sources, formulas)
+        except Exception as e:
+            result.errors.append(f"Local execution failed: {type(e).__name__}: {e}")
+
+        result.warnings.extend(self.warnings)
+        for layer, stats in self.stage_stats.items():
+            if layer == "SOURCES":
+                continue
+            result.layer_results[layer] = dict(stats)
+            result.actual_rows[layer] = stats["rows"]
+
+        if expected_rows:
+            result.expected_rows = dict(expected_rows)
+            for layer, expected in expected_rows.items():
+                actual = result.actual_rows.get(layer)
+                if actual != expected:
+                    result.row_count_match = False
+                    result.errors.append(f"{layer}: expected {expected} rows, got {actual}")
+
+        result.is_valid = not result.errors
+        result.duration_seconds = round(time.perf_counter() - started, 4)
+        return result
+
+    # ----------------------------------------
+    # Helpers
+    # ----------------------------------------
+
+    def _record(self, layer: str, object_name: str, started: float, rows: int) -> None:
+        self.stage_stats[layer] = {
+            "object_name": object_name,
+            "rows": rows,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    @staticmethod
+    def _find_column(df: pd.DataFrame, reference: str) -> Optional[str]:
+        """Resolve 'ALIAS.COLUMN' or 'COLUMN' against the joined frame."""
+        reference = reference.upper()
+        if reference in df.columns:
+            return reference
+        bare = reference.split(".")[-1]
+        if bare in df.columns:
+            return bare
+        matches = [c for c in df.columns if c.split(".")[-1] == bare]
+        return matches[0] if matches else None
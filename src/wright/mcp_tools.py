@@ -1,7 +1,7 @@
 """
 MCP Tools for Hierarchy-Driven Data Mart Factory (Wright Module).
 
-Provides 29 tools for automated data mart generation and dbt integration:
+Provides 30 tools for automated data mart generation and dbt integration:
 
 Configuration Management (3):
 - create_mart_config
@@ -17,9 +17,10 @@ AI Discovery (2):
 - discover_hierarchy_pattern
 - suggest_mart_config
 
-Validation (2):
+Validation (3):
 - validate_mart_config
 - validate_mart_pipeline
+- run_mart_pipeline_locally
 
 Data Quality (Phase 31) (3):
 - validate_hierarchy_data_quality
@@ -1682,6 +1683,86 @@ def register_mart_factory_tools(mcp, settings=None) -> Dict[str, Any]:
             logger.error(f"Failed to validate pipeline: {e}")
             return {"success": False, "error": str(e)}
 
+    @mcp.tool()
+    def run_mart_pipeline_locally(
+        config_name: str,
+        sources: str,
+        include_formulas: bool = True,
+        expected_rows: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        preview_rows: int = 5,
+    ) -> Dict[str, Any]:
+        """
+        Execute the 4-object pipeline in-process against local extracts.
+
+        Runs VW_1 → DT_2 → DT_3A → DT_3 with pandas on CSV/JSON/Parquet
+        files instead of Snowflake, reporting per-stage row counts and
+        timings. Use it to iterate on a configuration offline and to
+        regression-test it against known row counts.
+
+        Args:
+            config_name: Name of the configuration
+            sources: JSON object mapping table names (as used in the config)
+                or the roles "mapping", "hierarchy", "fact" to file paths
+            include_formulas: Whether to apply the standard LOS formulas in DT_3
+            expected_rows: Optional JSON object of expected rows per layer
+            output_dir: Optional directory to write each stage as CSV
+            preview_rows: Rows of DT_3 to include in the response
+
+        Returns:
+            Validation result with per-layer row counts and timings
+
+        Example:
+            run_mart_pipeline_locally(
+                config_name="upstream_gross",
+                sources='{"mapping": "extracts/map.csv", "hierarchy": "extracts/hier.csv", "fact": "extracts/fact.parquet"}',
+                expected_rows='{"DT_3": 42}'
+            )
+        """
+        try:
+            from .local_executor import LocalPipelineExecutor
+
+            config = config_gen.get_config(config_name)
+            if not config:
+                return {"success": False, "error": f"Configuration '{config_name}' not found"}
+
+            source_map = json.loads(sources)
+            expected = json.loads(expected_rows) if expected_rows else None
+            formulas = create_standard_los_formulas(config.report_type) if include_formulas else None
+
+            executor = LocalPipelineExecutor(formula_engine)
+            result = executor.validate(config, source_map, formulas, expected)
+            outputs = executor.last_outputs
+
+            written = {}
+            if output_dir and outputs:
+                from pathlib import Path
+
+                out_dir = Path(output_dir)
+                out_dir.mkdir(parents=True, exist_ok=True)
+                for layer, frame in outputs.items():
+                    file_path = out_dir / f"{result.layer_results[layer]['object_name']}.csv"
+                    frame.to_csv(file_path, index=False)
+                    written[layer] = str(file_path)
+
+            preview = []
+            if "DT_3" in outputs:
+                preview = json.loads(outputs["DT_3"].head(preview_rows).to_json(orient="records"))
+
+            return {
+                "success": True,
+                **result.to_dict(),
+                "actual_rows": result.actual_rows,
+                "errors": result.errors,
+                "warnings": result.warnings,
+                "files": written,
+                "preview": preview,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to run pipeline locally: {e}")
+            return {"success": False, "error": str(e)}
+
     # ========================================
     # Additional utility tools
     # ========================================
@@ -3885,7 +3966,7 @@ models:
 
     # Return registration info
     return {
-        "tools_registered": 31,
+        "tools_registered": 32,
         "tools": [
             # Configuration Management
             "create_mart_config",
@@ -3901,6 +3982,7 @@ models:
             # Validation
             "validate_mart_config",
             "validate_mart_pipeline",
+            "run_mart_pipeline_locally",
             # Data Quality (Phase 31)
             "validate_hierarchy_data_quality",
             "normalize_id_source_values",
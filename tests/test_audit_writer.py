@@ -0,0 +1,163 @@
+"""
+Unit tests for the background audit trail writer.
+
+Tests cover:
+- Queued writes becoming visible to readers
+- Tail reads and entry counts
+- Size- and age-based rotation with gzip compression
+- get_audit_log served from the writer
+"""
+
+import gzip
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+HEADER = "timestamp,user,action,impact\n"
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for audit files."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def writer(temp_dir):
+    """AuditWriter with a long flush interval so only readers force flushes."""
+    from src.audit_writer import AuditWriter
+
+    writer = AuditWriter(temp_dir / "audit.csv", header=HEADER, batch_size=1000, flush_interval=60)
+    yield writer
+    writer.close()
+
+
+# =============================================================================
+# Writer Tests
+# =============================================================================
+
+class TestAuditWriter:
+    """Tests for AuditWriter."""
+
+    def test_writes_are_queued_until_flushed(self, writer):
+        for i in range(5):
+            writer.write(f"2024-01-01T00:00:0{i},system,action {i},impact")
+        assert not writer.path.exists()
+        assert writer.pending == 5
+
+        assert writer.flush()
+        assert writer.pending == 0
+        lines = writer.path.read_text().splitlines()
+        assert lines[0] == HEADER.strip()
+        assert lines[-1] == "2024-01-01T00:00:04,system,action 4,impact"
+
+    def test_tail_and_count(self, writer):
+        for i in range(500):
+            writer.write(f"t{i},system,action {i},impact {i}")
+
+        recent = writer.tail(3)
+        assert [row["action"] for row in recent] == ["action 497", "action 498", "action 499"]
+        assert recent[0] == {"timestamp": "t497", "user": "system", "action": "action 497", "impact": "impact 497"}
+        assert writer.count() == 500
+        assert len(writer.tail(1000)) == 500
+        assert writer.tail(0) == []
+
+        writer.write("t500,system,late,impact")
+        assert writer.count() == 501
+        assert writer.tail(1)[0]["action"] == "late"
+
+    def test_count_detects_external_rewrite(self, writer):
+        writer.write("t0,system,a,b")
+        assert writer.count() == 1
+
+        writer.path.write_text(HEADER)
+        assert writer.count() == 0
+        assert writer.tail(5) == []
+
+    def test_size_rotation_compresses_and_prunes(self, temp_dir):
+        from src.audit_writer import AuditWriter
+
+        writer = AuditWriter(temp_dir / "audit.csv", header=HEADER, batch_size=1,
+                             max_bytes=300, backup_count=2)
+        for i in range(60):
+            writer.write(f"t{i},system,action {i},impact")
+            writer.flush()
+        writer.close()
+
+        backups = writer.rotated_files()
+        assert writer.rotations >= 3
+        assert len(backups) == 2
+        assert all(p.suffix == ".gz" for p in backups)
+        with gzip.open(backups[-1], "rt") as f:
+            assert f.readline() == HEADER
+        assert writer.path.read_text().startswith(HEADER)
+        assert writer.tail(1)[0]["action"] == "action 59"
+
+    def test_age_rotation_survives_restarts(self, temp_dir):
+        import os
+        import time
+
+        from src.audit_writer import AuditWriter
+
+        path = temp_dir / "audit.csv"
+        path.write_text(HEADER + "t0,system,old,impact\n")
+        day_ago = time.time() - 86400
+        os.utime(path, (day_ago, day_ago))
+        if getattr(path.stat(), "st_birthtime", None):
+            pytest.skip("file age comes from the birth time on this platform")
+
+        # A new process must not restart the file's age from zero
+        writer = AuditWriter(path, header=HEADER, batch_size=1, rotate_interval=3600)
+        writer.write("t1,system,new,impact")
+        writer.flush()
+        writer.write("t2,system,newer,impact")
+        writer.close()
+
+        assert writer.rotations == 1
+        assert [row["action"] for row in writer.tail(5)] == ["new", "newer"]
+
+    def test_invalid_fsync_policy(self, temp_dir):
+        from src.audit_writer import AuditWriter
+
+        with pytest.raises(ValueError):
+            AuditWriter(temp_dir / "audit.csv", fsync_policy="sometimes")
+
+    def test_invalid_fsync_setting_is_rejected(self):
+        from pydantic import ValidationError
+
+        from src.config import Settings
+
+        with pytest.raises(ValidationError):
+            Settings(audit_fsync="sometimes")
+
+
+# =============================================================================
+# Server Integration Tests
+# =============================================================================
+
+class TestServerAuditLog:
+    """Tests for log_action and get_audit_log."""
+
+    def test_logged_actions_are_returned(self, temp_dir, monkeypatch):
+        import src.server as server
+
+        monkeypatch.setattr(server.settings, "audit_log", temp_dir / "server_audit.csv")
+        for i in range(12):
+            server.log_action("system", f"step,{i}", "impact\nline")
+
+        get_audit_log = getattr(server.get_audit_log, "fn", server.get_audit_log)
+        result = json.loads(get_audit_log(limit=3))
+
+        assert result["total_entries"] == 12
+        assert result["showing"] == 3
+        assert result["entries"][-1]["action"] == "step;11"
+        assert result["entries"][-1]["impact"] == "impact line"
@@ -0,0 +1,180 @@
+"""
+Unit tests for the connections API client.
+
+Tests cover:
+- Shared pooled session with retries
+- Metadata caching and scoped invalidation
+- Parallel async column fetches
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+class FakeResponse:
+    """Minimal requests.Response stand-in."""
+
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self.text = json.dumps(payload)
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Session recording requests and answering from a handler."""
+
+    def __init__(self, handler=None, delay=0.0):
+        self.calls = []
+        self.handler = handler or (lambda method, url, data: {"data": [url.rsplit("/", 1)[-1]]})
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, json=None, params=None, timeout=None):
+        with self._lock:
+            self.calls.append((method, url, json))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return FakeResponse(self.handler(method, url, json))
+
+
+@pytest.fixture
+def client():
+    from src.connections.api_client import ConnectionsApiClient
+
+    return ConnectionsApiClient("http://backend/api/", "key", session=FakeSession())
+
+
+# =============================================================================
+# Session Tests
+# =============================================================================
+
+class TestSharedSession:
+    """Tests for get_session."""
+
+    def test_session_is_shared_and_retries(self):
+        from src.connections.http_session import RETRY_STATUSES, get_session
+
+        session = get_session()
+        assert get_session() is session
+        assert get_session(retries=0) is not session
+
+        adapter = session.get_adapter("http://backend/api")
+        assert adapter.max_retries.total == 2
+        assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUSES)
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+    def test_clients_default_to_shared_session(self):
+        from src.connections.api_client import ConnectionsApiClient
+        from src.connections.http_session import get_session
+        from src.hierarchy.api_sync import HierarchyApiSync
+
+        assert ConnectionsApiClient("http://backend", "key").session is get_session()
+        assert HierarchyApiSync("http://backend", "key", auto_sync=False).session is get_session()
+
+
+# =============================================================================
+# Metadata Cache Tests
+# =============================================================================
+
+class TestMetadataCache:
+    """Tests for cached metadata listings."""
+
+    def test_repeated_browsing_hits_cache(self, client):
+        for _ in range(3):
+            assert client.get_databases("c1") == ["databases"]
+            assert client.get_schemas("c1", "DB") == ["schemas"]
+            assert client.get_tables("c1", "DB", "S") == ["tables"]
+            assert client.get_columns("c1", "DB", "S", "T") == ["columns"]
+
+        assert len(client.session.calls) == 4
+        assert client.session.calls[3][2] == {
+            "connectionId": "c1", "database": "DB", "schema": "S", "table": "T",
+        }
+        assert client.metadata_cache.stats()["hits"] == 8
+
+    def test_scoped_invalidation(self, client):
+        client.get_databases("c1")
+        client.get_tables("c1", "DB", "S")
+        client.get_columns("c1", "DB", "S", "T")
+        client.get_columns("c1", "DB", "OTHER", "T")
+
+        assert client.invalidate_metadata("c1", "DB", "S") == 2
+        client.get_databases("c1")
+        client.get_columns("c1", "DB", "OTHER", "T")
+        assert len(client.session.calls) == 4
+
+        client.get_columns("c1", "DB", "S", "T")
+        assert len(client.session.calls) == 5
+
+        assert client.invalidate_metadata() == 3
+
+    def test_errors_are_not_cached_and_ttl_expires(self):
+        from src.connections.api_client import ConnectionsApiClient
+        from src.connections.http_session import MetadataCache
+
+        responses = [{"error": True, "message": "down"}, {"data": ["DB"]}]
+        session = FakeSession(handler=lambda method, url, data: responses.pop(0))
+        client = ConnectionsApiClient("http://backend", "key", session=session)
+
+        assert client.get_databases("c1") == []
+        assert client.get_databases("c1") == ["DB"]
+        assert client.get_databases("c1") == ["DB"]
+        assert len(session.calls) == 2
+
+        cache = MetadataCache(ttl_seconds=60)
+        cache.put(("c1", "databases"), ["DB"])
+        key, (stored_at, value) = next(iter(cache._entries.items()))
+        cache._entries[key] = (stored_at - 120, value)
+        assert cache.get(("c1", "databases")) is None
+
+        disabled = MetadataCache(ttl_seconds=0)
+        disabled.put(("c1", "databases"), ["DB"])
+        assert len(disabled) == 0
+
+    def test_cached_lists_are_copies(self, client):
+        client.get_tables("c1", "DB", "S").append("mutated")
+        assert client.get_tables("c1", "DB", "S") == ["tables"]
+
+
+# =============================================================================
+# Async Tests
+# =============================================================================
+
+class TestAsyncColumns:
+    """Tests for parallel column fetches."""
+
+    def test_columns_for_many_tables_in_parallel(self):
+        from src.connections.api_client import ConnectionsApiClient
+
+        session = FakeSession(
+            handler=lambda method, url, data: {"data": [{"name": f"{data['table']}_ID"}]},
+            delay=0.02,
+        )
+        client = ConnectionsApiClient("http://backend", "key", session=session)
+        tables = [("DB", "S", f"T{i}") for i in range(6)]
+
+        result = asyncio.run(client.aget_columns_many("c1", tables, max_concurrency=3))
+
+        assert list(result) == tables
+        assert result[("DB", "S", "T4")] == [{"name": "T4_ID"}]
+        assert 1 < session.peak <= 3
+
+        # Second pass is served from the metadata cache
+        asyncio.run(client.aget_columns_many("c1", tables))
+        assert len(session.calls) == 6
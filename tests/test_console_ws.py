@@ -6,6 +6,7 @@ Tests the WebSocket types, broadcaster, handlers, and MCP tools.
 
 import pytest
 import asyncio
+import json
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -192,7 +193,11 @@ class TestInMemoryBroadcaster:
         count = broadcaster.publish("console", msg)
 
         assert count == 1
-        callback.assert_called_once_with(msg)
+        callback.assert_called_once()
+        # Subscribers receive a copy stamped with the sequence number
+        delivered = callback.call_args.args[0]
+        assert delivered.model_dump(exclude={"seq"}) == msg.model_dump()
+        assert delivered.seq == 1
 
     def test_publish_to_multiple_subscribers(self):
         """Test publishing to multiple subscribers."""
@@ -242,6 +247,105 @@ class TestInMemoryBroadcaster:
         assert len(history) == 0
 
 
+def _log(i, msg_type=WebSocketMessageType.CONSOLE_LOG, **payload):
+    return WebSocketMessage(type=msg_type, payload={"i": i, **payload})
+
+
+class TestMessageHistory:
+    """Test ring-buffer history, indexes and replay cursors."""
+
+    def test_per_channel_capacity_and_order(self):
+        """Each channel keeps its newest messages within its own capacity."""
+        broadcaster = InMemoryBroadcaster(max_history=3, channel_capacity={"reasoning": 5})
+
+        for i in range(10):
+            broadcaster.publish("console", _log(i))
+            broadcaster.publish("reasoning", _log(i, WebSocketMessageType.REASONING_STEP))
+
+        assert [m.payload["i"] for m in broadcaster.get_history(channel="console")] == [7, 8, 9]
+        assert [m.payload["i"] for m in broadcaster.get_history(channel="reasoning")] == [5, 6, 7, 8, 9]
+        assert broadcaster.history_size() == 8
+        # Cross-channel history is merged in publish order
+        assert [(m.type.value, m.payload["i"]) for m in broadcaster.get_history(limit=3)] == [
+            ("reasoning.step", 8), ("console.log", 9), ("reasoning.step", 9),
+        ]
+
+    def test_type_and_since_filters(self):
+        """Type index and time bounds select only matching messages."""
+        from datetime import timedelta
+
+        broadcaster = InMemoryBroadcaster(max_history=4)
+        base = datetime(2026, 1, 1)
+        for i in range(6):
+            msg_type = WebSocketMessageType.CONSOLE_LOG if i % 2 else WebSocketMessageType.CONSOLE_CLEAR
+            msg = _log(i, msg_type)
+            msg.timestamp = base + timedelta(seconds=i)
+            broadcaster.publish("console", msg)
+
+        logs = broadcaster.get_history(message_type=WebSocketMessageType.CONSOLE_LOG)
+        assert [m.payload["i"] for m in logs] == [3, 5]
+
+        assert [m.payload["i"] for m in broadcaster.get_history(since=base + timedelta(seconds=4))] == [4, 5]
+        assert broadcaster.get_history(since=datetime.now() + timedelta(hours=1)) == []
+
+    def test_replay_from_cursor(self):
+        """Replay returns only the gap and flags evicted history."""
+        broadcaster = InMemoryBroadcaster(max_history=3)
+        for i in range(3):
+            broadcaster.publish("console", _log(i))
+        cursor = broadcaster.last_sequence
+        for i in range(3, 5):
+            broadcaster.publish("console", _log(i))
+        broadcaster.publish("agents", _log(99))
+
+        result = broadcaster.replay(cursor, channels=["console"])
+        assert [m.payload["i"] for m in result["messages"]] == [3, 4]
+        assert result["cursor"] == broadcaster.last_sequence
+        assert result["truncated"] is False
+
+        page = broadcaster.replay(0, limit=2)
+        assert page["truncated"] is True
+        assert [m.payload["i"] for m in page["messages"]] == [2, 3]
+        assert page["cursor"] == page["messages"][-1].seq
+
+    def test_publish_to_all_keeps_per_channel_seq(self):
+        """Each channel's history keeps its own sequence number."""
+        broadcaster = InMemoryBroadcaster()
+        for channel in ("console", "agents"):
+            broadcaster.subscribe(channel, lambda message: None)
+        message = _log(1)
+        broadcaster.publish_to_all(message)
+
+        seqs = [broadcaster.replay(0, channels=[ch])["messages"][0].seq for ch in ("console", "agents")]
+        assert sorted(seqs) == [1, 2]
+        assert getattr(message, "seq", None) is None
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_with_cursor_replays_gap(self):
+        """A reconnecting client receives missed messages exactly once."""
+        broadcaster = InMemoryBroadcaster()
+        manager = ConnectionManager(broadcaster)
+        broadcaster.publish("console", _log(0))
+        cursor = broadcaster.last_sequence
+        broadcaster.publish("console", _log(1))
+        broadcaster.publish("console", _log(2))
+
+        ws = AsyncMock()
+        conn = await manager.connect(ws)
+        ws.send_text.reset_mock()
+        response = await manager.handle_message(conn, json.dumps({
+            "type": "subscribe", "payload": {"channels": ["console"], "cursor": cursor},
+        }))
+        assert response.payload["replayed"] == 2
+        assert response.payload["cursor"] == broadcaster.last_sequence
+
+        broadcaster.publish("console", _log(3))
+        assert await conn.flush()
+        sent = [json.loads(call.args[0]) for call in ws.send_text.call_args_list]
+        assert [m["payload"]["i"] for m in sent] == [1, 2, 3]
+        assert [m["seq"] for m in sent] == [2, 3, 4]
+
+
 class TestConsoleBroadcaster:
     """Test high-level console broadcaster."""
 
@@ -469,6 +573,127 @@ class TestConnectionManager:
         assert "subscriptions" in stats
 
 
+class SlowWebSocket:
+    """WebSocket stand-in recording sent frames, optionally blocking."""
+
+    def __init__(self, gate: asyncio.Event = None):
+        self.sent = []
+        self.gate = gate
+
+    async def send_text(self, data):
+        if self.gate is not None:
+            await self.gate.wait()
+        self.sent.append(data)
+
+
+class TestFanOut:
+    """Test serialize-once fan-out and bounded send queues."""
+
+    async def _subscribed(self, manager, channels=("reasoning",), websocket=None, **filters):
+        websocket = websocket or SlowWebSocket()
+        conn = await manager.connect(websocket)
+        payload = {"channels": list(channels), **filters}
+        await manager.handle_message(conn, json.dumps({"type": "subscribe", "payload": payload}))
+        websocket.sent.clear()
+        return conn, websocket
+
+    @pytest.mark.asyncio
+    async def test_publish_serializes_once_and_filters(self):
+        """One serialization per message regardless of client count."""
+        broadcaster = InMemoryBroadcaster()
+        manager = ConnectionManager(broadcaster)
+        clients = [await self._subscribed(manager) for _ in range(3)]
+        filtered = await self._subscribed(manager, conversation_id="other")
+
+        msg = WebSocketMessage(
+            type=WebSocketMessageType.REASONING_STEP,
+            payload={"conversation_id": "conv-1"},
+        )
+        with patch.object(WebSocketMessage, "model_dump_json", autospec=True,
+                          return_value='{"frame": 1}') as dump:
+            assert broadcaster.publish("reasoning", msg) == 1
+        assert dump.call_count == 1
+
+        for conn, ws in clients:
+            assert await conn.flush()
+            assert ws.sent == ['{"frame": 1}']
+        assert filtered[1].sent == []
+        assert await manager.broadcast(msg, "reasoning") == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_client_drops_oldest_without_blocking(self):
+        """A stalled client's queue is bounded and others keep receiving."""
+        broadcaster = InMemoryBroadcaster()
+        manager = ConnectionManager(broadcaster, max_queue_size=2)
+        gate = asyncio.Event()
+        gate.set()
+        slow, slow_ws = await self._subscribed(manager, websocket=SlowWebSocket(gate))
+        fast, fast_ws = await self._subscribed(manager)
+        gate.clear()
+
+        for i in range(5):
+            broadcaster.publish("reasoning", WebSocketMessage(
+                type=WebSocketMessageType.REASONING_STEP, payload={"step": i},
+            ))
+            await asyncio.sleep(0)
+
+        assert await fast.flush()
+        assert [json.loads(d)["payload"]["step"] for d in fast_ws.sent] == [0, 1, 2, 3, 4]
+
+        gate.set()
+        assert await slow.flush()
+        # First message was in flight when the client stalled; 1 and 2 were dropped
+        assert [json.loads(d)["payload"]["step"] for d in slow_ws.sent] == [0, 3, 4]
+        assert manager.get_stats()["dropped_messages"] == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_status_is_coalesced(self):
+        """Queued status snapshots are replaced by newer ones."""
+        broadcaster = InMemoryBroadcaster()
+        manager = ConnectionManager(broadcaster)
+        conn, ws = await self._subscribed(manager, channels=["agents"])
+
+        for status in ("busy", "idle", "error"):
+            broadcaster.publish("agents", AgentActivityMessage(
+                agent_id="a1", agent_name="Agent", status=status,
+            ).to_ws_message())
+
+        assert await conn.flush()
+        assert [json.loads(d)["payload"]["status"] for d in ws.sent] == ["error"]
+        assert conn.coalesced_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_and_disconnect_release_callbacks(self):
+        """Broadcaster callbacks are removed once no connection needs them."""
+        broadcaster = InMemoryBroadcaster()
+        manager = ConnectionManager(broadcaster)
+        first, _ = await self._subscribed(manager, channels=["console", "reasoning"])
+        second, _ = await self._subscribed(manager, channels=["console"])
+        assert broadcaster.get_channel_count() == {"console": 1, "reasoning": 1}
+
+        await manager.handle_message(first, '{"type": "unsubscribe", "payload": {"channels": ["reasoning"]}}')
+        assert broadcaster.get_channel_count() == {"console": 1}
+
+        await manager.disconnect(first.connection_id)
+        assert broadcaster.get_channel_count() == {"console": 1}
+        await manager.disconnect(second.connection_id)
+        assert broadcaster.get_channel_count() == {}
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self):
+        """Messages published off the event loop are delivered on it."""
+        broadcaster = InMemoryBroadcaster()
+        manager = ConnectionManager(broadcaster)
+        conn, ws = await self._subscribed(manager, channels=["console"])
+
+        msg = ConsoleLogMessage(level=ConsoleLogLevel.INFO, source="tool", message="hi").to_ws_message()
+        await asyncio.to_thread(broadcaster.publish, "console", msg)
+        await asyncio.sleep(0.01)
+
+        assert await conn.flush()
+        assert json.loads(ws.sent[0])["payload"]["message"] == "hi"
+
+
 class TestMCPTools:
     """Test MCP tools registration."""
 
@@ -3,10 +3,11 @@ Unit tests for CortexAgent module.
 
 Tests cover:
 - Types and data models
-- CortexClient SQL generation
+- CortexClient SQL generation and async/batch calls
+- Cortex response cache (TTL, size bound, persistence, bypass)
 - Context state management
 - Console output handling
-- Reasoning loop logic
+- Reasoning loop logic and concurrent plan steps
 """
 
 import json
@@ -298,6 +299,165 @@ class TestCortexClient:
         assert result.success is False
         assert result.error == "Connection failed"
 
+    def test_complete_batch(self):
+        """Test COMPLETE over many prompts in one query."""
+        self.mock_query.return_value = [
+            {"IDX": 0, "RESULT": '"first"'},
+            {"IDX": 1, "RESULT": '"second"'},
+        ]
+        result = self.client.complete_batch(["One", "It's two"])
+
+        self.mock_query.assert_called_once()
+        sql = self.mock_query.call_args.kwargs["query"]
+        assert "FROM (VALUES" in sql
+        assert "(1, 'It''s two')" in sql
+        assert [row["RESULT"] for row in result.result] == ["first", "second"]
+
+    def test_async_offloads_blocking_query(self):
+        """Test async methods run the sync query function off the event loop."""
+        import asyncio
+        import threading
+
+        threads = []
+        self.mock_query.side_effect = lambda **kwargs: threads.append(threading.get_ident()) or [
+            {"RESULT": '"ok"'}
+        ]
+
+        async def run():
+            return await asyncio.gather(self.client.acomplete("a"), self.client.asummarize("b"))
+
+        results = asyncio.run(run())
+        self.client.close()
+
+        assert [r.result for r in results] == ["ok", "ok"]
+        assert threading.get_ident() not in threads
+        assert self.client.get_call_count() == 2
+
+    def test_async_query_func(self):
+        """Test async methods await an async query function when given."""
+        import asyncio
+
+        async_query = AsyncMock(return_value=[{"RESULT": "0.5"}])
+        client = CortexClient(
+            connection_id="test-conn",
+            query_func=self.mock_query,
+            async_query_func=async_query,
+        )
+
+        result = asyncio.run(client.asentiment("fine"))
+
+        assert result.result == 0.5
+        async_query.assert_awaited_once()
+        self.mock_query.assert_not_called()
+
+
+class TestCortexResponseCache:
+    """Test CortexResponseCache and its use by CortexClient."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        from src.cortex_agent.cortex_client import CortexResponseCache
+
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.mock_query = MagicMock(return_value=[{"RESULT": '"Cached answer"'}])
+        self.cache = CortexResponseCache(max_size=2, ttl_seconds=60)
+        self.client = CortexClient(
+            connection_id="test-conn",
+            query_func=self.mock_query,
+            cache=self.cache,
+        )
+
+    def teardown_method(self):
+        """Clean up temp directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_repeated_call_is_served_from_cache(self):
+        first = self.client.complete("Same prompt")
+        second = self.client.complete("Same   prompt")  # whitespace-normalized
+
+        assert self.mock_query.call_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.result == "Cached answer"
+        assert self.client.get_call_count() == 1
+        stats = self.client.get_cache_stats()
+        assert stats["enabled"] is True
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+        # Different options or function are separate entries
+        self.client.complete("Same prompt", temperature=0.9)
+        self.client.summarize("Same prompt")
+        assert self.mock_query.call_count == 3
+
+    def test_bypass_errors_and_table_calls_are_not_cached(self):
+        self.client.complete("Prompt")
+        self.client.complete("Prompt", use_cache=False)
+        assert self.mock_query.call_count == 2
+
+        self.mock_query.side_effect = Exception("boom")
+        assert self.client.sentiment("bad").success is False
+        self.mock_query.side_effect = None
+        assert self.client.sentiment("bad").cached is False
+
+        self.client.complete_on_table("T", "C", "Describe {value}")
+        self.client.complete_on_table("T", "C", "Describe {value}")
+        assert self.mock_query.call_count == 6
+
+    def test_size_bound_and_ttl(self):
+        key_a = self.cache.make_key(CortexFunction.COMPLETE, "SELECT 'a'")
+        key_b = self.cache.make_key(CortexFunction.COMPLETE, "SELECT 'b'")
+        key_c = self.cache.make_key(CortexFunction.COMPLETE, "SELECT 'c'")
+        for key in (key_a, key_b, key_c):
+            self.cache.put(key, key)
+
+        assert len(self.cache) == 2
+        assert self.cache.get(key_a) is None
+
+        self.cache._entries[key_b]["stored_at"] -= 120
+        assert self.cache.get(key_b) is None
+        assert self.cache.get(key_c) == (key_c, None)
+
+    def test_disk_persistence(self):
+        from src.cortex_agent.cortex_client import CortexResponseCache
+
+        path = self.temp_dir / "cortex_cache.json"
+        client = CortexClient("test-conn", self.mock_query, cache=CortexResponseCache(path=path))
+        client.translate("Hello", "en", "fr")
+        assert not path.exists()
+        client.close()
+        assert path.exists()
+
+        client = CortexClient("test-conn", self.mock_query, cache=CortexResponseCache(path=path))
+        result = client.translate("Hello", "en", "fr")
+
+        assert result.cached is True
+        assert self.mock_query.call_count == 1
+
+    def test_disk_writes_are_batched(self):
+        from src.cortex_agent.cortex_client import CortexResponseCache
+
+        path = self.temp_dir / "cortex_cache.json"
+        cache = CortexResponseCache(path=path, flush_every=3)
+        with patch.object(cache, "_save", wraps=cache._save) as save:
+            for i in range(7):
+                cache.put(f"k{i}", i)
+            assert save.call_count == 2
+            cache.flush()
+            cache.flush()
+            assert save.call_count == 3
+
+        assert len(CortexResponseCache(path=path)) == 7
+
+    def test_async_calls_share_the_cache(self):
+        import asyncio
+
+        self.client.complete("Shared")
+        result = asyncio.run(self.client.acomplete("Shared"))
+        self.client.close()
+
+        assert result.cached is True
+        assert self.mock_query.call_count == 1
+
 
 class TestCortexAgentContext:
     """Test CortexAgentContext state management."""
@@ -663,6 +823,66 @@ class TestReasoningLoopIntegration:
         # May or may not succeed depending on mock responses
         assert response.total_cortex_calls > 0
 
+    def test_parse_plan_dependencies(self):
+        """Test depends_on is parsed and steps are grouped into waves."""
+        from src.cortex_agent.reasoning_loop import CortexReasoningLoop
+
+        loop = CortexReasoningLoop(self.client, self.console, self.context, self.config)
+        steps = loop._parse_plan(json.dumps([
+            {"step": 1, "action": "A", "function": "COMPLETE"},
+            {"step": 2, "action": "B", "function": "SUMMARIZE", "depends_on": []},
+            {"step": 3, "action": "C", "function": "COMPLETE", "depends_on": [1, 2]},
+        ]))
+
+        assert [s.depends_on for s in steps] == [[], [], [1, 2]]
+        waves = loop._schedule_waves(steps)
+        assert [[s.step_number for s in wave] for wave in waves] == [[1, 2], [3]]
+
+        # Without any depends_on the plan stays sequential
+        for step in steps:
+            step.depends_on = []
+        assert len(loop._schedule_waves(steps)) == 3
+
+        # Cycles fall back to plan order
+        steps[0].depends_on, steps[1].depends_on, steps[2].depends_on = [2], [1], [1]
+        assert [[s.step_number for s in wave] for wave in loop._schedule_waves(steps)] == [[1], [2], [3]]
+
+    def test_independent_steps_run_concurrently(self):
+        """Test independent plan steps execute at the same time."""
+        import asyncio
+        from src.cortex_agent.reasoning_loop import CortexReasoningLoop
+
+        plan = [
+            {"step": 1, "action": "A", "function": "COMPLETE", "parameters": {"prompt": "a"}},
+            {"step": 2, "action": "B", "function": "COMPLETE", "parameters": {"prompt": "b"}, "depends_on": []},
+            {"step": 3, "action": "C", "function": "COMPLETE", "parameters": {"prompt": "c"}, "depends_on": [1, 2]},
+        ]
+        state = {"in_flight": 0, "peak": 0, "calls": 0}
+
+        async def query(connection_id, query):
+            state["calls"] += 1
+            if "creating an execution plan" in query:
+                return [{"RESULT": json.dumps(json.dumps(plan))}]
+            if "evaluating if a goal" in query:
+                return [{"RESULT": json.dumps('{"complete": false}')}]
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            return [{"RESULT": '"done"'}]
+
+        client = CortexClient("test-conn", self.mock_query, async_query_func=query)
+        config = CortexAgentConfig(connection_id="test-conn", max_reasoning_steps=10)
+        loop = CortexReasoningLoop(client, self.console, self.context, config)
+
+        response = asyncio.run(loop.run("Parallel goal"))
+
+        assert response.success is True
+        assert state["peak"] == 2
+        # observe + plan + 3 steps + 2 reflections (one per wave) + synthesize
+        assert state["calls"] == 8
+        self.mock_query.assert_not_called()
+
 
 class TestMCPToolsRegistration:
     """Test MCP tools can be registered."""
@@ -7,6 +7,8 @@ Tests cover:
 - Tag management
 - Search functionality
 - PII detection
+- Concurrent, incremental connection scans
+- Set-based column profiling
 - Catalog statistics
 """
 
@@ -297,6 +299,18 @@ class TestCatalogStore:
         # Remove tag from asset
         assert catalog_store.remove_tag_from_asset(sample_asset.id, "production") is True
 
+    def test_delete_tag_notifies_updated_assets(self, catalog_store, sample_asset):
+        """Deleting a tag emits asset_updated for every asset that carried it."""
+        catalog_store.create_asset(sample_asset)
+        catalog_store.add_tag_to_asset(sample_asset.id, "deprecated")
+
+        events = []
+        catalog_store.subscribe(lambda event, obj: events.append((event, obj.id)))
+
+        assert catalog_store.delete_tag("deprecated") is True
+        assert events == [("asset_updated", sample_asset.id)]
+        assert "deprecated" not in [t.name for t in catalog_store.get_asset(sample_asset.id).tags]
+
     def test_glossary_term_operations(self, catalog_store):
         """Test glossary term CRUD."""
         from src.data_catalog.types import GlossaryTerm, TermStatus
@@ -352,6 +366,83 @@ class TestCatalogStore:
         assert retrieved is not None
         assert retrieved.name == "PERSIST_TEST"
 
+    def test_reopen_restores_index_and_hydrates_lazily(self, temp_data_dir, sample_asset):
+        """Test that reopening uses the index snapshot plus replayed changes."""
+        from src.data_catalog.catalog_store import CatalogStore
+        from src.data_catalog.types import DataAsset, AssetType, SearchQuery
+
+        store1 = CatalogStore(data_dir=temp_data_dir)
+        store1.create_asset(sample_asset)
+        doomed = store1.create_asset(DataAsset(name="OLD_ORDERS", asset_type=AssetType.TABLE))
+        store1.flush()
+
+        # Changes after the snapshot are replayed on open
+        store1.create_asset(DataAsset(name="INVOICE_FACT", asset_type=AssetType.TABLE))
+        store1.delete_asset(doomed.id)
+
+        store2 = CatalogStore(data_dir=temp_data_dir)
+        assert store2._assets.hydrated_count == 1  # only the replayed upsert
+
+        names = [r.name for r in store2.search(SearchQuery(query="invoice")).results]
+        assert names == ["INVOICE_FACT"]
+        assert store2.search(SearchQuery(query="orders")).total_count == 0
+
+        results = store2.search(SearchQuery(query="customer"))
+        assert results.results[0].asset_id == sample_asset.id
+        assert store2._assets.hydrated_count == 2
+
+    def test_index_snapshot_is_not_pickled(self, temp_data_dir, sample_asset):
+        """Test that the search index snapshot round-trips as plain arrays."""
+        import pickle
+        from src.data_catalog.catalog_store import CatalogStore
+        from src.data_catalog.search_index import CatalogSearchIndex
+        from src.data_catalog.types import SearchQuery
+
+        store1 = CatalogStore(data_dir=temp_data_dir)
+        store1.create_asset(sample_asset)
+        store1.flush()
+
+        seq, blob = store1._storage.load_snapshot("search_index")
+        restored = CatalogSearchIndex.from_bytes(blob)
+        assert len(restored) == len(store1._search_index)
+        assert restored.search("customer")[0] == store1._search_index.search("customer")[0]
+
+        # A pickled snapshot is discarded (never unpickled) and the index rebuilt
+        store1._storage.save_snapshot("search_index", pickle.dumps(("x", object())))
+        store2 = CatalogStore(data_dir=temp_data_dir)
+        results = store2.search(SearchQuery(query="customer"))
+        assert results.results[0].asset_id == sample_asset.id
+
+    def test_migrates_json_files(self, temp_data_dir, sample_asset):
+        """Test that catalogs saved as JSON files are imported once."""
+        from src.data_catalog.catalog_store import CatalogStore
+
+        Path(temp_data_dir, "assets.json").write_text(json.dumps({
+            sample_asset.id: sample_asset.model_dump(mode="json"),
+        }))
+        Path(temp_data_dir, "tags.json").write_text(json.dumps({
+            "finance": {"name": "finance"},
+        }))
+
+        store = CatalogStore(data_dir=temp_data_dir)
+        assert store.get_asset(sample_asset.id).schema_name == "PUBLIC"
+        assert store.get_tag("finance") is not None
+
+        store.delete_asset(sample_asset.id)
+        assert CatalogStore(data_dir=temp_data_dir).get_asset(sample_asset.id) is None
+
+    def test_batch_writes(self, catalog_store):
+        """Test grouping writes in one transaction."""
+        from src.data_catalog.catalog_store import CatalogStore
+        from src.data_catalog.types import DataAsset, AssetType
+
+        with catalog_store.batch():
+            for i in range(20):
+                catalog_store.create_asset(DataAsset(name=f"T_{i}", asset_type=AssetType.TABLE))
+
+        reopened = CatalogStore(data_dir=str(catalog_store.data_dir))
+        assert len(reopened.list_assets()) == 20
+
 
 # =============================================================================
 # Search Tests
@@ -424,6 +515,77 @@ class TestCatalogSearch:
 
         assert results.total_count >= 1
 
+    def test_search_prefix_and_ranking(self, catalog_store):
+        """Test prefix matching and that name matches outrank column matches."""
+        from src.data_catalog.types import DataAsset, AssetType, ColumnProfile, SearchQuery
+
+        catalog_store.create_asset(DataAsset(
+            name="ORDERS",
+            asset_type=AssetType.TABLE,
+            columns=[ColumnProfile(column_name="CUSTOMER_ID", data_type="NUMBER")],
+        ))
+        catalog_store.create_asset(DataAsset(name="CUSTOMER_DIM", asset_type=AssetType.TABLE))
+
+        results = catalog_store.search(SearchQuery(query="cust"))
+
+        assert results.total_count == 2
+        assert results.results[0].name == "CUSTOMER_DIM"
+        assert results.results[0].match_score == 1.0
+        assert 0 < results.results[1].match_score < 1.0
+
+    def test_search_facet_filters(self, catalog_store):
+        """Test tag (all-of), database and owner filters."""
+        from src.data_catalog.types import DataAsset, AssetType, Owner, SearchQuery, Tag
+
+        catalog_store.create_asset(DataAsset(
+            name="SALES_A", asset_type=AssetType.TABLE, database="PROD",
+            tags=[Tag(name="sales"), Tag(name="gold")],
+            owners=[Owner(user_id="u1", name="User One")],
+        ))
+        catalog_store.create_asset(DataAsset(
+            name="SALES_B", asset_type=AssetType.TABLE, database="DEV",
+            tags=[Tag(name="sales")],
+        ))
+        catalog_store.create_asset(DataAsset(name="SALES_C", asset_type=AssetType.TABLE))
+
+        tagged = catalog_store.search(SearchQuery(query="sales", tags=["Sales", "gold"]))
+        assert [r.name for r in tagged.results] == ["SALES_A"]
+
+        # Assets without a database are not excluded by the database filter
+        prod = catalog_store.search(SearchQuery(query="sales", databases=["prod"]))
+        assert {r.name for r in prod.results} == {"SALES_A", "SALES_C"}
+
+        owned = catalog_store.search(SearchQuery(query="sales", owners=["u1"]))
+        assert [r.name for r in owned.results] == ["SALES_A"]
+
+    def test_search_reflects_updates_and_pagination(self, catalog_store):
+        """Test index maintenance on update/delete and paging totals."""
+        from src.data_catalog.types import DataAsset, AssetType, SearchQuery
+
+        assets = [
+            catalog_store.create_asset(DataAsset(name=f"LEDGER_{i}", asset_type=AssetType.TABLE))
+            for i in range(5)
+        ]
+        catalog_store.update_asset(assets[0].id, {"name": "JOURNAL_0"})
+        catalog_store.delete_asset(assets[1].id)
+
+        page = catalog_store.search(SearchQuery(query="ledger", limit=2, offset=1))
+        assert page.total_count == 3
+        assert len(page.results) == 2
+        assert catalog_store.search(SearchQuery(query="journal")).results[0].name == "JOURNAL_0"
+
+    def test_search_includes_glossary_terms(self, catalog_store):
+        """Test glossary terms are returned unless excluded."""
+        from src.data_catalog.types import GlossaryTerm, SearchQuery
+
+        catalog_store.create_term(GlossaryTerm(name="Churn Rate", definition="Share of customers lost"))
+
+        results = catalog_store.search(SearchQuery(query="churn"))
+        assert results.results[0].name == "[Term] Churn Rate"
+
+        results = catalog_store.search(SearchQuery(query="churn", include_glossary=False))
+        assert results.total_count == 0
+
 
 # =============================================================================
 # Scanner Tests
@@ -459,6 +621,157 @@ class TestCatalogScanner:
         cc_col = next(c for c in columns if "CREDIT_CARD" in c.column_name)
         assert cc_col.classification == DataClassification.PCI
 
+    @staticmethod
+    def _fake_warehouse(tables, calls, delay=0.0):
+        """Query function serving a fake INFORMATION_SCHEMA."""
+        import threading
+        import time
+
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def query_func(connection_id, sql):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                time.sleep(delay)
+                if sql.startswith("SHOW SCHEMAS"):
+                    calls.append("schemas")
+                    return [{"name": "PUBLIC"}, {"name": "STAGING"}]
+                if "INFORMATION_SCHEMA.TABLES" in sql:
+                    calls.append("tables")
+                    schema = "STAGING" if "'STAGING'" in sql else "PUBLIC"
+                    return [
+                        {"TABLE_NAME": name, "TABLE_TYPE": "BASE TABLE", "LAST_ALTERED": altered}
+                        for (s, name), altered in tables.items() if s == schema
+                    ]
+                if "INFORMATION_SCHEMA.COLUMNS" in sql:
+                    calls.append("columns")
+                    return [
+                        {"COLUMN_NAME": "ID", "DATA_TYPE": "NUMBER", "IS_NULLABLE": "NO"},
+                        {"COLUMN_NAME": "EMAIL", "DATA_TYPE": "VARCHAR", "IS_NULLABLE": "YES"},
+                    ]
+                return []
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        return query_func, state
+
+    def test_scan_connection_is_incremental(self, catalog_store):
+        """Test that unchanged tables are skipped on rescan."""
+        from src.data_catalog.scanner import CatalogScanner
+        from src.data_catalog.types import ScanConfig
+
+        tables = {("PUBLIC", f"T{i}"): "2024-01-01" for i in range(6)}
+        tables[("STAGING", "RAW_ORDERS")] = "2024-01-01"
+        calls = []
+        query_func, _ = self._fake_warehouse(tables, calls)
+        scanner = CatalogScanner(catalog_store, query_func)
+        config = ScanConfig(connection_id="wh", database="ANALYTICS", batch_size=3)
+
+        progress = []
+        first = scanner.scan_connection(config, progress_callback=lambda r: progress.append(r.tables_completed))
+        assert first.status == "completed"
+        assert first.tables_completed == 7
+        assert first.pii_columns_detected == 7
+        assert progress[-1] == 7
+        assert calls.count("columns") == 7
+
+        table = catalog_store.get_asset_by_name("RAW_ORDERS", database="ANALYTICS")
+        assert [c.column_name for c in table.columns] == ["ID", "EMAIL"]
+
+        calls.clear()
+        tables[("PUBLIC", "T3")] = "2024-02-01"
+        second = scanner.scan_connection(config)
+        assert second.tables_skipped == 6
+        assert second.tables_completed == 1
+        assert calls.count("columns") == 1
+        assert len(catalog_store.list_assets(limit=100)) == 1 + 2 + 7
+
+        calls.clear()
+        full = scanner.scan_connection(ScanConfig(connection_id="wh", database="ANALYTICS", incremental=False))
+        assert full.tables_skipped == 0
+        assert calls.count("columns") == 7
+
+    def test_scan_connection_caps_concurrency(self, catalog_store):
+        """Test that queries per connection never exceed the configured cap."""
+        from src.data_catalog.scanner import CatalogScanner
+        from src.data_catalog.types import ScanConfig
+
+        tables = {("PUBLIC", f"T{i}"): None for i in range(12)}
+        query_func, state = self._fake_warehouse(tables, [], delay=0.01)
+        scanner = CatalogScanner(catalog_store, query_func)
+
+        result = scanner.scan_connection(ScanConfig(
+            connection_id="wh", database="ANALYTICS", max_workers=8, max_concurrent_queries=3,
+        ))
+
+        assert result.tables_completed == 12
+        assert 1 < state["peak"] <= 3
+        assert result.queries_executed == 1 + 2 + 12  # schemas, table lists, columns
+
+
+class TestColumnProfiler:
+    """Test set-based column profiling."""
+
+    def test_profiles_all_columns_in_few_queries(self, catalog_store):
+        """Test that a wide table is profiled with one statement per chunk."""
+        from src.data_catalog.scanner import CatalogScanner
+        from src.data_catalog.types import ColumnProfile, ScanConfig
+
+        columns = [ColumnProfile(column_name=f"AMT_{i}", data_type="NUMBER(38,2)") for i in range(120)]
+        columns.append(ColumnProfile(column_name="STATUS", data_type="VARCHAR"))
+        queries = []
+
+        def query_func(connection_id, sql):
+            queries.append(sql)
+            if "TOTAL_ROWS" in sql:
+                row = {"TOTAL_ROWS": 10}
+                for i in range(len(columns)):
+                    row.update({f"C{i}_DISTINCT": 4, f"C{i}_NONNULL": 8, f"C{i}_MIN": 1, f"C{i}_MAX": 9})
+                return [row]
+            return [{"STATUS": s} for s in ["open", None, "open", "closed"]]
+
+        scanner = CatalogScanner(catalog_store, query_func)
+        config = ScanConfig(connection_id="wh", profile_sample_percent=10, approximate_distinct=True)
+        scanner._profile_columns(config, "DB", "S", "T", columns, table_version="v1")
+
+        assert len(queries) == 3  # two aggregate chunks + one sample
+        assert "APPROX_COUNT_DISTINCT" in queries[0]
+        assert "TABLESAMPLE BERNOULLI (10)" in queries[0]
+        assert "SAMPLE (1000 ROWS)" in queries[2]
+        assert columns[0].null_count == 2
+        assert columns[0].max_value == "9"
+        assert columns[-1].sample_values == ["open", "closed"]
+
+        # Exact distinct counts unless approximation is requested
+        queries.clear()
+        scanner._profile_columns(ScanConfig(connection_id="wh"), "DB", "S", "T", columns, table_version="v2")
+        assert "APPROX_COUNT_DISTINCT" not in queries[0]
+        assert "COUNT(DISTINCT" in queries[0]
+
+        # Same table version is served from the cache
+        fresh = [ColumnProfile(column_name=c.column_name, data_type=c.data_type) for c in columns]
+        scanner._profile_columns(config, "DB", "S", "T", fresh, table_version="v1")
+        assert len(queries) == 3
+        assert fresh[-1].sample_values == ["open", "closed"]
+
+    def test_profile_file(self, temp_data_dir):
+        """Test profiling a local CSV file."""
+        from src.data_catalog.profiler import profile_file
+
+        path = Path(temp_data_dir) / "orders.csv"
+        path.write_text("order_id,amount,status\n1,10.5,open\n2,,closed\n3,7.25,open\n")
+
+        columns = {c.column_name: c for c in profile_file(str(path))}
+
+        assert columns["order_id"].distinct_count == 3
+        assert columns["amount"].null_count == 1
+        assert float(columns["amount"].min_value) == 7.25
+        assert sorted(columns["status"].sample_values) == ["closed", "open"]
+
 
 # =============================================================================
 # Statistics Tests
@@ -505,8 +818,6 @@ class TestDataCatalogMCPTools:
 
     def test_tools_registration(self, temp_data_dir):
         """Test that tools register successfully."""
-        from unittest.mock import MagicMock
-
         mock_mcp = MagicMock()
         mock_mcp.tool = MagicMock(return_value=lambda f: f)
 
@@ -465,6 +465,81 @@ class TestGitClient:
         assert len(log) >= 1
         assert log[0].message == "Initial commit"
 
+    def test_status_parses_file_states(self, git_repo):
+        """Test staged, modified, untracked and renamed entries."""
+        import subprocess
+
+        repo = Path(git_repo)
+        (repo / "README.md").write_text("# Changed")
+        (repo / "new.txt").write_text("new")
+        (repo / "staged.txt").write_text("staged")
+        subprocess.run(["git", "add", "staged.txt"], cwd=git_repo, capture_output=True)
+        subprocess.run(["git", "mv", "README.md", "DOCS.md"], cwd=git_repo, capture_output=True)
+
+        client = GitClient(status_cache_ttl=0)
+        client.set_repo_path(git_repo)
+        status = client.status()
+
+        assert status["branch"] == "main"
+        assert sorted(status["staged"]) == ["README.md -> DOCS.md", "staged.txt"]
+        assert status["untracked"] == ["new.txt"]
+        assert status["clean"] is False
+        assert status["ahead"] == 0
+
+    def test_status_is_cached_until_repo_changes(self, git_repo):
+        """Test repeated status polls reuse the cached result."""
+        import subprocess
+
+        client = GitClient(status_cache_ttl=60)
+        client.set_repo_path(git_repo)
+        assert client.status()["clean"] is True
+        assert [b.name for b in client.list_branches()] == ["main"]
+
+        with patch("subprocess.run", side_effect=AssertionError("unexpected git call")):
+            assert client.status()["clean"] is True
+            assert [b.name for b in client.list_branches()] == ["main"]
+
+        # Writes through the client invalidate immediately
+        (Path(git_repo) / "a.txt").write_text("a")
+        client.add(files=["a.txt"])
+        assert client.status()["staged"] == ["a.txt"]
+
+        # External index changes are detected by the index stamp
+        subprocess.run(["git", "reset", "-q"], cwd=git_repo, capture_output=True)
+        assert client.status()["staged"] == []
+
+        client.create_branch("x")
+        assert [b.name for b in client.list_branches()] == ["main", "x"]
+        assert client.status()["branch"] == "x"
+
+    def test_get_log_matches_git_log(self, git_repo):
+        """Test history read through cat-file matches git log."""
+        import subprocess
+
+        client = GitClient()
+        client.set_repo_path(git_repo)
+        for i, message in enumerate(["Pipe | in subject", "Multi\nline subject\n\nBody text", "Third"]):
+            (Path(git_repo) / f"f{i}.txt").write_text(str(i))
+            client.commit(message=message, files=[f"f{i}.txt"])
+
+        expected = subprocess.run(
+            ["git", "log", "-3", "--format=%H%x00%s%x00%an%x00%ae%x00%ai"],
+            cwd=git_repo, capture_output=True, text=True,
+        ).stdout.strip().split("\n")
+        log = client.get_log(count=3)
+
+        assert len(log) == 3
+        for commit, line in zip(log, expected):
+            sha, subject, author, email, date = line.split("\x00")
+            assert (commit.sha, commit.message, commit.author, commit.email) == (sha, subject, author, email)
+            assert commit.timestamp.isoformat(" ") == date.rsplit(" ", 1)[0]
+
+        reader = client._reader
+        assert client.get_log(count=1)[0].sha == log[0].sha
+        assert client._reader is reader  # same git process reused
+        client.close()
+        assert client.get_log(count=1)[0].message == "Third"
+
 
 # ========================================
 # GitHubClient Tests
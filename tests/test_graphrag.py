@@ -0,0 +1,329 @@
+"""
+Unit tests for GraphRAG entity linking (Phase 31).
+
+Tests cover:
+- Aho-Corasick multi-pattern matching
+- N-gram index candidate selection and suggestions
+- EntityExtractor linking against known tables/hierarchies/terms
+- ProofOfGraph table suggestions
+- Incremental index maintenance from catalog/hierarchy change events
+- SQL reference extraction and caching
+"""
+
+import shutil
+import tempfile
+
+import pytest
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for tests."""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _table(name, columns, fqn=None):
+    from src.data_catalog.types import AssetType, ColumnProfile, DataAsset
+
+    return DataAsset(
+        name=name,
+        asset_type=AssetType.TABLE,
+        fully_qualified_name=fqn,
+        columns=[ColumnProfile(column_name=c, data_type="VARCHAR") for c in columns],
+    )
+
+
+@pytest.fixture
+def catalog_store(temp_data_dir):
+    """CatalogStore with a few tables."""
+    from src.data_catalog.catalog_store import CatalogStore
+
+    catalog = CatalogStore(data_dir=f"{temp_data_dir}/catalog")
+    catalog.create_asset(_table("GL_ENTRIES", ["ACCOUNT_ID", "AMOUNT"], "FIN.PUBLIC.GL_ENTRIES"))
+    catalog.create_asset(_table("CUSTOMER_DIM", ["CUSTOMER_ID"]))
+    return catalog
+
+
+@pytest.fixture
+def hierarchy_service(temp_data_dir):
+    """HierarchyService with one project and hierarchy."""
+    from src.hierarchy.service import HierarchyService
+
+    service = HierarchyService(data_dir=f"{temp_data_dir}/hierarchy")
+    project = service.create_project("Finance")
+    service.create_hierarchy(project.id, "Revenue")
+    return service
+
+
+# =============================================================================
+# Entity Index Tests
+# =============================================================================
+
+class TestAhoCorasickMatcher:
+    """Tests for the multi-pattern automaton."""
+
+    def test_finds_overlapping_keywords(self):
+        from src.graphrag.entity_index import AhoCorasickMatcher
+
+        matcher = AhoCorasickMatcher()
+        for word in ["he", "she", "his", "hers"]:
+            matcher.add(word)
+
+        found = {(start, key) for start, _end, key, _ in matcher.find_all("ushers")}
+        assert found == {(1, "she"), (2, "he"), (2, "hers")}
+
+    def test_whole_words_and_case(self):
+        from src.graphrag.entity_index import AhoCorasickMatcher
+
+        matcher = AhoCorasickMatcher()
+        matcher.add("Revenue", payload="r1")
+
+        assert matcher.find_all("Total REVENUE by month", whole_words=True) == [
+            (6, 13, "revenue", "r1")
+        ]
+        assert matcher.find_all("revenues", whole_words=True) == []
+        assert len(matcher.find_all("revenues")) == 1
+
+    def test_incremental_add_and_remove(self):
+        from src.graphrag.entity_index import AhoCorasickMatcher
+
+        matcher = AhoCorasickMatcher()
+        matcher.add("alpha")
+        assert matcher.find_all("alpha beta") != []
+
+        matcher.add("beta")
+        matcher.remove("alpha")
+        keys = [key for _, _, key, _ in matcher.find_all("alpha beta")]
+        assert keys == ["beta"]
+
+    def test_single_changes_do_not_recompile(self):
+        from src.graphrag.entity_index import AhoCorasickMatcher
+
+        matcher = AhoCorasickMatcher()
+        for i in range(1000):
+            matcher.add(f"table_{i:04d}")
+        assert len(matcher.find_all("select * from table_0042")) == 1
+        main = matcher._main
+
+        matcher.add("gl_entries")
+        matcher.remove("table_0042")
+        matcher.add("table_0042", payload="again")
+        found = matcher.find_all("join gl_entries on table_0042", whole_words=True)
+        assert [(key, payload) for _, _, key, payload in found] == [
+            ("gl_entries", None), ("table_0042", "again")
+        ]
+        assert matcher._main is main
+
+        # Enough changes fold everything back into one automaton
+        for i in range(300):
+            matcher.remove(f"table_{i:04d}")
+        assert matcher.find_all("table_0001 table_0999") == [(11, 21, "table_0999", None)]
+        assert matcher._main is not main
+
+
+class TestEntityIndex:
+    """Tests for the combined entity index."""
+
+    def test_suggest_uses_ngrams(self):
+        from src.graphrag.entity_index import EntityIndex
+
+        index = EntityIndex()
+        index.add_many(EntityIndex.TABLES, [f"TABLE_{i}" for i in range(500)])
+        index.add(EntityIndex.TABLES, "GL_ENTRIES")
+
+        assert index.suggest(EntityIndex.TABLES, "gl_entry") == "GL_ENTRIES"
+        assert index.suggest(EntityIndex.TABLES, "zzzz") is None
+
+    def test_prefix_and_version(self):
+        from src.graphrag.entity_index import EntityIndex
+
+        index = EntityIndex()
+        index.add_many(EntityIndex.TABLES, ["SALES_FACT", "SALES_DIM", "COST_FACT"])
+        version = index.version
+
+        assert index.prefix(EntityIndex.TABLES, "sales") == ["SALES_DIM", "SALES_FACT"]
+
+        index.remove(EntityIndex.TABLES, "SALES_DIM")
+        assert index.version > version
+        assert index.prefix(EntityIndex.TABLES, "SALES") == ["SALES_FACT"]
+
+
+# =============================================================================
+# Extractor / Validator Tests
+# =============================================================================
+
+class TestEntityExtractor:
+    """Tests for entity linking in EntityExtractor."""
+
+    def test_links_known_entities(self, catalog_store, hierarchy_service):
+        from src.graphrag.entity_extractor import EntityExtractor
+        from src.graphrag.types import EntityType
+
+        extractor = EntityExtractor(
+            catalog_store=catalog_store,
+            hierarchy_service=hierarchy_service,
+            glossary_terms=[{"name": "Net Income", "id": "t1"}],
+        )
+
+        entities = extractor.extract("Show net income from gl_entries for revenue")
+        by_type = {}
+        for e in entities:
+            by_type.setdefault(e.entity_type, []).append(e)
+
+        tables = by_type[EntityType.TABLE]
+        assert tables[0].linked_id == "GL_ENTRIES"
+        assert any(e.linked_id == "REVENUE" for e in by_type[EntityType.HIERARCHY])
+        assert by_type[EntityType.GLOSSARY_TERM][0].linked_id == "t1"
+
+    def test_mentioned_table_without_sql_keyword(self, catalog_store):
+        from src.graphrag.entity_extractor import EntityExtractor
+        from src.graphrag.types import EntityType
+
+        extractor = EntityExtractor(catalog_store=catalog_store)
+        entities = extractor.extract("how many rows are in customer_dim?")
+
+        tables = [e for e in entities if e.entity_type == EntityType.TABLE]
+        assert [t.linked_id for t in tables] == ["CUSTOMER_DIM"]
+
+    def test_add_and_remove_glossary_term(self):
+        from src.graphrag.entity_extractor import EntityExtractor
+        from src.graphrag.types import EntityType
+
+        extractor = EntityExtractor()
+        extractor.add_glossary_term("EBITDA", "t9")
+        assert any(
+            e.entity_type == EntityType.GLOSSARY_TERM
+            for e in extractor.extract("what drove ebitda")
+        )
+
+        extractor.remove_glossary_term("EBITDA")
+        assert not any(
+            e.entity_type == EntityType.GLOSSARY_TERM
+            for e in extractor.extract("what drove ebitda")
+        )
+
+    def test_follows_catalog_changes(self, catalog_store):
+        from src.graphrag.entity_extractor import EntityExtractor
+        from src.graphrag.types import EntityType
+
+        extractor = EntityExtractor(catalog_store=catalog_store)
+        asset = catalog_store.create_asset(_table("ORDERS_FACT", ["ORDER_ID"]))
+        tables = [e for e in extractor.extract("count orders_fact rows") if e.entity_type == EntityType.TABLE]
+        assert [t.linked_id for t in tables] == ["ORDERS_FACT"]
+
+        catalog_store.delete_asset(asset.id)
+        tables = [e for e in extractor.extract("count orders_fact rows") if e.entity_type == EntityType.TABLE]
+        assert tables == []
+
+    def test_removed_table_drops_its_columns(self, catalog_store):
+        from src.graphrag.entity_extractor import EntityExtractor
+        from src.graphrag.entity_index import EntityIndex
+
+        extractor = EntityExtractor(catalog_store=catalog_store)
+        asset = catalog_store.create_asset(_table("ORDERS_FACT", ["ORDER_ID", "CUSTOMER_ID"]))
+        assert extractor.index.contains(EntityIndex.COLUMNS, "ORDER_ID")
+
+        catalog_store.update_asset(asset.id, {"columns": asset.columns[1:]})
+        assert not extractor.index.contains(EntityIndex.COLUMNS, "ORDER_ID")
+
+        catalog_store.delete_asset(asset.id)
+        # Still owned by CUSTOMER_DIM
+        assert extractor.index.contains(EntityIndex.COLUMNS, "CUSTOMER_ID")
+        assert not extractor.index.contains(EntityIndex.COLUMNS, "ORDER_ID")
+
+
+class TestProofOfGraph:
+    """Tests for ProofOfGraph suggestions."""
+
+    def test_suggests_similar_table(self, catalog_store):
+        from src.graphrag.proof_of_graph import ProofOfGraph
+
+        validator = ProofOfGraph(catalog_store=catalog_store)
+        result = validator.validate("SELECT AMOUNT FROM GL_ENTRY")
+
+        assert "GL_ENTRY" in result.missing_entities
+        issue = next(i for i in result.issues if i.entity == "GL_ENTRY")
+        assert "GL_ENTRIES" in issue.suggestion
+
+
+class TestProofOfGraphIndex:
+    """Tests for incremental index maintenance and SQL parsing."""
+
+    def test_catalog_events_update_index(self, catalog_store):
+        from src.graphrag.proof_of_graph import ProofOfGraph
+
+        validator = ProofOfGraph(catalog_store=catalog_store)
+        catalog_store.iter_assets = None  # a full reload would now fail
+
+        asset = catalog_store.create_asset(_table("ORDERS_FACT", ["ORDER_ID"]))
+        assert validator.validate("SELECT ORDER_ID FROM ORDERS_FACT").missing_entities == []
+
+        catalog_store.update_asset(asset.id, {"name": "ORDERS_F"})
+        assert "ORDERS_FACT" not in validator._known_tables
+        assert "ORDERS_F" in validator._known_tables
+
+        catalog_store.delete_asset(asset.id)
+        assert validator.validate("SELECT * FROM ORDERS_F").missing_entities == ["ORDERS_F"]
+        assert "ORDER_ID" not in validator._column_refs
+
+    def test_hierarchy_events_and_shared_names(self, catalog_store, hierarchy_service):
+        from src.graphrag.proof_of_graph import ProofOfGraph
+
+        validator = ProofOfGraph(catalog_store=catalog_store, hierarchy_service=hierarchy_service)
+        project_id = hierarchy_service.list_projects()[0]["id"]
+        hier = hierarchy_service.create_hierarchy(project_id, "Expenses")
+        hierarchy_service.add_source_mapping(
+            project_id, hier.hierarchy_id, "FIN", "PUBLIC", "GL_ENTRIES", "ACCOUNT_ID",
+        )
+
+        assert "EXPENSES" in validator._known_hierarchies
+        assert validator._table_refs["GL_ENTRIES"] == 2
+
+        hierarchy_service.delete_hierarchy(project_id, hier.hierarchy_id)
+        assert "EXPENSES" not in validator._known_hierarchies
+        # Still provided by the catalog asset
+        assert "GL_ENTRIES" in validator._known_tables
+
+    def test_detects_writes_from_other_instances(self, hierarchy_service, temp_data_dir):
+        from src.graphrag.proof_of_graph import ProofOfGraph
+        from src.hierarchy.service import HierarchyService
+
+        validator = ProofOfGraph(hierarchy_service=hierarchy_service)
+        other = HierarchyService(data_dir=f"{temp_data_dir}/hierarchy")
+        project_id = other.list_projects()[0]["id"]
+        other.create_hierarchy(project_id, "Capex")
+
+        validator.validate("hierarchy_name: CAPEX_1", content_type="hierarchy")
+        assert "CAPEX" in validator._known_hierarchies
+
+    def test_sql_references_are_parsed_and_cached(self):
+        from src.graphrag.proof_of_graph import ProofOfGraph, SQLGLOT_AVAILABLE
+
+        validator = ProofOfGraph()
+        sql = (
+            "WITH recent AS (SELECT id, amount FROM fin.public.gl_entries) "
+            "SELECT r.id, SUM(r.amount) AS total FROM recent r "
+            "JOIN customer_dim c ON c.customer_id = r.id GROUP BY r.id"
+        )
+        refs = validator.parse_sql_references(sql)
+
+        assert validator.parse_sql_references(sql) is refs
+        assert "RECENT" in refs.ctes
+        assert "fin.public.gl_entries" in refs.tables
+        assert "customer_dim" in refs.tables
+        if SQLGLOT_AVAILABLE:
+            assert refs.parsed
+            assert set(refs.columns) == {"id", "amount", "customer_id"}
+
+    def test_unparseable_sql_falls_back_to_regex(self):
+        from src.graphrag.proof_of_graph import ProofOfGraph
+
+        validator = ProofOfGraph()
+        refs = validator.parse_sql_references("select * from {{ ref('stg_orders') }} where status = 'x'")
+        assert "status" in refs.columns
@@ -0,0 +1,225 @@
+"""
+Unit tests for the hierarchy auto-sync outbox.
+
+Tests cover:
+- Coalescing of repeated changes per hierarchy
+- Background delivery with batched mappings and bulk deletes
+- Retries with backoff and dead-lettering
+- Journal persistence and recovery
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for the outbox journal."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _op(operation, hierarchy_id=None, data=None, project_id="p1"):
+    return {
+        "operation": operation,
+        "project_id": project_id,
+        "hierarchy_id": hierarchy_id,
+        "data": data,
+        "enqueued_at": time.time(),
+        "attempts": 0,
+    }
+
+
+def _sync(temp_dir=None, **options):
+    """Build a HierarchyApiSync whose HTTP calls are recorded."""
+    from src.hierarchy.api_sync import HierarchyApiSync
+
+    sync = HierarchyApiSync(
+        base_url="http://backend/api",
+        api_key="key",
+        outbox_path=temp_dir / "outbox.jsonl" if temp_dir else None,
+    )
+    manager = sync.auto_sync_manager
+    manager.set_local_service(object())
+    manager.disable_event_bus()
+    for name, value in options.items():
+        setattr(manager, name, value)
+    return sync, manager
+
+
+# =============================================================================
+# Coalescing Tests
+# =============================================================================
+
+class TestOutboxCoalescing:
+    """Tests for SyncOutbox coalescing rules."""
+
+    def test_updates_and_mappings_collapse(self):
+        from src.hierarchy.api_sync import SyncOutbox
+
+        outbox = SyncOutbox()
+        outbox.put(_op("create_hierarchy", "H1", {"hierarchy_name": "H1"}))
+        for version in range(3):
+            outbox.put(_op("update_hierarchy", "H1", {"hierarchy_name": "H1", "version": version}))
+        outbox.put(_op("add_mapping", "H1", {"source_column": "A"}))
+        outbox.put(_op("add_mapping", "H1", {"source_column": "B"}))
+        outbox.put(_op("update_hierarchy", "H2", {"hierarchy_name": "H2", "version": 0}))
+
+        slot, = outbox.take_ready(1, time.time())
+        assert [op["operation"] for op in slot] == ["create_hierarchy", "update_hierarchy", "add_mapping"]
+        assert slot[1]["data"] == {"hierarchy_name": "H1", "version": 2}
+        assert [m["source_column"] for m in slot[2]["mappings"]] == ["A", "B"]
+        assert outbox.coalesced == 3
+        assert len(outbox) == 1
+
+    def test_marker_updates_are_not_merged(self):
+        from src.hierarchy.api_sync import SyncOutbox
+
+        outbox = SyncOutbox()
+        outbox.put(_op("update_hierarchy", "H1", {"hierarchy_name": "H1", "version": 1}))
+        outbox.put(_op("update_hierarchy", "H1", {"property_added": "color"}))
+        outbox.put(_op("update_hierarchy", "H1", {"property_added": "size"}))
+        outbox.put(_op("update_hierarchy", "H1", {"hierarchy_name": "H1", "version": 2}))
+
+        slot, = outbox.take_ready(1, time.time())
+        assert [op["data"] for op in slot] == [
+            {"hierarchy_name": "H1", "version": 1},
+            {"property_added": "color"},
+            {"property_added": "size"},
+            {"hierarchy_name": "H1", "version": 2},
+        ]
+        assert outbox.coalesced == 0
+
+    def test_deletes_cancel_pending_work(self):
+        from src.hierarchy.api_sync import SyncOutbox
+
+        outbox = SyncOutbox()
+        outbox.put(_op("create_hierarchy", "NEW"))
+        outbox.put(_op("update_hierarchy", "NEW"))
+        outbox.put(_op("delete_hierarchy", "NEW"))
+        assert len(outbox) == 0
+
+        outbox.put(_op("update_hierarchy", "OLD"))
+        outbox.put(_op("delete_hierarchy", "OLD"))
+        assert [op["operation"] for slot in outbox.take_ready(10, time.time()) for op in slot] == [
+            "delete_hierarchy"
+        ]
+
+        outbox.put(_op("create_project", project_id="p2"))
+        outbox.put(_op("create_hierarchy", "X", project_id="p2"))
+        outbox.put(_op("delete_project", project_id="p2"))
+        assert len(outbox) == 0
+
+    def test_journal_is_replayed(self, temp_dir):
+        from src.hierarchy.api_sync import SyncOutbox
+
+        path = temp_dir / "outbox.jsonl"
+        outbox = SyncOutbox(path)
+        outbox.put(_op("update_hierarchy", "H1", {"hierarchy_name": "H1", "version": 1}))
+        outbox.put(_op("update_hierarchy", "H1", {"hierarchy_name": "H1", "version": 2}))
+        outbox.put(_op("add_mapping", "H2", {"source_column": "A"}))
+
+        recovered = SyncOutbox(path)
+        assert len(recovered) == 2
+        slots = recovered.take_ready(10, time.time())
+        assert slots[0][0]["data"] == {"hierarchy_name": "H1", "version": 2}
+        # Startup compacts the journal to the pending operations
+        assert len(path.read_text().splitlines()) == 2
+
+
+# =============================================================================
+# Delivery Tests
+# =============================================================================
+
+class TestOutboxDelivery:
+    """Tests for the background worker."""
+
+    def test_local_changes_are_queued_and_delivered_coalesced(self, temp_dir):
+        sync, manager = _sync(temp_dir)
+        calls = []
+        events = []
+        manager.add_callback(events.append)
+
+        def request(method, endpoint, data=None, params=None):
+            calls.append((method, endpoint))
+            if method == "GET":
+                return {"hierarchyId": "H1", "mapping": [{"mapping_index": 4}]}
+            return {"success": True}
+
+        with patch.object(sync, "_request", side_effect=request), \
+                patch.object(manager, "_ensure_worker"):
+            result = manager.on_local_change("create_hierarchy", "p1", "H1", {"hierarchy_name": "H1"})
+            for version in range(5):
+                manager.on_local_change(
+                    "update_hierarchy", "p1", "H1", {"hierarchy_id": "H1", "hierarchy_name": "H1", "v": version}
+                )
+            manager.on_local_change("add_mapping", "p1", "H1", {"source_column": "A"})
+            manager.on_local_change("add_mapping", "p1", "H1", {"source_column": "B"})
+            for hierarchy_id in ("D1", "D2", "D3"):
+                manager.on_local_change("delete_hierarchy", "p1", hierarchy_id)
+
+            assert result["queued"] is True
+            assert calls == []
+            assert manager.get_outbox_stats()["queue_depth"] == 6
+
+        with patch.object(sync, "_request", side_effect=request) as mock_request:
+            manager._ensure_worker()
+            assert manager.flush(timeout=5)
+
+        assert calls == [
+            ("POST", "/smart-hierarchy"),
+            ("PUT", "/smart-hierarchy/project/p1/H1"),
+            ("GET", "/smart-hierarchy/project/p1/H1"),
+            ("PUT", "/smart-hierarchy/project/p1/H1"),
+            ("POST", "/smart-hierarchy/project/p1/bulk-delete"),
+        ]
+        mapping_update = mock_request.call_args_list[3].args[2]["mapping"]
+        assert [m["mapping_index"] for m in mapping_update] == [4, 5, 6]
+        assert mock_request.call_args_list[4].args[2] == {"hierarchyIds": ["D1", "D2", "D3"]}
+
+        stats = manager.get_outbox_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["coalesced"] == 5
+        assert stats["sent"] == 6
+        assert [e["operation"] for e in events].count("delete_hierarchy") == 3
+        assert sync.get_sync_status()["outbox"]["durable"] is True
+        manager.stop()
+
+    def test_failures_retry_with_backoff_then_dead_letter(self):
+        sync, manager = _sync(retry_backoff=0.01, max_attempts=3)
+        responses = [{"error": True, "message": "Backend not reachable"}, {"success": True}]
+
+        with patch.object(sync, "_request", side_effect=lambda *a, **k: responses.pop(0)):
+            manager.on_local_change("update_hierarchy", "p1", "H1", {"hierarchy_id": "H1"})
+            assert manager.flush(timeout=5)
+
+        stats = manager.get_outbox_stats()
+        assert (stats["sent"], stats["failed_attempts"]) == (1, 1)
+        assert stats["last_error"] == "Backend not reachable"
+
+        with patch.object(sync, "_request", return_value={"error": True, "message": "down"}):
+            manager.on_local_change("update_hierarchy", "p1", "H2", {"hierarchy_id": "H2"})
+            assert manager.flush(timeout=5)
+
+        assert [op["hierarchy_id"] for op in manager.dead_letters] == ["H2"]
+        assert manager.get_outbox_stats()["failed_attempts"] == 4
+        manager.stop()
+
+    def test_inline_mode_syncs_immediately(self):
+        sync, manager = _sync(background=False)
+
+        with patch.object(sync, "_request", return_value={"success": True}) as mock_request:
+            result = manager.on_local_change("delete_project", "p1")
+
+        assert result["synced"] is True
+        mock_request.assert_called_once_with("DELETE", "/smart-hierarchy/projects/p1")
@@ -0,0 +1,231 @@
+"""
+Unit tests for the plugin loader.
+
+Tests cover:
+- Tool signature generation for plugin.json manifests
+- Lazy stub registration and first-call import
+- Eager fallback for context providers and unsupported signatures
+- Tool manifest cache keyed by plugin source hash
+- Startup timing report
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+
+
+PLUGIN_SOURCE = '''
+from typing import Any, Dict, Optional
+
+
+class Thing:
+    pass
+
+
+def register_{name}_tools(mcp, settings=None):
+    @mcp.tool()
+    def {name}_add(a: int, b: int = 2, label: Optional[str] = None) -> Dict[str, Any]:
+        """Add two numbers."""
+        return {{"sum": a + b, "label": label}}
+
+    @mcp.tool()
+    async def {name}_echo(text: str) -> str:
+        """Echo text in upper case."""
+        return text.upper()
+    {extra}
+    return "service"
+'''
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+class FakeMCP:
+    """Minimal FastMCP stand-in recording registered tools."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, *args, **kwargs):
+        def decorator(fn):
+            self.tools[kwargs.get("name") or fn.__name__] = fn
+            return fn
+        return decorator
+
+
+@pytest.fixture
+def plugin_root():
+    """Create a temporary plugin directory root."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _make_plugin(root, name=None, extra="", signatures=True):
+    """Write a plugin directory, optionally with generated tool signatures."""
+    from src.plugins.loader import discover_plugins, generate_tool_signatures
+
+    name = name or f"demo{uuid.uuid4().hex[:8]}"
+    plugin_dir = root / name
+    plugin_dir.mkdir()
+    (plugin_dir / "mcp_tools.py").write_text(PLUGIN_SOURCE.format(name=name, extra=extra))
+    manifest = {"name": name, "tier": "CE", "phase": 1, "tools": 2}
+    (plugin_dir / "plugin.json").write_text(json.dumps(manifest))
+
+    if signatures:
+        discovered = next(m for m in discover_plugins([root]) if m["name"] == name)
+        manifest["tool_signatures"] = generate_tool_signatures(discovered)
+        (plugin_dir / "plugin.json").write_text(json.dumps(manifest))
+        # Forget the import done while generating signatures
+        sys.modules.pop(f"databridge_plugin_{name}_mcp_tools", None)
+    return name
+
+
+# =============================================================================
+# Signature Generation Tests
+# =============================================================================
+
+class TestToolSignatures:
+    """Tests for generate_tool_signatures."""
+
+    def test_generates_manifest_signatures(self, plugin_root):
+        name = _make_plugin(plugin_root)
+        manifest = json.loads((plugin_root / name / "plugin.json").read_text())
+
+        add, echo = manifest["tool_signatures"]
+        assert add["name"] == f"{name}_add"
+        assert add["description"] == "Add two numbers."
+        assert add["parameters"] == [
+            {"name": "a", "type": "int"},
+            {"name": "b", "type": "int", "default": 2},
+            {"name": "label", "type": "Optional[str]", "default": None},
+        ]
+        assert add["returns"] == "Dict[str, Any]"
+        assert echo.get("async") is True
+
+    def test_unsupported_types_are_not_described(self, plugin_root):
+        from src.plugins.loader import discover_plugins, generate_tool_signatures
+
+        extra = '''
+    @mcp.tool()
+    def custom(thing: Thing) -> str:
+        return "x"
+'''
+        name = _make_plugin(plugin_root, extra=extra, signatures=False)
+        manifest = next(m for m in discover_plugins([plugin_root]) if m["name"] == name)
+
+        assert generate_tool_signatures(manifest) is None
+
+
+# =============================================================================
+# Lazy Loading Tests
+# =============================================================================
+
+class TestLazyLoading:
+    """Tests for stub registration and deferred imports."""
+
+    def test_stubs_import_module_on_first_call(self, plugin_root):
+        import asyncio
+        import inspect
+        from src.plugins.loader import load_all_plugins
+
+        name = _make_plugin(plugin_root)
+        mcp = FakeMCP()
+        results = load_all_plugins(mcp, None, plugin_dirs=[plugin_root], license_manager=None, lazy=True)
+
+        assert results[name]["lazy"] is True
+        assert results[name]["loaded"] is True
+        assert f"databridge_plugin_{name}_mcp_tools" not in sys.modules
+
+        add = mcp.tools[f"{name}_add"]
+        assert list(inspect.signature(add).parameters) == ["a", "b", "label"]
+        assert add(a=3) == {"sum": 5, "label": None}
+        assert f"databridge_plugin_{name}_mcp_tools" in sys.modules
+        assert "import_ms" in results[name]
+
+        echo = mcp.tools[f"{name}_echo"]
+        assert inspect.iscoroutinefunction(echo)
+        assert asyncio.run(echo(text="hi")) == "HI"
+
+    def test_eager_when_disabled_or_context_provider(self, plugin_root, monkeypatch):
+        from src.plugins import loader
+        from src.plugins.loader import load_all_plugins
+
+        name = _make_plugin(plugin_root)
+        provider = _make_plugin(plugin_root)
+        monkeypatch.setitem(loader.CONTEXT_PROVIDERS, provider, "demo_service")
+        mcp = FakeMCP()
+        context = {}
+        results = load_all_plugins(
+            mcp, None, plugin_dirs=[plugin_root], context=context, license_manager=None, lazy=False,
+        )
+
+        assert not results[name].get("lazy")
+        assert results[provider]["loaded"] is True
+        assert context["demo_service"] == "service"
+        assert mcp.tools[f"{name}_add"](a=1, b=1)["sum"] == 2
+
+        mcp = FakeMCP()
+        context = {}
+        results = load_all_plugins(
+            mcp, None, plugin_dirs=[plugin_root], context=context, license_manager=None, lazy=True,
+        )
+        assert results[name]["lazy"] is True
+        assert not results[provider].get("lazy")
+        assert context["demo_service"] == "service"
+
+    def test_manifest_cache_makes_next_start_lazy(self, plugin_root):
+        from src.plugins.loader import ToolManifestCache, discover_plugins, load_all_plugins
+
+        name = _make_plugin(plugin_root, signatures=False)
+        cache_path = plugin_root / "cache" / "tool_manifest_cache.json"
+        module_name = f"databridge_plugin_{name}_mcp_tools"
+
+        mcp = FakeMCP()
+        results = load_all_plugins(
+            mcp, None, plugin_dirs=[plugin_root], license_manager=None, lazy=True,
+            manifest_cache=cache_path,
+        )
+        assert not results[name].get("lazy")
+        assert mcp.tools[f"{name}_add"](a=1)["sum"] == 3
+        assert cache_path.exists()
+
+        sys.modules.pop(module_name, None)
+        mcp = FakeMCP()
+        results = load_all_plugins(
+            mcp, None, plugin_dirs=[plugin_root], license_manager=None, lazy=True,
+            manifest_cache=cache_path,
+        )
+        assert results[name]["lazy"] is True
+        assert results[name]["cached"] is True
+        assert module_name not in sys.modules
+        assert mcp.tools[f"{name}_add"](a=1)["sum"] == 3
+
+        # Editing the plugin source invalidates its entry
+        source = plugin_root / name / "mcp_tools.py"
+        source.write_text(source.read_text() + "\n# changed\n")
+        sys.modules.pop(module_name, None)
+        results = load_all_plugins(
+            FakeMCP(), None, plugin_dirs=[plugin_root], license_manager=None, lazy=True,
+            manifest_cache=cache_path,
+        )
+        assert not results[name].get("lazy")
+        manifest = next(m for m in discover_plugins([plugin_root]) if m["name"] == name)
+        assert ToolManifestCache(cache_path).get(manifest) is not None
+
+    def test_timing_report(self, plugin_root):
+        from src.plugins.loader import format_timing_report, load_all_plugins
+
+        name = _make_plugin(plugin_root)
+        results = load_all_plugins(FakeMCP(), None, plugin_dirs=[plugin_root], license_manager=None, lazy=True)
+
+        report = format_timing_report(results)
+        assert report.startswith("[Plugins] Startup")
+        assert "(1 lazy)" in report
+        assert name in report
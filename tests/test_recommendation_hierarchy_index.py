@@ -0,0 +1,100 @@
+"""
+Unit tests for the column-to-hierarchy match index.
+
+Tests cover:
+- Exact, partial and source-mapping matches in listing order
+- Incremental maintenance from HierarchyService change events
+- Rebuild after writes from another service instance
+"""
+
+import shutil
+import tempfile
+
+import pytest
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def hierarchy_service():
+    """HierarchyService over a temporary data directory."""
+    from src.hierarchy.service import HierarchyService
+
+    temp_dir = tempfile.mkdtemp()
+    yield HierarchyService(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def project(hierarchy_service):
+    """Project with a few hierarchies and one source mapping."""
+    proj = hierarchy_service.create_project("Financials")
+    hierarchy_service.create_hierarchy(proj.id, "Total Revenue", sort_order=2)
+    hierarchy_service.create_hierarchy(proj.id, "Cost_Center", sort_order=1)
+    gl = hierarchy_service.create_hierarchy(proj.id, "GL", sort_order=3)
+    hierarchy_service.add_source_mapping(proj.id, gl.hierarchy_id, "DB", "S", "T", "ACCOUNT_CODE")
+    return proj
+
+
+def _summary(matches):
+    return [(m["hierarchy_name"], m["match_type"], m["column"]) for m in matches]
+
+
+# =============================================================================
+# Match Tests
+# =============================================================================
+
+class TestHierarchyMatchIndex:
+    """Tests for HierarchyMatchIndex."""
+
+    def test_match_types_and_order(self, hierarchy_service, project):
+        from src.recommendations.recommendation_engine import RecommendationEngine
+
+        engine = RecommendationEngine(hierarchy_service=hierarchy_service)
+        matches = engine.check_existing_hierarchies(
+            ["cost-center", "REVENUE", "account_code", "GL_BALANCE", "UNRELATED"]
+        )
+
+        assert _summary(matches) == [
+            ("Cost_Center", "exact", "cost-center"),
+            ("Total Revenue", "partial", "REVENUE"),
+            ("GL", "partial", "GL_BALANCE"),
+            ("GL", "mapping_match", "account_code"),
+        ]
+        assert matches[0]["project_name"] == "Financials"
+        assert matches[0]["recommendation"] == (
+            "Map column 'cost-center' to existing hierarchy 'Cost_Center' in project 'Financials'"
+        )
+
+    def test_events_update_index_without_rescans(self, hierarchy_service, project, monkeypatch):
+        from src.recommendations.hierarchy_index import HierarchyMatchIndex
+
+        index = HierarchyMatchIndex(hierarchy_service)
+        monkeypatch.setattr(index, "rebuild", lambda: pytest.fail("unexpected rebuild"))
+
+        node = hierarchy_service.create_hierarchy(project.id, "Net Income")
+        assert _summary(index.match_columns(["NET_INCOME"])) == [("Net Income", "exact", "NET_INCOME")]
+
+        hierarchy_service.update_hierarchy(project.id, node.hierarchy_id, {"hierarchy_name": "EBITDA"})
+        assert index.match_columns(["NET_INCOME"]) == []
+        assert _summary(index.match_columns(["ebitda"])) == [("EBITDA", "exact", "ebitda")]
+
+        hierarchy_service.delete_hierarchy(project.id, node.hierarchy_id)
+        assert index.match_columns(["ebitda"]) == []
+
+        hierarchy_service.delete_project(project.id)
+        assert index.match_columns(["REVENUE", "ACCOUNT_CODE"]) == []
+        assert len(index) == 0
+
+    def test_external_writes_trigger_rebuild(self, hierarchy_service, project):
+        from src.hierarchy.service import HierarchyService
+        from src.recommendations.hierarchy_index import HierarchyMatchIndex
+
+        index = HierarchyMatchIndex(hierarchy_service)
+        HierarchyService(str(hierarchy_service.data_dir)).create_hierarchy(project.id, "Capex")
+
+        assert _summary(index.match_columns(["CAPEX"])) == [("Capex", "exact", "CAPEX")]
+        index.close()
+        assert index._on_change not in hierarchy_service._listeners
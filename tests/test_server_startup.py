@@ -0,0 +1,103 @@
+"""
+Startup benchmark for the MCP server.
+
+Imports src.server in a fresh interpreter under ``python -X importtime``
+and fails if the import exceeds the startup budget or pulls in optional
+heavy dependencies that should only load when a tool needs them.
+
+The budget defaults to STARTUP_BUDGET_MS, about 1.3x the warm-cache import
+time measured on a development machine (~1.5 s under -X importtime), and
+can be overridden with $DATABRIDGE_STARTUP_BUDGET_MS on slow CI runners.
+The best of STARTUP_RUNS warm imports is compared so scheduler noise does
+not fail the test.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+STARTUP_BUDGET_MS = 2000
+STARTUP_RUNS = 3
+
+# Modules that must not be imported just to advertise the tools
+DEFERRED_MODULES = [
+    "pypdf", "pytesseract", "PIL", "sqlalchemy", "rapidfuzz",
+    "sentence_transformers", "chromadb", "duckdb",
+]
+
+PROBE = """
+import json, sys, types
+import src.server
+pandas = sys.modules.get("pandas")
+print(json.dumps({
+    "imported": [m for m in %r if m in sys.modules],
+    "pandas_loaded": type(pandas) is types.ModuleType,
+}))
+""" % (DEFERRED_MODULES,)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary data directory for the server."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _import_server(data_dir: Path):
+    """Import src.server in a subprocess. Returns (cumulative_ms, probe)."""
+    env = dict(
+        os.environ,
+        DATA_DIR=str(data_dir),
+        WORKFLOW_FILE=str(data_dir / "workflow.json"),
+        AUDIT_LOG=str(data_dir / "audit_trail.csv"),
+        DATABRIDGE_LAZY_PLUGINS="1",
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=300,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    cumulative_ms = None
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if line.startswith("import time:") and len(parts) == 3 and parts[2].strip() == "src.server":
+            cumulative_ms = int(parts[1]) / 1000
+    assert cumulative_ms is not None, "src.server missing from -X importtime output"
+
+    probe = json.loads(proc.stdout.strip().splitlines()[-1])
+    return cumulative_ms, probe
+
+
+# =============================================================================
+# Startup Budget Tests
+# =============================================================================
+
+class TestServerStartup:
+    """Import-time budget for src.server."""
+
+    def test_import_within_budget(self, temp_data_dir):
+        # The first start imports plugins and fills the tool manifest cache
+        _import_server(temp_data_dir)
+        assert (temp_data_dir / "tool_manifest_cache.json").exists()
+
+        budget = float(os.environ.get("DATABRIDGE_STARTUP_BUDGET_MS", STARTUP_BUDGET_MS))
+        runs = [_import_server(temp_data_dir) for _ in range(STARTUP_RUNS)]
+        elapsed_ms, probe = min(runs, key=lambda run: run[0])
+
+        assert elapsed_ms < budget, f"src.server import took {elapsed_ms:.0f} ms (budget {budget:.0f} ms)"
+        assert probe["imported"] == []
+        assert probe["pandas_loaded"] is False
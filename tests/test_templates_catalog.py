@@ -0,0 +1,183 @@
+"""
+Unit tests for the cached template, skill and knowledge base catalogs.
+
+Tests cover:
+- Indexed template lookups by industry, domain and hierarchy type
+- Lazily parsed template bodies served from the LRU
+- Invalidation when files change on disk
+- Cached client knowledge profiles
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+def _template_entry(template_id, industry="general", domain="accounting", hierarchy_type="income_statement"):
+    return {
+        "id": template_id,
+        "name": template_id.title(),
+        "domain": domain,
+        "hierarchy_type": hierarchy_type,
+        "category": "income_statement",
+        "industry": industry,
+        "description": f"{template_id} template",
+        "file": f"{domain}/{template_id}.json",
+    }
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _touch_later(path):
+    """Bump mtime so the change is visible even on coarse-grained filesystems."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for templates, skills and knowledge base."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def service(temp_dir):
+    """TemplateService over a small on-disk catalog."""
+    from src.templates.service import TemplateService
+
+    templates_dir = temp_dir / "templates"
+    entries = [
+        _template_entry("standard_pl"),
+        _template_entry("oil_gas_los", industry="oil_gas"),
+        _template_entry("upstream_pl", industry="oil_gas_upstream"),
+        _template_entry("saas_pl", industry="saas"),
+        _template_entry("geo", domain="operations", hierarchy_type="geographic"),
+    ]
+    _write_json(templates_dir / "index.json", {"version": "2.0", "templates": entries})
+    for entry in entries:
+        _write_json(templates_dir / entry["file"], {
+            "id": entry["id"],
+            "name": entry["name"],
+            "industry": entry["industry"],
+            "description": entry["description"],
+            "hierarchies": [{"hierarchy_id": "ROOT", "hierarchy_name": "Root", "level": 1}],
+        })
+
+    skills_dir = temp_dir / "skills"
+    _write_json(skills_dir / "index.json", {
+        "skills": [
+            {"id": "analyst", "name": "Analyst", "description": "General", "domain": "accounting",
+             "industries": ["general"], "prompt_file": "analyst.txt", "documentation_file": "analyst.md"},
+            {"id": "oil", "name": "Oil", "description": "Oil & gas", "domain": "operations",
+             "industries": ["oil_gas"], "prompt_file": "oil.txt", "documentation_file": "oil.md"},
+        ],
+        "industries": {"oil_gas": ["oil"], "general": ["analyst"]},
+    })
+    (skills_dir / "oil.txt").write_text("You are an oil & gas analyst.", encoding="utf-8")
+
+    return TemplateService(str(templates_dir), str(skills_dir), str(temp_dir / "knowledge_base"))
+
+
+# =============================================================================
+# Template Catalog Tests
+# =============================================================================
+
+class TestTemplateCatalog:
+    """Tests for indexed template listing and lookup."""
+
+    def test_industry_matches_general_parents_and_children(self, service):
+        def ids(**filters):
+            return [t.id for t in service.list_templates(**filters)]
+
+        assert ids(industry="oil_gas") == ["standard_pl", "oil_gas_los", "upstream_pl", "geo"]
+        assert ids(industry="oil_gas_upstream") == ["standard_pl", "oil_gas_los", "upstream_pl", "geo"]
+        assert ids(industry="saas_b2b") == ["standard_pl", "saas_pl", "geo"]
+        assert ids(industry="saas", domain="accounting") == ["standard_pl", "saas_pl"]
+        assert ids(hierarchy_type="geographic") == ["geo"]
+        assert ids(domain="finance") == []
+
+    def test_index_is_parsed_once(self, service, monkeypatch):
+        service.list_templates()
+        service.get_template("standard_pl")
+        monkeypatch.setattr(service, "_load_json", lambda path: pytest.fail(f"re-read {path}"))
+
+        for _ in range(3):
+            assert len(service.list_templates(industry="saas")) == 3
+            assert service.get_template("standard_pl").id == "standard_pl"
+
+    def test_template_bodies_are_cached_and_isolated(self, service):
+        first = service.get_template("upstream_pl")
+        first.hierarchies.clear()
+
+        second = service.get_template("upstream_pl")
+        assert len(second.hierarchies) == 1
+        assert service.get_template("missing") is None
+        assert service.get_cache_stats()["parsed_files"]["hits"] == 1
+
+    def test_changes_on_disk_are_picked_up(self, service):
+        index_path = service.templates_dir / "index.json"
+        body_path = service.templates_dir / "accounting" / "saas_pl.json"
+        assert service.get_template("saas_pl").name == "Saas_Pl"
+
+        body = json.loads(body_path.read_text())
+        body["name"] = "SaaS P&L v2"
+        _write_json(body_path, body)
+        _touch_later(body_path)
+        assert service.get_template("saas_pl").name == "SaaS P&L v2"
+
+        index = json.loads(index_path.read_text())
+        index["templates"] = index["templates"][:1]
+        _write_json(index_path, index)
+        _touch_later(index_path)
+        assert [t.id for t in service.list_templates()] == ["standard_pl"]
+        assert service.get_template("saas_pl") is None
+
+
+# =============================================================================
+# Skill and Knowledge Base Tests
+# =============================================================================
+
+class TestSkillAndClientCatalog:
+    """Tests for cached skills and client knowledge."""
+
+    def test_skill_lookups(self, service):
+        assert [s.id for s in service.list_skills(industry="oil_gas_upstream")] == ["analyst", "oil"]
+        assert [s.id for s in service.list_skills(domain="operations")] == ["oil"]
+        assert [s.id for s in service.get_skills_for_industry("oil_gas")] == ["oil"]
+        assert service.get_skill("oil").name == "Oil"
+        assert service.get_skill("missing") is None
+        assert service.get_skill_prompt("oil") == "You are an oil & gas analyst."
+        assert service.get_skill_prompt("analyst") is None
+
+    def test_client_knowledge_tracks_updates(self, service):
+        from src.templates.types import CustomPrompt
+
+        service.create_client("acme", "Acme Corp", industry="saas")
+        assert service.get_client_knowledge("acme").industry == "saas"
+        assert [c.client_id for c in service.list_clients()] == ["acme"]
+
+        service.update_client_knowledge("acme", "industry", "manufacturing")
+        assert service.get_client_knowledge("acme").industry == "manufacturing"
+        assert service.list_clients()[0].industry == "manufacturing"
+
+        service.add_client_prompt("acme", CustomPrompt(id="p1", name="P", trigger="t", content="c"))
+        knowledge = service.get_client_knowledge("acme")
+        assert [p.id for p in knowledge.custom_prompts] == ["p1"]
+        assert service.list_clients()[0].prompt_count == 1
+
+        knowledge.custom_prompts.clear()
+        assert len(service.get_client_knowledge("acme").custom_prompts) == 1
+        assert service.get_client_knowledge("unknown") is None
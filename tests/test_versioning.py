@@ -896,7 +896,7 @@ class TestEdgeCases:
         assert len(multi_objects) == 3
 
     def test_large_snapshot_storage(self, temp_data_dir):
-        """Test that large snapshots are stored separately."""
+        """Test that large snapshots are stored as compressed blobs."""
         store = VersionStore(data_dir=temp_data_dir)
 
         # Create a large snapshot (>10KB)
@@ -909,9 +909,12 @@ class TestEdgeCases:
             change_type=ChangeType.CREATE,
         )
 
-        # Check snapshot file was created
-        snapshot_dir = Path(temp_data_dir) / "snapshots" / "hierarchy_project" / "large-1"
-        assert snapshot_dir.exists()
+        # Check a compressed snapshot blob was created, not a copy in the history log
+        blobs = list((Path(temp_data_dir) / "blobs").glob("*/*.json.gz"))
+        assert len(blobs) == 1
+        assert blobs[0].stat().st_size < 1000
+        log_file = Path(temp_data_dir) / "histories" / "hierarchy_project" / "large-1.jsonl"
+        assert "x" * 100 not in log_file.read_text()
 
         # Verify we can retrieve it
         retrieved = store.get_version(
@@ -921,5 +924,190 @@ class TestEdgeCases:
         assert len(retrieved.snapshot["data"]) == 15000
 
 
+class TestSnapshotStorage:
+    """Tests for delta-encoded, content-addressed snapshot storage."""
+
+    @staticmethod
+    def _project(n_hierarchies, renamed=None):
+        hierarchies = [
+            {"id": f"H{i:04d}", "name": f"Node {i}", "level": i % 5, "children": [f"H{i + 1:04d}"]}
+            for i in range(n_hierarchies)
+        ]
+        if renamed is not None:
+            hierarchies[renamed]["name"] = f"Renamed {renamed}"
+        return {"name": "Big Project", "hierarchies": hierarchies}
+
+    def test_delta_round_trip(self):
+        from src.versioning.delta import apply_delta, compute_delta
+
+        old = {"a": 1, "b": {"c": [1, 2, 3], "d": "x"}, "items": [{"k": 1}, {"k": 2}, {"k": 3}]}
+        new = {"b": {"c": [1, 3, 4], "d": "x"}, "items": [{"k": 1}, {"k": 20}, {"k": 3}, {"k": 4}], "e": None}
+        assert apply_delta(old, compute_delta(old, new)) == new
+        assert list(apply_delta(old, compute_delta(old, {"b": 1, "a": 1}))) == ["b", "a"]
+        assert apply_delta([1], compute_delta([1], {"x": 1})) == {"x": 1}
+
+    def test_delta_keeps_type_only_changes(self):
+        from src.versioning.delta import apply_delta, compute_delta
+
+        cases = [
+            ({"root": True}, {"root": 1}),
+            ({"a": {"x": 1.0}}, {"a": {"x": 1}}),
+            ({"a": [{"x": 0}]}, {"a": [{"x": False}]}),
+        ]
+        for old, new in cases:
+            restored = apply_delta(old, compute_delta(old, new))
+            assert json.dumps(restored) == json.dumps(new)
+
+    def test_versions_are_stored_as_deltas_with_keyframes(self, temp_data_dir):
+        store = VersionStore(data_dir=temp_data_dir)
+        store.KEYFRAME_INTERVAL = 4
+        for i in range(10):
+            store.create_version(
+                VersionedObjectType.HIERARCHY_PROJECT, "big", self._project(300, renamed=i), ChangeType.UPDATE,
+            )
+
+        history = store.get_history(VersionedObjectType.HIERARCHY_PROJECT, "big", load_snapshots=False)
+        depths = [store._chain_depth(store._refs[v.id]) for v in history.versions]
+        assert depths == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+        assert all(v.snapshot == {} for v in history.versions)
+
+        reloaded = VersionStore(data_dir=temp_data_dir)
+        for i in range(10):
+            v = reloaded.get_version(VersionedObjectType.HIERARCHY_PROJECT, "big", f"0.0.{i + 1}")
+            assert v.snapshot == self._project(300, renamed=i)
+
+    def test_identical_snapshots_share_a_blob(self, version_manager, temp_data_dir):
+        obj = VersionedObjectType.HIERARCHY
+        version_manager.snapshot(obj, "h1", {"v": 1})
+        version_manager.snapshot(obj, "h1", {"v": 2})
+        restored = version_manager.rollback(obj, "h1", "0.0.1")
+
+        assert restored == {"v": 1}
+        assert version_manager.get_latest(obj, "h1").snapshot == {"v": 1}
+        assert len(list((Path(temp_data_dir) / "blobs").glob("*/*.json.gz"))) == 2
+
+    def test_tags_and_deletes_survive_reload(self, version_store, temp_data_dir):
+        obj = VersionedObjectType.HIERARCHY
+        for i in range(3):
+            version_store.create_version(obj, "h/2", {"v": i}, ChangeType.UPDATE, object_name="Slash")
+        version_store.add_tag(obj, "h/2", "0.0.2", "release")
+        version_store.delete_version(obj, "h/2", "0.0.1")
+
+        reloaded = VersionStore(data_dir=temp_data_dir)
+        history = reloaded.get_history(obj, "h/2")
+        assert history.object_name == "Slash"
+        assert [v.version for v in history.versions] == ["0.0.2", "0.0.3"]
+        assert history.versions[0].tags == ["release"]
+        assert [v.snapshot for v in history.versions] == [{"v": 1}, {"v": 2}]
+
+    def test_legacy_histories_file_is_migrated(self, temp_data_dir):
+        legacy = VersionHistory(
+            object_type=VersionedObjectType.CATALOG_ASSET,
+            object_id="asset-1",
+            current_version="0.0.2",
+            current_version_number=2,
+            versions=[
+                Version(object_type=VersionedObjectType.CATALOG_ASSET, object_id="asset-1", version=f"0.0.{n}",
+                        version_number=n, change_type=ChangeType.UPDATE, snapshot={"n": n})
+                for n in (1, 2)
+            ],
+        )
+        legacy_file = Path(temp_data_dir) / "histories.json"
+        legacy_file.write_text(json.dumps({"catalog_asset:asset-1": legacy.model_dump(mode="json")}))
+
+        store = VersionStore(data_dir=temp_data_dir)
+
+        assert not legacy_file.exists()
+        assert store.get_version(VersionedObjectType.CATALOG_ASSET, "asset-1", "0.0.1").snapshot == {"n": 1}
+        assert store.get_version(VersionedObjectType.CATALOG_ASSET, "asset-1").version == "0.0.2"
+
+
+class TestStructuralDiff:
+    """Tests for the identity-aware JSON Patch diff."""
+
+    @staticmethod
+    def _tree(n):
+        return {
+            "name": "P&L",
+            "hierarchies": [
+                {"hierarchy_id": f"H{i}", "name": f"Node {i}", "mapping": [{"col": f"C{i}"}]}
+                for i in range(n)
+            ],
+        }
+
+    def test_nested_edit_in_large_list_is_one_operation(self, version_manager):
+        obj = VersionedObjectType.HIERARCHY_PROJECT
+        old = self._tree(20000)
+        new = self._tree(20000)
+        new["hierarchies"][12345]["mapping"][0]["col"] = "REVENUE"
+        version_manager.snapshot(obj, "big-diff", old)
+        version_manager.snapshot(obj, "big-diff", new)
+
+        diff = version_manager.diff(obj, "big-diff", "0.0.1", "0.0.2")
+
+        assert diff.path_changes == [{
+            "op": "replace", "path": "/hierarchies/12345/mapping/0/col", "value": "REVENUE", "old": "C12345",
+        }]
+        assert diff.modified == {"hierarchies": {"changes": 1}}
+        assert diff.total_changes == 1
+
+    def test_identity_matching_handles_insert_delete_and_moves(self):
+        from src.versioning.patch import apply_patch, diff_snapshots, invert_patch
+
+        old = self._tree(6)
+        new = self._tree(6)
+        new["hierarchies"].pop(1)
+        new["hierarchies"].insert(0, new["hierarchies"].pop(3))
+        new["hierarchies"].append({"hierarchy_id": "H9", "name": "New"})
+        new["hierarchies"][2]["name"] = "Renamed"
+        new["owner/team"] = "fp~a"
+
+        ops = diff_snapshots(old, new)
+        assert {op["op"] for op in ops} == {"remove", "move", "add", "replace"}
+        assert not any(op["op"] == "replace" and op["path"].count("/") < 3 for op in ops)
+        assert apply_patch(old, ops) == new
+        assert apply_patch(new, invert_patch(ops)) == old
+
+    def test_plain_lists_and_type_changes_round_trip(self):
+        from src.versioning.patch import apply_patch, diff_snapshots, invert_patch
+
+        cases = [
+            ({"a": [1, 2, 3, 4]}, {"a": [1, 3, 4, 5, 6]}),
+            ({"a": [{"x": 1}, {"x": 2}]}, {"a": [{"x": 1}, {"x": 3}]}),
+            ({"a": {"b": 1}}, {"a": [1]}),
+            ({"a": 1, "b": None}, {"b": {"c": [True]}}),
+            ({"ids": [{"id": 1}, {"id": 1}]}, {"ids": [{"id": 1}]}),
+        ]
+        for old, new in cases:
+            ops = diff_snapshots(old, new)
+            assert apply_patch(old, ops) == new
+            assert apply_patch(new, invert_patch(ops)) == old
+        assert diff_snapshots({"a": [1]}, {"a": [1]}) == []
+
+    def test_type_only_changes_are_diffed(self):
+        from src.versioning.patch import apply_patch, diff_snapshots, invert_patch
+
+        for old, new in [({"root": True}, {"root": 1}), ({"a": {"x": 1.0}}, {"a": {"x": 1}})]:
+            ops = diff_snapshots(old, new)
+            assert len(ops) == 1
+            assert json.dumps(apply_patch(old, ops)) == json.dumps(new)
+            assert json.dumps(apply_patch(new, invert_patch(ops))) == json.dumps(old)
+
+    def test_rollback_preview_patch_restores_target(self, version_manager):
+        from src.versioning.patch import apply_patch
+
+        obj = VersionedObjectType.HIERARCHY_PROJECT
+        v1 = self._tree(50)
+        v2 = self._tree(50)
+        del v2["hierarchies"][10]
+        v2["hierarchies"][0]["name"] = "Top"
+        version_manager.snapshot(obj, "rb-patch", v1)
+        version_manager.snapshot(obj, "rb-patch", v2)
+
+        preview = version_manager.preview_rollback(obj, "rb-patch", "0.0.1")
+        assert apply_patch(v2, preview.diff.path_changes) == v1
+        assert preview.diff.total_changes == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
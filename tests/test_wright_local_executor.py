@@ -0,0 +1,255 @@
+"""
+Tests for the Wright local pipeline executor.
+
+Tests:
+- LocalPipelineExecutor: VW_1 → DT_2 → DT_3A → DT_3 on local extracts
+- FormulaPrecedenceEngine.evaluate_cascade: vectorized formula cascade
+- apply_sql_filter: JoinPattern filter predicates
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+HIERARCHY = [
+    {"HIERARCHY_ID": 1, "ACTIVE_FLAG": True, "CALCULATION_FLAG": False,
+     "LEVEL_1": "Revenue", "LEVEL_2": "Oil", "FORMULA_GROUP": "Revenue"},
+    {"HIERARCHY_ID": 2, "ACTIVE_FLAG": True, "CALCULATION_FLAG": False,
+     "LEVEL_1": "Revenue", "LEVEL_2": "Royalty", "FORMULA_GROUP": "Revenue", "SIGN_CHANGE_FLAG": True},
+    {"HIERARCHY_ID": 3, "ACTIVE_FLAG": True, "CALCULATION_FLAG": False,
+     "LEVEL_1": "Expense", "FORMULA_GROUP": "Operating Expense"},
+    {"HIERARCHY_ID": 4, "ACTIVE_FLAG": False, "CALCULATION_FLAG": False, "LEVEL_1": "Retired"},
+]
+
+MAPPING = [
+    {"FK_REPORT_KEY": 1, "ID": 4100, "ID_SOURCE": "ACCOUNT_CODE", "EXCLUSION_FLAG": False, "FILTER_GROUP_1": "Oil"},
+    {"FK_REPORT_KEY": 2, "ID": 4200, "ID_SOURCE": "ACCOUNT_CODE", "EXCLUSION_FLAG": False, "FILTER_GROUP_1": "Royalties"},
+    {"FK_REPORT_KEY": 3, "ID": 6100, "ID_SOURCE": "ACCOUNT_CODE", "EXCLUSION_FLAG": False, "FILTER_GROUP_1": "LOE"},
+    {"FK_REPORT_KEY": 4, "ID": 9999, "ID_SOURCE": "ACCOUNT_CODE", "EXCLUSION_FLAG": False, "FILTER_GROUP_1": "Old"},
+]
+
+FACT = [
+    {"FK_ACCOUNT_KEY": "4100", "ACCOUNT_SEGMENT": "GROSS", "AMOUNT": 100, "VOLUME": 10, "MCFE": 1},
+    {"FK_ACCOUNT_KEY": "4100", "ACCOUNT_SEGMENT": "GROSS", "AMOUNT": 50, "VOLUME": 5, "MCFE": 1},
+    {"FK_ACCOUNT_KEY": "4200", "ACCOUNT_SEGMENT": "GROSS", "AMOUNT": 30, "VOLUME": 3, "MCFE": 1},
+    {"FK_ACCOUNT_KEY": "6100", "ACCOUNT_SEGMENT": "GROSS", "AMOUNT": 40, "VOLUME": 0, "MCFE": 0},
+    {"FK_ACCOUNT_KEY": "6100", "ACCOUNT_SEGMENT": "NET", "AMOUNT": 999, "VOLUME": 0, "MCFE": 0},
+]
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for extracts."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def extracts(temp_dir):
+    """Write the sample tables as CSV extracts."""
+    import pandas as pd
+
+    paths = {}
+    for name, rows in (("HIER", HIERARCHY), ("MAP", MAPPING), ("FACT", FACT)):
+        path = temp_dir / f"{name.lower()}.csv"
+        pd.DataFrame(rows).to_csv(path, index=False)
+        paths[name] = str(path)
+    return paths
+
+
+def _config(**overrides):
+    from src.wright.types import DynamicColumnMapping, JoinPattern, MartConfig
+
+    values = dict(
+        project_name="demo",
+        report_type="GROSS",
+        hierarchy_table="DB.MARTS.HIER",
+        mapping_table="DB.MARTS.MAP",
+        fact_table="DB.MARTS.FACT",
+        account_segment="GROSS",
+        dynamic_column_map=[DynamicColumnMapping(id_source="ACCOUNT_CODE", physical_column="MAP.ID")],
+        join_patterns=[JoinPattern(name="account", join_keys=["LOS_ACCOUNT_ID_FILTER"], fact_keys=["FK_ACCOUNT_KEY"])],
+    )
+    values.update(overrides)
+    return MartConfig(**values)
+
+
+# =============================================================================
+# Pipeline Tests
+# =============================================================================
+
+class TestLocalPipelineExecutor:
+    """Tests for LocalPipelineExecutor."""
+
+    def test_runs_all_stages_from_csv(self, extracts):
+        from src.wright.local_executor import LocalPipelineExecutor
+
+        executor = LocalPipelineExecutor()
+        outputs = executor.run(_config(), extracts)
+
+        assert list(outputs) == ["VW_1", "DT_2", "DT_3A", "DT_3"]
+        # Inactive hierarchy node is dropped
+        assert len(outputs["VW_1"]) == 3
+        assert outputs["VW_1"]["RESOLVED_VALUE"].tolist() == [4100, 4200, 6100]
+
+        dt3a = outputs["DT_3A"].set_index("FK_REPORT_KEY")
+        assert dt3a.loc[1, "GROSS_AMOUNT"] == 150
+        assert dt3a.loc[3, "GROSS_AMOUNT"] == 40  # NET row filtered by ACCOUNT_SEGMENT
+        assert set(dt3a["JOIN_BRANCHES"]) == {"account"}
+
+        dt3 = outputs["DT_3"]
+        assert dt3["LEVEL_9"].tolist() == ["Oil", "Royalty", "Expense"]
+        assert dt3["LEVEL_2_KEY"].tolist() == [2, 3, 1]
+        assert executor.stage_stats["DT_3"]["rows"] == 3
+        assert executor.stage_stats["DT_3"]["object_name"] == "DT_3_DEMO"
+
+    def test_sign_change_and_pattern_filter(self, extracts):
+        from src.wright.local_executor import LocalPipelineExecutor
+        from src.wright.types import JoinPattern
+
+        config = _config(
+            has_sign_change=True,
+            join_patterns=[
+                JoinPattern(name="account", join_keys=["LOS_ACCOUNT_ID_FILTER"], fact_keys=["FK_ACCOUNT_KEY"]),
+                JoinPattern(name="royalty", join_keys=["LOS_ACCOUNT_ID_FILTER"], fact_keys=["FK_ACCOUNT_KEY"],
+                            filter="ROYALTY_FILTER = 'Y'"),
+            ],
+        )
+        outputs = LocalPipelineExecutor().run(config, extracts)
+
+        dt3a = outputs["DT_3A"].set_index("FK_REPORT_KEY")
+        # Royalty key matches both branches and has its sign flipped
+        assert dt3a.loc[2, "GROSS_AMOUNT"] == -60
+        assert dt3a.loc[2, "JOIN_BRANCHES"] == "account,royalty"
+        assert dt3a.loc[1, "GROSS_AMOUNT"] == 150
+
+    def test_formula_cascade(self, extracts):
+        from src.wright.formula_engine import create_standard_los_formulas
+        from src.wright.local_executor import LocalPipelineExecutor
+
+        outputs = LocalPipelineExecutor().run(_config(), extracts, create_standard_los_formulas("GROSS"))
+
+        calculated = outputs["DT_3"][outputs["DT_3"]["IS_CALCULATED"] == 1].set_index("FORMULA_GROUP")
+        assert calculated.loc["Total Revenue", "GROSS_AMOUNT"] == 180
+        assert calculated.loc["Total OpEx", "GROSS_AMOUNT"] == 40
+        assert calculated.loc["Operating Income", "GROSS_AMOUNT"] == 140
+        assert calculated.loc["Cash Flow", "GROSS_AMOUNT"] == 140
+
+    def test_validate_reports_row_counts(self, extracts):
+        from src.wright.local_executor import LocalPipelineExecutor
+
+        executor = LocalPipelineExecutor()
+        result = executor.validate(_config(), extracts, expected_rows={"VW_1": 3, "DT_3": 4})
+
+        assert result.is_valid is False
+        assert result.row_count_match is False
+        assert result.actual_rows == {"VW_1": 3, "DT_2": 3, "DT_3A": 3, "DT_3": 3}
+        assert result.errors == ["DT_3: expected 4 rows, got 3"]
+        assert "duration_ms" in result.layer_results["DT_2"]
+
+    def test_missing_extract_is_an_error(self, extracts):
+        from src.wright.local_executor import LocalPipelineExecutor
+
+        sources = {"hier": extracts["HIER"], "map": extracts["MAP"]}
+        result = LocalPipelineExecutor().validate(_config(), sources)
+
+        assert result.is_valid is False
+        assert "No local extract for fact table" in result.errors[0]
+
+
+# =============================================================================
+# Formula and Filter Tests
+# =============================================================================
+
+class TestLocalEvaluation:
+    """Tests for cascade evaluation and filter predicates."""
+
+    def test_evaluate_cascade_logic(self):
+        import pandas as pd
+        from src.wright.formula_engine import FormulaPrecedenceEngine
+        from src.wright.types import FormulaLogic, FormulaPrecedence
+
+        base = pd.DataFrame({
+            "FK_REPORT_KEY": [1, 2],
+            "FORMULA_GROUP": ["A", "B"],
+            "NET_AMOUNT": [10.0, 4.0],
+            "NET_VOLUME": [1.0, 1.0],
+            "NET_MCFE": [0.0, 0.0],
+        })
+        formulas = [
+            FormulaPrecedence(precedence_level=2, formula_group="Ratio", logic=FormulaLogic.DIVIDE,
+                              param_ref="A", param2_ref="B"),
+            FormulaPrecedence(precedence_level=2, formula_group="Both", logic=FormulaLogic.SUM,
+                              param_ref="A", param2_ref="B"),
+            FormulaPrecedence(precedence_level=3, formula_group="Net", logic=FormulaLogic.SUBTRACT,
+                              param_ref="Both", param2_ref="A, Missing"),
+        ]
+
+        result = FormulaPrecedenceEngine().evaluate_cascade(base, formulas, "NET").set_index("FORMULA_GROUP")
+
+        assert result.loc["Ratio", "NET_AMOUNT"] == 2.5
+        assert result.loc["Both", "NET_VOLUME"] == 2.0
+        assert result.loc["Net", "NET_AMOUNT"] == 4.0
+        assert result.loc["Net", "FK_REPORT_KEY"] == "CALC_Net"
+
+    def test_evaluate_cascade_matches_generated_sql(self):
+        import sqlite3
+
+        import pandas as pd
+        from src.wright.formula_engine import FormulaPrecedenceEngine, create_standard_los_formulas
+        from src.wright.types import FormulaLogic, FormulaPrecedence
+
+        columns = (
+            ["FK_REPORT_KEY"] + [f"LEVEL_{n}" for n in range(1, 10)]
+            + ["FORMULA_GROUP", "FORMULA_PRECEDENCE", "FORMULA_PARAM_REF", "FORMULA_LOGIC",
+               "FORMULA_PARAM2_REF", "GROSS_AMOUNT", "GROSS_VOLUME", "GROSS_MCFE", "IS_CALCULATED"]
+        )
+        groups = ["Revenue", "Revenue", "Taxes", "Deducts", "Royalties", "Operating Expense", "Capital Spend"]
+        base = pd.DataFrame([
+            {"FK_REPORT_KEY": i, "FORMULA_GROUP": group, "GROSS_AMOUNT": 100.0 - 7 * i,
+             "GROSS_VOLUME": float(i), "GROSS_MCFE": 0.5 * i, "IS_CALCULATED": 0}
+            for i, group in enumerate(groups)
+        ]).reindex(columns=columns)
+
+        formulas = create_standard_los_formulas("GROSS") + [
+            FormulaPrecedence(precedence_level=2, formula_group="Avg Revenue", logic=FormulaLogic.AVERAGE,
+                              param_ref="Revenue", param2_ref="Taxes"),
+            FormulaPrecedence(precedence_level=2, formula_group="Margin", logic=FormulaLogic.DIVIDE,
+                              param_ref="Total Taxes", param2_ref="Total Revenue"),
+            FormulaPrecedence(precedence_level=2, formula_group="Scaled", logic=FormulaLogic.MULTIPLY,
+                              param_ref="Total Taxes", param2_ref="Total Deducts, Missing"),
+        ]
+        engine = FormulaPrecedenceEngine()
+
+        local = engine.evaluate_cascade(base, formulas, "GROSS")
+
+        conn = sqlite3.connect(":memory:")
+        base.to_sql("DT_3A", conn, index=False)
+        sql = f"WITH {engine.generate_cascade_cte(formulas)} SELECT * FROM PRECEDENCE_5"
+        remote = pd.read_sql_query(sql, conn)
+        conn.close()
+
+        measures = ["GROSS_AMOUNT", "GROSS_VOLUME", "GROSS_MCFE"]
+        local_calc = local[local["IS_CALCULATED"] == 1].set_index("FORMULA_GROUP")[measures]
+        remote_calc = remote[remote["IS_CALCULATED"] == 1].set_index("FORMULA_GROUP")[measures]
+        assert len(remote) == len(local)
+        pd.testing.assert_frame_equal(local_calc, remote_calc.astype(float), check_like=True)
+        assert local_calc.loc["Gross Profit", "GROSS_AMOUNT"] == 193.0 - (86.0 + 79.0) - 72.0
+
+    def test_sql_filter_fallback(self, monkeypatch):
+        import pandas as pd
+        from src.wright import local_executor
+
+        monkeypatch.setattr(local_executor, "DUCKDB_AVAILABLE", False)
+        df = pd.DataFrame({"ROYALTY_FILTER": ["Y", None, "Y"], "AMOUNT": [1, 2, 3]})
+
+        filtered = local_executor.apply_sql_filter(df, "DT2.ROYALTY_FILTER = 'Y' AND AMOUNT <> 3")
+        assert filtered["AMOUNT"].tolist() == [1]